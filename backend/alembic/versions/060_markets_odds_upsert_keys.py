@@ -0,0 +1,112 @@
+"""Dedupe markets/odds and add unique keys used by bulk odds ingestion.
+
+Revision ID: 060_markets_odds_upsert_keys
+Revises: 059_canonical_key_dedup
+Create Date: 2026-10-16
+
+- markets: one row per (game_id, market_type, book). For duplicate groups the market
+  with the most odds survives; odds of losers are re-pointed, then losers deleted.
+- odds: one row per (market_id, outcome); the most recent (created_at, id) survives.
+- Add unique indexes uq_markets_game_type_book and uq_odds_market_outcome
+  (targets of INSERT ... ON CONFLICT in OddsBulkWriter).
+"""
+
+from __future__ import annotations
+
+from alembic import op
+from sqlalchemy import text
+
+revision = "060_markets_odds_upsert_keys"
+down_revision = "059_canonical_key_dedup"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgres(conn) -> bool:
+    return conn.dialect.name == "postgresql"
+
+
+def _index_exists(conn, index_name: str) -> bool:
+    r = conn.execute(
+        text("SELECT 1 FROM pg_indexes WHERE schemaname = current_schema() AND indexname = :n"),
+        {"n": index_name},
+    ).scalar()
+    return r is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if not _is_postgres(conn):
+        # SQLite (tests/local): tables come from metadata.create_all with the indexes.
+        return
+
+    # 1) Duplicate markets: survivor = most odds, then lowest id.
+    conn.execute(
+        text("""
+        CREATE TEMP TABLE _market_dupes ON COMMIT DROP AS
+        SELECT id AS loser_id, survivor_id FROM (
+            SELECT m.id,
+                   first_value(m.id) OVER (
+                       PARTITION BY m.game_id, m.market_type, m.book
+                       ORDER BY (SELECT count(*) FROM odds o WHERE o.market_id = m.id) DESC, m.id
+                   ) AS survivor_id
+            FROM markets m
+            WHERE (m.game_id, m.market_type, m.book) IN (
+                SELECT game_id, market_type, book FROM markets
+                GROUP BY game_id, market_type, book HAVING count(*) > 1
+            )
+        ) ranked
+        WHERE id <> survivor_id
+        """)
+    )
+    conn.execute(
+        text("""
+        UPDATE odds SET market_id = d.survivor_id
+        FROM _market_dupes d
+        WHERE odds.market_id = d.loser_id
+        """)
+    )
+    conn.execute(text("DELETE FROM markets WHERE id IN (SELECT loser_id FROM _market_dupes)"))
+
+    # 2) Duplicate odds per (market_id, outcome): keep the latest row.
+    conn.execute(
+        text("""
+        DELETE FROM odds
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY market_id, outcome
+                    ORDER BY created_at DESC NULLS LAST, id DESC
+                ) AS rn
+                FROM odds
+            ) ranked
+            WHERE rn > 1
+        )
+        """)
+    )
+
+    # 3) Unique keys (idempotent)
+    if not _index_exists(conn, "uq_markets_game_type_book"):
+        op.create_index(
+            "uq_markets_game_type_book",
+            "markets",
+            ["game_id", "market_type", "book"],
+            unique=True,
+        )
+    if not _index_exists(conn, "uq_odds_market_outcome"):
+        op.create_index(
+            "uq_odds_market_outcome",
+            "odds",
+            ["market_id", "outcome"],
+            unique=True,
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if not _is_postgres(conn):
+        return
+    if _index_exists(conn, "uq_odds_market_outcome"):
+        op.drop_index("uq_odds_market_outcome", table_name="odds")
+    if _index_exists(conn, "uq_markets_game_type_book"):
+        op.drop_index("uq_markets_game_type_book", table_name="markets")
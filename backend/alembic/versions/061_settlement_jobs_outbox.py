@@ -0,0 +1,46 @@
+"""Add settlement_jobs outbox for event-driven settlement.
+
+Revision ID: 061_settlement_jobs_outbox
+Revises: 060_markets_odds_upsert_keys
+Create Date: 2026-10-16
+
+- settlement_jobs: one row per game awaiting settlement (unique game_id), written when
+  the score scraper moves a game to FINAL and consumed by SettlementWorker.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "061_settlement_jobs_outbox"
+down_revision = "060_markets_odds_upsert_keys"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "settlement_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("game_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("available_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["game_id"], ["games.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("game_id", name="uq_settlement_jobs_game_id"),
+    )
+    op.create_index(
+        "idx_settlement_jobs_status_available",
+        "settlement_jobs",
+        ["status", "available_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_settlement_jobs_status_available", table_name="settlement_jobs")
+    op.drop_table("settlement_jobs")
@@ -0,0 +1,46 @@
+"""Add full_article_jobs queue table.
+
+Revision ID: 062_full_article_jobs
+Revises: 061_settlement_jobs_outbox
+Create Date: 2026-10-16
+
+- full_article_jobs: DB fallback for the full-article generation queue (unique
+  analysis_id), consumed by FullArticleWorker when Redis is unavailable.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "062_full_article_jobs"
+down_revision = "061_settlement_jobs_outbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "full_article_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("analysis_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("available_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["analysis_id"], ["game_analyses.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("analysis_id", name="uq_full_article_jobs_analysis_id"),
+    )
+    op.create_index(
+        "idx_full_article_jobs_status_available",
+        "full_article_jobs",
+        ["status", "available_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_full_article_jobs_status_available", table_name="full_article_jobs")
+    op.drop_table("full_article_jobs")
@@ -0,0 +1,153 @@
+"""Add pre-aggregated leaderboard totals tables.
+
+Revision ID: 063_leaderboard_totals
+Revises: 062_full_article_jobs
+Create Date: 2026-10-16
+
+- verified_winner_totals: per-user verified custom parlay wins/resolved counts.
+- ai_usage_totals: per-user AI generation counts (all-time and rolling 30d).
+
+Both are maintained incrementally by LeaderboardTotalsService and rebuilt by the
+scheduler; the /leaderboards endpoints read them instead of aggregating per request.
+On Postgres, upgrade backfills both tables with the same aggregation as
+`LeaderboardTotalsService.rebuild()`, so the leaderboards are populated before the
+first scheduled rebuild.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+revision = "063_leaderboard_totals"
+down_revision = "062_full_article_jobs"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgres(conn) -> bool:
+    return conn.dialect.name == "postgresql"
+
+
+def _backfill(conn) -> None:
+    # Verified Winners: resolved custom saved parlays with a confirmed verification record.
+    conn.execute(
+        text("""
+        WITH verified AS (
+            SELECT r.user_id, r.hit, r.resolved_at
+            FROM saved_parlay_results r
+            WHERE r.parlay_type = 'custom'
+              AND r.hit IS NOT NULL
+              AND EXISTS (
+                  SELECT 1 FROM verification_records v
+                  WHERE v.user_id = r.user_id
+                    AND v.saved_parlay_id = r.saved_parlay_id
+                    AND v.status = 'confirmed'
+              )
+        ),
+        agg AS (
+            SELECT user_id,
+                   SUM(CASE WHEN hit THEN 1 ELSE 0 END) AS wins,
+                   COUNT(*) AS resolved,
+                   MAX(CASE WHEN hit THEN resolved_at END) AS last_win_at
+            FROM verified
+            GROUP BY user_id
+        ),
+        last_inscription AS (
+            SELECT DISTINCT ON (v.user_id)
+                   v.user_id,
+                   COALESCE(
+                       NULLIF(TRIM(v.tx_digest), ''),
+                       NULLIF(TRIM(v.object_id), ''),
+                       NULLIF(TRIM(v.data_hash), '')
+                   ) AS inscription_id
+            FROM verification_records v
+            JOIN saved_parlay_results r
+              ON r.saved_parlay_id = v.saved_parlay_id AND r.user_id = v.user_id
+            WHERE v.status = 'confirmed' AND r.parlay_type = 'custom' AND r.hit IS TRUE
+            ORDER BY v.user_id, r.resolved_at DESC, v.created_at DESC
+        )
+        INSERT INTO verified_winner_totals (
+            id, user_id, verified_wins, verified_resolved, win_rate,
+            last_win_at, last_win_inscription_id, updated_at
+        )
+        SELECT gen_random_uuid(), a.user_id, a.wins, a.resolved,
+               CASE WHEN a.resolved > 0 THEN a.wins::float / a.resolved ELSE 0 END,
+               a.last_win_at, li.inscription_id, now()
+        FROM agg a
+        LEFT JOIN last_inscription li ON li.user_id = a.user_id
+        ON CONFLICT (user_id) DO NOTHING
+        """)
+    )
+
+    # AI Power Users: generated parlays plus saved custom parlays.
+    conn.execute(
+        text("""
+        WITH usage AS (
+            SELECT user_id, created_at FROM parlays WHERE user_id IS NOT NULL
+            UNION ALL
+            SELECT user_id, created_at FROM saved_parlays
+            WHERE user_id IS NOT NULL AND parlay_type = 'custom'
+        )
+        INSERT INTO ai_usage_totals (id, user_id, total_count, count_30d, last_generated_at, updated_at)
+        SELECT gen_random_uuid(), user_id, COUNT(*),
+               SUM(CASE WHEN created_at >= now() - interval '30 days' THEN 1 ELSE 0 END),
+               MAX(created_at), now()
+        FROM usage
+        GROUP BY user_id
+        ON CONFLICT (user_id) DO NOTHING
+        """)
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "verified_winner_totals",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("verified_wins", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("verified_resolved", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("win_rate", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("last_win_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_win_inscription_id", sa.String(255), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("user_id", name="uq_verified_winner_totals_user_id"),
+    )
+    op.create_index("ix_verified_winner_totals_user_id", "verified_winner_totals", ["user_id"])
+    op.create_index(
+        "idx_verified_winner_totals_rank",
+        "verified_winner_totals",
+        ["verified_wins", "win_rate", "last_win_at"],
+    )
+
+    op.create_table(
+        "ai_usage_totals",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("total_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("count_30d", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_generated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("user_id", name="uq_ai_usage_totals_user_id"),
+    )
+    op.create_index("ix_ai_usage_totals_user_id", "ai_usage_totals", ["user_id"])
+    op.create_index("idx_ai_usage_totals_all_time", "ai_usage_totals", ["total_count", "last_generated_at"])
+    op.create_index("idx_ai_usage_totals_30d", "ai_usage_totals", ["count_30d", "last_generated_at"])
+
+    conn = op.get_bind()
+    if _is_postgres(conn):
+        _backfill(conn)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_ai_usage_totals_30d", table_name="ai_usage_totals")
+    op.drop_index("idx_ai_usage_totals_all_time", table_name="ai_usage_totals")
+    op.drop_index("ix_ai_usage_totals_user_id", table_name="ai_usage_totals")
+    op.drop_table("ai_usage_totals")
+    op.drop_index("idx_verified_winner_totals_rank", table_name="verified_winner_totals")
+    op.drop_index("ix_verified_winner_totals_user_id", table_name="verified_winner_totals")
+    op.drop_table("verified_winner_totals")
@@ -8,8 +8,9 @@ Alpha contribution weight capped initially at 5%; gradually increase via perform
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +23,29 @@ STATUS_VALIDATED = "VALIDATED"
 STATUS_DEPRECATED = "DEPRECATED"
 
 
+def alpha_adjustments(
+    contributions: Sequence[Dict[str, Any]],
+    feature_values_rows: Sequence[Optional[Dict[str, float]]],
+) -> np.ndarray:
+    """
+    Alpha adjustment for each row of feature_name -> value (-1 to 1 scale).
+
+    Every validated feature gets an equal share of ALPHA_WEIGHT_CAP_INITIAL; values are
+    clamped to [-1, 1] and each row's total is capped at ALPHA_WEIGHT_CAP_INITIAL.
+    """
+    n = len(feature_values_rows)
+    if not contributions:
+        return np.zeros(n)
+    names = [c["feature_name"] for c in contributions]
+    values = np.array(
+        [[float((row or {}).get(name, 0.0)) for name in names] for row in feature_values_rows],
+        dtype=float,
+    ).reshape(n, len(names))
+    per_feature = ALPHA_WEIGHT_CAP_INITIAL / len(names)
+    adjustment = (np.clip(values, -1.0, 1.0) * per_feature).sum(axis=1)
+    return np.clip(adjustment, -ALPHA_WEIGHT_CAP_INITIAL, ALPHA_WEIGHT_CAP_INITIAL)
+
+
 class ModelAugmentationService:
     """
     Provides validated alpha feature list and their weight caps for the prediction pipeline.
@@ -38,7 +62,15 @@ class ModelAugmentationService:
         """
         Returns list of {feature_name, weight_cap, feature_id} for validated (non-deprecated) features.
         context can contain prediction context (sport, matchup) for future per-context weights.
+        Served from the process-wide model inputs snapshot (reloaded on version bump).
         """
+        from app.services.institutional.model_inputs_snapshot import get_model_inputs_snapshot
+
+        snapshot = await get_model_inputs_snapshot(self.db)
+        return list(snapshot.alpha_contributions)
+
+    async def load_validated_alpha_contributions(self) -> List[Dict[str, Any]]:
+        """Query validated (non-deprecated) features from the DB."""
         result = await self.db.execute(
             select(AlphaFeature)
             .where(AlphaFeature.status == STATUS_VALIDATED)
@@ -70,13 +102,4 @@ class ModelAugmentationService:
         contributions = await self.get_validated_alpha_contributions()
         if not contributions:
             return 0.0
-        total_cap = ALPHA_WEIGHT_CAP_INITIAL
-        per_feature = total_cap / len(contributions) if contributions else 0.0
-        adjustment = 0.0
-        for c in contributions:
-            name = c["feature_name"]
-            val = feature_values.get(name, 0.0)
-            val = max(-1.0, min(1.0, float(val)))
-            adjustment += per_feature * val
-        adjustment = max(-total_cap, min(total_cap, adjustment))
-        return adjustment
+        return float(alpha_adjustments(contributions, [feature_values])[0])
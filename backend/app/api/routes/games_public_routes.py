@@ -6,11 +6,17 @@ import time
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.routes.games_response_cache import games_response_cache
+from app.api.routes.games_response_cache import (
+    EncodedGamesResponse,
+    encode_games_list,
+    games_response_cache,
+    meta_fingerprint,
+)
 from app.core.dependencies import get_db
 from app.models.game import Game
 from app.models.watched_game import WatchedGame
@@ -54,6 +60,50 @@ def _filter_games_by_window(
     return out
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _encoded_response(request: Request, entry: EncodedGamesResponse) -> Response:
+    """
+    Serve a pre-encoded games list: gzip body when the client accepts it, else identity.
+    Each coding has its own strong ETag; 304 when it matches the selected representation.
+    """
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
+    etag = entry.etag_gzip if use_gzip else entry.etag
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=entry.body_gzip, media_type="application/json", headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def _respond_with_games(
+    request: Request,
+    cache_key: str,
+    games: List[GameResponse],
+    meta: dict,
+    window_start_utc: datetime,
+    window_end_utc: datetime,
+    *,
+    reuse_encoded: bool = True,
+) -> Response:
+    """Reuse the encoded response for this key/meta/window, encoding (and caching) it on a miss."""
+    fingerprint = meta_fingerprint(meta)
+    entry = None
+    if reuse_encoded:
+        entry = games_response_cache.get_encoded(cache_key, fingerprint, window_start_utc, window_end_utc)
+    if entry is None:
+        entry = encode_games_list(games, meta, window_start_utc, window_end_utc)
+        games_response_cache.set_encoded(cache_key, fingerprint, entry)
+    return _encoded_response(request, entry)
+
+
 @router.get("/weeks/nfl", summary="Get NFL weeks info")
 async def get_nfl_weeks(db: AsyncSession = Depends(get_db)):
     """
@@ -130,6 +180,7 @@ async def get_nfl_weeks(db: AsyncSession = Depends(get_db)):
 @router.get("/sports/{sport}/games", response_model=GamesListResponse)
 async def get_games_for_sport(
     sport: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     refresh: bool = Query(False, description="Bypass server cache (does not force external odds refresh)"),
     week: Optional[int] = Query(
@@ -145,6 +196,9 @@ async def get_games_for_sport(
 
     IMPORTANT: `refresh=true` bypasses only the server's in-memory cache. It does NOT
     force a The Odds API call (to preserve credits).
+
+    Listings are served from pre-encoded gzip JSON with a strong ETag; a matching
+    `If-None-Match` gets 304 Not Modified.
     """
     start_time = time.time()
     sport_config = get_sport_config(sport)
@@ -181,13 +235,13 @@ async def get_games_for_sport(
     if not refresh:
         cached_games = games_response_cache.get(cache_key)
         if cached_games is not None:
+            response = _respond_with_games(request, cache_key, cached_games, _meta(), window.start_utc, window.end_utc)
             elapsed = time.time() - start_time
             cache_age = games_response_cache.age_seconds(cache_key) or 0.0
-            filtered = _filter_games_by_window(cached_games, window.start_utc, window.end_utc)
             print(
-                f"[GAMES] Cached {sport_config.display_name} -> {len(filtered)} in window (age: {cache_age:.0f}s) in {elapsed:.2f}s"
+                f"[GAMES] Cached {sport_config.display_name} (age: {cache_age:.0f}s) -> {response.status_code} in {elapsed:.3f}s"
             )
-            return GamesListResponse(games=filtered, **_meta())
+            return response
 
     try:
         fetcher = OddsFetcherService(db)
@@ -212,8 +266,9 @@ async def get_games_for_sport(
         if week and sport_config.code == "NFL":
             games = [g for g in games if g.week == week]
         games_response_cache.set(cache_key, games)
-        filtered = _filter_games_by_window(games, window.start_utc, window.end_utc)
-        return GamesListResponse(games=filtered, **_meta())
+        return _respond_with_games(
+            request, cache_key, games, _meta(), window.start_utc, window.end_utc, reuse_encoded=False
+        )
     except Exception as e:
         import traceback
 
@@ -1,52 +1,166 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from app.schemas.game import GameResponse
+from app.schemas.game import GameResponse, GamesListResponse
+from app.services.tiered_cache import LocalTtlCache
+from app.utils.timezone_utils import TimezoneNormalizer
 
 
 @dataclass(frozen=True)
-class GamesCacheEntry:
-    data: List[GameResponse]
-    cached_at: datetime
+class EncodedGamesResponse:
+    """
+    A `GamesListResponse` serialized once: identity and gzip bodies, each with its own
+    strong ETag (`etag` for the JSON, `etag_gzip` for the gzip coding of it).
+
+    The filtered game set only changes when a game crosses a listing-window edge, so the
+    entry stays valid while `start_floor < window.start <= start_ceiling` and
+    `end_floor <= window.end < end_ceiling` (bounds are the neighbouring game start times).
+    """
+
+    body: bytes
+    body_gzip: bytes
+    etag: str
+    start_floor: Optional[datetime]
+    start_ceiling: Optional[datetime]
+    end_floor: Optional[datetime]
+    end_ceiling: Optional[datetime]
+
+    def matches_window(self, window_start_utc: datetime, window_end_utc: datetime) -> bool:
+        if self.start_floor is not None and window_start_utc <= self.start_floor:
+            return False
+        if self.start_ceiling is not None and window_start_utc > self.start_ceiling:
+            return False
+        if self.end_floor is not None and window_end_utc < self.end_floor:
+            return False
+        if self.end_ceiling is not None and window_end_utc >= self.end_ceiling:
+            return False
+        return True
+
+    @property
+    def etag_gzip(self) -> str:
+        return f'{self.etag[:-1]}-gz"'
+
+
+def encode_games_list(
+    games: List[GameResponse],
+    meta: Dict[str, Any],
+    window_start_utc: datetime,
+    window_end_utc: datetime,
+) -> EncodedGamesResponse:
+    """Filter `games` to the window and pre-encode the response (JSON + gzip, sha256 ETag)."""
+    in_window: List[GameResponse] = []
+    start_floor = start_ceiling = end_floor = end_ceiling = None
+    for g in games:
+        st = TimezoneNormalizer.ensure_utc(g.start_time)
+        if st < window_start_utc:
+            start_floor = st if start_floor is None else max(start_floor, st)
+        elif st > window_end_utc:
+            end_ceiling = st if end_ceiling is None else min(end_ceiling, st)
+        else:
+            in_window.append(g)
+            start_ceiling = st if start_ceiling is None else min(start_ceiling, st)
+            end_floor = st if end_floor is None else max(end_floor, st)
+
+    raw = GamesListResponse(games=in_window, **meta).model_dump_json().encode("utf-8")
+    return EncodedGamesResponse(
+        body=raw,
+        body_gzip=gzip.compress(raw, compresslevel=6, mtime=0),
+        etag=f'"{hashlib.sha256(raw).hexdigest()[:32]}"',
+        start_floor=start_floor,
+        start_ceiling=start_ceiling,
+        end_floor=end_floor,
+        end_ceiling=end_ceiling,
+    )
+
+
+def meta_fingerprint(meta: Dict[str, Any]) -> str:
+    return hashlib.sha1(repr(sorted(meta.items())).encode("utf-8")).hexdigest()[:16]
 
 
 class GamesResponseCache:
-    """Small in-process cache for `GameResponse[]` lists."""
-
-    def __init__(self, *, ttl_seconds: int):
-        self._ttl = timedelta(seconds=int(ttl_seconds))
-        self._entries: Dict[str, GamesCacheEntry] = {}
+    """
+    Small in-process cache for `GameResponse[]` lists (bounded LRU + TTL).
+
+    Alongside each list it keeps pre-encoded responses (`EncodedGamesResponse`) keyed by
+    `{key}|{meta fingerprint}`; they are dropped whenever the underlying list is replaced,
+    deleted or invalidated, so the next request re-encodes from fresh odds.
+    """
+
+    def __init__(self, *, ttl_seconds: int, max_entries: int = 64, max_bytes: int = 32 * 1024 * 1024):
+        self._ttl = int(ttl_seconds)
+        self._entries = LocalTtlCache(
+            "games_response",
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            stale_grace_seconds=0,
+        )
+        self._encoded = LocalTtlCache(
+            "games_response_encoded",
+            max_entries=max_entries * 2,
+            max_bytes=max_bytes // 4,
+            stale_grace_seconds=0,
+        )
 
     def get(self, key: str) -> Optional[List[GameResponse]]:
-        entry = self._entries.get(key)
-        if entry is None:
-            return None
-        if datetime.now() - entry.cached_at >= self._ttl:
-            self._entries.pop(key, None)
-            return None
-        return entry.data
+        return self._entries.get(key)
 
     def age_seconds(self, key: str) -> Optional[float]:
-        entry = self._entries.get(key)
-        if entry is None:
+        stored_at = self._entries.stored_at(key)
+        if stored_at is None:
             return None
-        return (datetime.now() - entry.cached_at).total_seconds()
+        return time.time() - stored_at
 
     def set(self, key: str, data: List[GameResponse]) -> None:
-        self._entries[key] = GamesCacheEntry(data=data, cached_at=datetime.now())
+        self._drop_encoded(lambda k: k == key)
+        self._entries.set(key, data, ttl=self._ttl)
+
+    def get_encoded(
+        self,
+        key: str,
+        fingerprint: str,
+        window_start_utc: datetime,
+        window_end_utc: datetime,
+    ) -> Optional[EncodedGamesResponse]:
+        entry: Optional[EncodedGamesResponse] = self._encoded.get(f"{key}|{fingerprint}")
+        if entry is None or not entry.matches_window(window_start_utc, window_end_utc):
+            return None
+        return entry
+
+    def set_encoded(self, key: str, fingerprint: str, entry: EncodedGamesResponse) -> None:
+        # Never outlive the list it was built from.
+        ttl = self._ttl
+        age = self.age_seconds(key)
+        if age is not None:
+            ttl = max(1.0, self._ttl - age)
+        self._encoded.set(f"{key}|{fingerprint}", entry, ttl=ttl, size=len(entry.body) + len(entry.body_gzip) + 256)
 
     def delete(self, key: str) -> None:
-        self._entries.pop(key, None)
+        self._entries.delete(key)
+        self._drop_encoded(lambda k: k == key)
+
+    def invalidate_sport(self, slug: str) -> int:
+        """Drop every list cached for `slug` (keys are `slug` or `{slug}_week_{n}`)."""
+        slug = (slug or "").strip().lower()
+
+        def _is_sport(k: str) -> bool:
+            return k == slug or k.startswith(f"{slug}_week_")
+
+        self._drop_encoded(_is_sport)
+        return self._entries.delete_where(_is_sport)
 
     def clear(self) -> None:
         self._entries.clear()
+        self._encoded.clear()
+
+    def _drop_encoded(self, predicate) -> int:
+        return self._encoded.delete_where(lambda k: predicate(k.split("|", 1)[0]))
 
 
 # Singleton cache (10 minutes)
 games_response_cache = GamesResponseCache(ttl_seconds=600)
-
-
-
@@ -5,10 +5,13 @@ Gorilla Bot API routes.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+import json
+import logging
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -20,6 +23,8 @@ from app.services.gorilla_bot.conversation_repository import GorillaBotConversat
 from app.services.gorilla_bot.message_repository import GorillaBotMessageRepository
 from app.services.gorilla_bot.gorilla_bot_manager import GorillaBotManager
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -120,6 +125,54 @@ async def chat_gorilla_bot(
     )
 
 
+def _sse_frame(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/gorilla-bot/chat/stream")
+@rate_limit("60/hour")
+async def stream_chat_gorilla_bot(
+    request: Request,
+    payload: GorillaBotChatRequest,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Server-Sent Events variant of `/gorilla-bot/chat`.
+
+    Emits `start` (conversation_id, citations), then `token` frames as the model writes,
+    then `done` (message_id and the final sanitized reply) once the reply is saved.
+    """
+    _ = request
+    if not settings.gorilla_bot_enabled:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Gorilla Bot is disabled.")
+
+    parser = GorillaBotRequestParser()
+    conversation_id = parser.parse_conversation_id(payload.conversation_id)
+    manager = GorillaBotManager(db)
+
+    try:
+        chat_stream = await manager.start_chat_stream(user, payload.message, conversation_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
+
+    async def _frames():
+        try:
+            async for event in chat_stream.events():
+                yield _sse_frame(event.event, event.data)
+        except Exception as exc:
+            logger.warning("Gorilla Bot stream aborted: %s", exc)
+            yield _sse_frame("error", {"detail": "Gorilla Bot could not finish this reply."})
+
+    return StreamingResponse(
+        _frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/gorilla-bot/conversations", response_model=List[GorillaBotConversationSummaryResponse])
 @rate_limit("120/hour")
 async def list_gorilla_bot_conversations(
@@ -13,6 +13,7 @@ from app.core.dependencies import get_db
 from app.models.parlay import Parlay
 from app.models.user import User
 from app.models.game import Game
+from app.services.tiered_cache import tiered_cache_stats
 
 router = APIRouter()
 
@@ -29,6 +30,7 @@ async def get_metrics(
         - System metrics (CPU, memory, disk)
         - Database metrics (connection pool, table counts)
         - Application metrics (users, parlays, games)
+        - In-process cache stats per namespace (entries, estimated bytes, hits/evictions)
     """
     try:
         # System metrics
@@ -84,6 +86,7 @@ async def get_metrics(
             },
             "database": db_metrics,
             "application": app_metrics,
+            "caches": tiered_cache_stats(),
         }
     except Exception as e:
         return {
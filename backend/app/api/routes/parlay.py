@@ -19,6 +19,7 @@ from app.core.config import settings
 from app.core.event_logger import log_event
 from app.models.user import User
 from app.schemas.parlay import (
+    ParlayExplanationStatus,
     ParlayRequest,
     ParlayResponse,
     ParlaySuggestError,
@@ -41,6 +42,7 @@ from app.core.safety_mode import (
 from app.core import telemetry
 from app.services.mixed_sports_parlay import MixedSportsParlayBuilder
 from app.services.openai_service import OpenAIService
+from app.services.parlay_explanation_jobs import STATUS_PENDING, STATUS_READY, get_parlay_explanation_jobs
 from app.services.parlay_explanation_manager import ParlayExplanationManager
 from app.services.cache_manager import CacheManager
 from app.services.badge_service import BadgeService
@@ -48,6 +50,7 @@ from app.services.subscription_service import SubscriptionService
 from app.services.guards.generator_guard import get_generator_guard
 from app.utils.memory import log_mem
 from app.models.parlay import Parlay
+from app.services.leaderboards.leaderboard_totals_service import LeaderboardTotalsService
 from app.middleware.rate_limiter import rate_limit
 import uuid
 
@@ -156,8 +159,15 @@ async def _prepare_parlay_response(
     requested_legs: Optional[int] = None,
     final_legs: Optional[int] = None,
     degraded_policies_applied: Optional[List[str]] = None,
+    defer_explanation: bool = False,
 ) -> ParlayResponse:
-    """Generate AI explanation (fail-safe), persist parlay, and return ParlayResponse."""
+    """
+    Generate AI explanation (fail-safe), persist parlay, and return ParlayResponse.
+
+    With `defer_explanation`, a cached explanation is used if there is one; otherwise the
+    parlay is saved with a provisional write-up and `explanation_status="pending"`, and the
+    caller schedules the real one (`ParlayExplanationJobs`).
+    """
     # Defensive validation
     if not parlay_data or not isinstance(parlay_data, dict):
         raise ValueError("parlay_data must be a non-empty dictionary")
@@ -169,9 +179,17 @@ async def _prepare_parlay_response(
     
     explanation_fallback_used = False
     explanation_fallback_error_type: Optional[str] = None
+    explanation_status: Optional[str] = None
 
     if explanation_override:
         explanation = explanation_override
+    elif defer_explanation:
+        manager = ParlayExplanationManager(openai_service=openai_service)
+        explanation = await manager.get_cached_explanation(parlay_data, risk_profile)
+        explanation_status = STATUS_READY
+        if explanation is None:
+            explanation = manager.provisional_explanation(parlay_data, risk_profile)
+            explanation_status = STATUS_PENDING
     else:
         manager = ParlayExplanationManager(openai_service=openai_service)
         explanation, explanation_fallback_used, explanation_fallback_error_type = (
@@ -209,6 +227,7 @@ async def _prepare_parlay_response(
         db.add(parlay)
         await db.flush()
         parlay_id = str(parlay.id)
+        await LeaderboardTotalsService(db).record_ai_generation(parlay.user_id)
         
         # Create parlay_legs records for settlement tracking
         try:
@@ -261,6 +280,8 @@ async def _prepare_parlay_response(
         requested_legs=requested_legs,
         final_legs=final_legs,
         degraded_policies_applied=degraded_policies_applied,
+        explanation_status=explanation_status,
+        explanation_token=parlay_id if explanation_status == STATUS_PENDING else None,
     )
 
     return response
@@ -825,6 +846,7 @@ async def suggest_parlay(
                 requested_legs=requested_legs_orig,
                 final_legs=int(parlay_data.get("num_legs", 0)),
                 degraded_policies_applied=degraded_policies if safety_yellow_reasons else None,
+                defer_explanation=parlay_request.async_explanation,
             )
         except Exception as e:
             telemetry.inc("generation_failures_5m")
@@ -863,6 +885,19 @@ async def suggest_parlay(
         try:
             await db.commit()
             
+            # The parlay row exists now; generate the deferred explanation in the background.
+            if response.explanation_status == STATUS_PENDING:
+                jobs = get_parlay_explanation_jobs()
+                await jobs.mark_pending(response.id)
+                jobs.schedule(
+                    parlay_id=response.id,
+                    parlay_data=parlay_data,
+                    risk_profile=parlay_request.risk_profile,
+                    user_id=str(current_user.id),
+                    request_id=trace_id,
+                    sports=sports,
+                )
+            
             # Consume parlay access (free or purchased) AFTER successful generation
             await consume_parlay_access(current_user, db, access_info)
             
@@ -1081,6 +1116,33 @@ async def suggest_parlay(
         raise HTTPException(status_code=500, detail=detail)
 
 
+@router.get("/parlay/{parlay_id}/explanation", response_model=ParlayExplanationStatus)
+async def get_parlay_explanation(
+    parlay_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Poll a deferred (`async_explanation=true`) parlay explanation."""
+    try:
+        parlay_uuid = uuid.UUID(parlay_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Parlay not found")
+    parlay = await db.get(Parlay, parlay_uuid)
+    if parlay is None or str(parlay.user_id) != str(current_user.id):
+        raise HTTPException(status_code=404, detail="Parlay not found")
+
+    entry = await get_parlay_explanation_jobs().get_status(parlay_id)
+    if entry:
+        return ParlayExplanationStatus(**entry)
+    # No (or expired) status entry: whatever is on the row is final.
+    return ParlayExplanationStatus(
+        parlay_id=parlay_id,
+        status=STATUS_READY,
+        ai_summary=parlay.ai_summary,
+        ai_risk_notes=parlay.ai_risk_notes,
+    )
+
+
 @router.post("/parlay/suggest/triple", response_model=TripleParlayResponse)
 @rate_limit("10/hour")
 async def suggest_triple_parlay(
@@ -1154,7 +1216,9 @@ async def suggest_triple_parlay(
                 leg_overrides=leg_overrides,
             )
             openai_service = OpenAIService()
-            ai_explanations = await openai_service.generate_triple_parlay_explanations(triple_data)
+            ai_explanations = await ParlayExplanationManager(openai_service=openai_service).get_triple_explanations(
+                triple_data
+            )
             responses: Dict[str, ParlayResponse] = {}
             metadata: Dict[str, Dict] = {}
 
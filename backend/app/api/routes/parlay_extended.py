@@ -12,6 +12,7 @@ from app.models.parlay import Parlay
 from app.models.user import User
 from app.schemas.parlay import ParlayResponse
 from app.services.parlay_builder import ParlayBuilderService
+from app.services.leaderboards.leaderboard_totals_service import LeaderboardTotalsService
 from app.services.upset_finder import get_upset_finder
 from app.core.model_config import MODEL_VERSION
 
@@ -49,6 +50,8 @@ async def generate_20_leg_parlay(
             ai_risk_notes=parlay_data.get("ai_risk_notes"),
         )
         db.add(parlay)
+        await db.flush()
+        await LeaderboardTotalsService(db).record_ai_generation(parlay.user_id)
         await db.commit()
         await db.refresh(parlay)
         
@@ -28,6 +28,7 @@ from app.models.saved_parlay import InscriptionStatus, SavedParlay, SavedParlayT
 from app.models.saved_parlay_results import SavedParlayResult
 from app.models.user import User
 from app.schemas.saved_parlay import SaveAiParlayRequest, SaveCustomParlayRequest, SavedParlayResponse
+from app.services.leaderboards.leaderboard_totals_service import LeaderboardTotalsService
 from app.services.parlay_grading import ParlayLegStatus, ParlayOutcomeCalculator
 from app.services.saved_parlay_tracker import SavedParlayTrackerService
 from app.services.saved_parlays.saved_parlay_inscription_service import SavedParlayInscriptionService
@@ -186,6 +187,7 @@ async def save_custom_parlay(
     )
     db.add(saved)
     await db.flush()
+    await LeaderboardTotalsService(db).record_ai_generation(saved.user_id, at=now)
     
     # Create parlay_legs records for settlement tracking
     try:
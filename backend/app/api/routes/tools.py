@@ -11,6 +11,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.access_control import get_optional_user_access
 from app.core.event_logger import log_event
@@ -20,7 +21,7 @@ from app.models.game import Game
 from app.models.game_analysis import GameAnalysis
 from app.schemas.tools import HeatmapProbabilityResponse, UpsetFinderToolsResponse
 from app.services.analysis.analysis_repository import AnalysisRepository
-from app.services.model_win_probability import compute_game_win_probability
+from app.services.model_win_probability import SlateGame, compute_slate_win_probabilities
 from app.services.odds_snapshot_builder import OddsSnapshotBuilder
 from app.services.sports_config import get_sport_config
 from app.services.subscription_access_level import UserAccessLevel
@@ -43,7 +44,8 @@ async def get_heatmap_probabilities(
 
     For each game:
     - If cached analysis exists: extract probabilities from analysis_content
-    - If not cached: calculate lightweight probabilities using compute_game_win_probability
+    - If not cached: calculate probabilities for the remaining slate in one batch using
+      compute_slate_win_probabilities (team stats/injuries fetched once per team)
 
     Returns probabilities for H2H markets and confidence scores for spreads/totals.
     """
@@ -75,9 +77,10 @@ async def get_heatmap_probabilities(
         analysis_repo = AnalysisRepository(db)
         odds_snapshot_builder = OddsSnapshotBuilder()
 
-        responses: List[HeatmapProbabilityResponse] = []
+        responses: List[Optional[HeatmapProbabilityResponse]] = [None] * len(games)
+        uncached: List[int] = []
 
-        for game in games:
+        for index, game in enumerate(games):
             try:
                 # Check for cached analysis
                 cached_analysis = await analysis_repo.get_by_game_id(
@@ -110,57 +113,70 @@ async def get_heatmap_probabilities(
                         except (ValueError, TypeError):
                             total_confidence = None
 
-                    responses.append(HeatmapProbabilityResponse(
+                    responses[index] = HeatmapProbabilityResponse(
                         game_id=str(game.id),
                         home_win_prob=home_win_prob,
                         away_win_prob=away_win_prob,
                         spread_confidence=spread_confidence,
                         total_confidence=total_confidence,
                         has_cached_analysis=True,
-                    ))
-                else:
-                    # Calculate lightweight probabilities
-                    from app.models.market import Market
-                    markets_result = await db.execute(
-                        select(Market).where(Market.game_id == game.id)
-                    )
-                    markets = markets_result.scalars().all()
-
-                    odds_snapshot = odds_snapshot_builder.build(game=game, markets=markets)
-                    matchup_data = {}
-
-                    model_result = await compute_game_win_probability(
-                        db=db,
-                        home_team=game.home_team,
-                        away_team=game.away_team,
-                        sport=game.sport,
-                        matchup_data=matchup_data,
-                        odds_data=odds_snapshot,
                     )
+                else:
+                    uncached.append(index)
+            except Exception as e:
+                logger.warning("heatmap_probabilities game_error game_id=%s error=%s", game.id, e)
 
-                    home_win_prob = float(model_result.get("home_model_prob", 0.5))
-                    away_win_prob = float(model_result.get("away_model_prob", 0.5))
-
-                    responses.append(HeatmapProbabilityResponse(
-                        game_id=str(game.id),
-                        home_win_prob=home_win_prob,
-                        away_win_prob=away_win_prob,
+        # Calculate probabilities for the rest of the slate in one batch
+        if uncached:
+            try:
+                from app.models.market import Market
+                markets_result = await db.execute(
+                    select(Market)
+                    .where(Market.game_id.in_([games[i].id for i in uncached]))
+                    .options(selectinload(Market.odds))
+                )
+                markets_by_game: Dict[Any, List[Any]] = {}
+                for market in markets_result.scalars().all():
+                    markets_by_game.setdefault(market.game_id, []).append(market)
+
+                slate = [
+                    SlateGame(
+                        home_team=games[i].home_team,
+                        away_team=games[i].away_team,
+                        sport=games[i].sport,
+                        odds_data=odds_snapshot_builder.build(
+                            game=games[i], markets=markets_by_game.get(games[i].id, [])
+                        ),
+                        game_id=str(games[i].id),
+                        game_time=games[i].start_time,
+                    )
+                    for i in uncached
+                ]
+                model_results = await compute_slate_win_probabilities(db, slate)
+                for i, model_result in zip(uncached, model_results):
+                    responses[i] = HeatmapProbabilityResponse(
+                        game_id=str(games[i].id),
+                        home_win_prob=float(model_result.get("home_model_prob", 0.5)),
+                        away_win_prob=float(model_result.get("away_model_prob", 0.5)),
                         spread_confidence=None,
                         total_confidence=None,
                         has_cached_analysis=False,
-                    ))
+                    )
             except Exception as e:
-                logger.warning("heatmap_probabilities game_error game_id=%s error=%s", game.id, e)
-                responses.append(HeatmapProbabilityResponse(
-                    game_id=str(game.id),
-                    home_win_prob=0.5,
-                    away_win_prob=0.5,
-                    spread_confidence=None,
-                    total_confidence=None,
-                    has_cached_analysis=False,
-                ))
-
-        return responses
+                logger.warning("heatmap_probabilities slate_error sport=%s games=%s error=%s", sport, len(uncached), e)
+
+        return [
+            response
+            or HeatmapProbabilityResponse(
+                game_id=str(game.id),
+                home_win_prob=0.5,
+                away_win_prob=0.5,
+                spread_confidence=None,
+                total_confidence=None,
+                has_cached_analysis=False,
+            )
+            for game, response in zip(games, responses)
+        ]
     except HTTPException:
         raise
     except Exception as e:
@@ -29,6 +29,16 @@ class Settings(BaseSettings):
     # - Distributed Odds API cache (credits protection across instances)
     # - Scheduler leader election (prevents duplicate jobs in multi-instance deploys)
     redis_url: str = ""
+    # Redis cache value codec: serializer auto|msgpack|json, compression auto|zstd|zlib|none
+    # ("auto" uses msgpack/zstd when installed). Bodies below the threshold are not compressed.
+    redis_cache_serializer: str = "auto"
+    redis_cache_compression: str = "auto"
+    redis_cache_compress_min_bytes: int = 1024
+    # Default bounds for each in-process (L1) cache namespace; LRU-evicted beyond these.
+    tiered_cache_l1_max_entries: int = 1024
+    tiered_cache_l1_max_bytes: int = 16 * 1024 * 1024
+    # How long expired L1 entries stay readable as stale fallbacks before being purged.
+    tiered_cache_stale_grace_seconds: int = 3600
     # Odds API caching policy (credits protection)
     odds_api_cache_ttl_seconds: int = 172800  # 48 hours
     # Stats platform v2 TTLs (hours)
@@ -56,6 +66,8 @@ class Settings(BaseSettings):
     gorilla_bot_chat_timeout_seconds: float = 30.0
     gorilla_bot_kb_path: str = "docs/gorilla-bot/kb"
     gorilla_bot_max_context_chunks: int = 6
+    # How often the in-process KB vector index re-checks document checksums (non-pgvector path).
+    gorilla_bot_index_refresh_seconds: float = 60.0
     gorilla_bot_max_response_tokens: int = 700
     # Optional APIs (for enhanced features)
     # NOTE: Sportsradar has been removed. API-Sports is now the primary sports data source.
@@ -95,6 +107,14 @@ class Settings(BaseSettings):
     getty_images_api_secret: Optional[str] = None  # Getty Images API secret (required with API key for OAuth2)
     pexels_api_key: Optional[str] = None  # For team action photos (better quality, 200 req/hour free)
     unsplash_access_key: Optional[str] = None  # For team action photos (50 req/hour free)
+    # Shared outbound HTTP client (app/services/http): pool limits and default timeouts.
+    # Per-call timeouts passed by fetchers override the defaults.
+    http_client_max_connections: int = 200
+    http_client_max_keepalive_connections: int = 50
+    http_client_keepalive_expiry_seconds: float = 30.0
+    http_client_timeout_seconds: float = 15.0
+    http_client_connect_timeout_seconds: float = 5.0
+    http_client_http2: bool = True
     # Application URLs
     backend_url: str = "http://localhost:8000"
     frontend_url: str = "http://localhost:3000"
@@ -195,6 +215,13 @@ class Settings(BaseSettings):
     parlay_max_odds_rows_processed: int = 600
     # Short-lived cache for candidate legs per sport/day to absorb ad bursts (seconds)
     candidate_legs_cache_ttl_seconds: int = 45
+    # After the TTL, serve the stale pool for this long while one background task rebuilds it.
+    candidate_legs_cache_stale_seconds: int = 120
+    # Memoized same-game joint probabilities (per game/profile/leg group); dropped on odds updates.
+    joint_probability_cache_max_entries: int = 4096
+    joint_probability_cache_ttl_seconds: int = 900
+    # Share memoized joint probabilities across instances via Redis (adds a round-trip per miss).
+    joint_probability_cache_redis_enabled: bool = False
 
     # Analysis detail endpoint should never hang while attempting probability refresh.
     analysis_probability_refresh_timeout_seconds: float = 8.0
@@ -206,14 +233,20 @@ class Settings(BaseSettings):
     analysis_core_timeout_seconds: float = 8.0
     # Optional: short OpenAI polishing pass for core copy (kept very small).
     analysis_core_ai_polish_timeout_seconds: float = 4.0
-    # Long-form article generation runs in background (best-effort).
+    # Long-form article generation runs in background via a durable job queue.
     analysis_full_article_enabled: bool = True
     analysis_full_article_timeout_seconds: float = 90.0
+    # Articles the full-article worker generates at once.
+    analysis_full_article_worker_concurrency: int = 3
     # How long analysis core should be considered fresh before being regenerated
     # by background jobs. User traffic should not force regeneration.
     analysis_cache_ttl_hours: float = 48.0
     # Non-NFL leagues (NBA/NHL/MLB/etc.) have more frequent slates; keep analyses fresher.
     analysis_cache_ttl_hours_non_nfl: float = 24.0
+    # Scheduler analysis generation: parallel workers (each with its own DB session) and the
+    # max OpenAI polish calls in flight across them.
+    analysis_generation_workers: int = 4
+    analysis_generation_openai_max_concurrent: int = 2
     
     # Background Jobs
     enable_background_jobs: bool = True
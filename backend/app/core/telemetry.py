@@ -11,13 +11,21 @@ from __future__ import annotations
 
 import json
 import time
-from collections import deque
 from threading import Lock
 from typing import Any, Dict, List, Optional
 
-# Rolling windows: (timestamp, count) or just timestamps for event counts
+# Rolling windows (seconds) and the event counters that use them
 _WINDOW_5M = 300
 _WINDOW_30M = 1800
+_ROLLING_WINDOWS: Dict[str, int] = {
+    "error_count_5m": _WINDOW_5M,
+    "generation_failures_5m": _WINDOW_5M,
+    "not_enough_games_failures_30m": _WINDOW_30M,
+    "api_429_count_30m": _WINDOW_30M,
+    "api_failures_30m": _WINDOW_30M,
+}
+# Buckets per window: 5s buckets for 5m, 30s buckets for 30m
+_BUCKETS_PER_WINDOW = 60
 
 # Keys persisted to Redis when available (TTL: refresh 48h, cooldown 1h)
 _CRITICAL_KEYS_REFRESH = ("last_successful_odds_refresh_at", "last_successful_games_refresh_at")
@@ -28,9 +36,36 @@ _TTL_REFRESH_SEC = 48 * 3600
 _TTL_COOLDOWN_SEC = 3600
 _TTL_BUDGET_SEC = 24 * 3600
 
+
+class _RollingCounter:
+    """
+    Fixed-size ring of time buckets. `add` is O(1) and allocation-free; `total` sums the
+    buckets still inside the window. Resolution is window / buckets (5s for 5m windows).
+    """
+
+    __slots__ = ("_width", "_size", "_counts", "_epochs")
+
+    def __init__(self, window_sec: int, buckets: int = _BUCKETS_PER_WINDOW):
+        self._width = window_sec / buckets
+        self._size = buckets
+        self._counts = [0] * buckets
+        self._epochs = [-1] * buckets
+
+    def add(self, n: int, now: float) -> None:
+        epoch = int(now // self._width)
+        slot = epoch % self._size
+        if self._epochs[slot] != epoch:
+            self._epochs[slot] = epoch
+            self._counts[slot] = 0
+        self._counts[slot] += n
+
+    def total(self, now: float) -> int:
+        oldest = int(now // self._width) - self._size
+        return sum(count for count, epoch in zip(self._counts, self._epochs) if epoch > oldest)
+
+
 _store: Dict[str, Any] = {}
-_timestamps_5m: Dict[str, deque] = {}
-_timestamps_30m: Dict[str, deque] = {}
+_rolling: Dict[str, _RollingCounter] = {}
 _safety_events: List[Dict[str, Any]] = []
 _lock = Lock()
 
@@ -39,31 +74,19 @@ def _now() -> float:
     return time.time()
 
 
-def _prune(deq: deque, window_sec: float) -> None:
-    cutoff = _now() - window_sec
-    while deq and deq[0] < cutoff:
-        deq.popleft()
-
-
 def inc(metric: str, n: int = 1) -> None:
     """Increment a counter or add n events to a rolling window."""
-    with _lock:
-        if metric in ("error_count_5m", "generation_failures_5m"):
-            key = metric
-            if key not in _timestamps_5m:
-                _timestamps_5m[key] = deque()
-            for _ in range(n):
-                _timestamps_5m[key].append(_now())
-            _prune(_timestamps_5m[key], _WINDOW_5M)
-        elif metric in ("not_enough_games_failures_30m", "api_429_count_30m", "api_failures_30m"):
-            key = metric
-            if key not in _timestamps_30m:
-                _timestamps_30m[key] = deque()
-            for _ in range(n):
-                _timestamps_30m[key].append(_now())
-            _prune(_timestamps_30m[key], _WINDOW_30M)
-        else:
+    window = _ROLLING_WINDOWS.get(metric)
+    if window is None:
+        with _lock:
             _store[metric] = _store.get(metric, 0) + n
+        return
+    now = _now()
+    with _lock:
+        counter = _rolling.get(metric)
+        if counter is None:
+            counter = _rolling[metric] = _RollingCounter(window)
+        counter.add(n, now)
 
 
 def set(metric: str, value: Any) -> None:
@@ -74,13 +97,11 @@ def set(metric: str, value: Any) -> None:
 
 def get(metric: str, default: Any = None) -> Any:
     """Get current value or count in window."""
+    now = _now()
     with _lock:
-        if metric in _timestamps_5m:
-            _prune(_timestamps_5m[metric], _WINDOW_5M)
-            return len(_timestamps_5m[metric])
-        if metric in _timestamps_30m:
-            _prune(_timestamps_30m[metric], _WINDOW_30M)
-            return len(_timestamps_30m[metric])
+        counter = _rolling.get(metric)
+        if counter is not None:
+            return counter.total(now)
         return _store.get(metric, default)
 
 
@@ -90,14 +111,11 @@ def get_snapshot() -> Dict[str, Any]:
     high_conf_loss_rate_24h, overall_hit_rate_7d, baseline_hit_rate_7d, performance_delta,
     correlated_legs_detected_24h, last_correlation_penalty_at.
     """
+    now = _now()
     with _lock:
         out = {k: v for k, v in _store.items() if not k.startswith("_")}
-        for k, deq in list(_timestamps_5m.items()):
-            _prune(deq, _WINDOW_5M)
-            out[k] = len(deq)
-        for k, deq in list(_timestamps_30m.items()):
-            _prune(deq, _WINDOW_30M)
-            out[k] = len(deq)
+        for k, counter in _rolling.items():
+            out[k] = counter.total(now)
     return out
 
 
@@ -125,7 +143,7 @@ def get_safety_events() -> List[Dict[str, Any]]:
 
 
 async def load_critical_from_redis() -> None:
-    """Merge critical keys from Redis into in-memory store (if Redis configured)."""
+    """Merge critical keys from Redis into in-memory store (if Redis configured). One MGET round trip."""
     try:
         from app.services.redis.redis_client_provider import get_redis_provider
         provider = get_redis_provider()
@@ -133,38 +151,42 @@ async def load_critical_from_redis() -> None:
             return
         client = provider.get_client()
         prefix = "safety_telemetry:"
-        for key in _CRITICAL_KEYS:
-            val = await client.get(f"{prefix}{key}")
-            if val is not None:
+        values = await client.mget([f"{prefix}{key}" for key in (*_CRITICAL_KEYS, "events")])
+        loaded: Dict[str, Any] = {}
+        for key, val in zip(_CRITICAL_KEYS, values):
+            if val is None:
+                continue
+            try:
+                decoded = val.decode("utf-8") if isinstance(val, bytes) else val
                 try:
-                    decoded = val.decode("utf-8") if isinstance(val, bytes) else val
-                    try:
-                        num = float(decoded)
-                        use = int(num) if num == int(num) else num
-                    except ValueError:
-                        use = decoded
-                    with _lock:
-                        _store[key] = use
-                except Exception:
-                    pass
-        # Load events ring buffer
-        raw = await client.get(f"{prefix}events")
+                    num = float(decoded)
+                    use = int(num) if num == int(num) else num
+                except ValueError:
+                    use = decoded
+                loaded[key] = use
+            except Exception:
+                pass
+        events: Optional[List[Dict[str, Any]]] = None
+        raw = values[-1]
         if raw is not None:
             try:
                 decoded = raw.decode("utf-8") if isinstance(raw, bytes) else raw
-                loaded = json.loads(decoded)
-                if isinstance(loaded, list) and loaded:
-                    with _lock:
-                        _safety_events.clear()
-                        _safety_events.extend(loaded)
+                parsed = json.loads(decoded)
+                if isinstance(parsed, list) and parsed:
+                    events = parsed
             except Exception:
                 pass
+        with _lock:
+            _store.update(loaded)
+            if events is not None:
+                _safety_events.clear()
+                _safety_events.extend(events)
     except Exception:
         pass
 
 
 async def save_critical_to_redis(snapshot: Dict[str, Any]) -> None:
-    """Write critical telemetry keys to Redis with TTL (if configured)."""
+    """Write critical telemetry keys to Redis with TTL (if configured), batched in one pipeline."""
     try:
         from app.services.redis.redis_client_provider import get_redis_provider
         provider = get_redis_provider()
@@ -173,25 +195,25 @@ async def save_critical_to_redis(snapshot: Dict[str, Any]) -> None:
         client = provider.get_client()
         prefix = "safety_telemetry:"
         telemetry = snapshot.get("telemetry") if isinstance(snapshot.get("telemetry"), dict) else snapshot
+        pipe = client.pipeline(transaction=False)
+        queued = 0
         for key in _CRITICAL_KEYS:
             val = telemetry.get(key)
             if val is None:
                 continue
-            rkey = f"{prefix}{key}"
-            str_val = str(val)
-            payload = str_val.encode("utf-8") if isinstance(str_val, str) else str_val
             if key in _CRITICAL_KEYS_COOLDOWN:
-                await client.set(rkey, payload, ex=_TTL_COOLDOWN_SEC)
+                ttl = _TTL_COOLDOWN_SEC
             elif key in _CRITICAL_KEYS_BUDGET:
-                await client.set(rkey, payload, ex=_TTL_BUDGET_SEC)
+                ttl = _TTL_BUDGET_SEC
             else:
-                await client.set(rkey, payload, ex=_TTL_REFRESH_SEC)
+                ttl = _TTL_REFRESH_SEC
+            pipe.set(f"{prefix}{key}", str(val).encode("utf-8"), ex=ttl)
+            queued += 1
         events = get_safety_events()
         if events:
-            await client.set(
-                f"{prefix}events",
-                json.dumps(events).encode("utf-8"),
-                ex=_TTL_REFRESH_SEC,
-            )
+            pipe.set(f"{prefix}events", json.dumps(events).encode("utf-8"), ex=_TTL_REFRESH_SEC)
+            queued += 1
+        if queued:
+            await pipe.execute()
     except Exception:
         pass
@@ -556,6 +556,18 @@ async def startup_event():
     else:
         print("[STARTUP] Scheduler runs as standalone process (SCHEDULER_STANDALONE=true); skipping in-process scheduler")
 
+    # Receive odds change events ingested by other instances (e.g. the standalone scheduler).
+    try:
+        from app.services.odds_api.odds_change_feed import get_odds_change_bus
+        if get_odds_change_bus().start_listener():
+            print("[STARTUP] Odds change feed listener started")
+    except Exception as feed_error:
+        print(f"[STARTUP] Warning: Odds change feed listener failed to start: {feed_error}")
+
+    # Batch ParlayCache hit counts recorded by cache reads on this instance.
+    from app.services.parlay_cache_hit_buffer import get_parlay_cache_hit_buffer
+    get_parlay_cache_hit_buffer().start_flusher()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -564,6 +576,26 @@ async def shutdown_event():
         from app.services.scheduler import get_scheduler
         scheduler = get_scheduler()
         await scheduler.stop()
+    try:
+        from app.services.odds_api.odds_change_feed import get_odds_change_bus
+        await get_odds_change_bus().stop_listener()
+    except Exception as feed_error:
+        print(f"[SHUTDOWN] Warning: Odds change feed listener failed to stop: {feed_error}")
+    try:
+        from app.services.parlay_cache_hit_buffer import get_parlay_cache_hit_buffer
+        await get_parlay_cache_hit_buffer().stop_flusher()
+    except Exception as flusher_error:
+        print(f"[SHUTDOWN] Warning: ParlayCache hit flusher failed to stop: {flusher_error}")
+    try:
+        from app.services.parlay_explanation_jobs import get_parlay_explanation_jobs
+        await get_parlay_explanation_jobs().drain(timeout=15)
+    except Exception as jobs_error:
+        print(f"[SHUTDOWN] Warning: Parlay explanation jobs failed to drain: {jobs_error}")
+    try:
+        from app.services.http.shared_http_client import close_http_clients
+        await close_http_clients()
+    except Exception as http_error:
+        print(f"[SHUTDOWN] Warning: Shared HTTP clients failed to close: {http_error}")
     from app.database.session import engine
     await engine.dispose()
 
@@ -6,11 +6,14 @@ from app.models.odds import Odds
 from app.models.parlay import Parlay
 from app.models.parlay_leg import ParlayLeg
 from app.models.parlay_feed_event import ParlayFeedEvent
+from app.models.settlement_job import SettlementJob
 from app.models.system_heartbeat import SystemHeartbeat
 from app.models.saved_parlay import SavedParlay, SavedParlayType, InscriptionStatus
 from app.models.saved_parlay_results import SavedParlayResult
 from app.models.arcade_points_event import ArcadePointsEvent
 from app.models.arcade_points_totals import ArcadePointsTotals
+from app.models.verified_winner_totals import VerifiedWinnerTotals
+from app.models.ai_usage_totals import AiUsageTotals
 from app.models.user import User, UserRole, UserPlan, SubscriptionStatusEnum
 from app.models.parlay_cache import ParlayCache
 from app.models.shared_parlay import SharedParlay, ParlayLike
@@ -19,6 +22,7 @@ from app.models.game_results import GameResult
 from app.models.parlay_results import ParlayResult
 from app.models.market_efficiency import MarketEfficiency
 from app.models.game_analysis import GameAnalysis
+from app.models.full_article_job import FullArticleJob
 from app.models.push_subscription import PushSubscription
 from app.models.analysis_page_views import AnalysisPageViews
 from app.models.watched_game import WatchedGame
@@ -93,14 +97,15 @@ from app.models.calibration_bin import CalibrationBin
 __all__ = [
     # Core models
     "Game", "Market", "Odds", "Parlay",
-    "ParlayLeg", "ParlayFeedEvent", "SystemHeartbeat",
+    "ParlayLeg", "ParlayFeedEvent", "SettlementJob", "SystemHeartbeat",
     "SavedParlay", "SavedParlayType", "InscriptionStatus",
     "SavedParlayResult",
-    "ArcadePointsEvent", "ArcadePointsTotals",
+    "ArcadePointsEvent", "ArcadePointsTotals", "VerifiedWinnerTotals", "AiUsageTotals",
     "TeamStats", "GameResult", "ParlayResult", "MarketEfficiency",
     "User", "UserRole", "UserPlan", "SubscriptionStatusEnum",
     "ParlayCache", "SharedParlay", "ParlayLike",
     "GameAnalysis",
+    "FullArticleJob",
     "PushSubscription",
     "AnalysisPageViews",
     "WatchedGame",
@@ -0,0 +1,39 @@
+"""AI usage totals model - per-user aggregate for the AI Power Users leaderboard."""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer
+from sqlalchemy.sql import func
+
+from app.database.session import Base
+from app.database.types import GUID
+
+
+class AiUsageTotals(Base):
+    """
+    Per-user count of AI parlay generations plus custom saved parlays.
+
+    `total_count` is all-time; `count_30d` is incremented on each generation and
+    recomputed from source by the periodic rebuild so old activity ages out.
+    """
+
+    __tablename__ = "ai_usage_totals"
+
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    user_id = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
+
+    total_count = Column(Integer, nullable=False, default=0)
+    count_30d = Column(Integer, nullable=False, default=0)
+    last_generated_at = Column(DateTime(timezone=True), nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("idx_ai_usage_totals_all_time", "total_count", "last_generated_at"),
+        Index("idx_ai_usage_totals_30d", "count_30d", "last_generated_at"),
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<AiUsageTotals(user_id={self.user_id}, total={self.total_count}, last_30d={self.count_30d})>"
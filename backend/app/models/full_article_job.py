@@ -0,0 +1,39 @@
+"""Full-article job queue (DB fallback when Redis is not configured or unavailable).
+
+One row per analysis whose long-form article still needs generating. Producers upsert
+(dedupe by analysis_id); the full-article worker claims queued rows, generates, and deletes
+the row or re-queues it with backoff.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.database.session import Base
+from app.database.types import GUID
+
+
+class FullArticleJob(Base):
+    __tablename__ = "full_article_jobs"
+
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    # One open job per analysis; re-enqueueing keeps the existing row.
+    analysis_id = Column(GUID(), ForeignKey("game_analyses.id", ondelete="CASCADE"), nullable=False, unique=True)
+
+    status = Column(String(20), nullable=False, default="queued")  # queued, processing
+    attempts = Column(Integer, nullable=False, default=0)
+    available_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("idx_full_article_jobs_status_available", "status", "available_at"),
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<FullArticleJob(analysis_id={self.analysis_id}, status={self.status}, attempts={self.attempts})>"
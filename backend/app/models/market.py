@@ -26,6 +26,8 @@ class Market(Base):
     __table_args__ = (
         Index("idx_market_game_type", "game_id", "market_type"),
         Index("idx_market_book", "book"),
+        # One market per (game, type, book); target of the bulk odds ingestion upsert.
+        Index("uq_markets_game_type_book", "game_id", "market_type", "book", unique=True),
     )
     
     def __repr__(self):
@@ -30,6 +30,8 @@ class Odds(Base):
     __table_args__ = (
         Index("idx_odds_market_created", "market_id", "created_at"),
         Index("idx_odds_implied_prob", "implied_prob"),
+        # Latest price per market outcome; target of the bulk odds ingestion upsert.
+        Index("uq_odds_market_outcome", "market_id", "outcome", unique=True),
     )
     
     def __repr__(self):
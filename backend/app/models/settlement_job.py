@@ -0,0 +1,39 @@
+"""Settlement job outbox: one row per game whose legs need settling.
+
+Written in the same transaction that moves a game to FINAL, so the job exists iff the
+status change committed. The settlement worker claims queued rows, settles the game's
+legs, and deletes the row (at-least-once; settling twice is a no-op).
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.database.session import Base
+from app.database.types import GUID
+
+
+class SettlementJob(Base):
+    __tablename__ = "settlement_jobs"
+
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    # One open job per game; re-enqueueing an existing game re-queues its row.
+    game_id = Column(GUID(), ForeignKey("games.id", ondelete="CASCADE"), nullable=False, unique=True)
+
+    status = Column(String(20), nullable=False, default="queued")  # queued, processing
+    attempts = Column(Integer, nullable=False, default=0)
+    available_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("idx_settlement_jobs_status_available", "status", "available_at"),
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<SettlementJob(game_id={self.game_id}, status={self.status}, attempts={self.attempts})>"
@@ -0,0 +1,41 @@
+"""Verified Winners totals model - per-user aggregate for fast leaderboard queries."""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.sql import func
+
+from app.database.session import Base
+from app.database.types import GUID
+
+
+class VerifiedWinnerTotals(Base):
+    """
+    Per-user aggregate of resolved, verified custom saved parlays.
+
+    Maintained by `LeaderboardTotalsService`: refreshed per user when a saved parlay
+    resolves or a verification confirms, and rebuilt in full periodically.
+    """
+
+    __tablename__ = "verified_winner_totals"
+
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    user_id = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
+
+    verified_wins = Column(Integer, nullable=False, default=0)
+    verified_resolved = Column(Integer, nullable=False, default=0)
+    win_rate = Column(Float, nullable=False, default=0.0)
+    last_win_at = Column(DateTime(timezone=True), nullable=True)
+    last_win_inscription_id = Column(String(255), nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Matches the leaderboard ORDER BY so top-N reads walk the index.
+        Index("idx_verified_winner_totals_rank", "verified_wins", "win_rate", "last_win_at"),
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<VerifiedWinnerTotals(user_id={self.user_id}, wins={self.verified_wins}, resolved={self.verified_resolved})>"
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
@@ -182,6 +182,26 @@ class SportsDataRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_team_stats_many(
+        self,
+        sport: str,
+        team_ids: Iterable[int],
+    ) -> Dict[int, ApisportsTeamStat]:
+        """Return latest team stats per team_id for sport in one query (missing teams omitted)."""
+        ids = list({tid for tid in team_ids if tid is not None})
+        if not ids:
+            return {}
+        result = await self._db.execute(
+            select(ApisportsTeamStat).where(
+                ApisportsTeamStat.sport == sport,
+                ApisportsTeamStat.team_id.in_(ids),
+            ).order_by(ApisportsTeamStat.last_fetched_at.desc())
+        )
+        latest: Dict[int, ApisportsTeamStat] = {}
+        for row in result.scalars().all():
+            latest.setdefault(row.team_id, row)
+        return latest
+
     # ---------- Standings ----------
 
     async def upsert_standings(
@@ -92,6 +92,14 @@ class ParlayRequest(BaseModel):
         default=False,
         description="Include player props in AI parlay generation (premium feature). Only available for premium users."
     )
+    async_explanation: bool = Field(
+        default=False,
+        description=(
+            "Return picks without waiting for the AI write-up. The response carries a provisional "
+            "explanation and explanation_status='pending'; the final text is pushed on /ws/user and "
+            "served by GET /parlay/{explanation_token}/explanation."
+        ),
+    )
 
 
 class BadgeInfo(BaseModel):
@@ -173,6 +181,18 @@ class ParlayResponse(BaseModel):
     requested_legs: Optional[int] = Field(default=None, description="Legs requested by client")
     final_legs: Optional[int] = Field(default=None, description="Legs in response (may be capped in YELLOW)")
     degraded_policies_applied: Optional[List[str]] = Field(default=None, description="e.g. ['cap_legs']")
+    # Deferred AI explanation (async_explanation=true)
+    explanation_status: Optional[str] = Field(default=None, description="pending | ready")
+    explanation_token: Optional[str] = Field(default=None, description="Poll /parlay/{token}/explanation while pending")
+
+
+class ParlayExplanationStatus(BaseModel):
+    """Status of a deferred parlay explanation"""
+    parlay_id: str
+    status: str = Field(description="pending | ready")
+    ai_summary: Optional[str] = None
+    ai_risk_notes: Optional[str] = None
+    explanation_fallback_used: Optional[bool] = None
 
 
 class TripleParlayRequest(BaseModel):
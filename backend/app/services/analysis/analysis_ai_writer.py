@@ -7,12 +7,20 @@ polish copy when OpenAI is enabled and responsive, under strict timeouts.
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import json
 from typing import Any, Dict, Optional
 
 from app.services.openai_service import OpenAIService
 from app.services.analysis.prompt_templates import AnalysisPromptTemplates
 
+# Optional OpenAI concurrency budget for polish calls, set by batch callers (e.g. the
+# scheduler's analysis generation pipeline) so parallel workers share a bounded number of
+# in-flight requests. Unset for request-path generation.
+polish_slots: contextvars.ContextVar[Optional[asyncio.Semaphore]] = contextvars.ContextVar(
+    "analysis_polish_slots", default=None
+)
+
 
 class AnalysisAiWriter:
     def __init__(self, openai: Optional[OpenAIService] = None):
@@ -41,6 +49,43 @@ class AnalysisAiWriter:
         if not self.enabled:
             return draft
 
+        slots = polish_slots.get()
+        if slots is None:
+            return await self._polish(
+                matchup=matchup,
+                league=league,
+                model_probs=model_probs,
+                odds_snapshot=odds_snapshot,
+                draft=draft,
+                timeout_seconds=timeout_seconds,
+            )
+        # Budget exhausted for the whole timeout: skip polish rather than delay the core.
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            return draft
+        try:
+            return await self._polish(
+                matchup=matchup,
+                league=league,
+                model_probs=model_probs,
+                odds_snapshot=odds_snapshot,
+                draft=draft,
+                timeout_seconds=timeout_seconds,
+            )
+        finally:
+            slots.release()
+
+    async def _polish(
+        self,
+        *,
+        matchup: str,
+        league: str,
+        model_probs: Dict[str, Any],
+        odds_snapshot: Dict[str, Any],
+        draft: Dict[str, Any],
+        timeout_seconds: float,
+    ) -> Dict[str, Any]:
         try:
             prompt = self._build_ui_prompt(
                 matchup=matchup,
@@ -0,0 +1,218 @@
+"""Bounded-concurrency core analysis generation for scheduled backfills.
+
+The scheduler selects games that need core analysis; this pipeline generates them with a
+small worker pool instead of one game at a time:
+
+- Each worker owns its own DB session (AsyncSession is not safe to share across tasks).
+- Games are ordered by `TrafficRanker` score (recent page views, start-time proximity),
+  then start time, so the highest-traffic games are ready first.
+- OpenAI polish calls share `analysis_generation_openai_max_concurrent` slots across
+  workers (see `analysis_ai_writer.polish_slots`). If the API-Sports circuit breaker
+  opens mid-run, workers stop taking new games and the rest wait for the next run.
+- Every game emits an `analysis_generation.game` event with its duration.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+
+from app.core import telemetry
+from app.core.config import settings
+from app.core.event_logger import log_event
+from app.models.analysis_page_views import AnalysisPageViews
+from app.models.game import Game
+from app.services.analysis.analysis_ai_writer import polish_slots
+from app.services.analysis.analysis_contract import is_core_ready
+
+logger = logging.getLogger(__name__)
+
+PAGE_VIEW_WINDOW_DAYS = 2
+
+
+@dataclass
+class AnalysisGenerationTask:
+    """One game to (re)generate core analysis for."""
+    game_id: UUID
+    league: str
+    start_time: Optional[datetime] = None
+    force_regenerate: bool = False
+    reason: str = "missing"
+    priority: float = 0.0
+
+
+@dataclass
+class AnalysisGenerationResult:
+    generated: int = 0
+    failed: int = 0
+    deferred: int = 0
+    durations_ms: List[float] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, Any]:
+        durations = sorted(self.durations_ms)
+        p50 = durations[len(durations) // 2] if durations else None
+        p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))] if durations else None
+        return {
+            "generated": self.generated,
+            "failed": self.failed,
+            "deferred": self.deferred,
+            "p50_ms": round(p50, 1) if p50 is not None else None,
+            "p95_ms": round(p95, 1) if p95 is not None else None,
+        }
+
+
+class AnalysisGenerationPipeline:
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        *,
+        workers: Optional[int] = None,
+        openai_max_concurrent: Optional[int] = None,
+        core_timeout_seconds: Optional[float] = None,
+        circuit_open: Optional[Callable[[], Any]] = None,
+    ):
+        self._session_factory = session_factory
+        self._workers = max(1, int(workers or settings.analysis_generation_workers))
+        self._openai_max = max(1, int(openai_max_concurrent or settings.analysis_generation_openai_max_concurrent))
+        self._core_timeout = float(core_timeout_seconds or settings.analysis_core_timeout_seconds)
+        self._circuit_open = circuit_open or _apisports_circuit_open
+
+    async def prioritize(self, db, tasks: Sequence[AnalysisGenerationTask]) -> List[AnalysisGenerationTask]:
+        """Score tasks with TrafficRanker (one page-view query for all) and sort best first."""
+        if not tasks:
+            return []
+        from app.services.traffic_ranker import TrafficRanker
+
+        views: Dict[UUID, int] = {}
+        try:
+            result = await db.execute(
+                select(AnalysisPageViews.game_id, func.sum(AnalysisPageViews.views))
+                .where(AnalysisPageViews.game_id.in_([t.game_id for t in tasks]))
+                .where(AnalysisPageViews.view_bucket_date >= date.today() - timedelta(days=PAGE_VIEW_WINDOW_DAYS))
+                .group_by(AnalysisPageViews.game_id)
+            )
+            views = {game_id: int(total or 0) for game_id, total in result.all()}
+        except Exception as e:
+            logger.warning(f"[AnalysisGenerationPipeline] Page view lookup failed: {e}")
+
+        ranker = TrafficRanker(db)
+        for task in tasks:
+            task.priority = ranker.score(
+                {"page_views": views.get(task.game_id, 0), "start_time": task.start_time, "sport": task.league}
+            ).score
+
+        far_future = datetime.max.replace(tzinfo=timezone.utc)
+        return sorted(tasks, key=lambda t: (-t.priority, _aware(t.start_time) or far_future))
+
+    async def run(self, tasks: Sequence[AnalysisGenerationTask]) -> AnalysisGenerationResult:
+        """Generate core analysis for `tasks` in order, `workers` at a time."""
+        result = AnalysisGenerationResult()
+        if not tasks:
+            return result
+
+        queue: asyncio.Queue[AnalysisGenerationTask] = asyncio.Queue()
+        for task in tasks:
+            queue.put_nowait(task)
+        stop = asyncio.Event()
+        started = time.perf_counter()
+
+        # Workers inherit the context, so every polish call in this run shares these slots.
+        token = polish_slots.set(asyncio.Semaphore(self._openai_max))
+        try:
+            workers = [
+                asyncio.create_task(self._worker(index, queue, stop, result))
+                for index in range(min(self._workers, len(tasks)))
+            ]
+        finally:
+            polish_slots.reset(token)
+        await asyncio.gather(*workers)
+        result.deferred += queue.qsize()
+
+        summary = result.summary()
+        summary["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        summary["workers"] = len(workers)
+        log_event(logger, "analysis_generation.run", **summary)
+        telemetry.set("analysis_generation_last_run", summary)
+        return result
+
+    async def _worker(
+        self,
+        index: int,
+        queue: "asyncio.Queue[AnalysisGenerationTask]",
+        stop: asyncio.Event,
+        result: AnalysisGenerationResult,
+    ) -> None:
+        from app.services.analysis import AnalysisOrchestratorService
+
+        async with self._session_factory() as db:
+            orchestrator = AnalysisOrchestratorService(db)
+            while not stop.is_set():
+                try:
+                    task = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                if await self._circuit_open():
+                    logger.warning("[AnalysisGenerationPipeline] API-Sports circuit open; deferring remaining games")
+                    stop.set()
+                    queue.put_nowait(task)
+                    return
+
+                started = time.perf_counter()
+                status = "error"
+                try:
+                    game = await db.get(Game, task.game_id)
+                    if game is None:
+                        status = "missing_game"
+                    else:
+                        analysis = await orchestrator.ensure_core_for_game(
+                            game=game,
+                            core_timeout_seconds=self._core_timeout,
+                            force_regenerate=task.force_regenerate,
+                        )
+                        content = getattr(analysis, "analysis_content", None)
+                        status = "ready" if isinstance(content, dict) and is_core_ready(content) else "partial"
+                        result.generated += 1
+                except Exception as e:
+                    logger.warning(f"[AnalysisGenerationPipeline] Error generating analysis for game {task.game_id}: {e}")
+                    try:
+                        await db.rollback()
+                    except Exception:
+                        pass
+                if status in ("error", "missing_game"):
+                    result.failed += 1
+
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                result.durations_ms.append(elapsed_ms)
+                log_event(
+                    logger,
+                    "analysis_generation.game",
+                    game_id=str(task.game_id),
+                    league=task.league,
+                    reason=task.reason,
+                    priority=round(task.priority, 3),
+                    status=status,
+                    duration_ms=round(elapsed_ms, 1),
+                    worker=index,
+                )
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+async def _apisports_circuit_open() -> bool:
+    try:
+        from app.services.apisports.quota_manager import get_quota_manager
+
+        return bool(await get_quota_manager().is_circuit_open())
+    except Exception:
+        return False
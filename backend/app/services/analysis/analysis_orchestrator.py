@@ -62,7 +62,7 @@ class AnalysisOrchestratorService:
         # Attempt to load by requested slug (supports both prefixed and legacy).
         analysis = await self._repo.get_by_slug(league=league, slug=f"{sport_identifier.lower()}/{slug}")
         if analysis and self._repo.analysis_has_core(analysis) and not refresh:
-            self._maybe_enqueue_full_article(analysis)
+            await self._maybe_enqueue_full_article(analysis)
             return OrchestratorResult(analysis=analysis, core_generated=False)
 
         # Resolve game if needed.
@@ -97,7 +97,7 @@ class AnalysisOrchestratorService:
             # Re-check after acquiring lock.
             latest = await self._repo.get_by_game_id(league=game.sport, game_id=game.id)
             if latest and self._repo.analysis_has_core(latest) and not refresh:
-                self._maybe_enqueue_full_article(latest)
+                await self._maybe_enqueue_full_article(latest)
                 return OrchestratorResult(analysis=latest, core_generated=False)
 
             # If refresh is True, log that we're regenerating with fresh data
@@ -123,7 +123,7 @@ class AnalysisOrchestratorService:
                 force_refresh=refresh,  # Force refresh core content when refresh=true
             )
 
-            self._maybe_enqueue_full_article(upserted)
+            await self._maybe_enqueue_full_article(upserted)
             return OrchestratorResult(analysis=upserted, core_generated=True)
 
     async def ensure_core_for_game(
@@ -145,7 +145,7 @@ class AnalysisOrchestratorService:
         async with lock:
             existing = await self._repo.get_by_game_id(league=game.sport, game_id=game.id)
             if existing and self._repo.analysis_has_core(existing) and not force_regenerate:
-                self._maybe_enqueue_full_article(existing)
+                await self._maybe_enqueue_full_article(existing)
                 return existing
 
             core_content = await self._core.generate(game=game, timeout_seconds=core_timeout_seconds)
@@ -164,7 +164,7 @@ class AnalysisOrchestratorService:
                 seo_metadata=seo_metadata,
                 force_refresh=force_regenerate,  # Force refresh core content when force_regenerate=true
             )
-            self._maybe_enqueue_full_article(upserted)
+            await self._maybe_enqueue_full_article(upserted)
             
             # Trigger odds sync when analytics are updated (for Gorilla Bot)
             # This ensures odds stay fresh when new analyses are generated
@@ -182,7 +182,7 @@ class AnalysisOrchestratorService:
             
             return upserted
 
-    def _maybe_enqueue_full_article(self, analysis: GameAnalysis) -> None:
+    async def _maybe_enqueue_full_article(self, analysis: GameAnalysis) -> None:
         content = analysis.analysis_content or {}
         if not isinstance(content, dict):
             return
@@ -191,9 +191,9 @@ class AnalysisOrchestratorService:
         status = (content.get("generation") or {}).get("full_article_status")
         if status not in ("queued", "ready") and self._full_jobs.enabled:
             # Marking queued happens on next core upsert; enqueue anyway.
-            self._full_jobs.enqueue(analysis_id=str(analysis.id))
+            await self._full_jobs.enqueue(analysis_id=str(analysis.id))
         elif status == "queued" and self._full_jobs.enabled:
-            self._full_jobs.enqueue(analysis_id=str(analysis.id))
+            await self._full_jobs.enqueue(analysis_id=str(analysis.id))
 
     def _full_article_status_for(self, core_content: Dict[str, Any]) -> str:
         if is_full_article_ready(core_content):
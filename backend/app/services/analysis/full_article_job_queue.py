@@ -0,0 +1,306 @@
+"""Persistent queue for full-article generation jobs.
+
+Producers (the analysis orchestrator) enqueue analysis ids; `FullArticleWorker` claims,
+generates and acks them. Jobs survive restarts and are deduplicated by analysis_id.
+
+Backends:
+- Redis (when configured): `ready` sorted set scored by available-at time, `processing`
+  sorted set scored by claim deadline, and an attempts hash. Claims run as one Lua script.
+- DB fallback (`full_article_jobs`): used when Redis is not configured, or when a Redis
+  enqueue fails. The worker drains both, so jobs written during a Redis outage still run.
+
+Both backends release claims whose worker died after `PROCESSING_TIMEOUT_SECONDS` and
+retry failures with exponential backoff up to `MAX_ATTEMPTS`.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.database.session import AsyncSessionLocal
+from app.models.full_article_job import FullArticleJob
+from app.services.redis.redis_client_provider import RedisClientProvider, get_redis_provider
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "parlay_gorilla:queue:full_article"
+PROCESSING_TIMEOUT_SECONDS = 300
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 3600
+MAX_ATTEMPTS = 5
+
+SOURCE_REDIS = "redis"
+SOURCE_DB = "db"
+
+# KEYS: ready, processing, attempts. ARGV: now, limit, processing deadline.
+_CLAIM_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+for _, member in ipairs(expired) do
+  redis.call('ZREM', KEYS[2], member)
+  redis.call('ZADD', KEYS[1], ARGV[1], member)
+end
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+local out = {}
+for _, member in ipairs(due) do
+  redis.call('ZREM', KEYS[1], member)
+  redis.call('ZADD', KEYS[2], ARGV[3], member)
+  local attempts = redis.call('HINCRBY', KEYS[3], member, 1)
+  table.insert(out, member)
+  table.insert(out, attempts)
+end
+return out
+"""
+
+# KEYS: ready, processing. ARGV: now, member. Skip ids already queued or being generated.
+_ENQUEUE_SCRIPT = """
+if redis.call('ZSCORE', KEYS[2], ARGV[2]) then
+  return 0
+end
+return redis.call('ZADD', KEYS[1], 'NX', ARGV[1], ARGV[2])
+"""
+
+
+@dataclass(frozen=True)
+class ClaimedArticleJob:
+    analysis_id: str
+    attempts: int
+    source: str
+
+
+def retry_delay_seconds(attempts: int) -> int:
+    return min(RETRY_BASE_SECONDS * (2 ** max(int(attempts or 1) - 1, 0)), RETRY_MAX_SECONDS)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class _RedisBackend:
+    def __init__(self, provider: RedisClientProvider):
+        self._provider = provider
+        self._ready = f"{KEY_PREFIX}:ready"
+        self._processing = f"{KEY_PREFIX}:processing"
+        self._attempts = f"{KEY_PREFIX}:attempts"
+
+    def is_available(self) -> bool:
+        return self._provider.is_configured()
+
+    async def enqueue(self, analysis_ids: List[str]) -> int:
+        client = self._provider.get_client()
+        now = time.time()
+        added = 0
+        for analysis_id in analysis_ids:
+            added += int(await client.eval(_ENQUEUE_SCRIPT, 2, self._ready, self._processing, now, analysis_id) or 0)
+        return added
+
+    async def claim(self, limit: int) -> List[ClaimedArticleJob]:
+        client = self._provider.get_client()
+        now = time.time()
+        raw = await client.eval(
+            _CLAIM_SCRIPT,
+            3,
+            self._ready,
+            self._processing,
+            self._attempts,
+            now,
+            int(limit),
+            now + PROCESSING_TIMEOUT_SECONDS,
+        )
+        raw = list(raw or [])
+        jobs: List[ClaimedArticleJob] = []
+        for member, attempts in zip(raw[0::2], raw[1::2]):
+            analysis_id = member.decode() if isinstance(member, bytes) else str(member)
+            jobs.append(ClaimedArticleJob(analysis_id=analysis_id, attempts=int(attempts), source=SOURCE_REDIS))
+        return jobs
+
+    async def complete(self, analysis_id: str) -> None:
+        client = self._provider.get_client()
+        await client.zrem(self._processing, analysis_id)
+        await client.hdel(self._attempts, analysis_id)
+
+    async def retry(self, job: ClaimedArticleJob, error: str) -> bool:
+        client = self._provider.get_client()
+        await client.zrem(self._processing, job.analysis_id)
+        if job.attempts >= MAX_ATTEMPTS:
+            await client.hdel(self._attempts, job.analysis_id)
+            return False
+        await client.zadd(self._ready, {job.analysis_id: time.time() + retry_delay_seconds(job.attempts)})
+        return True
+
+    async def depth(self) -> Dict[str, int]:
+        client = self._provider.get_client()
+        return {
+            "queued": int(await client.zcard(self._ready) or 0),
+            "processing": int(await client.zcard(self._processing) or 0),
+        }
+
+
+class _DbBackend:
+    def __init__(self, session_factory: Callable[[], Any]):
+        self._session_factory = session_factory
+
+    async def enqueue(self, analysis_ids: List[str]) -> int:
+        rows = [
+            {"id": uuid.uuid4(), "analysis_id": uuid.UUID(a), "status": "queued", "attempts": 0, "available_at": _utcnow()}
+            for a in analysis_ids
+        ]
+        async with self._session_factory() as db:
+            insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+            result = await db.execute(
+                insert(FullArticleJob)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["analysis_id"])
+                .returning(FullArticleJob.id)
+            )
+            inserted = len(result.all())
+            await db.commit()
+        return inserted
+
+    async def claim(self, limit: int) -> List[ClaimedArticleJob]:
+        now = _utcnow()
+        async with self._session_factory() as db:
+            # Release rows claimed by a worker that never acked (crash, deploy)
+            await db.execute(
+                update(FullArticleJob)
+                .where(
+                    and_(
+                        FullArticleJob.status == "processing",
+                        FullArticleJob.claimed_at < now - timedelta(seconds=PROCESSING_TIMEOUT_SECONDS),
+                    )
+                )
+                .values(status="queued", last_error="released (stuck)")
+            )
+            result = await db.execute(
+                select(FullArticleJob.id, FullArticleJob.analysis_id, FullArticleJob.attempts)
+                .where(and_(FullArticleJob.status == "queued", FullArticleJob.available_at <= now))
+                .order_by(FullArticleJob.available_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            rows = result.all()
+            if rows:
+                await db.execute(
+                    update(FullArticleJob)
+                    .where(FullArticleJob.id.in_([row.id for row in rows]))
+                    .values(status="processing", claimed_at=now, attempts=FullArticleJob.attempts + 1)
+                )
+            await db.commit()
+        return [
+            ClaimedArticleJob(analysis_id=str(row.analysis_id), attempts=int(row.attempts or 0) + 1, source=SOURCE_DB)
+            for row in rows
+        ]
+
+    async def complete(self, analysis_id: str) -> None:
+        async with self._session_factory() as db:
+            await db.execute(
+                delete(FullArticleJob).where(
+                    and_(FullArticleJob.analysis_id == uuid.UUID(analysis_id), FullArticleJob.status == "processing")
+                )
+            )
+            await db.commit()
+
+    async def retry(self, job: ClaimedArticleJob, error: str) -> bool:
+        analysis_uuid = uuid.UUID(job.analysis_id)
+        async with self._session_factory() as db:
+            if job.attempts >= MAX_ATTEMPTS:
+                await db.execute(delete(FullArticleJob).where(FullArticleJob.analysis_id == analysis_uuid))
+                await db.commit()
+                return False
+            await db.execute(
+                update(FullArticleJob)
+                .where(FullArticleJob.analysis_id == analysis_uuid)
+                .values(
+                    status="queued",
+                    claimed_at=None,
+                    available_at=_utcnow() + timedelta(seconds=retry_delay_seconds(job.attempts)),
+                    last_error=(error or "")[:500],
+                )
+            )
+            await db.commit()
+        return True
+
+    async def depth(self) -> Dict[str, int]:
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(FullArticleJob.status, func.count(FullArticleJob.id)).group_by(FullArticleJob.status)
+            )
+            counts = {status: int(count) for status, count in result.all()}
+        return {"queued": counts.get("queued", 0), "processing": counts.get("processing", 0)}
+
+
+class FullArticleJobQueue:
+    """Enqueue/claim/ack for full-article jobs; Redis first, DB fallback."""
+
+    def __init__(
+        self,
+        *,
+        provider: Optional[RedisClientProvider] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self._redis = _RedisBackend(provider or get_redis_provider())
+        self._db = _DbBackend(session_factory or AsyncSessionLocal)
+
+    async def enqueue(self, analysis_ids: Iterable[str]) -> int:
+        """Queue analyses for generation (no-op for ids already queued or in progress)."""
+        ids = list(dict.fromkeys(str(a) for a in analysis_ids if a))
+        if not ids:
+            return 0
+        if self._redis.is_available():
+            try:
+                return await self._redis.enqueue(ids)
+            except Exception as e:
+                logger.warning("full_article_queue redis enqueue failed, using DB: %s", e)
+        return await self._db.enqueue(ids)
+
+    async def claim(self, limit: int) -> List[ClaimedArticleJob]:
+        """Claim up to `limit` due jobs (Redis first, then DB fallback rows)."""
+        if limit <= 0:
+            return []
+        jobs: List[ClaimedArticleJob] = []
+        if self._redis.is_available():
+            try:
+                jobs.extend(await self._redis.claim(limit))
+            except Exception as e:
+                logger.warning("full_article_queue redis claim failed: %s", e)
+        if len(jobs) < limit:
+            jobs.extend(await self._db.claim(limit - len(jobs)))
+        return jobs
+
+    async def complete(self, job: ClaimedArticleJob) -> None:
+        await self._backend(job).complete(job.analysis_id)
+
+    async def retry(self, job: ClaimedArticleJob, error: str) -> bool:
+        """Re-queue with backoff. Returns False when the job has used all attempts (dropped)."""
+        return await self._backend(job).retry(job, error)
+
+    async def depth(self) -> Dict[str, int]:
+        """Queued/processing counts across both backends."""
+        totals = await self._db.depth()
+        if self._redis.is_available():
+            try:
+                for key, value in (await self._redis.depth()).items():
+                    totals[key] = totals.get(key, 0) + value
+            except Exception as e:
+                logger.debug("full_article_queue redis depth failed: %s", e)
+        return totals
+
+    def _backend(self, job: ClaimedArticleJob):
+        return self._redis if job.source == SOURCE_REDIS else self._db
+
+
+_queue: Optional[FullArticleJobQueue] = None
+
+
+def get_full_article_job_queue() -> FullArticleJobQueue:
+    global _queue
+    if _queue is None:
+        _queue = FullArticleJobQueue()
+    return _queue
@@ -1,13 +1,12 @@
-"""In-process background runner for full-article generation.
+"""Full-article generation jobs.
 
-This runner is best-effort: tasks may be lost on process restart. The core
-analysis remains available immediately. The scheduler can be extended later
-to re-queue missing full articles if desired.
+`enqueue` writes the analysis id to the durable `FullArticleJobQueue`; the
+`FullArticleWorker` claims jobs and calls `run_job`. The core analysis remains
+available immediately, and queued jobs survive process restarts.
 """
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
@@ -23,6 +22,7 @@ from app.models.game_analysis import GameAnalysis
 from app.services.analysis.analysis_repository import AnalysisRepository
 from app.services.analysis.allowed_player_name_enforcer import AllowedPlayerNameEnforcer
 from app.services.analysis.full_article_generator import FullArticleGenerator
+from app.services.analysis.full_article_job_queue import FullArticleJobQueue, get_full_article_job_queue
 from app.services.analysis.role_language_sanitizer import RoleLanguageSanitizer
 from app.services.analysis.roster_context_builder import RosterContextBuilder
 from app.services.apisports.season_resolver import get_season_for_sport
@@ -31,23 +31,36 @@ logger = logging.getLogger(__name__)
 
 
 class FullArticleJobRunner:
-    def __init__(self, *, generator: Optional[FullArticleGenerator] = None):
+    def __init__(
+        self,
+        *,
+        generator: Optional[FullArticleGenerator] = None,
+        queue: Optional[FullArticleJobQueue] = None,
+    ):
         self._generator = generator or FullArticleGenerator()
+        self._queue = queue
 
     @property
     def enabled(self) -> bool:
         return bool(settings.analysis_full_article_enabled) and self._generator.enabled
 
-    def enqueue(self, *, analysis_id: str) -> None:
+    async def enqueue(self, *, analysis_id: str) -> None:
         if not self.enabled:
             return
-        asyncio.create_task(self._run(analysis_id=analysis_id))
+        try:
+            await (self._queue or get_full_article_job_queue()).enqueue([analysis_id])
+        except Exception as e:
+            logger.warning("Failed to enqueue full article for analysis %s: %s", analysis_id, e)
+
+    async def run_job(self, *, analysis_id: str) -> bool:
+        """Generate the article for one queued job. Returns False if generation should be retried."""
+        return await self._run(analysis_id=analysis_id)
 
-    async def _run(self, *, analysis_id: str) -> None:
+    async def _run(self, *, analysis_id: str) -> bool:
         try:
             analysis_uuid = uuid.UUID(analysis_id)
         except Exception:
-            return
+            return True
 
         async with AsyncSessionLocal() as db:
             repo = AnalysisRepository(db)
@@ -56,17 +69,17 @@ class FullArticleJobRunner:
                 result = await db.execute(select(GameAnalysis).where(GameAnalysis.id == analysis_uuid))
                 analysis = result.scalar_one_or_none()
                 if not analysis:
-                    return
+                    return True
 
                 content = analysis.analysis_content or {}
                 if isinstance(content, dict) and str(content.get("full_article") or "").strip():
                     # Already generated.
-                    return
+                    return True
 
                 game_result = await db.execute(select(Game).where(Game.id == analysis.game_id))
                 game = game_result.scalar_one_or_none()
                 if not game:
-                    return
+                    return True
 
                 allowed_names: list = []
                 try:
@@ -119,12 +132,11 @@ class FullArticleJobRunner:
                             rewrite_count=rewrite_count,
                             timestamp=datetime.now(timezone.utc).isoformat(),
                         )
-                else:
-                    await repo.update_full_article(
-                        analysis=analysis,
-                        full_article="",
-                        full_article_status="error",
-                        last_error="Full article generation failed or timed out.",
-                    )
-
-
+                    return True
+                await repo.update_full_article(
+                    analysis=analysis,
+                    full_article="",
+                    full_article_status="error",
+                    last_error="Full article generation failed or timed out.",
+                )
+                return False
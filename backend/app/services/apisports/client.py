@@ -17,6 +17,7 @@ from app.services.apisports.base_url_resolver import get_base_url_for_sport
 from app.services.apisports.endpoints import get_team_stats_endpoint
 from app.services.apisports.quota_manager import get_quota_manager
 from app.services.apisports.soft_rate_limiter import get_soft_rate_limiter
+from app.services.http.shared_http_client import pooled_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +106,7 @@ class ApiSportsClient:
 
         for attempt in range(MAX_RETRIES):
             try:
-                async with httpx.AsyncClient(timeout=self._timeout) as client:
+                async with pooled_http_session(timeout=self._timeout) as client:
                     resp = await client.request(
                         method,
                         url,
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.cache_manager import CacheManager
+from app.services.cache_manager import CacheManager, clear_parlay_memory_cache
+
+if TYPE_CHECKING:
+    from app.services.odds_api.odds_change_feed import OddsChangeEvent
 
 
 def clear_games_cache():
@@ -30,6 +33,25 @@ def clear_analysis_cache():
         pass
 
 
+def clear_analysis_cache_for_sport(sport: str):
+    """Drop analysis list entries for one sport (keys are `{sport}:{limit}`, sport as requested)."""
+    try:
+        from app.api.routes import analysis as analysis_routes
+        from app.services.sports_config import get_sport_config
+
+        names = {sport.lower()}
+        try:
+            config = get_sport_config(sport)
+            names.update({config.slug.lower(), config.code.lower()})
+        except ValueError:
+            pass
+        for key in list(analysis_routes._analysis_list_cache):
+            if key.split(":", 1)[0].lower() in names:
+                analysis_routes._analysis_list_cache.pop(key, None)
+    except Exception:
+        pass
+
+
 async def clear_parlay_cache(db: AsyncSession, sport: Optional[str] = None):
     """Clear parlay cache (DB + in-memory)."""
     try:
@@ -40,13 +62,86 @@ async def clear_parlay_cache(db: AsyncSession, sport: Optional[str] = None):
         pass
 
 
-async def invalidate_after_odds_update(db: AsyncSession, sport: Optional[str] = None):
+async def clear_joint_probability_cache(game_ids: Optional[Iterable[str]] = None):
+    """Drop memoized same-game joint probabilities (per game when ids are known, else all)."""
+    try:
+        from app.services.parlay_probability.joint_probability_cache import get_joint_probability_cache
+
+        cache = get_joint_probability_cache()
+        if game_ids is None:
+            cache.clear()
+        else:
+            await cache.invalidate_games_shared(game_ids)
+    except Exception:
+        pass
+
+
+async def invalidate_after_odds_update(
+    db: AsyncSession,
+    sport: Optional[str] = None,
+    game_ids: Optional[Iterable[str]] = None,
+):
     """Clear caches that depend on fresh odds/games data."""
     clear_games_cache()
     clear_analysis_cache()
+    await clear_joint_probability_cache(game_ids)
     await clear_parlay_cache(db, sport=sport)
 
 
+async def invalidate_after_odds_changes(events: List["OddsChangeEvent"], *, local: bool):
+    """
+    `OddsChangeBus` subscriber: drop only what depends on the changed games' sports.
+
+    Per-process caches are cleared on every instance; shared (Redis) entries and the
+    candidate-leg rebuild are handled once, by the instance that ingested the odds (`local`).
+    """
+    sports = sorted({e.sport for e in events if e.sport})
+    game_ids = [e.game_id for e in events]
+    try:
+        from app.api.routes.games_response_cache import games_response_cache
+        from app.services.sports_config import get_sport_config
+        from app.services.tools.upset_finder_response_cache import upset_finder_response_cache
+
+        for sport in sports:
+            try:
+                slug = get_sport_config(sport).slug
+            except ValueError:
+                slug = sport.lower()
+            games_response_cache.invalidate_sport(slug)
+            clear_analysis_cache_for_sport(sport)
+            await upset_finder_response_cache.invalidate_sport(slug, shared=local)
+    except Exception:
+        pass
+
+    try:
+        from app.services.parlay_explanation_cache import get_parlay_explanation_cache
+
+        await get_parlay_explanation_cache().invalidate_games(game_ids, shared=local)
+    except Exception:
+        pass
+
+    if local:
+        await clear_joint_probability_cache(game_ids)
+        try:
+            from app.services.probability_engine_impl.candidate_leg_refresher import (
+                schedule_candidate_leg_refresh,
+            )
+
+            schedule_candidate_leg_refresh(sports)
+        except Exception:
+            pass
+    else:
+        try:
+            from app.services.parlay_probability.joint_probability_cache import get_joint_probability_cache
+
+            get_joint_probability_cache().invalidate_games(game_ids)
+        except Exception:
+            pass
+        # The ingesting instance clears the parlay rows and Redis; drop this process's copies.
+        for sport in sports:
+            clear_parlay_memory_cache(sport)
+
+
 async def invalidate_after_stats_update(db: AsyncSession, sport: Optional[str] = None):
     """Clear caches that depend on fresh team stats data."""
     # Clear analysis cache so fresh analyses are shown
@@ -7,8 +7,34 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete
 import hashlib
 import json
+import time
+import uuid
 
 from app.models.parlay_cache import ParlayCache
+from app.services.parlay_cache_hit_buffer import get_parlay_cache_hit_buffer
+from app.services.tiered_cache import TieredCache
+
+# Process-wide L1 (+ Redis L2) for ParlayCache rows, keyed "{SPORT}:{params hash}". Values
+# are {"id", "data", "cached_at" (epoch seconds), "stale"}. Entries live at most a few
+# minutes (never past the row's expires_at), so an instance that missed an invalidation
+# cannot serve parlays built on old lines for long.
+_parlay_memory_cache = TieredCache("parlay_cache", max_entries=256, stale_grace_seconds=0)
+_MEMORY_TTL_SECONDS = 300.0
+_STALE_MEMORY_TTL_SECONDS = 300.0
+
+
+def _memory_sport_prefix(sport: str) -> str:
+    return f"{(sport or '').upper()}:"
+
+
+def clear_parlay_memory_cache(sport: Optional[str] = None) -> int:
+    """Drop this process's in-memory parlay entries (one sport, or all). Returns how many."""
+    if sport is None:
+        removed = len(_parlay_memory_cache.l1)
+        _parlay_memory_cache.l1.clear()
+        return removed
+    prefix = _memory_sport_prefix(sport)
+    return _parlay_memory_cache.l1.delete_where(lambda key: key.startswith(prefix))
 
 
 class CacheManager:
@@ -16,9 +42,6 @@ class CacheManager:
     
     def __init__(self, db: AsyncSession):
         self.db = db
-        # In-memory cache for frequently accessed data
-        self._memory_cache: Dict[str, Any] = {}
-        self._memory_cache_ttl: Dict[str, datetime] = {}
         # Allow serving last-good cache entries when fresh cache is missing/expired.
         # This improves reliability during upstream/API outages or transient DB issues.
         self._stale_tolerance_hours: int = 24
@@ -47,16 +70,15 @@ class CacheManager:
         Returns:
             Cached parlay data or None if not found/expired
         """
-        # Check in-memory cache first
-        cache_key = self._generate_cache_key(num_legs, risk_profile, sport)
-        if cache_key in self._memory_cache:
-            if cache_key in self._memory_cache_ttl:
-                if self._memory_cache_ttl[cache_key] > datetime.now(timezone.utc):
-                    return self._memory_cache[cache_key]
-                else:
-                    # Expired, remove from memory
-                    del self._memory_cache[cache_key]
-                    del self._memory_cache_ttl[cache_key]
+        # Check the shared memory cache first (pure lookup; the hit is counted in a buffer
+        # that is flushed to ParlayCache.hit_count in batches).
+        cache_key = self._memory_key(num_legs, risk_profile, sport)
+        entry = await _parlay_memory_cache.get(cache_key)
+        if entry is not None and (
+            entry.get("stale") or float(entry.get("cached_at") or 0.0) > time.time() - max_age_hours * 3600
+        ):
+            get_parlay_cache_hit_buffer().record(entry.get("id"))
+            return entry.get("data")
         
         # Check database cache
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
@@ -74,14 +96,10 @@ class CacheManager:
         cached = result.scalar_one_or_none()
         
         if cached:
-            # Update hit count
-            cached.hit_count += 1
-            await self.db.commit()
-            
-            # Store in memory cache for faster access
-            self._memory_cache[cache_key] = cached.cached_parlay_data
-            self._memory_cache_ttl[cache_key] = cached.expires_at
-            
+            get_parlay_cache_hit_buffer().record(cached.id)
+            await self._remember(
+                cache_key, cached, ttl_seconds=min(_MEMORY_TTL_SECONDS, self._seconds_until(cached.expires_at))
+            )
             return cached.cached_parlay_data
 
         # Stale fallback: if no fresh cache exists, return the most recent entry within
@@ -102,15 +120,33 @@ class CacheManager:
         stale = result.scalar_one_or_none()
 
         if stale:
-            stale.hit_count += 1
-            await self.db.commit()
-
+            get_parlay_cache_hit_buffer().record(stale.id)
             # Cache stale result briefly in memory to avoid repeated DB hits.
-            self._memory_cache[cache_key] = stale.cached_parlay_data
-            self._memory_cache_ttl[cache_key] = datetime.now(timezone.utc) + timedelta(minutes=5)
+            await self._remember(cache_key, stale, ttl_seconds=_STALE_MEMORY_TTL_SECONDS, stale=True)
             return stale.cached_parlay_data
         
         return None
+
+    def _memory_key(self, num_legs: int, risk_profile: str, sport: str) -> str:
+        return _memory_sport_prefix(sport) + self._generate_cache_key(num_legs, risk_profile, sport)
+
+    async def _remember(self, cache_key: str, row: ParlayCache, *, ttl_seconds: float, stale: bool = False) -> None:
+        if ttl_seconds <= 0:
+            return
+        cached_at = row.cached_at.timestamp() if isinstance(row.cached_at, datetime) else time.time()
+        await _parlay_memory_cache.set(
+            cache_key,
+            {"id": str(row.id), "data": row.cached_parlay_data, "cached_at": cached_at, "stale": stale},
+            ttl=ttl_seconds,
+        )
+
+    @staticmethod
+    def _seconds_until(moment: Optional[datetime]) -> float:
+        if not isinstance(moment, datetime):
+            return 0.0
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return (moment - datetime.now(timezone.utc)).total_seconds()
     
     async def set_cached_parlay(
         self,
@@ -133,7 +169,9 @@ class CacheManager:
         expires_at = datetime.now(timezone.utc) + timedelta(hours=ttl_hours)
         
         # Store in database cache
+        row_id = uuid.uuid4()
         cache_entry = ParlayCache(
+            id=row_id,
             num_legs=num_legs,
             risk_profile=risk_profile,
             sport=sport,
@@ -141,13 +179,15 @@ class CacheManager:
             expires_at=expires_at,
         )
         self.db.add(cache_entry)
-        
-        # Store in memory cache
-        cache_key = self._generate_cache_key(num_legs, risk_profile, sport)
-        self._memory_cache[cache_key] = parlay_data
-        self._memory_cache_ttl[cache_key] = expires_at
-        
         await self.db.commit()
+        
+        # Store in memory cache (shared by every request in this process, and via Redis)
+        cache_key = self._memory_key(num_legs, risk_profile, sport)
+        await _parlay_memory_cache.set(
+            cache_key,
+            {"id": str(row_id), "data": parlay_data, "cached_at": time.time(), "stale": False},
+            ttl=min(_MEMORY_TTL_SECONDS, ttl_hours * 3600),
+        )
     
     async def clear_expired_cache(self):
         """Remove expired cache entries from database"""
@@ -177,24 +217,14 @@ class CacheManager:
         result = await self.db.execute(query)
         await self.db.commit()
         
-        # Clear memory cache if matching
-        keys_to_remove = []
-        for key in self._memory_cache.keys():
-            # Simple check - in production, might want more sophisticated matching
-            keys_to_remove.append(key)
-        
-        for key in keys_to_remove:
-            if key in self._memory_cache:
-                del self._memory_cache[key]
-            if key in self._memory_cache_ttl:
-                del self._memory_cache_ttl[key]
+        # Memory keys start with the sport; without one, drop every entry (here and in Redis).
+        await _parlay_memory_cache.delete_prefix(_memory_sport_prefix(sport) if sport is not None else "")
         
         return result.rowcount
     
     def clear_memory_cache(self):
         """Clear all in-memory cache"""
-        self._memory_cache.clear()
-        self._memory_cache_ttl.clear()
+        clear_parlay_memory_cache()
 
 
 # Function-level caching decorators
@@ -4,8 +4,7 @@ import heapq
 import math
 import uuid
 from dataclasses import dataclass
-from itertools import combinations
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 from app.schemas.parlay import (
     CoverageTicket,
@@ -32,6 +31,36 @@ class _ScoredCombo:
     indices: Tuple[int, ...]
 
 
+def _clamp_probability(percent: float) -> float:
+    return max(0.000001, min(0.999999, float(percent) / 100.0))
+
+
+def _cheapest_subsets(costs: List[float], k: int) -> Iterator[int]:
+    """
+    Yield up to k bitmasks over `costs` (all >= 0) in nondecreasing total cost, lazily.
+
+    Classic best-first enumeration over costs sorted ascending: a state ends at sorted position j;
+    its successors either add position j+1 or replace j with j+1. Each subset is generated once,
+    so this is O(k log k) heap work instead of walking all 2^n masks.
+    """
+    if k <= 0:
+        return
+    yield 0
+    order = sorted(range(len(costs)), key=lambda i: costs[i])
+    if not order:
+        return
+    heap: List[Tuple[float, int, int]] = [(costs[order[0]], 0, 1 << order[0])]
+    emitted = 1
+    while heap and emitted < k:
+        cost, j, mask = heapq.heappop(heap)
+        yield mask
+        emitted += 1
+        if j + 1 < len(order):
+            nxt = order[j + 1]
+            heapq.heappush(heap, (cost + costs[nxt], j + 1, mask | (1 << nxt)))
+            heapq.heappush(heap, (cost - costs[order[j]] + costs[nxt], j + 1, (mask ^ (1 << order[j])) | (1 << nxt)))
+
+
 class ParlayCoverageService:
     """
     Builds an upset coverage pack from a user's selected legs.
@@ -129,22 +158,24 @@ class ParlayCoverageService:
         if k <= 0 or n == 0:
             return []
 
-        p_orig = [max(0.000001, min(0.999999, float(l.ai_probability) / 100.0)) for l in original_leg_analyses]
-        p_flip = [max(0.000001, min(0.999999, float(l.ai_probability) / 100.0)) for l in flipped_leg_analyses]
+        p_orig = [_clamp_probability(l.ai_probability) for l in original_leg_analyses]
+        p_flip = [_clamp_probability(l.ai_probability) for l in flipped_leg_analyses]
 
-        heap: List[Tuple[float, int]] = []
-        for mask in range(1 << n):
-            prob = 1.0
-            for i in range(n):
-                prob *= p_flip[i] if (mask & (1 << i)) else p_orig[i]
-            if len(heap) < k:
-                heapq.heappush(heap, (prob, mask))
-            else:
-                if prob > heap[0][0]:
-                    heapq.heapreplace(heap, (prob, mask))
+        # Start from the most likely side of every game; each "switch" to the other side costs
+        # log(best) - log(other) >= 0, so the k most likely scenarios are the k cheapest switch sets.
+        best_mask = 0
+        costs: List[float] = []
+        for i in range(n):
+            if p_flip[i] > p_orig[i]:
+                best_mask |= 1 << i
+            costs.append(abs(math.log(p_orig[i]) - math.log(p_flip[i])))
 
-        heap.sort(key=lambda x: x[0], reverse=True)
-        return [_ScoredMask(probability=p, mask=m) for p, m in heap]
+        scored: List[_ScoredMask] = []
+        for switched in _cheapest_subsets(costs, k):
+            mask = best_mask ^ switched
+            prob = math.prod(p_flip[i] if (mask & (1 << i)) else p_orig[i] for i in range(n))
+            scored.append(_ScoredMask(probability=prob, mask=mask))
+        return scored
 
     def _top_k_round_robins(
         self,
@@ -159,21 +190,32 @@ class ParlayCoverageService:
         if size < 2 or size > n:
             return []
 
-        p = [max(0.000001, min(0.999999, float(l.ai_probability) / 100.0)) for l in leg_analyses]
-        heap: List[Tuple[float, Tuple[int, ...]]] = []
-
-        for combo in combinations(range(n), size):
-            prob = 1.0
-            for idx in combo:
-                prob *= p[idx]
-            if len(heap) < k:
-                heapq.heappush(heap, (prob, combo))
-            else:
-                if prob > heap[0][0]:
-                    heapq.heapreplace(heap, (prob, combo))
-
-        heap.sort(key=lambda x: x[0], reverse=True)
-        return [_ScoredCombo(probability=pv, indices=combo) for pv, combo in heap]
+        p = [_clamp_probability(l.ai_probability) for l in leg_analyses]
+        # Rank legs most likely first; combos are positions into this order.
+        order = sorted(range(n), key=lambda i: -p[i])
+        log_p = [math.log(p[i]) for i in order]
+
+        # Best-first over positions: the top combo is the first `size` legs, and moving one
+        # position to the next free slot never increases probability. `seen` dedupes combos
+        # reachable by more than one move.
+        start = tuple(range(size))
+        heap: List[Tuple[float, Tuple[int, ...]]] = [(-sum(log_p[j] for j in start), start)]
+        seen = {start}
+        scored: List[_ScoredCombo] = []
+        while heap and len(scored) < k:
+            neg_log, positions = heapq.heappop(heap)
+            indices = tuple(sorted(order[j] for j in positions))
+            scored.append(_ScoredCombo(probability=math.prod(p[i] for i in indices), indices=indices))
+            for slot, pos in enumerate(positions):
+                nxt = pos + 1
+                if nxt >= n or (slot + 1 < size and positions[slot + 1] == nxt):
+                    continue
+                moved = positions[:slot] + (nxt,) + positions[slot + 1 :]
+                if moved in seen:
+                    continue
+                seen.add(moved)
+                heapq.heappush(heap, (neg_log - log_p[nxt] + log_p[pos], moved))
+        return scored
 
     # ------------------------------------------------------------------
     # Ticket builders
@@ -19,6 +19,7 @@ import logging
 import re
 
 from app.services.data_fetchers.fetch_utils import RateLimitedFetcher
+from app.services.http.shared_http_client import pooled_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -147,7 +148,7 @@ class ESPNScraper(RateLimitedFetcher):
     async def _make_request(self, url: str) -> Optional[Dict]:
         """Make an HTTP request with error handling"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_session(timeout=self.timeout) as client:
                 response = await client.get(url)
                 if response.status_code == 200:
                     return response.json()
@@ -16,6 +16,8 @@ import logging
 import hashlib
 import json
 
+from app.services.tiered_cache import LocalTtlCache
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -73,14 +75,26 @@ class RateLimiter:
 
 class InMemoryCache:
     """
-    Simple in-memory cache with TTL support.
-    
+    In-process cache with TTL support, bounded by entry count and estimated bytes.
+
+    Thin async wrapper over `LocalTtlCache` (LRU eviction). Expired entries stay
+    readable with `allow_stale=True` until evicted or dropped by `clear_expired`.
     Note: In production, use Redis for distributed caching.
     """
     
-    def __init__(self):
-        self._cache: Dict[str, tuple[Any, float, float]] = {}  # key -> (value, expires_at, stored_at)
-        self._lock = asyncio.Lock()
+    def __init__(
+        self,
+        namespace: str = "in_memory",
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self._cache = LocalTtlCache(
+            namespace,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            stale_grace_seconds=float("inf"),
+        )
     
     async def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
         """
@@ -93,21 +107,12 @@ class InMemoryCache:
         Returns:
             Cached value or None
         """
-        async with self._lock:
-            if key not in self._cache:
-                return None
-            
-            value, expires_at, stored_at = self._cache[key]
-            now = time.time()
-            
-            if now < expires_at:
-                return value
-            
-            if allow_stale:
-                logger.warning(f"Returning stale cache for {key} (expired {now - expires_at:.0f}s ago)")
-                return value
-            
-            return None
+        value = self._cache.get(key, allow_stale=allow_stale)
+        if value is not None and allow_stale:
+            remaining = self._cache.remaining_ttl(key)
+            if remaining is not None and remaining <= 0:
+                logger.warning(f"Returning stale cache for {key} (expired {-remaining:.0f}s ago)")
+        return value
     
     async def set(self, key: str, value: Any, ttl: int = 300) -> None:
         """
@@ -118,23 +123,15 @@ class InMemoryCache:
             value: Value to cache
             ttl: Time to live in seconds (default 5 minutes)
         """
-        async with self._lock:
-            now = time.time()
-            self._cache[key] = (value, now + ttl, now)
+        self._cache.set(key, value, ttl=ttl)
     
     async def delete(self, key: str) -> None:
         """Delete a key from cache"""
-        async with self._lock:
-            self._cache.pop(key, None)
+        self._cache.delete(key)
     
     async def clear_expired(self) -> int:
         """Clear all expired entries. Returns count of cleared entries."""
-        async with self._lock:
-            now = time.time()
-            expired_keys = [k for k, (_, exp, _) in self._cache.items() if now >= exp]
-            for key in expired_keys:
-                del self._cache[key]
-            return len(expired_keys)
+        return self._cache.clear_expired()
 
 
 class RateLimitedFetcher:
@@ -165,7 +162,7 @@ class RateLimitedFetcher:
         name: str = "fetcher"
     ):
         self.rate_limiter = RateLimiter(calls_per_minute)
-        self.cache = InMemoryCache()
+        self.cache = InMemoryCache(f"fetcher:{name}")
         self.cache_ttl = cache_ttl_seconds
         self.name = name
     
@@ -274,7 +271,7 @@ def cached(ttl_seconds: int = 300):
         async def get_team_stats(team_name: str) -> Dict:
             ...
     """
-    cache = InMemoryCache()
+    cache = InMemoryCache("cached_decorator")
     
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @wraps(func)
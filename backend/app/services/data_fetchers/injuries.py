@@ -1,10 +1,10 @@
 """Injury data fetcher with multi-sport ESPN team resolution."""
 
-import httpx
 from typing import Dict, List, Optional
 from app.core.config import settings
 from app.services.espn.espn_injuries_client import EspnInjuriesClient
 from app.services.espn.espn_team_resolver import EspnTeamResolver
+from app.services.http.shared_http_client import pooled_http_session
 
 
 class InjuryFetcher:
@@ -163,7 +163,7 @@ class InjuryFetcher:
             return []
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_session(timeout=self.timeout) as client:
                 url = f"{self.base_url}/teams/{team_abbr}/injuries"
                 response = await client.get(url)
                 if response.status_code == 200:
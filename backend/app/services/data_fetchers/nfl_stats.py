@@ -1,9 +1,9 @@
 """NFL team statistics and performance data fetcher"""
 
-import httpx
 from typing import Dict, Optional, List
 from datetime import datetime, timedelta
 from app.core.config import settings
+from app.services.http.shared_http_client import pooled_http_session
 
 
 class NFLStatsFetcher:
@@ -31,7 +31,7 @@ class NFLStatsFetcher:
             if not team_abbr:
                 return None
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_session(timeout=self.timeout) as client:
                 # Get team info and stats
                 url = f"{self.base_url}/teams/{team_abbr}"
                 response = await client.get(url)
@@ -60,7 +60,7 @@ class NFLStatsFetcher:
             if not team_abbr:
                 return []
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_session(timeout=self.timeout) as client:
                 # Get team schedule/results
                 url = f"{self.base_url}/teams/{team_abbr}/schedule"
                 response = await client.get(url)
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import httpx
 import re
 import unicodedata
 from typing import Dict, List, Optional
 
 from app.core.config import settings
+from app.services.http.shared_http_client import pooled_http_session
 
 # Keep consistent with probability engine budgets. This fetcher is used for
 # heuristics only; prefer fast fallback over hanging requests.
@@ -170,7 +170,7 @@ class NHLStatsFetcher:
     async def _fetch_team_payload(self, slug: str) -> Dict:
         if slug in self._team_payload_cache:
             return self._team_payload_cache[slug]
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
+        async with pooled_http_session(timeout=HTTP_TIMEOUT) as client:
             response = await client.get(f"{self.ESPN_BASE_URL}/{slug}")
             response.raise_for_status()
         payload = response.json().get("team", {})
@@ -180,7 +180,7 @@ class NHLStatsFetcher:
     async def _fetch_schedule_events(self, slug: str) -> List[Dict]:
         if slug in self._schedule_cache:
             return self._schedule_cache[slug]
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
+        async with pooled_http_session(timeout=HTTP_TIMEOUT) as client:
             response = await client.get(f"{self.ESPN_BASE_URL}/{slug}/schedule")
             response.raise_for_status()
         events = response.json().get("events", [])
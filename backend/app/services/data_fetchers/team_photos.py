@@ -1,8 +1,8 @@
 """Service for fetching real team action photos from sports photo APIs"""
 
-import httpx
 from typing import Optional, Dict, List
 from app.core.config import settings
+from app.services.http.shared_http_client import pooled_http_session
 import hashlib
 import json
 from datetime import datetime, timedelta
@@ -254,7 +254,7 @@ class TeamPhotoFetcher:
     ) -> List[str]:
         """Search Pexels for multiple stadium photos"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_session(timeout=self.timeout) as client:
                 headers = {
                     "Authorization": self.pexels_api_key
                 }
@@ -319,7 +319,7 @@ class TeamPhotoFetcher:
     ) -> List[str]:
         """Search Unsplash for multiple stadium photos"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_session(timeout=self.timeout) as client:
                 url = f"{self.unsplash_base_url}/search/photos"
                 headers = {
                     "Authorization": f"Client-ID {self.unsplash_access_key}"
@@ -473,7 +473,7 @@ class TeamPhotoFetcher:
             return self._getty_access_token
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_session(timeout=self.timeout) as client:
                 url = "https://api.gettyimages.com/oauth2/token"
                 data = {
                     "grant_type": "client_credentials",
@@ -530,7 +530,7 @@ class TeamPhotoFetcher:
                 # Team-specific search
                 query = f"{team_name} {league}"
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_session(timeout=self.timeout) as client:
                 # Step 1: Search for images
                 search_url = f"{self.getty_base_url}/search/images"
                 params = {
@@ -665,7 +665,7 @@ class TeamPhotoFetcher:
                         f"{sport_term} game action",
                     ]
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_session(timeout=self.timeout) as client:
                 headers = {
                     "Authorization": self.pexels_api_key  # Pexels uses API key directly as Authorization header
                 }
@@ -743,7 +743,7 @@ class TeamPhotoFetcher:
     async def _verify_image_exists(self, url: str) -> bool:
         """Verify that an image URL actually exists and is accessible"""
         try:
-            async with httpx.AsyncClient(timeout=5.0, follow_redirects=True) as client:
+            async with pooled_http_session(timeout=5.0, follow_redirects=True) as client:
                 response = await client.head(url)
                 return response.status_code == 200
         except:
@@ -789,7 +789,7 @@ class TeamPhotoFetcher:
                     f"{sport_term} game action",  # Generic sport action
                 ]
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_session(timeout=self.timeout) as client:
                 headers = {
                     "Authorization": f"Client-ID {self.unsplash_access_key}"
                 }
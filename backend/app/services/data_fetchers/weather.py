@@ -1,9 +1,9 @@
 """Weather data fetcher for game conditions"""
 
-import httpx
 from typing import Dict, Optional
 from datetime import datetime
 from app.core.config import settings
+from app.services.http.shared_http_client import pooled_http_session
 
 
 class WeatherFetcher:
@@ -97,7 +97,7 @@ class WeatherFetcher:
             
             lat, lon = coords
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_session(timeout=self.timeout) as client:
                 # Get forecast (OpenWeatherMap free tier)
                 url = f"{self.base_url}/forecast"
                 params = {
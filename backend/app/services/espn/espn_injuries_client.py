@@ -5,11 +5,11 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional
 
-import httpx
 
 from app.services.data_fetchers.espn_scraper import ESPNScraper
 from app.services.espn.espn_sport_resolver import EspnSportResolver
 from app.services.espn.espn_team_resolver import ResolvedTeamRef
+from app.services.http.shared_http_client import pooled_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ class EspnInjuriesClient:
             logger.warning("ESPN injuries: no injuries_url or team_id for %s", team_ref.matched_name)
             return None
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
+            async with pooled_http_session(timeout=self._timeout) as client:
                 response = await client.get(url)
                 if response.status_code != 200:
                     logger.warning("ESPN injuries fetch failed: %s %s", response.status_code, url)
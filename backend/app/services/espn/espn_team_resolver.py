@@ -9,9 +9,9 @@ import time
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional
 
-import httpx
 
 from app.services.espn.espn_sport_resolver import EspnSportResolver
+from app.services.http.shared_http_client import pooled_http_session
 from app.services.team_name_normalizer import TeamNameNormalizer
 
 logger = logging.getLogger(__name__)
@@ -204,7 +204,7 @@ class EspnTeamResolver:
         base_url = EspnSportResolver.get_base_url(sport)
         url = f"{base_url}/teams"
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
+            async with pooled_http_session(timeout=self._timeout) as client:
                 response = await client.get(url)
                 if response.status_code != 200:
                     logger.warning("ESPN teams list failed: %s %s", response.status_code, url)
@@ -11,7 +11,7 @@ Returns a standardized feature vector for all prediction models.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Any, List
+from typing import Awaitable, Callable, Dict, Optional, Any, List, Sequence, Tuple
 from datetime import datetime, date, timedelta
 import logging
 import asyncio
@@ -200,6 +200,24 @@ HOME_ADVANTAGE_BY_SPORT = {
 }
 
 
+# Max concurrent external fetches (ESPN, injuries, weather) while building a slate
+SLATE_FETCH_CONCURRENCY = 8
+
+# (sport, team name) as passed by callers; the unit slate fetches are deduplicated on
+TeamKey = Tuple[str, str]
+
+
+@dataclass
+class SlateMatchup:
+    """One game of a slate passed to `FeaturePipeline.build_slate_features`."""
+    home_team: str
+    away_team: str
+    sport: str
+    game_id: Optional[str] = None
+    game_time: Optional[datetime] = None
+    odds_data: Optional[Dict] = None
+
+
 class FeaturePipeline:
     """
     Unified feature pipeline that combines data from multiple sources
@@ -268,15 +286,7 @@ class FeaturePipeline:
         """
         logger.info(f"[FeaturePipeline] Building features for {away_team} @ {home_team} ({sport})")
         
-        # Initialize feature vector with defaults
-        features = MatchupFeatureVector(
-            home_team=home_team,
-            away_team=away_team,
-            sport=sport.upper(),
-            game_id=game_id,
-            game_time=game_time,
-            home_advantage=HOME_ADVANTAGE_BY_SPORT.get(sport.lower(), 0.025),
-        )
+        features = self._new_feature_vector(home_team, away_team, sport, game_id, game_time)
         
         # Fetch data from all sources in parallel
         tasks = [
@@ -292,50 +302,218 @@ class FeaturePipeline:
         
         # Execute all tasks in parallel
         results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        def _pair(result: Any) -> tuple:
+            return result if isinstance(result, tuple) else (None, None)
+
+        def _value(index: int) -> Any:
+            if len(results) > index and not isinstance(results[index], Exception):
+                return results[index]
+            return None
         
-        # Process team stats
-        if not isinstance(results[0], Exception) and isinstance(results[0], tuple):
-            home_stats, away_stats = results[0]
-            if home_stats or away_stats:
-                self._apply_team_stats(features, home_stats, away_stats, sport)
-                features.has_stats_data = True
-        
-        # Process injuries
-        if len(results) > 1 and not isinstance(results[1], Exception) and isinstance(results[1], tuple):
-            home_injuries, away_injuries = results[1]
-            if home_injuries or away_injuries:
-                self._apply_injuries(features, home_injuries, away_injuries)
-                features.has_injury_data = True
-        
-        # Process recent form
-        if len(results) > 2 and not isinstance(results[2], Exception) and results[2]:
-            home_form, away_form = results[2]
+        self._assemble_features(
+            features,
+            sport,
+            team_stats=_pair(_value(0)),
+            injuries=_pair(_value(1)),
+            recent_form=_value(2) or None,
+            context=_value(3),
+            weather=_value(4),
+            odds_data=odds_data,
+        )
+        
+        logger.info(f"[FeaturePipeline] Features built with quality score: {features.data_quality_score:.1f}")
+        
+        return features
+
+    async def build_slate_features(
+        self,
+        games: Sequence[SlateMatchup],
+        concurrency: int = SLATE_FETCH_CONCURRENCY,
+    ) -> List[MatchupFeatureVector]:
+        """
+        Build matchup feature vectors for a whole slate of games.
+
+        Team-level sources (stats, injuries, recent form) are fetched once per team across
+        the slate rather than once per game the team plays in, and API-Sports team stats are
+        read with one query per sport. DB reads run sequentially on the session; external
+        fetches (ESPN, injuries, matchup context, weather) run concurrently, at most
+        `concurrency` at a time. Returns vectors in input order.
+        """
+        if not games:
+            return []
+        logger.info(f"[FeaturePipeline] Building slate features for {len(games)} games")
+
+        sources = await self._fetch_slate_sources(games, concurrency)
+        vectors: List[MatchupFeatureVector] = []
+        for g, src in zip(games, sources):
+            features = self._new_feature_vector(g.home_team, g.away_team, g.sport, g.game_id, g.game_time)
+            self._assemble_features(
+                features,
+                g.sport,
+                team_stats=(src["home_team_stats"], src["away_team_stats"]),
+                injuries=(src["home_injuries"], src["away_injuries"]),
+                recent_form=(src["home_form"] or [], src["away_form"] or []),
+                context=src["context"],
+                weather=src["weather"],
+                odds_data=g.odds_data,
+            )
+            vectors.append(features)
+        return vectors
+
+    async def build_slate_matchup_data(
+        self,
+        games: Sequence[SlateMatchup],
+        concurrency: int = SLATE_FETCH_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Slate form of the StatsScraperService `matchup_data` dict (team stats, injuries,
+        weather), built with the same deduplicated bulk fetches as `build_slate_features`.
+        Recent form and matchup context are not part of that shape and are skipped.
+        """
+        if not games:
+            return []
+        sources = await self._fetch_slate_sources(games, concurrency, with_form_and_context=False)
+        return [
+            {
+                "home_team_stats": src["home_team_stats"],
+                "away_team_stats": src["away_team_stats"],
+                "weather": src["weather"],
+                "home_injuries": src["home_injuries"],
+                "away_injuries": src["away_injuries"],
+                "head_to_head": None,
+            }
+            for src in sources
+        ]
+
+    async def _fetch_slate_sources(
+        self,
+        games: Sequence[SlateMatchup],
+        concurrency: int,
+        *,
+        with_form_and_context: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Raw per-game source data for a slate, each source fetched once per team/matchup"""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def limited(awaitable: Awaitable[Any]) -> Any:
+            async with semaphore:
+                try:
+                    return await awaitable
+                except Exception as e:
+                    logger.debug(f"[FeaturePipeline] Slate fetch failed: {e}")
+                    return None
+
+        async def none_for_each(keys: Sequence[Any]) -> List[Any]:
+            return [None] * len(keys)
+
+        teams: List[TeamKey] = list(
+            dict.fromkeys(key for g in games for key in ((g.sport, g.home_team), (g.sport, g.away_team)))
+        )
+        matchups = list(dict.fromkeys((g.sport, g.home_team, g.away_team) for g in games))
+        weather_keys = list(
+            dict.fromkeys(
+                (g.sport, g.home_team, g.game_time)
+                for g in games
+                if g.game_time and self._sport_supports_weather(g.sport)
+            )
+        )
+
+        # External-only sources start now and overlap with the DB reads below
+        contexts_task = (
+            asyncio.gather(*(limited(self._fetch_matchup_context(h, a, s)) for s, h, a in matchups))
+            if with_form_and_context
+            else none_for_each(matchups)
+        )
+        external = asyncio.ensure_future(
+            asyncio.gather(
+                self._fetch_injuries_many(teams, limited),
+                contexts_task,
+                asyncio.gather(*(limited(self._fetch_weather(h, t, s)) for s, h, t in weather_keys)),
+            )
+        )
+        try:
+            team_stats = await self._fetch_team_stats_many(teams, limited)
+            recent_form = await self._fetch_recent_form_many(teams, limited) if with_form_and_context else {}
+        finally:
+            injuries, contexts, weathers = await external
+        context_by_matchup = dict(zip(matchups, contexts))
+        weather_by_key = dict(zip(weather_keys, weathers))
+
+        sources: List[Dict[str, Any]] = []
+        for g in games:
+            home, away = (g.sport, g.home_team), (g.sport, g.away_team)
+            sources.append(
+                {
+                    "home_team_stats": team_stats.get(home),
+                    "away_team_stats": team_stats.get(away),
+                    "home_injuries": injuries.get(home),
+                    "away_injuries": injuries.get(away),
+                    "home_form": recent_form.get(home),
+                    "away_form": recent_form.get(away),
+                    "context": context_by_matchup.get((g.sport, g.home_team, g.away_team)),
+                    "weather": weather_by_key.get((g.sport, g.home_team, g.game_time)),
+                }
+            )
+        return sources
+
+    def _new_feature_vector(
+        self,
+        home_team: str,
+        away_team: str,
+        sport: str,
+        game_id: Optional[str],
+        game_time: Optional[datetime],
+    ) -> MatchupFeatureVector:
+        """Feature vector with defaults"""
+        return MatchupFeatureVector(
+            home_team=home_team,
+            away_team=away_team,
+            sport=sport.upper(),
+            game_id=game_id,
+            game_time=game_time,
+            home_advantage=HOME_ADVANTAGE_BY_SPORT.get(sport.lower(), 0.025),
+        )
+
+    def _assemble_features(
+        self,
+        features: MatchupFeatureVector,
+        sport: str,
+        team_stats: tuple,
+        injuries: tuple,
+        recent_form: Optional[tuple],
+        context: Optional[Dict],
+        weather: Optional[Dict],
+        odds_data: Optional[Dict],
+    ) -> MatchupFeatureVector:
+        """Apply fetched source data, then derive quality and style scores"""
+        home_stats, away_stats = team_stats
+        if home_stats or away_stats:
+            self._apply_team_stats(features, home_stats, away_stats, sport)
+            features.has_stats_data = True
+        
+        home_injuries, away_injuries = injuries
+        if home_injuries or away_injuries:
+            self._apply_injuries(features, home_injuries, away_injuries)
+            features.has_injury_data = True
+        
+        if recent_form:
+            home_form, away_form = recent_form
             self._apply_recent_form(features, home_form, away_form)
         
-        # Process matchup context
-        if len(results) > 3 and not isinstance(results[3], Exception) and results[3]:
-            context = results[3]
+        if context:
             self._apply_matchup_context(features, context)
         
-        # Process weather (if applicable)
-        if len(results) > 4 and not isinstance(results[4], Exception) and results[4]:
-            weather = results[4]
+        if weather:
             self._apply_weather(features, weather, sport)
             features.has_weather_data = True
         
-        # Apply odds data if provided
         if odds_data:
             self._apply_odds_data(features, odds_data)
             features.has_odds_data = True
         
-        # Calculate data quality score
         features.data_quality_score = self._calculate_data_quality(features)
-        
-        # Calculate style matchup score
         features.style_matchup_score = self._calculate_style_matchup(features, sport)
-        
-        logger.info(f"[FeaturePipeline] Features built with quality score: {features.data_quality_score:.1f}")
-        
         return features
     
     async def _fetch_team_stats(
@@ -529,11 +707,7 @@ class FeaturePipeline:
                 team_id=home_team_id,
                 last_n=5
             )
-            if features:
-                # Convert to form list format
-                wins = features.get("last_n_form_wins", 0)
-                losses = features.get("last_n_form_losses", 0)
-                home_form = [{"result": "W"} for _ in range(wins)] + [{"result": "L"} for _ in range(losses)]
+            home_form = self._form_from_team_features(features)
         
         if away_team_id:
             features = await self._feature_builder.build_team_features(
@@ -541,10 +715,7 @@ class FeaturePipeline:
                 team_id=away_team_id,
                 last_n=5
             )
-            if features:
-                wins = features.get("last_n_form_wins", 0)
-                losses = features.get("last_n_form_losses", 0)
-                away_form = [{"result": "W"} for _ in range(wins)] + [{"result": "L"} for _ in range(losses)]
+            away_form = self._form_from_team_features(features)
         
         # Fallback to ESPN if API-Sports data unavailable
         espn = self._get_espn_scraper()
@@ -556,6 +727,96 @@ class FeaturePipeline:
         
         return home_form or [], away_form or []
     
+    def _form_from_team_features(self, features: Optional[Dict]) -> List[Dict]:
+        """Convert FeatureBuilderService last-N wins/losses to form list format"""
+        if not features:
+            return []
+        wins = features.get("last_n_form_wins", 0)
+        losses = features.get("last_n_form_losses", 0)
+        return [{"result": "W"} for _ in range(wins)] + [{"result": "L"} for _ in range(losses)]
+
+    async def _fetch_team_stats_many(
+        self,
+        teams: Sequence[TeamKey],
+        limited: Callable[[Awaitable[Any]], Awaitable[Any]],
+    ) -> Dict[TeamKey, Optional[Dict]]:
+        """Team stats for every team in a slate: one API-Sports query per sport, ESPN fallback per missing team"""
+        stats: Dict[TeamKey, Optional[Dict]] = {}
+        if self.db and self._apisports_repo:
+            keys_by_sport: Dict[str, Dict[int, List[TeamKey]]] = {}
+            for key in teams:
+                sport_key = self._normalize_sport_key(key[0])
+                team_id = self._team_mapper.get_team_id(key[1], sport_key)
+                if team_id:
+                    keys_by_sport.setdefault(sport_key, {}).setdefault(team_id, []).append(key)
+            for sport_key, keys_by_team in keys_by_sport.items():
+                rows = await self._apisports_repo.get_team_stats_many(sport_key, keys_by_team.keys())
+                for team_id, team_stat in rows.items():
+                    if not team_stat.payload_json:
+                        continue
+                    converted = self._data_adapter.team_stats_to_internal_format(
+                        team_stat.payload_json,
+                        team_id,
+                        sport_key,
+                        team_stat.season
+                    )
+                    for key in keys_by_team[team_id]:
+                        stats[key] = converted
+        
+        # Fallback to ESPN if API-Sports data unavailable
+        espn = self._get_espn_scraper()
+        missing = [key for key in teams if not stats.get(key)]
+        fetched = await asyncio.gather(*(limited(espn.scrape_team_stats(team, sport)) for sport, team in missing))
+        stats.update(zip(missing, fetched))
+        return stats
+
+    async def _fetch_recent_form_many(
+        self,
+        teams: Sequence[TeamKey],
+        limited: Callable[[Awaitable[Any]], Awaitable[Any]],
+    ) -> Dict[TeamKey, List[Dict]]:
+        """Recent form for every team in a slate: FeatureBuilderService once per team, ESPN fallback per missing team"""
+        forms: Dict[TeamKey, List[Dict]] = {}
+        if self.db and self._feature_builder:
+            built: Dict[Tuple[str, int], List[Dict]] = {}
+            for key in teams:
+                sport_key = self._normalize_sport_key(key[0])
+                team_id = self._team_mapper.get_team_id(key[1], sport_key)
+                if not team_id:
+                    continue
+                if (sport_key, team_id) not in built:
+                    features = await self._feature_builder.build_team_features(
+                        sport=sport_key,
+                        team_id=team_id,
+                        last_n=5
+                    )
+                    built[(sport_key, team_id)] = self._form_from_team_features(features)
+                forms[key] = built[(sport_key, team_id)]
+        
+        espn = self._get_espn_scraper()
+        missing = [key for key in teams if not forms.get(key)]
+        fetched = await asyncio.gather(*(limited(espn.scrape_recent_games(team, sport, n=5)) for sport, team in missing))
+        forms.update((key, form or []) for key, form in zip(missing, fetched))
+        return forms
+
+    async def _fetch_injuries_many(
+        self,
+        teams: Sequence[TeamKey],
+        limited: Callable[[Awaitable[Any]], Awaitable[Any]],
+    ) -> Dict[TeamKey, Optional[Dict]]:
+        """Injury summaries for every team in a slate (the shared fetcher is sport-stateful, so one sport at a time)"""
+        fetcher = self._get_injury_fetcher()
+        teams_by_sport: Dict[str, List[TeamKey]] = {}
+        for key in teams:
+            teams_by_sport.setdefault((key[0] or "").lower().strip(), []).append(key)
+
+        summaries: Dict[TeamKey, Optional[Dict]] = {}
+        for sport_lower, keys in teams_by_sport.items():
+            fetcher.sport = sport_lower
+            raw = await asyncio.gather(*(limited(fetcher.get_team_injuries(team)) for _, team in keys))
+            summaries.update((key, self._injury_list_to_summary(injuries)) for key, injuries in zip(keys, raw))
+        return summaries
+    
     async def _fetch_matchup_context(
         self, 
         home_team: str, 
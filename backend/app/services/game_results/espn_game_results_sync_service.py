@@ -16,6 +16,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.game_results import GameResult
+from app.services.http.shared_http_client import pooled_http_session
 from app.utils.timezone_utils import TimezoneNormalizer
 
 logger = logging.getLogger(__name__)
@@ -74,7 +75,7 @@ class EspnGameResultsSyncService:
         url = f"{base_url}?dates={date_str}"
 
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
+            async with pooled_http_session(timeout=self.TIMEOUT) as client:
                 response = await client.get(url)
                 if response.status_code != 200:
                     logger.debug(f"[GAME_RESULTS_SYNC] ESPN returned {response.status_code} for {sport_code} on {date_str}")
@@ -5,6 +5,7 @@ from datetime import datetime, date, timedelta
 from typing import Dict, Optional, List
 import logging
 
+from app.services.http.shared_http_client import pooled_http_session
 from app.utils.timezone_utils import TimezoneNormalizer
 
 logger = logging.getLogger(__name__)
@@ -166,7 +167,7 @@ class GameTimeCorrector:
             return []
         
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
+            async with pooled_http_session(timeout=self.TIMEOUT) as client:
                 response = await client.get(
                     base_url,
                     params={"dates": date_str}
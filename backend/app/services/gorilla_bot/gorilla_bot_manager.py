@@ -6,13 +6,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+import asyncio
 import uuid
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.database.session import AsyncSessionLocal
 from app.models.user import User
 from app.services.ai_text_sanitizer import AiTextSanitizer
 from app.services.gorilla_bot.conversation_repository import GorillaBotConversationRepository
@@ -40,6 +42,70 @@ class GorillaBotChatResult:
     citations: List[GorillaBotCitation]
 
 
+@dataclass(frozen=True)
+class GorillaBotStreamEvent:
+    event: str  # start | token | done
+    data: Dict[str, Any]
+
+
+class GorillaBotChatStream:
+    """
+    A started streaming chat turn.
+
+    The conversation and the user's message are already committed; `events()` forwards
+    reply tokens as they arrive and saves the assistant message (in its own session) once
+    the stream completes.
+    """
+
+    def __init__(
+        self,
+        conversation_id: uuid.UUID,
+        citations: List[GorillaBotCitation],
+        tokens: AsyncIterator[str],
+        sanitizer: AiTextSanitizer,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self._conversation_id = conversation_id
+        self._citations = citations
+        self._tokens = tokens
+        self._sanitizer = sanitizer
+        self._session_factory = session_factory
+
+    async def events(self) -> AsyncIterator[GorillaBotStreamEvent]:
+        yield GorillaBotStreamEvent(
+            "start",
+            {
+                "conversation_id": str(self._conversation_id),
+                "citations": [citation.__dict__ for citation in self._citations],
+            },
+        )
+        parts: List[str] = []
+        async for delta in self._tokens:
+            parts.append(delta)
+            yield GorillaBotStreamEvent("token", {"text": delta})
+
+        reply = self._sanitizer.sanitize("".join(parts))
+        message_id = await self._persist(reply)
+        yield GorillaBotStreamEvent(
+            "done",
+            {"conversation_id": str(self._conversation_id), "message_id": message_id, "reply": reply},
+        )
+
+    async def _persist(self, reply: str) -> str:
+        async with self._session_factory() as db:
+            message = await GorillaBotMessageRepository(db).add_message(
+                self._conversation_id,
+                "assistant",
+                reply,
+                citations=[citation.__dict__ for citation in self._citations] if self._citations else None,
+            )
+            await GorillaBotConversationRepository(db).mark_last_message(
+                self._conversation_id, datetime.now(timezone.utc)
+            )
+            await db.commit()
+            return str(message.id)
+
+
 class GorillaBotConversationTitleGenerator:
     def generate(self, question: str) -> str:
         words = [w for w in (question or "").strip().split() if w]
@@ -175,11 +241,7 @@ class GorillaBotManager:
             raise RuntimeError("Gorilla Bot is disabled.")
 
         try:
-            conversation = await self._get_or_create_conversation(user, conversation_id, question)
-            await self._messages.add_message(conversation.id, "user", question)
-
-            user_context = await self._user_context_builder.build(user)
-            snippets = await self._retriever.retrieve(question)
+            conversation, user_context, snippets = await self._prepare_turn(user, question, conversation_id)
             citations = self._build_citations(snippets)
 
             reply = await self._generate_reply(question, user_context, snippets, citations)
@@ -203,6 +265,60 @@ class GorillaBotManager:
             await self._db.rollback()
             raise
 
+    async def start_chat_stream(
+        self,
+        user: User,
+        question: str,
+        conversation_id: Optional[uuid.UUID],
+    ) -> GorillaBotChatStream:
+        """
+        Save the user's message and return a stream of the reply.
+
+        Conversation errors (ValueError) and a disabled bot (RuntimeError) raise here,
+        before any token is sent. The request session is committed before streaming starts,
+        so no transaction stays open while the model is writing.
+        """
+        if not settings.gorilla_bot_enabled:
+            raise RuntimeError("Gorilla Bot is disabled.")
+
+        try:
+            conversation, user_context, snippets = await self._prepare_turn(user, question, conversation_id)
+            await self._conversations.mark_last_message(conversation.id, datetime.now(timezone.utc))
+            await self._db.commit()
+        except Exception:
+            await self._db.rollback()
+            raise
+
+        citations = self._build_citations(snippets)
+        return GorillaBotChatStream(
+            conversation_id=conversation.id,
+            citations=citations,
+            tokens=self._stream_reply(question, user_context, snippets, citations),
+            sanitizer=self._sanitizer,
+        )
+
+    async def _prepare_turn(
+        self,
+        user: User,
+        question: str,
+        conversation_id: Optional[uuid.UUID],
+    ) -> Tuple[Any, GorillaBotUserContext, List[GorillaBotContextSnippet]]:
+        """
+        Load/create the conversation, store the question and build user context while
+        knowledgebase retrieval runs concurrently (the retriever uses its own session).
+        """
+        retrieval = asyncio.create_task(self._retriever.retrieve(question))
+        try:
+            conversation = await self._get_or_create_conversation(user, conversation_id, question)
+            await self._messages.add_message(conversation.id, "user", question)
+            user_context = await self._user_context_builder.build(user)
+        except BaseException:
+            retrieval.cancel()
+            await asyncio.gather(retrieval, return_exceptions=True)
+            raise
+        snippets = await retrieval
+        return conversation, user_context, snippets
+
     async def _get_or_create_conversation(
         self,
         user: User,
@@ -240,6 +356,32 @@ class GorillaBotManager:
 
         return self._sanitizer.sanitize(response)
 
+    async def _stream_reply(
+        self,
+        question: str,
+        user_context: GorillaBotUserContext,
+        snippets: List[GorillaBotContextSnippet],
+        citations: List[GorillaBotCitation],
+    ) -> AsyncIterator[str]:
+        if not self._openai.enabled:
+            yield self._fallback.build(question, user_context, citations)
+            return
+
+        messages = self._prompt_builder.build_messages(question, user_context, snippets)
+        received = False
+        try:
+            async for delta in self._openai.stream_chat_completion(
+                messages=messages,
+                max_tokens=int(settings.gorilla_bot_max_response_tokens),
+            ):
+                received = True
+                yield delta
+        except Exception as exc:
+            logger.warning("Gorilla Bot OpenAI stream failed: %s", exc)
+            # Keep a partial answer as-is; only replace a reply that never started.
+            if not received:
+                yield self._fallback.build(question, user_context, citations)
+
     def _build_citations(self, snippets: List[GorillaBotContextSnippet]) -> List[GorillaBotCitation]:
         citations: List[GorillaBotCitation] = []
         seen = set()
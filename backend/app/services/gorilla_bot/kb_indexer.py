@@ -17,6 +17,7 @@ from app.core.config import settings
 from app.models.gorilla_bot_kb_chunk import GorillaBotKnowledgeChunk, GORILLA_BOT_EMBEDDING_DIM
 from app.services.gorilla_bot.kb_chunker import GorillaBotChunker
 from app.services.gorilla_bot.kb_repository import GorillaBotKnowledgeRepository
+from app.services.gorilla_bot.kb_vector_index import get_gorilla_bot_vector_index
 from app.services.gorilla_bot.openai_client import GorillaBotOpenAIClient
 
 logger = logging.getLogger(__name__)
@@ -136,6 +137,9 @@ class GorillaBotKnowledgeBaseIndexer:
             else:
                 skipped += 1
 
+        # Load new/changed documents into this process's retrieval index right away.
+        await get_gorilla_bot_vector_index().sync(self._db)
+
         return GorillaBotIndexSummary(
             total_documents=len(documents),
             indexed_documents=indexed,
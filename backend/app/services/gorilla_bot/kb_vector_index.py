@@ -0,0 +1,183 @@
+"""
+Process-local vector index for Gorilla Bot knowledgebase retrieval (non-pgvector path).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.gorilla_bot_kb_chunk import GorillaBotKnowledgeChunk
+from app.models.gorilla_bot_kb_document import GorillaBotKnowledgeDocument
+from app.services.gorilla_bot.prompt_builder import GorillaBotContextSnippet
+
+
+@dataclass(frozen=True)
+class _IndexedDocument:
+    checksum: str
+    snippets: List[GorillaBotContextSnippet]
+    embeddings: List[Optional[List[float]]]
+
+
+class GorillaBotVectorIndex:
+    """
+    Exact cosine search over active chunk embeddings held as one float32 matrix.
+
+    Rows are L2-normalized so a query is a single matmul + argpartition. Documents are
+    (re)loaded by checksum: a sync reads only (id, checksum) for active documents and
+    fetches chunk embeddings just for documents that are new or changed. Chunks without a
+    usable embedding keep a zero row (score 0.0), matching the old full-scan behaviour.
+    """
+
+    def __init__(self, *, refresh_seconds: Optional[float] = None):
+        if refresh_seconds is None:
+            refresh_seconds = float(getattr(settings, "gorilla_bot_index_refresh_seconds", 60.0))
+        self._refresh_seconds = max(0.0, float(refresh_seconds))
+        self._documents: Dict[str, _IndexedDocument] = {}
+        self._snippets: List[GorillaBotContextSnippet] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._checked_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._snippets)
+
+    @property
+    def dimension(self) -> int:
+        return 0 if self._matrix is None else int(self._matrix.shape[1])
+
+    def invalidate(self) -> None:
+        """Force the next `ensure_fresh` to re-check document checksums."""
+        self._checked_at = None
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        checked_at = self._checked_at
+        if checked_at is not None and time.monotonic() - checked_at < self._refresh_seconds:
+            return
+        await self.sync(db)
+
+    async def sync(self, db: AsyncSession) -> bool:
+        """Reload new/changed documents and drop inactive ones. Returns True if the index changed."""
+        async with self._lock:
+            result = await db.execute(
+                select(
+                    GorillaBotKnowledgeDocument.id,
+                    GorillaBotKnowledgeDocument.checksum,
+                    GorillaBotKnowledgeDocument.title,
+                    GorillaBotKnowledgeDocument.source_path,
+                    GorillaBotKnowledgeDocument.source_url,
+                ).where(GorillaBotKnowledgeDocument.is_active == True)  # noqa: E712
+            )
+            active = {str(row.id): row for row in result.all()}
+            changed = [
+                row
+                for doc_id, row in active.items()
+                if doc_id not in self._documents or self._documents[doc_id].checksum != row.checksum
+            ]
+            removed = [doc_id for doc_id in self._documents if doc_id not in active]
+
+            if changed:
+                loaded = await self._load_documents(db, changed)
+                self._documents.update(loaded)
+            for doc_id in removed:
+                self._documents.pop(doc_id, None)
+            if changed or removed:
+                self._rebuild()
+            self._checked_at = time.monotonic()
+            return bool(changed or removed)
+
+    def search(self, vector: List[float], limit: int) -> List[GorillaBotContextSnippet]:
+        """Top `limit` snippets by cosine similarity to `vector` (highest first)."""
+        count = len(self._snippets)
+        k = min(max(0, int(limit)), count)
+        if k == 0:
+            return []
+        scores = self._scores(vector, count)
+        if k < count:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(count)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [replace(self._snippets[i], score=float(scores[i])) for i in top]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _scores(self, vector: List[float], count: int) -> np.ndarray:
+        matrix = self._matrix
+        query = np.asarray(vector or [], dtype=np.float32)
+        if matrix is None or query.shape != (matrix.shape[1],):
+            return np.zeros(count, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return np.zeros(count, dtype=np.float32)
+        return matrix @ (query / norm)
+
+    async def _load_documents(self, db: AsyncSession, docs: List[Any]) -> Dict[str, _IndexedDocument]:
+        by_id = {str(doc.id): doc for doc in docs}
+        result = await db.execute(
+            select(
+                GorillaBotKnowledgeChunk.document_id,
+                GorillaBotKnowledgeChunk.content,
+                GorillaBotKnowledgeChunk.embedding_json,
+            )
+            .where(GorillaBotKnowledgeChunk.document_id.in_([doc.id for doc in docs]))
+            .order_by(GorillaBotKnowledgeChunk.document_id, GorillaBotKnowledgeChunk.chunk_index)
+        )
+        loaded = {
+            doc_id: _IndexedDocument(checksum=doc.checksum, snippets=[], embeddings=[])
+            for doc_id, doc in by_id.items()
+        }
+        for document_id, content, embedding in result.all():
+            doc_id = str(document_id)
+            doc = by_id[doc_id]
+            loaded[doc_id].snippets.append(
+                GorillaBotContextSnippet(
+                    title=doc.title,
+                    content=content,
+                    source_path=doc.source_path,
+                    source_url=doc.source_url,
+                    score=0.0,
+                )
+            )
+            loaded[doc_id].embeddings.append(list(embedding) if embedding else None)
+        return loaded
+
+    def _rebuild(self) -> None:
+        snippets: List[GorillaBotContextSnippet] = []
+        embeddings: List[Optional[List[float]]] = []
+        for doc_id in sorted(self._documents):
+            document = self._documents[doc_id]
+            snippets.extend(document.snippets)
+            embeddings.extend(document.embeddings)
+
+        dim = next((len(e) for e in embeddings if e), 0)
+        matrix: Optional[np.ndarray] = None
+        if dim:
+            matrix = np.zeros((len(embeddings), dim), dtype=np.float32)
+            for row, embedding in enumerate(embeddings):
+                if embedding and len(embedding) == dim:
+                    matrix[row] = embedding
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+        self._snippets = snippets
+        self._matrix = matrix
+
+
+_vector_index: Optional[GorillaBotVectorIndex] = None
+
+
+def get_gorilla_bot_vector_index() -> GorillaBotVectorIndex:
+    """Module singleton shared by the retriever and the indexer."""
+    global _vector_index
+    if _vector_index is None:
+        _vector_index = GorillaBotVectorIndex()
+    return _vector_index
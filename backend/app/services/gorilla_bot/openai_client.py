@@ -5,7 +5,7 @@ OpenAI client wrapper for Gorilla Bot.
 from __future__ import annotations
 
 import asyncio
-from typing import List, Dict, Any
+from typing import Any, AsyncIterator, Dict, List
 
 from openai import AsyncOpenAI
 
@@ -56,3 +56,28 @@ class GorillaBotOpenAIClient:
             timeout=self._chat_timeout,
         )
         return (response.choices[0].message.content or "").strip()
+
+    async def stream_chat_completion(self, messages: List[Dict[str, Any]], max_tokens: int) -> AsyncIterator[str]:
+        """Yield completion text deltas as they arrive (the timeout applies to each wait, not the total)."""
+        if not self._enabled or not self._client:
+            raise RuntimeError("OpenAI is disabled for Gorilla Bot chat.")
+
+        stream = await asyncio.wait_for(
+            self._client.chat.completions.create(
+                model=self._chat_model,
+                messages=messages,
+                temperature=0.2,
+                max_tokens=max_tokens,
+                stream=True,
+            ),
+            timeout=self._chat_timeout,
+        )
+        chunks = stream.__aiter__()
+        while True:
+            try:
+                chunk = await asyncio.wait_for(chunks.__anext__(), timeout=self._chat_timeout)
+            except StopAsyncIteration:
+                return
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
@@ -0,0 +1,169 @@
+"""
+Process-wide pooled `httpx.AsyncClient` for outbound data fetchers.
+
+Creating a client per call pays a fresh TCP+TLS handshake every time. Fetchers instead
+use `pooled_http_session(timeout=..., headers=..., follow_redirects=...)` in place of
+`httpx.AsyncClient(...)`: same `async with` shape, but requests go through the shared
+client and leaving the block does not close the pool.
+httpx keeps one connection pool per origin inside the client; HTTP/2 is negotiated via
+ALPN when `h2` is installed and the host supports it (others stay on HTTP/1.1).
+
+An `httpx.AsyncClient` is bound to the event loop that first used it, so the registry
+keeps one client per running loop (tests and `asyncio.run` scripts get their own).
+The FastAPI app and the worker entrypoints call `close_http_clients()` on shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+try:  # Optional: enables HTTP/2
+    import h2  # type: ignore  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    _HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class SharedHttpClientRegistry:
+    """One lazily-created, pooled `httpx.AsyncClient` per event loop."""
+
+    def __init__(
+        self,
+        *,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry_seconds: Optional[float] = None,
+        timeout_seconds: Optional[float] = None,
+        connect_timeout_seconds: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=int(max_connections or getattr(settings, "http_client_max_connections", 200)),
+            max_keepalive_connections=int(
+                max_keepalive_connections or getattr(settings, "http_client_max_keepalive_connections", 50)
+            ),
+            keepalive_expiry=float(
+                keepalive_expiry_seconds or getattr(settings, "http_client_keepalive_expiry_seconds", 30.0)
+            ),
+        )
+        self._timeout = httpx.Timeout(
+            float(timeout_seconds or getattr(settings, "http_client_timeout_seconds", 15.0)),
+            connect=float(connect_timeout_seconds or getattr(settings, "http_client_connect_timeout_seconds", 5.0)),
+        )
+        if http2 is None:
+            http2 = bool(getattr(settings, "http_client_http2", True))
+        self._http2 = bool(http2) and _HTTP2_AVAILABLE
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self._http2,
+                limits=self._limits,
+                timeout=self._timeout,
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the current loop's client (a later `get()` creates a new one)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        client = self._clients.pop(loop, None)
+        if client is not None and not client.is_closed:
+            try:
+                await client.aclose()
+            except Exception as exc:
+                logger.debug("Shared HTTP client close failed: %s", exc)
+
+
+_registry: Optional[SharedHttpClientRegistry] = None
+
+
+def get_http_client_registry() -> SharedHttpClientRegistry:
+    global _registry
+    if _registry is None:
+        _registry = SharedHttpClientRegistry()
+    return _registry
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Pooled client for the running event loop. Do not close it; it is shared."""
+    return get_http_client_registry().get()
+
+
+async def close_http_clients() -> None:
+    await get_http_client_registry().aclose()
+
+
+class PooledHttpSession:
+    """Per-call defaults (timeout, headers, redirects) applied to requests on the shared client."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        timeout: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        follow_redirects: Optional[bool] = None,
+    ) -> None:
+        self._client = client
+        self._timeout = timeout
+        self._headers = dict(headers or {})
+        self._follow_redirects = follow_redirects
+
+    async def __aenter__(self) -> "PooledHttpSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None  # the pool outlives the session
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client.is_closed
+
+    async def request(self, method: str, url: Any, **kwargs: Any) -> httpx.Response:
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        if self._follow_redirects is not None:
+            kwargs.setdefault("follow_redirects", self._follow_redirects)
+        if self._headers:
+            kwargs["headers"] = {**self._headers, **dict(kwargs.get("headers") or {})}
+        return await self._client.request(method, url, **kwargs)
+
+    async def get(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def head(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("HEAD", url, **kwargs)
+
+
+def pooled_http_session(
+    *,
+    timeout: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+    follow_redirects: Optional[bool] = None,
+) -> PooledHttpSession:
+    """Drop-in for `httpx.AsyncClient(timeout=..., ...)` blocks that reuses pooled connections."""
+    return PooledHttpSession(
+        get_http_client(), timeout=timeout, headers=headers, follow_redirects=follow_redirects
+    )
@@ -57,8 +57,22 @@ class MarketRegimeService:
     ) -> str:
         """
         Classify regime from variance of predictions (and optional odds variance).
-        Uses rolling statistical thresholds.
+        Uses rolling statistical thresholds. Without explicit inputs the per-sport regime
+        comes from the model inputs snapshot (recomputed every few minutes).
         """
+        if odds_variance is None and prediction_variance is None:
+            from app.services.institutional.model_inputs_snapshot import get_model_inputs_cache
+
+            return await get_model_inputs_cache().get_regime(self.db, sport)
+        return await self.compute_regime(sport, odds_variance, prediction_variance)
+
+    async def compute_regime(
+        self,
+        sport: Optional[str] = None,
+        odds_variance: Optional[float] = None,
+        prediction_variance: Optional[float] = None,
+    ) -> str:
+        """Classify regime from the DB (no snapshot)."""
         var = prediction_variance
         if var is None:
             var = await self._recent_prediction_variance(sport=sport)
@@ -0,0 +1,165 @@
+"""
+Process-wide snapshot of slow-changing model inputs: validated alpha features, strategy
+weights and the market regime per sport.
+
+These change only when the alpha research worker promotes/deprecates features or
+`RLWeightOptimizer` writes new weights, yet the prediction path read them from the DB
+for every game. Readers now share one in-process snapshot:
+
+- The snapshot is tagged with a version. Writers call `bump_model_inputs_version()`
+  after committing; it increments a Redis counter (and a local one), and each process
+  reloads on its next read once it sees a different version. The Redis version is
+  checked at most every `VERSION_CHECK_SECONDS`.
+- Regimes depend on recent predictions, not on writers, so they are computed lazily per
+  sport and expire after `REGIME_TTL_SECONDS`. The whole snapshot also expires after
+  `MAX_AGE_SECONDS` as a safety net if Redis is unavailable.
+- Loads are single-flight per process. Redis errors fail open to local versioning.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "model_inputs:version:v1"
+VERSION_CHECK_SECONDS = 5.0
+MAX_AGE_SECONDS = 600.0
+REGIME_TTL_SECONDS = 300.0
+
+
+@dataclass
+class ModelInputsSnapshot:
+    version: str
+    loaded_at: float
+    alpha_contributions: List[Dict[str, Any]]
+    strategy_weights: Dict[str, float]
+    regimes: Dict[str, Tuple[str, float]] = field(default_factory=dict)  # sport -> (regime, computed_at)
+
+
+class ModelInputsCache:
+    """Holds the current snapshot and reloads it when the version changes."""
+
+    def __init__(self, provider: Any = None) -> None:
+        self._provider = provider
+        self._snapshot: Optional[ModelInputsSnapshot] = None
+        self._local_version = 0
+        self._shared_version: Optional[str] = None
+        self._version_checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def reset(self) -> None:
+        self._lock = asyncio.Lock()
+        self._snapshot = None
+        self._shared_version = None
+        self._version_checked_at = 0.0
+
+    async def get(self, db: AsyncSession) -> ModelInputsSnapshot:
+        version = await self._current_version()
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh(snapshot, version):
+            return snapshot
+        async with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and self._is_fresh(snapshot, version):
+                return snapshot
+            snapshot = await self._load(db, version)
+            self._snapshot = snapshot
+            return snapshot
+
+    async def get_regime(self, db: AsyncSession, sport: Optional[str]) -> str:
+        snapshot = await self.get(db)
+        key = (sport or "").upper()
+        cached = snapshot.regimes.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < REGIME_TTL_SECONDS:
+            return cached[0]
+        from app.services.institutional.market_regime_service import MarketRegimeService
+
+        regime = await MarketRegimeService(db).compute_regime(sport=sport)
+        snapshot.regimes[key] = (regime, now)
+        return regime
+
+    async def bump(self) -> None:
+        self._local_version += 1
+        self._snapshot = None
+        client = self._redis_client()
+        if client is None:
+            return
+        try:
+            self._shared_version = str(await client.incr(VERSION_KEY))
+            self._version_checked_at = time.monotonic()
+        except Exception as exc:
+            logger.debug("Model inputs version bump failed: %s", exc)
+
+    def _is_fresh(self, snapshot: ModelInputsSnapshot, version: str) -> bool:
+        return snapshot.version == version and time.monotonic() - snapshot.loaded_at < MAX_AGE_SECONDS
+
+    async def _current_version(self) -> str:
+        now = time.monotonic()
+        if now - self._version_checked_at >= VERSION_CHECK_SECONDS:
+            self._version_checked_at = now
+            client = self._redis_client()
+            if client is not None:
+                try:
+                    raw = await client.get(VERSION_KEY)
+                    self._shared_version = raw.decode() if isinstance(raw, bytes) else (str(raw) if raw else "0")
+                except Exception as exc:
+                    logger.debug("Model inputs version check failed: %s", exc)
+        return f"{self._shared_version or '0'}:{self._local_version}"
+
+    async def _load(self, db: AsyncSession, version: str) -> ModelInputsSnapshot:
+        from app.alpha.model_augmentation_service import ModelAugmentationService
+        from app.services.institutional.strategy_decomposition_service import StrategyDecompositionService
+
+        alpha = await ModelAugmentationService(db).load_validated_alpha_contributions()
+        weights = await StrategyDecompositionService(db).load_weights()
+        logger.debug("Model inputs snapshot loaded version=%s alpha_features=%s", version, len(alpha))
+        return ModelInputsSnapshot(
+            version=version,
+            loaded_at=time.monotonic(),
+            alpha_contributions=alpha,
+            strategy_weights=weights,
+        )
+
+    def _redis_client(self) -> Any:
+        if self._provider is None:
+            from app.services.redis.redis_client_provider import get_redis_provider
+
+            self._provider = get_redis_provider()
+        try:
+            if not self._provider.is_configured():
+                return None
+            return self._provider.get_client()
+        except Exception:
+            return None
+
+
+_cache: Optional[ModelInputsCache] = None
+
+
+def get_model_inputs_cache() -> ModelInputsCache:
+    global _cache
+    if _cache is None:
+        _cache = ModelInputsCache()
+    return _cache
+
+
+async def get_model_inputs_snapshot(db: AsyncSession) -> ModelInputsSnapshot:
+    return await get_model_inputs_cache().get(db)
+
+
+async def bump_model_inputs_version() -> None:
+    """Call after committing changes to alpha features or strategy weights."""
+    await get_model_inputs_cache().bump()
+
+
+def reset_model_inputs_snapshot() -> None:
+    """Drop the in-process snapshot (for testing)."""
+    get_model_inputs_cache().reset()
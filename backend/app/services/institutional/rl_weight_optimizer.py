@@ -20,6 +20,7 @@ from app.models.prediction_outcome import PredictionOutcome
 from app.models.strategy_weight import StrategyWeight
 from app.models.strategy_contribution import StrategyContribution
 from app.models.model_health_state import ModelHealthState
+from app.services.institutional.model_inputs_snapshot import bump_model_inputs_version
 from app.services.institutional.strategy_constants import ALL_STRATEGIES, default_equal_weights
 
 logger = logging.getLogger(__name__)
@@ -180,6 +181,7 @@ class RLWeightOptimizer:
         else:
             self.db.add(ModelHealthState(last_rl_update_at=now_utc))
         await self.db.commit()
+        await bump_model_inputs_version()
 
         logger.info(
             "rl_weight_optimizer.updated",
@@ -50,6 +50,13 @@ class StrategyDecompositionService:
         logger.info("institutional.strategy_weights.seeded", extra={"strategies": len(ALL_STRATEGIES)})
 
     async def get_weights(self) -> Dict[str, float]:
+        """Strategy weights from the process-wide model inputs snapshot (reloaded on version bump)."""
+        from app.services.institutional.model_inputs_snapshot import get_model_inputs_snapshot
+
+        snapshot = await get_model_inputs_snapshot(self.db)
+        return dict(snapshot.strategy_weights)
+
+    async def load_weights(self) -> Dict[str, float]:
         """Load strategy weights from DB; normalize to sum 1.0; cap each at 0.5."""
         result = await self.db.execute(select(StrategyWeight))
         rows = result.scalars().all()
@@ -0,0 +1,317 @@
+"""Maintains the pre-aggregated leaderboard tables.
+
+`verified_winner_totals` and `ai_usage_totals` hold one row per user so the
+/leaderboards endpoints read a top-N slice off an index instead of aggregating
+saved parlay results, verification records and parlays on every request.
+
+Updates:
+- `refresh_verified_winners(user_ids)`: recompute those users' rows from source. Called
+  when a saved parlay resolves and (via `refresh_recent_verifications`) when verification
+  records confirm; the SUI verifier runs out of process, so confirmations are picked up by
+  a short scheduler job on `confirmed_at`.
+- `record_ai_generation(user_id)`: +1 on both counters when a parlay is generated or a
+  custom parlay is saved.
+- `rebuild()`: full recompute (scheduler), which also ages generations out of `count_30d`.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, delete, exists, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ai_usage_totals import AiUsageTotals
+from app.models.parlay import Parlay
+from app.models.saved_parlay import SavedParlay, SavedParlayType
+from app.models.saved_parlay_results import SavedParlayResult
+from app.models.user import User
+from app.models.verification_record import VerificationRecord, VerificationStatus
+from app.models.verified_winner_totals import VerifiedWinnerTotals
+
+logger = logging.getLogger(__name__)
+
+AI_USAGE_WINDOW_DAYS = 30
+UPSERT_CHUNK_SIZE = 500
+
+_VERIFIED_WINNER_COLUMNS = (
+    "verified_wins",
+    "verified_resolved",
+    "win_rate",
+    "last_win_at",
+    "last_win_inscription_id",
+)
+_AI_USAGE_COLUMNS = ("total_count", "count_30d", "last_generated_at")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _inscription_id(tx_digest: Any, object_id: Any, data_hash: Any) -> Optional[str]:
+    for value in (tx_digest, object_id, data_hash):
+        text = str(value or "").strip()
+        if text:
+            return text
+    return None
+
+
+class LeaderboardTotalsService:
+    """Incremental updates, full rebuilds and top-N reads for leaderboard totals."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ------------------------------------------------------------------
+    # Verified Winners
+    # ------------------------------------------------------------------
+
+    async def refresh_verified_winners(self, user_ids: Iterable[uuid.UUID]) -> int:
+        """Recompute verified winner totals for these users and commit."""
+        ids = list(dict.fromkeys(uid for uid in user_ids if uid))
+        if not ids:
+            return 0
+        rows = await self._compute_verified_winners(ids)
+        stale = set(ids) - {row["user_id"] for row in rows}
+        if stale:
+            await self.db.execute(delete(VerifiedWinnerTotals).where(VerifiedWinnerTotals.user_id.in_(list(stale))))
+        await self._upsert_rows(VerifiedWinnerTotals, rows, _VERIFIED_WINNER_COLUMNS)
+        await self.db.commit()
+        return len(rows)
+
+    async def refresh_recent_verifications(self, since: datetime) -> int:
+        """Refresh users whose verification records confirmed at or after `since`."""
+        result = await self.db.execute(
+            select(VerificationRecord.user_id)
+            .where(VerificationRecord.status == VerificationStatus.confirmed.value)
+            .where(VerificationRecord.confirmed_at >= since)
+            .distinct()
+        )
+        return await self.refresh_verified_winners([row[0] for row in result.all()])
+
+    async def _compute_verified_winners(self, user_ids: Optional[List[uuid.UUID]]) -> List[Dict[str, Any]]:
+        wins_expr = func.sum(case((SavedParlayResult.hit.is_(True), 1), else_=0))
+        last_win_expr = func.max(case((SavedParlayResult.hit.is_(True), SavedParlayResult.resolved_at), else_=None))
+        q = (
+            select(
+                SavedParlayResult.user_id,
+                wins_expr.label("wins"),
+                func.count(SavedParlayResult.id).label("resolved"),
+                last_win_expr.label("last_win_at"),
+            )
+            .where(SavedParlayResult.parlay_type == SavedParlayType.custom.value)
+            .where(SavedParlayResult.hit.isnot(None))
+            .where(
+                exists(
+                    select(1)
+                    .select_from(VerificationRecord)
+                    .where(VerificationRecord.user_id == SavedParlayResult.user_id)
+                    .where(VerificationRecord.saved_parlay_id == SavedParlayResult.saved_parlay_id)
+                    .where(VerificationRecord.status == VerificationStatus.confirmed.value)
+                )
+            )
+            .group_by(SavedParlayResult.user_id)
+        )
+        if user_ids is not None:
+            q = q.where(SavedParlayResult.user_id.in_(user_ids))
+        aggregates = (await self.db.execute(q)).all()
+        inscriptions = await self._last_win_inscriptions(user_ids)
+
+        rows: List[Dict[str, Any]] = []
+        for user_id, wins, resolved, last_win_at in aggregates:
+            wins = int(wins or 0)
+            resolved = int(resolved or 0)
+            rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "verified_wins": wins,
+                    "verified_resolved": resolved,
+                    "win_rate": (wins / resolved) if resolved else 0.0,
+                    "last_win_at": last_win_at,
+                    "last_win_inscription_id": inscriptions.get(str(user_id)),
+                }
+            )
+        return rows
+
+    async def _last_win_inscriptions(self, user_ids: Optional[List[uuid.UUID]]) -> Dict[str, str]:
+        """Inscription id of each user's most recent verified win (one query for all users)."""
+        q = (
+            select(
+                VerificationRecord.user_id,
+                VerificationRecord.tx_digest,
+                VerificationRecord.object_id,
+                VerificationRecord.data_hash,
+            )
+            .select_from(VerificationRecord)
+            .join(
+                SavedParlayResult,
+                (SavedParlayResult.saved_parlay_id == VerificationRecord.saved_parlay_id)
+                & (SavedParlayResult.user_id == VerificationRecord.user_id),
+            )
+            .where(VerificationRecord.status == VerificationStatus.confirmed.value)
+            .where(SavedParlayResult.parlay_type == SavedParlayType.custom.value)
+            .where(SavedParlayResult.hit.is_(True))
+            .order_by(
+                VerificationRecord.user_id,
+                SavedParlayResult.resolved_at.desc(),
+                VerificationRecord.created_at.desc(),
+            )
+        )
+        if user_ids is not None:
+            q = q.where(VerificationRecord.user_id.in_(user_ids))
+        out: Dict[str, str] = {}
+        seen = set()
+        for user_id, tx_digest, object_id, data_hash in (await self.db.execute(q)).all():
+            key = str(user_id)
+            if key in seen:
+                continue
+            seen.add(key)
+            inscription = _inscription_id(tx_digest, object_id, data_hash)
+            if inscription:
+                out[key] = inscription
+        return out
+
+    async def top_verified_winners(self, limit: int) -> List[Tuple[Any, ...]]:
+        """(totals, display_name, username, account_number, leaderboard_visibility), best first."""
+        result = await self.db.execute(
+            select(
+                VerifiedWinnerTotals,
+                User.display_name,
+                User.username,
+                User.account_number,
+                User.leaderboard_visibility,
+            )
+            .join(User, User.id == VerifiedWinnerTotals.user_id)
+            .where(VerifiedWinnerTotals.verified_wins > 0)
+            .where(User.leaderboard_visibility != "hidden")
+            .order_by(
+                VerifiedWinnerTotals.verified_wins.desc(),
+                VerifiedWinnerTotals.win_rate.desc(),
+                VerifiedWinnerTotals.last_win_at.desc(),
+            )
+            .limit(int(limit))
+        )
+        return [tuple(row) for row in result.all()]
+
+    # ------------------------------------------------------------------
+    # AI Power Users
+    # ------------------------------------------------------------------
+
+    async def record_ai_generation(self, user_id: Optional[uuid.UUID], at: Optional[datetime] = None) -> None:
+        """
+        Count one AI generation / custom save for `user_id`. Joins the caller's transaction.
+
+        Runs in a savepoint and never raises: a leaderboard counter must not fail parlay
+        creation (the periodic rebuild repairs any missed increment).
+        """
+        if not user_id:
+            return
+        at = at or _utcnow()
+        insert = self._insert()
+        stmt = insert(AiUsageTotals).values(
+            id=uuid.uuid4(), user_id=user_id, total_count=1, count_30d=1, last_generated_at=at
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                "total_count": AiUsageTotals.total_count + 1,
+                "count_30d": AiUsageTotals.count_30d + 1,
+                "last_generated_at": stmt.excluded.last_generated_at,
+                "updated_at": func.now(),
+            },
+        )
+        try:
+            async with self.db.begin_nested():
+                await self.db.execute(stmt)
+        except Exception as e:
+            logger.warning("Failed to record AI usage for user %s: %s", user_id, e)
+
+    async def _compute_ai_usage(self) -> List[Dict[str, Any]]:
+        cutoff = _utcnow() - timedelta(days=AI_USAGE_WINDOW_DAYS)
+        sources = (
+            (Parlay, select(Parlay.user_id).where(Parlay.user_id.isnot(None))),
+            (
+                SavedParlay,
+                select(SavedParlay.user_id)
+                .where(SavedParlay.user_id.isnot(None))
+                .where(SavedParlay.parlay_type == SavedParlayType.custom.value),
+            ),
+        )
+        by_user: Dict[str, Dict[str, Any]] = {}
+        for model, base in sources:
+            q = base.add_columns(
+                func.count(model.id),
+                func.sum(case((model.created_at >= cutoff, 1), else_=0)),
+                func.max(model.created_at),
+            ).group_by(model.user_id)
+            for user_id, total, recent, last_at in (await self.db.execute(q)).all():
+                row = by_user.setdefault(
+                    str(user_id),
+                    {"id": uuid.uuid4(), "user_id": user_id, "total_count": 0, "count_30d": 0, "last_generated_at": None},
+                )
+                row["total_count"] += int(total or 0)
+                row["count_30d"] += int(recent or 0)
+                last_at = _aware(last_at)
+                if last_at and (row["last_generated_at"] is None or last_at > row["last_generated_at"]):
+                    row["last_generated_at"] = last_at
+        return list(by_user.values())
+
+    async def top_ai_users(self, *, all_time: bool, limit: int) -> List[Tuple[Any, ...]]:
+        """(totals, display_name, username, account_number, leaderboard_visibility), most active first."""
+        count_col = AiUsageTotals.total_count if all_time else AiUsageTotals.count_30d
+        result = await self.db.execute(
+            select(
+                AiUsageTotals,
+                User.display_name,
+                User.username,
+                User.account_number,
+                User.leaderboard_visibility,
+            )
+            .join(User, User.id == AiUsageTotals.user_id)
+            .where(count_col > 0)
+            .where(User.leaderboard_visibility != "hidden")
+            .order_by(count_col.desc(), AiUsageTotals.last_generated_at.desc())
+            .limit(int(limit))
+        )
+        return [tuple(row) for row in result.all()]
+
+    # ------------------------------------------------------------------
+    # Full rebuild
+    # ------------------------------------------------------------------
+
+    async def rebuild(self) -> Dict[str, int]:
+        """Recompute both tables from source in one transaction."""
+        winners = await self._compute_verified_winners(None)
+        usage = await self._compute_ai_usage()
+        # Upserts (not plain inserts) so an incremental update racing the rebuild cannot conflict.
+        await self.db.execute(delete(VerifiedWinnerTotals))
+        await self._upsert_rows(VerifiedWinnerTotals, winners, _VERIFIED_WINNER_COLUMNS)
+        await self.db.execute(delete(AiUsageTotals))
+        await self._upsert_rows(AiUsageTotals, usage, _AI_USAGE_COLUMNS)
+        await self.db.commit()
+        return {"verified_winners": len(winners), "ai_usage": len(usage)}
+
+    async def _upsert_rows(self, model, rows: List[Dict[str, Any]], columns: Tuple[str, ...]) -> None:
+        insert = self._insert()
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            stmt = insert(model).values(rows[start : start + UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id"],
+                set_={**{col: stmt.excluded[col] for col in columns}, "updated_at": func.now()},
+            )
+            await self.db.execute(stmt)
+
+    def _insert(self):
+        dialect = self.db.get_bind().dialect.name
+        return postgresql.insert if dialect == "postgresql" else sqlite.insert
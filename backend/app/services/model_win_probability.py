@@ -9,15 +9,20 @@ Calculates win probabilities for matchups using a weighted combination of:
 Confidence score is based on both data quality (0-50 pts) and model edge (0-50 pts).
 """
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 import time
 import hashlib
+import logging
+
+import numpy as np
 
 from app.services.probability_engine import get_probability_engine, BaseProbabilityEngine
 
+logger = logging.getLogger(__name__)
+
 # In-memory cache for probability calculations (5 minute TTL)
 _probability_cache: Dict[str, Tuple[Dict, float]] = {}
 _cache_ttl_seconds = 300
@@ -225,118 +230,146 @@ class ModelWinProbabilityCalculator:
                 adjustments_applied: Dict
             }
         """
-        home_fair_prob = base.get("home_fair_prob", 0.5)
-        away_fair_prob = base.get("away_fair_prob", 0.5)
-        
-        # Track which adjustments were applied
-        adjustments_applied = {}
-        data_sources_used = []
-        
-        # 1. Calculate stats-based probability adjustment (30% weight)
-        stats_adjustment = await self._calculate_stats_adjustment(stats)
-        adjustments_applied["stats"] = stats_adjustment
-        if stats.home_team_stats or stats.away_team_stats:
-            data_sources_used.append("team_stats")
-
-        # 1b. API-Sports/v2 feature adjustment from opponent-adjusted strength and form.
-        feature_adjustment = self._calculate_feature_adjustment(stats)
-        adjustments_applied["apisports_features"] = feature_adjustment
-        if stats.home_features or stats.away_features:
-            data_sources_used.append("apisports_features")
-        
-        # 2. Calculate situational adjustment (20% weight)
-        situational_adjustment = await self._calculate_situational_adjustment(stats)
-        adjustments_applied["situational"] = situational_adjustment
-        if stats.weather or stats.rest_days_home is not None or stats.home_injuries:
-            data_sources_used.append("situational")
-        
-        # 3. Add sport-specific home advantage
-        home_advantage = self._get_home_advantage(stats.sport)
-        adjustments_applied["home_advantage"] = home_advantage
-        
+        results = await self.compute_model_win_probabilities_batch([(base, stats, odds_data)])
+        return results[0]
+
+    async def compute_model_win_probabilities_batch(
+        self,
+        items: Sequence[Tuple[Dict[str, float], TeamMatchupStats, Optional[Dict]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute model win probabilities for a slate of games in one pass.
+
+        Per-game adjustments are extracted into a feature matrix (one row per game); the
+        weighted combination, clamping, alpha augmentation and confidence scoring are then
+        applied column-wise with NumPy. Validated alpha contributions are read once for the
+        whole slate. Results are in input order, same shape as `compute_model_win_probabilities`.
+        """
+        n = len(items)
+        if n == 0:
+            return []
+
+        # Feature matrix columns: fair prob, stats, features, situational, home advantage, data quality
+        matrix = np.zeros((n, 6), dtype=float)
+        adjustments_by_game: List[Dict[str, float]] = []
+        sources_by_game: List[List[str]] = []
+
+        for i, (base, stats, odds_data) in enumerate(items):
+            # Track which adjustments were applied
+            adjustments_applied: Dict[str, float] = {}
+            data_sources_used: List[str] = []
+
+            # 1. Stats-based probability adjustment (30% weight)
+            stats_adjustment = await self._calculate_stats_adjustment(stats)
+            adjustments_applied["stats"] = stats_adjustment
+            if stats.home_team_stats or stats.away_team_stats:
+                data_sources_used.append("team_stats")
+
+            # 1b. API-Sports/v2 feature adjustment from opponent-adjusted strength and form.
+            feature_adjustment = self._calculate_feature_adjustment(stats)
+            adjustments_applied["apisports_features"] = feature_adjustment
+            if stats.home_features or stats.away_features:
+                data_sources_used.append("apisports_features")
+
+            # 2. Situational adjustment (20% weight)
+            situational_adjustment = await self._calculate_situational_adjustment(stats)
+            adjustments_applied["situational"] = situational_adjustment
+            if stats.weather or stats.rest_days_home is not None or stats.home_injuries:
+                data_sources_used.append("situational")
+
+            # 3. Sport-specific home advantage
+            home_advantage = self._get_home_advantage(stats.sport)
+            adjustments_applied["home_advantage"] = home_advantage
+
+            matrix[i] = (
+                base.get("home_fair_prob", 0.5),
+                stats_adjustment,
+                feature_adjustment,
+                situational_adjustment,
+                home_advantage,
+                self._calculate_data_quality_score(stats, odds_data, data_sources_used),
+            )
+            adjustments_by_game.append(adjustments_applied)
+            sources_by_game.append(data_sources_used)
+
+        home_fair, stats_adj, feature_adj, situational_adj, home_adv, data_quality = matrix.T
+
         # 4. Combine with weights
-        # The weighted combination ensures:
-        # - Odds provide 50% of the signal
-        # - Stats provide 30% of the signal  
-        # - Situational factors provide 20% of the signal
-        
-        # Base probability from odds (50% weight)
-        odds_component = home_fair_prob * ODDS_WEIGHT
-        
-        # Stats component (30% weight) - use fair prob as base, add adjustment
-        # The adjustment itself already accounts for the stat differences
-        stats_base = home_fair_prob + stats_adjustment + feature_adjustment
-        stats_component = stats_base * STATS_WEIGHT
-        
-        # Situational component (20% weight)
-        # Home advantage is a baseline situational factor
-        situational_base = home_fair_prob + situational_adjustment + home_advantage
-        situational_component = situational_base * SITUATIONAL_WEIGHT
-        
-        # Final home model probability
-        home_model_prob = odds_component + stats_component + situational_component
-        
-        # Also add a direct adjustment for extreme stat differences
-        # This ensures dominant teams are properly reflected
-        total_adjustment = stats_adjustment + situational_adjustment + home_advantage + feature_adjustment
-        home_model_prob += total_adjustment * 0.3  # Additional direct impact
-        
-        # Normalize to ensure probabilities sum to 1
-        home_model_prob = max(0.08, min(0.92, home_model_prob))  # Keep within reasonable bounds
-        away_model_prob = 1.0 - home_model_prob
+        # - Odds provide 50% of the signal (base probability from odds)
+        # - Stats provide 30% (fair prob as base plus the stat/feature adjustments)
+        # - Situational factors provide 20% (home advantage is a baseline situational factor)
+        odds_component = home_fair * ODDS_WEIGHT
+        stats_component = (home_fair + stats_adj + feature_adj) * STATS_WEIGHT
+        situational_component = (home_fair + situational_adj + home_adv) * SITUATIONAL_WEIGHT
+        home_model = odds_component + stats_component + situational_component
+
+        # Direct adjustment for extreme stat differences so dominant teams are reflected
+        total_adjustment = stats_adj + situational_adj + home_adv + feature_adj
+        home_model = home_model + total_adjustment * 0.3
+
+        # Keep within reasonable bounds
+        home_model = np.clip(home_model, 0.08, 0.92)
 
         # Alpha augmentation: validated alpha features (capped 5%) from alpha engine
+        alpha = await self._calculate_alpha_adjustments([stats for _, stats, _ in items])
+        home_model = np.where(alpha != 0, np.clip(home_model + alpha, 0.08, 0.92), home_model)
+        away_model = 1.0 - home_model
+
+        # 5. Confidence score
+        model_edge_score = self._calculate_model_edge_scores(np.abs(home_model - home_fair))
+        ai_confidence = data_quality + model_edge_score
+
+        return [
+            {
+                "home_model_prob": round(float(home_model[i]), 4),
+                "away_model_prob": round(float(away_model[i]), 4),
+                "ai_confidence": round(float(ai_confidence[i]), 1),
+                "calculation_method": self._calculation_method(items[i][1], items[i][2]),
+                "data_quality_score": round(float(data_quality[i]), 1),
+                "model_edge_score": round(float(model_edge_score[i]), 1),
+                "adjustments_applied": adjustments_by_game[i],
+                "data_sources_used": sources_by_game[i],
+            }
+            for i in range(n)
+        ]
+
+    async def _calculate_alpha_adjustments(self, stats_list: Sequence[TeamMatchupStats]) -> np.ndarray:
+        """
+        Alpha adjustment per game from validated alpha features (see ModelAugmentationService).
+
+        Returns zeros on failure (backward compatible: no alpha impact).
+        """
+        n = len(stats_list)
         try:
-            from app.alpha.model_augmentation_service import ModelAugmentationService
-            augmentation = ModelAugmentationService(self.db)
-            feature_values = getattr(stats, "alpha_feature_values", None) or {}
-            alpha_adj = await augmentation.compute_alpha_adjustment(
-                base_prob=home_model_prob,
-                feature_values=feature_values,
+            from app.alpha.model_augmentation_service import ModelAugmentationService, alpha_adjustments
+
+            contributions = await ModelAugmentationService(self.db).get_validated_alpha_contributions()
+            return alpha_adjustments(
+                contributions,
+                [getattr(stats, "alpha_feature_values", None) or {} for stats in stats_list],
             )
-            if alpha_adj != 0:
-                home_model_prob = max(0.08, min(0.92, home_model_prob + alpha_adj))
-                away_model_prob = 1.0 - home_model_prob
         except Exception:
-            pass  # Backward compatible: no alpha impact on failure
+            return np.zeros(n)
 
-        # 5. Calculate confidence score
-        data_quality_score = self._calculate_data_quality_score(stats, odds_data, data_sources_used)
-        model_edge = abs(home_model_prob - home_fair_prob)
-        model_edge_score = self._calculate_model_edge_score(model_edge)
-        ai_confidence = data_quality_score + model_edge_score
-        
-        # Determine calculation method
+    def _calculation_method(self, stats: TeamMatchupStats, odds_data: Optional[Dict]) -> str:
+        """Label which signals drove the probability."""
         has_stats_signal = bool(stats.home_team_stats or stats.away_team_stats)
         has_feature_signal = bool(stats.home_features or stats.away_features)
         if odds_data and (odds_data.get("home_ml") or odds_data.get("home_implied_prob")):
             if has_stats_signal and has_feature_signal:
-                calculation_method = "odds_stats_features"
-            elif has_stats_signal:
-                calculation_method = "odds_and_stats"
-            elif has_feature_signal:
-                calculation_method = "odds_and_features"
-            else:
-                calculation_method = "odds_only"
-        elif has_stats_signal and has_feature_signal:
-            calculation_method = "stats_and_features"
-        elif has_stats_signal:
-            calculation_method = "stats_only"
-        elif has_feature_signal:
-            calculation_method = "features_only"
-        else:
-            calculation_method = "minimal_data"
-        
-        return {
-            "home_model_prob": round(home_model_prob, 4),
-            "away_model_prob": round(away_model_prob, 4),
-            "ai_confidence": round(ai_confidence, 1),
-            "calculation_method": calculation_method,
-            "data_quality_score": round(data_quality_score, 1),
-            "model_edge_score": round(model_edge_score, 1),
-            "adjustments_applied": adjustments_applied,
-            "data_sources_used": data_sources_used,
-        }
+                return "odds_stats_features"
+            if has_stats_signal:
+                return "odds_and_stats"
+            if has_feature_signal:
+                return "odds_and_features"
+            return "odds_only"
+        if has_stats_signal and has_feature_signal:
+            return "stats_and_features"
+        if has_stats_signal:
+            return "stats_only"
+        if has_feature_signal:
+            return "features_only"
+        return "minimal_data"
     
     async def _calculate_stats_adjustment(self, stats: TeamMatchupStats) -> float:
         """
@@ -757,6 +790,11 @@ class ModelWinProbabilityCalculator:
             score = 50 - ((edge - 0.10) * 100)
         
         return max(10, min(50, score))  # Minimum 10 for having any model
+
+    def _calculate_model_edge_scores(self, edges: np.ndarray) -> np.ndarray:
+        """Vectorized `_calculate_model_edge_score`."""
+        scores = np.where(edges <= 0.10, edges * 500, 50 - ((edges - 0.10) * 100))
+        return np.clip(scores, 10, 50)
     
     # Helper methods for extracting stats
     def _first_float(self, *values: Any) -> Optional[float]:
@@ -1066,6 +1104,12 @@ def calculate_fair_probabilities_from_odds(odds_data: Dict) -> tuple[float, floa
     return 0.5, 0.5
 
 
+def _probability_cache_key(sport: str, home_team: str, away_team: str, odds_data: Optional[Dict]) -> str:
+    """Cache key from game identifier + odds hash."""
+    odds_hash = hashlib.md5(str(odds_data).encode()).hexdigest() if odds_data else "no_odds"
+    return f"{sport}:{home_team}:{away_team}:{odds_hash}"
+
+
 async def compute_game_win_probability(
     db: AsyncSession,
     home_team: str,
@@ -1079,9 +1123,7 @@ async def compute_game_win_probability(
     
     This is the main entry point for calculating model win probabilities.
     """
-    # Create cache key from game identifier + odds hash
-    odds_hash = hashlib.md5(str(odds_data).encode()).hexdigest() if odds_data else "no_odds"
-    cache_key = f"{sport}:{home_team}:{away_team}:{odds_hash}"
+    cache_key = _probability_cache_key(sport, home_team, away_team, odds_data)
     
     # Check cache
     if cache_key in _probability_cache:
@@ -1118,3 +1160,93 @@ async def compute_game_win_probability(
     
     return result
 
+
+@dataclass
+class SlateGame:
+    """One game of a slate passed to `compute_slate_win_probabilities`."""
+    home_team: str
+    away_team: str
+    sport: str
+    matchup_data: Dict = field(default_factory=dict)
+    odds_data: Optional[Dict] = None
+    game_id: Optional[str] = None
+    game_time: Optional[datetime] = None
+
+
+async def compute_slate_win_probabilities(
+    db: AsyncSession,
+    games: Sequence[SlateGame],
+    fetch_missing_features: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Batch form of `compute_game_win_probability` for a whole slate.
+
+    Games already in the probability cache are served from it. For the rest, games without
+    `matchup_data` get it from `FeaturePipeline.build_slate_matchup_data` (each team's
+    stats/injuries fetched once for the whole slate) unless `fetch_missing_features` is
+    False; they are then grouped by sport and scored in one vectorized pass per sport.
+    Results are in input order.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(games)
+    pending: Dict[str, List[Tuple[int, str, Tuple[Dict[str, float], TeamMatchupStats, Optional[Dict]]]]] = {}
+    sport_for_group: Dict[str, str] = {}
+    now = time.time()
+
+    uncached: List[Tuple[int, str]] = []
+    for i, game in enumerate(games):
+        cache_key = _probability_cache_key(game.sport, game.home_team, game.away_team, game.odds_data)
+        cached = _probability_cache.get(cache_key)
+        if cached is not None and (now - cached[1]) < _cache_ttl_seconds:
+            results[i] = cached[0]
+        else:
+            uncached.append((i, cache_key))
+
+    matchup_data_by_index: Dict[int, Dict] = {}
+    missing = [i for i, _ in uncached if not games[i].matchup_data]
+    if missing and fetch_missing_features:
+        from app.services.feature_pipeline import FeaturePipeline, SlateMatchup
+
+        try:
+            built = await FeaturePipeline(db).build_slate_matchup_data(
+                [
+                    SlateMatchup(
+                        home_team=games[i].home_team,
+                        away_team=games[i].away_team,
+                        sport=games[i].sport,
+                        game_id=games[i].game_id,
+                        game_time=games[i].game_time,
+                    )
+                    for i in missing
+                ]
+            )
+            matchup_data_by_index = dict(zip(missing, built))
+        except Exception as e:
+            logger.warning(f"[ModelWinProb] Slate feature build failed, scoring from odds only: {e}")
+
+    for i, cache_key in uncached:
+        game = games[i]
+        if game.odds_data:
+            home_fair_prob, away_fair_prob = calculate_fair_probabilities_from_odds(game.odds_data)
+        else:
+            home_fair_prob, away_fair_prob = 0.5, 0.5
+        stats = TeamMatchupStats.from_matchup_data(
+            matchup_data=game.matchup_data or matchup_data_by_index.get(i) or {},
+            home_team=game.home_team,
+            away_team=game.away_team,
+            sport=game.sport,
+        )
+        group = _normalize_sport_code(game.sport)
+        sport_for_group.setdefault(group, game.sport)
+        pending.setdefault(group, []).append(
+            (i, cache_key, ({"home_fair_prob": home_fair_prob, "away_fair_prob": away_fair_prob}, stats, game.odds_data))
+        )
+
+    for group, rows in pending.items():
+        calculator = ModelWinProbabilityCalculator(db, sport_for_group[group])
+        scored = await calculator.compute_model_win_probabilities_batch([row[2] for row in rows])
+        cached_at = time.time()
+        for (i, cache_key, _), result in zip(rows, scored):
+            _probability_cache[cache_key] = (result, cached_at)
+            results[i] = result
+
+    return results  # type: ignore[return-value]
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
 from dataclasses import dataclass
@@ -10,6 +9,7 @@ from typing import Any, Awaitable, Callable, Optional
 from app.core.config import settings
 from app.services.redis.redis_client_provider import RedisClientProvider, get_redis_provider
 from app.services.redis.redis_distributed_lock import RedisDistributedLock
+from app.services.redis.redis_value_codec import RedisValueCodec, get_redis_value_codec
 
 logger = logging.getLogger(__name__)
 
@@ -40,8 +40,10 @@ class DistributedOddsApiCache:
         *,
         provider: Optional[RedisClientProvider] = None,
         config: Optional[DistributedOddsApiCacheConfig] = None,
+        codec: Optional[RedisValueCodec] = None,
     ):
         self._provider = provider or get_redis_provider()
+        self._codec = codec or get_redis_value_codec()
         ttl_seconds = int(getattr(settings, "odds_api_cache_ttl_seconds", 172800) or 172800)
         self._config = config or DistributedOddsApiCacheConfig(cache_ttl_seconds=ttl_seconds)
 
@@ -65,13 +67,13 @@ class DistributedOddsApiCache:
         if not raw:
             return None
         try:
-            return json.loads(raw.decode("utf-8"))
+            return self._codec.decode(raw)
         except Exception:
             return None
 
     async def set(self, *, cache_key: str, value: Any) -> None:
         client = self._provider.get_client()
-        payload = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        payload = self._codec.encode(value)
         await client.set(self._redis_key(cache_key), payload, ex=int(self._config.cache_ttl_seconds))
 
     async def get_or_fetch(
@@ -3,6 +3,7 @@
 Kept separate from `OddsFetcherService` to keep files small and responsibilities clear:
 - `OddsFetcherService` orchestrates cache/limits/fallbacks and the high-level flow.
 - `OddsApiDataStore` normalizes Odds API payloads and upserts DB rows.
+- `OddsBulkWriter` writes markets/odds as set-based upserts (games stay on the ORM).
 
 Important behavior:
 - Avoids duplicate `games` rows when ESPN schedule fallback has already inserted
@@ -12,6 +13,8 @@ Important behavior:
 
 from __future__ import annotations
 
+import logging
+import uuid
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
@@ -21,21 +24,22 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.game import Game
-from app.models.market import Market
-from app.models.odds import Odds
-from app.services.cache_invalidation import invalidate_after_odds_update
+from app.services.cache_invalidation import clear_parlay_cache
 from app.services.game_match_key import (
     CanonicalGameMatchKey,
     build_canonical_key,
     canonical_key_to_string,
 )
 from app.services.game_status_normalizer import GameStatusNormalizer
+from app.services.odds_api.odds_bulk_writer import OddsBulkWriter, OddsIngestBatch
+from app.services.odds_api.odds_change_feed import build_odds_change_events, get_odds_change_bus
 from app.services.season_phase_helper import infer_season_phase_from_text
 from app.services.sports_config import SportConfig
 from app.services.team_name_normalizer import TeamNameNormalizer
 from app.utils.timezone_utils import TimezoneNormalizer
 from app.utils.nfl_week import calculate_nfl_week
 
+logger = logging.getLogger(__name__)
 
 # Bookmakers allowed for player props (premium feature)
 PLAYER_PROPS_BOOKS = ["fanduel", "draftkings"]
@@ -102,9 +106,6 @@ class OddsApiDataStore:
             
             # If we have placeholder team names, try to extract actual team names from market outcomes
             if home_upper in placeholder_names or away_upper in placeholder_names:
-                import logging
-                logger = logging.getLogger(__name__)
-                
                 # Try to extract actual team names from market outcomes (h2h, spreads, totals)
                 bookmakers = event.get("bookmakers", [])
                 extracted_home = None
@@ -267,6 +268,7 @@ class OddsApiDataStore:
                 existing_by_match[key] = game
 
         games: List[Game] = []
+        events_by_game: List[Tuple[Game, str, str, dict]] = []
 
         for external_game_id, home_team, away_team, commence_time, event in parsed_events:
             game = existing_by_external.get(external_game_id)
@@ -291,6 +293,7 @@ class OddsApiDataStore:
                 else:
                     phase, stage, round_val = _event_season_phase(event)
                     game = Game(
+                        id=uuid.uuid4(),
                         external_game_id=external_game_id,
                         sport=sport_config.code,
                         home_team=home_team,
@@ -303,7 +306,6 @@ class OddsApiDataStore:
                         canonical_match_key=canonical_key_to_string(match_key),
                     )
                     self._db.add(game)
-                    await self._db.flush()  # get game ID
                     existing_by_external[external_game_id] = game
                     existing_by_match[match_key] = game
 
@@ -326,167 +328,32 @@ class OddsApiDataStore:
             if round_val is not None:
                 game.round_ = round_val
 
-            # Process bookmakers (limit to first 3 books for speed, but process all for player props)
-            bookmakers = event.get("bookmakers") or []
-            # For player props, we need to check all bookmakers to find FanDuel/DraftKings
-            # For other markets, limit to first 3 for speed
-            if any("player_props" in str(m.get("key", "")) for b in bookmakers for m in b.get("markets", [])):
-                # If player props are present, process all bookmakers to find FanDuel/DraftKings
-                bookmakers_to_process = bookmakers
-            else:
-                # For regular markets, limit to first 3 for speed
-                bookmakers_to_process = bookmakers[:3]
-            
-            # Collect all markets and odds to batch process
-            markets_to_add: List[Market] = []
-            odds_to_add: List[Odds] = []
-            odds_to_update: List[Odds] = []
-            
-            for bookmaker in bookmakers_to_process:
-                book_name = str(bookmaker.get("key") or "").lower()
-                markets_data = bookmaker.get("markets", []) or []
-
-                for market_data in markets_data:
-                    market_type = str(market_data.get("key") or "")
-                    if market_type not in sport_config.supported_markets:
-                        continue
-                    
-                    # Filter player props to only FanDuel and DraftKings
-                    if market_type == "player_props" and book_name not in PLAYER_PROPS_BOOKS:
-                        continue
-
-                    outcomes = market_data.get("outcomes", []) or []
-
-                    result = await self._db.execute(
-                        select(Market)
-                        .where(Market.game_id == game.id)
-                        .where(Market.market_type == market_type)
-                        .where(Market.book == book_name)
-                        .limit(1)
-                    )
-                    market = result.scalar_one_or_none()
-
-                    if not market:
-                        market = Market(game_id=game.id, market_type=market_type, book=book_name)
-                        markets_to_add.append(market)
-
-                    # Process outcomes
-                    for outcome_data in outcomes[:10]:
-                        outcome_name = str(outcome_data.get("name") or "")
-                        price_american = outcome_data.get("price", 0)
-                        if not price_american:
-                            continue
-
-                        decimal_price = self._american_to_decimal(int(price_american))
-                        implied_prob = self._decimal_to_implied_prob(decimal_price)
-
-                        # Normalize outcome name
-                        if market_type == "h2h":
-                            home_norm = self._normalize_team(home_team, sport_config.code)
-                            away_norm = self._normalize_team(away_team, sport_config.code)
-                            out_norm = self._normalize_team(outcome_name, sport_config.code)
-
-                            if out_norm == home_norm:
-                                outcome = "home"
-                            elif out_norm == away_norm:
-                                outcome = "away"
-                            else:
-                                # Soccer three-way markets include Draw/Tie.
-                                lowered = outcome_name.strip().lower()
-                                if lowered in ("draw", "tie", "tied"):
-                                    outcome = "draw"
-                                else:
-                                    # Keep as-is rather than incorrectly overwriting away.
-                                    outcome = lowered or "draw"
-                        elif market_type == "spreads":
-                            point = outcome_data.get("point", 0)
-                            outcome = f"{outcome_name} {float(point):+.1f}"
-                        elif market_type == "totals":
-                            point = outcome_data.get("point", 0)
-                            outcome = f"{outcome_name} {float(point):.1f}"
-                        elif market_type == "player_props":
-                            # Player props format: "Player Name Prop Type Over/Under Line"
-                            # The Odds API typically provides: name (player + prop description), point (line)
-                            point = outcome_data.get("point")
-                            if point is not None:
-                                # Format: "Player Name Prop Type Over 27.5" or "Player Name Prop Type Under 27.5"
-                                outcome = f"{outcome_name} {float(point):.1f}"
-                            else:
-                                # Fallback: use name as-is if no point value
-                                outcome = outcome_name.strip()
-                        else:
-                            outcome = outcome_name
-
-                        # Only query existing odds if market already exists
-                        if market.id:
-                            result = await self._db.execute(
-                                select(Odds).where(Odds.market_id == market.id).where(Odds.outcome == outcome).limit(1)
-                            )
-                            existing_odds = result.scalar_one_or_none()
-
-                            formatted_price = f"+{price_american}" if int(price_american) > 0 else str(int(price_american))
-                            if existing_odds:
-                                existing_odds.price = formatted_price
-                                existing_odds.decimal_price = decimal_price
-                                existing_odds.implied_prob = implied_prob
-                                odds_to_update.append(existing_odds)
-                            else:
-                                odds = Odds(
-                                    market_id=market.id,
-                                    outcome=outcome,
-                                    price=formatted_price,
-                                    decimal_price=decimal_price,
-                                    implied_prob=implied_prob,
-                                )
-                                odds_to_add.append(odds)
-                        else:
-                            # Market doesn't exist yet, will add odds after market is flushed
-                            formatted_price = f"+{price_american}" if int(price_american) > 0 else str(int(price_american))
-                            odds = Odds(
-                                market_id=None,  # Will be set after market flush
-                                outcome=outcome,
-                                price=formatted_price,
-                                decimal_price=decimal_price,
-                                implied_prob=implied_prob,
-                            )
-                            # Store market reference for later
-                            odds._temp_market = market
-                            odds._temp_market_type = market_type
-                            odds._temp_book = book_name
-                            odds_to_add.append(odds)
-            
-            # Batch add markets, flush to get IDs
-            if markets_to_add:
-                self._db.add_all(markets_to_add)
-                await self._db.flush()
-            
-            # Now set market_id for odds that were waiting
-            for odds in odds_to_add:
-                if hasattr(odds, "_temp_market"):
-                    # Find the market we just created
-                    result = await self._db.execute(
-                        select(Market)
-                        .where(Market.game_id == game.id)
-                        .where(Market.market_type == odds._temp_market_type)
-                        .where(Market.book == odds._temp_book)
-                        .limit(1)
-                    )
-                    market = result.scalar_one_or_none()
-                    if market:
-                        odds.market_id = market.id
-                    delattr(odds, "_temp_market")
-                    delattr(odds, "_temp_market_type")
-                    delattr(odds, "_temp_book")
-            
-            # Batch add odds
-            if odds_to_add:
-                self._db.add_all(odds_to_add)
-
+            events_by_game.append((game, home_team, away_team, event))
             games.append(game)
 
+        # One flush for all new/promoted games, then markets/odds as set-based upserts.
+        await self._db.flush()
+        batch = OddsIngestBatch()
+        for game, home_team, away_team, event in events_by_game:
+            self._collect_event_odds(batch, game.id, home_team, away_team, event, sport_config)
+        write = await OddsBulkWriter(self._db).write(batch)
+        logger.info(
+            "odds_ingest sport=%s games=%s odds_games=%s odds_rows=%s statements=%s",
+            sport_config.code,
+            len(games),
+            len(write.game_ids),
+            write.odds_written,
+            write.statements,
+        )
+
         try:
             await self._db.commit()
-            await invalidate_after_odds_update(self._db, sport_config.code)
+            # Subscribers drop/rebuild only what depends on games whose content hash moved.
+            changed = await get_odds_change_bus().publish(
+                build_odds_change_events(sport_config.code, games, write.fingerprints)
+            )
+            if changed:
+                await clear_parlay_cache(self._db, sport=sport_config.code)
         except IntegrityError:
             await self._db.rollback()
             if not _retry:
@@ -499,6 +366,87 @@ class OddsApiDataStore:
 
         return games
 
+    def _collect_event_odds(
+        self,
+        batch: OddsIngestBatch,
+        game_id,
+        home_team: str,
+        away_team: str,
+        event: dict,
+        sport_config: SportConfig,
+    ) -> None:
+        """Append one event's supported markets/outcomes to `batch` (no DB access)."""
+        # Process bookmakers (limit to first 3 books for speed, but process all for player props)
+        bookmakers = event.get("bookmakers") or []
+        # For player props, we need to check all bookmakers to find FanDuel/DraftKings
+        if any("player_props" in str(m.get("key", "")) for b in bookmakers for m in b.get("markets", [])):
+            bookmakers_to_process = bookmakers
+        else:
+            bookmakers_to_process = bookmakers[:3]
+
+        home_norm = self._normalize_team(home_team, sport_config.code)
+        away_norm = self._normalize_team(away_team, sport_config.code)
+        for bookmaker in bookmakers_to_process:
+            book_name = str(bookmaker.get("key") or "").lower()
+            for market_data in bookmaker.get("markets", []) or []:
+                market_type = str(market_data.get("key") or "")
+                if market_type not in sport_config.supported_markets:
+                    continue
+                # Filter player props to only FanDuel and DraftKings
+                if market_type == "player_props" and book_name not in PLAYER_PROPS_BOOKS:
+                    continue
+
+                batch.add_market(game_id, market_type, book_name)
+                for outcome_data in (market_data.get("outcomes", []) or [])[:10]:
+                    price_american = outcome_data.get("price", 0)
+                    if not price_american:
+                        continue
+                    decimal_price = self._american_to_decimal(int(price_american))
+                    batch.add(
+                        game_id=game_id,
+                        market_type=market_type,
+                        book=book_name,
+                        outcome=self._outcome_label(
+                            market_type, outcome_data, home_norm, away_norm, sport_config.code
+                        ),
+                        price=f"+{price_american}" if int(price_american) > 0 else str(int(price_american)),
+                        decimal_price=decimal_price,
+                        implied_prob=self._decimal_to_implied_prob(decimal_price),
+                    )
+
+    def _outcome_label(
+        self,
+        market_type: str,
+        outcome_data: dict,
+        home_norm: str,
+        away_norm: str,
+        sport_code: str,
+    ) -> str:
+        outcome_name = str(outcome_data.get("name") or "")
+        if market_type == "h2h":
+            out_norm = self._normalize_team(outcome_name, sport_code)
+            if out_norm == home_norm:
+                return "home"
+            if out_norm == away_norm:
+                return "away"
+            # Soccer three-way markets include Draw/Tie.
+            lowered = outcome_name.strip().lower()
+            if lowered in ("draw", "tie", "tied"):
+                return "draw"
+            # Keep as-is rather than incorrectly overwriting away.
+            return lowered or "draw"
+        if market_type == "spreads":
+            return f"{outcome_name} {float(outcome_data.get('point', 0)):+.1f}"
+        if market_type == "totals":
+            return f"{outcome_name} {float(outcome_data.get('point', 0)):.1f}"
+        if market_type == "player_props":
+            # Player props format: "Player Name Prop Type Over 27.5"; name as-is if no line.
+            point = outcome_data.get("point")
+            if point is not None:
+                return f"{outcome_name} {float(point):.1f}"
+            return outcome_name.strip()
+        return outcome_name
+
     @staticmethod
     def _american_to_decimal(american_odds: int) -> Decimal:
         if american_odds > 0:
@@ -0,0 +1,185 @@
+"""Set-based writes of parsed Odds API markets/odds (one upsert per table per sync).
+
+`OddsApiDataStore` resolves `Game` rows through the ORM (few rows, ESPN promotion rules)
+and hands every market/outcome of the payload to `OddsBulkWriter` as a columnar
+`OddsIngestBatch`. The writer then:
+
+- inserts missing `markets` with `ON CONFLICT DO NOTHING` and reads ids back in one query,
+- upserts `odds` with `ON CONFLICT (market_id, outcome) DO UPDATE ... WHERE` any priced
+  column `IS DISTINCT FROM` the incoming row, so unchanged rows are left untouched.
+
+Every sync writes every game: the database, not a per-process cache, decides what changed.
+Per-game fingerprints are returned for `OddsChangeBus`, which uses them to skip publishing
+events for games whose content did not move.
+
+Statements are executed with executemany-style parameter lists, chunked to stay under
+driver parameter limits. Postgres and SQLite share the same `on_conflict_*` API.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.market import Market
+from app.models.odds import Odds
+
+MarketKey = Tuple[Any, str, str]  # (game_id, market_type, book)
+
+_CHUNK_ROWS = 1000
+
+
+@dataclass
+class OddsIngestBatch:
+    """Parsed odds as parallel columns (one entry per outcome row)."""
+
+    game_id: List[Any] = field(default_factory=list)
+    market_type: List[str] = field(default_factory=list)
+    book: List[str] = field(default_factory=list)
+    outcome: List[str] = field(default_factory=list)
+    price: List[str] = field(default_factory=list)
+    decimal_price: List[Decimal] = field(default_factory=list)
+    implied_prob: List[Decimal] = field(default_factory=list)
+    # Markets present in the payload even when they carry no priced outcomes.
+    markets: Dict[MarketKey, None] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.outcome)
+
+    def add_market(self, game_id: Any, market_type: str, book: str) -> None:
+        self.markets.setdefault((game_id, market_type, book), None)
+
+    def add(
+        self,
+        *,
+        game_id: Any,
+        market_type: str,
+        book: str,
+        outcome: str,
+        price: str,
+        decimal_price: Decimal,
+        implied_prob: Decimal,
+    ) -> None:
+        self.add_market(game_id, market_type, book)
+        self.game_id.append(game_id)
+        self.market_type.append(market_type)
+        self.book.append(book)
+        self.outcome.append(outcome)
+        self.price.append(price)
+        self.decimal_price.append(decimal_price)
+        self.implied_prob.append(implied_prob)
+
+    def fingerprints(self) -> Dict[Any, str]:
+        """Per-game hash over (market, book, outcome, price) rows, order-independent."""
+        rows: Dict[Any, List[str]] = {gid: [] for gid, _, _ in self.markets}
+        for market_key in self.markets:
+            rows[market_key[0]].append(f"m|{market_key[1]}|{market_key[2]}")
+        for i in range(len(self)):
+            rows[self.game_id[i]].append(
+                f"o|{self.market_type[i]}|{self.book[i]}|{self.outcome[i]}|{self.price[i]}"
+            )
+        return {
+            gid: hashlib.blake2b("\n".join(sorted(lines)).encode("utf-8"), digest_size=16).hexdigest()
+            for gid, lines in rows.items()
+        }
+
+
+@dataclass(frozen=True)
+class OddsWriteResult:
+    game_ids: List[Any]
+    markets_inserted: int
+    odds_written: int
+    statements: int
+    # game_id -> odds fingerprint for every game in the batch.
+    fingerprints: Dict[Any, str] = field(default_factory=dict)
+
+
+class OddsBulkWriter:
+    """Write an `OddsIngestBatch` with a handful of set-based statements."""
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+
+    async def write(self, batch: OddsIngestBatch) -> OddsWriteResult:
+        fingerprints = batch.fingerprints()
+        game_ids = list(fingerprints)
+        if not game_ids:
+            return OddsWriteResult([], 0, 0, 0, fingerprints)
+
+        insert = self._insert_factory()
+        statements = 0
+
+        market_rows = [
+            {"id": uuid.uuid4(), "game_id": gid, "market_type": mtype, "book": book}
+            for (gid, mtype, book) in batch.markets
+        ]
+        for chunk in _chunks(market_rows):
+            stmt = insert(Market).on_conflict_do_nothing(index_elements=["game_id", "market_type", "book"])
+            await self._db.execute(stmt, chunk)
+            statements += 1
+
+        market_ids: Dict[MarketKey, Any] = {}
+        for chunk in _chunks(game_ids):
+            result = await self._db.execute(
+                select(Market.id, Market.game_id, Market.market_type, Market.book).where(Market.game_id.in_(chunk))
+            )
+            statements += 1
+            for market_id, gid, mtype, book in result.all():
+                market_ids.setdefault((gid, mtype, book), market_id)
+
+        odds_rows: Dict[Tuple[Any, str], Dict[str, Any]] = {}
+        for i in range(len(batch)):
+            market_id = market_ids.get((batch.game_id[i], batch.market_type[i], batch.book[i]))
+            if market_id is None:
+                continue
+            # Last occurrence wins, matching the old per-row update order.
+            odds_rows[(market_id, batch.outcome[i])] = {
+                "id": uuid.uuid4(),
+                "market_id": market_id,
+                "outcome": batch.outcome[i],
+                "price": batch.price[i],
+                "decimal_price": batch.decimal_price[i],
+                "implied_prob": batch.implied_prob[i],
+            }
+
+        for chunk in _chunks(list(odds_rows.values())):
+            stmt = insert(Odds)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["market_id", "outcome"],
+                set_={
+                    "price": stmt.excluded.price,
+                    "decimal_price": stmt.excluded.decimal_price,
+                    "implied_prob": stmt.excluded.implied_prob,
+                },
+                where=or_(
+                    Odds.price.is_distinct_from(stmt.excluded.price),
+                    Odds.decimal_price.is_distinct_from(stmt.excluded.decimal_price),
+                    Odds.implied_prob.is_distinct_from(stmt.excluded.implied_prob),
+                ),
+            )
+            await self._db.execute(stmt, chunk)
+            statements += 1
+
+        return OddsWriteResult(
+            game_ids=game_ids,
+            markets_inserted=len(market_rows),
+            odds_written=len(odds_rows),
+            statements=statements,
+            fingerprints=fingerprints,
+        )
+
+    def _insert_factory(self):
+        dialect = self._db.get_bind().dialect.name
+        return postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+
+def _chunks(rows: List[Any], size: int = _CHUNK_ROWS) -> Iterable[List[Any]]:
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
@@ -0,0 +1,230 @@
+"""
+Per-game "odds changed" events from ingestion to downstream caches.
+
+`OddsApiDataStore` publishes one `OddsChangeEvent` per stored game after commit. The
+event carries a content hash (odds fingerprint + core game fields); the bus drops events
+whose hash matches the last one it saw for that game, so subscribers only hear about
+games that actually changed.
+
+- In-process: subscribers are awaited in registration order with `local=True`.
+- Fan-out: events are also PUBLISHed on a Redis channel. Other instances run
+  `start_listener()` and deliver them to their own subscribers with `local=False`, so
+  shared (Redis) state is invalidated once by the origin and per-process state everywhere.
+
+Redis errors fail open: in-process delivery still happens.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from app.services.tiered_cache import LocalTtlCache
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "odds_changes:v1"
+_HASH_TTL_SECONDS = 6 * 3600
+_LISTENER_RETRY_SECONDS = 5.0
+
+OddsChangeHandler = Callable[..., Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class OddsChangeEvent:
+    sport: str  # SportConfig.code, e.g. "NFL"
+    game_id: str
+    content_hash: str
+    occurred_at: float
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OddsChangeEvent":
+        return cls(
+            sport=str(data.get("sport") or ""),
+            game_id=str(data.get("game_id") or ""),
+            content_hash=str(data.get("content_hash") or ""),
+            occurred_at=float(data.get("occurred_at") or 0.0),
+        )
+
+
+def build_odds_change_events(
+    sport: str,
+    games: Iterable[Any],
+    odds_fingerprints: Dict[Any, str],
+) -> List[OddsChangeEvent]:
+    """One event per game; the hash covers its odds fingerprint and the fields pages render."""
+    now = time.time()
+    events: List[OddsChangeEvent] = []
+    for game in games:
+        game_id = getattr(game, "id", None)
+        if game_id is None:
+            continue
+        start_time = getattr(game, "start_time", None)
+        parts = [
+            odds_fingerprints.get(game_id, ""),
+            str(getattr(game, "home_team", "") or ""),
+            str(getattr(game, "away_team", "") or ""),
+            start_time.isoformat() if start_time is not None else "",
+            str(getattr(game, "status", "") or ""),
+        ]
+        digest = hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+        events.append(OddsChangeEvent(sport=sport, game_id=str(game_id), content_hash=digest, occurred_at=now))
+    return events
+
+
+class OddsChangeBus:
+    """In-process pub/sub for `OddsChangeEvent` batches with optional Redis fan-out."""
+
+    def __init__(self, *, provider: Any = None, codec: Any = None, channel: str = CHANNEL) -> None:
+        self._provider = provider
+        self._codec = codec
+        self._channel = channel
+        self._origin = uuid.uuid4().hex
+        self._handlers: List[OddsChangeHandler] = []
+        self._last_hash = LocalTtlCache("odds_change_hashes", max_entries=20000, stale_grace_seconds=0)
+        self._listener: Optional[asyncio.Task] = None
+
+    def subscribe(self, handler: OddsChangeHandler) -> None:
+        """Register `async handler(events, *, local)`; duplicates are ignored."""
+        if handler not in self._handlers:
+            self._handlers.append(handler)
+
+    def unsubscribe(self, handler: OddsChangeHandler) -> None:
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+
+    async def publish(self, events: Iterable[OddsChangeEvent]) -> List[OddsChangeEvent]:
+        """Deliver changed events locally, then fan out. Returns the events that changed."""
+        changed = self._remember(events)
+        if not changed:
+            return []
+        await self._dispatch(changed, local=True)
+        await self._fan_out(changed)
+        return changed
+
+    def forget(self) -> None:
+        """Drop remembered hashes (next publish treats every game as changed)."""
+        self._last_hash.clear()
+
+    # ------------------------------------------------------------------
+    # Redis listener
+    # ------------------------------------------------------------------
+
+    def start_listener(self) -> bool:
+        """Start consuming remote events (no-op without Redis or when already running)."""
+        if self._listener is not None and not self._listener.done():
+            return False
+        if not self._redis_configured():
+            return False
+        self._listener = asyncio.create_task(self._listen())
+        return True
+
+    async def stop_listener(self) -> None:
+        task, self._listener = self._listener, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def handle_message(self, raw: Any) -> List[OddsChangeEvent]:
+        """Decode one channel payload and deliver it with `local=False` (own messages are skipped)."""
+        try:
+            payload = self._codec.decode(raw)
+        except Exception as exc:
+            logger.debug("OddsChangeBus dropped undecodable message: %s", exc)
+            return []
+        if not isinstance(payload, dict) or payload.get("origin") == self._origin:
+            return []
+        events = [OddsChangeEvent.from_dict(e) for e in payload.get("events") or [] if isinstance(e, dict)]
+        # Remote instances remember hashes too, so a later local ingest of the same data is a no-op.
+        changed = self._remember(events)
+        if changed:
+            await self._dispatch(changed, local=False)
+        return changed
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._provider.get_client().pubsub()
+                await pubsub.subscribe(self._channel)
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        await self.handle_message(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("OddsChangeBus listener error (retrying in %ss): %s", _LISTENER_RETRY_SECONDS, exc)
+                await asyncio.sleep(_LISTENER_RETRY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _remember(self, events: Iterable[OddsChangeEvent]) -> List[OddsChangeEvent]:
+        changed: List[OddsChangeEvent] = []
+        for event in events:
+            if not event.game_id or self._last_hash.get(event.game_id) == event.content_hash:
+                continue
+            self._last_hash.set(event.game_id, event.content_hash, ttl=_HASH_TTL_SECONDS, size=96)
+            changed.append(event)
+        return changed
+
+    async def _dispatch(self, events: List[OddsChangeEvent], *, local: bool) -> None:
+        for handler in list(self._handlers):
+            try:
+                await handler(events, local=local)
+            except Exception as exc:
+                logger.warning("OddsChangeBus subscriber %r failed: %s", handler, exc)
+
+    async def _fan_out(self, events: List[OddsChangeEvent]) -> None:
+        if not self._redis_configured():
+            return
+        try:
+            payload = self._codec.encode({"origin": self._origin, "events": [asdict(e) for e in events]})
+            await self._provider.get_client().publish(self._channel, payload)
+        except Exception as exc:
+            logger.debug("OddsChangeBus Redis publish failed: %s", exc)
+
+    def _redis_configured(self) -> bool:
+        if self._provider is None:
+            from app.services.redis.redis_client_provider import get_redis_provider
+
+            self._provider = get_redis_provider()
+        if self._codec is None:
+            from app.services.redis.redis_value_codec import get_redis_value_codec
+
+            self._codec = get_redis_value_codec()
+        try:
+            return bool(self._provider.is_configured())
+        except Exception:
+            return False
+
+
+_odds_change_bus: Optional[OddsChangeBus] = None
+
+
+def get_odds_change_bus() -> OddsChangeBus:
+    """Module singleton bus, with the cache-invalidation subscriber registered."""
+    global _odds_change_bus
+    if _odds_change_bus is None:
+        from app.services.cache_invalidation import invalidate_after_odds_changes
+
+        _odds_change_bus = OddsChangeBus()
+        _odds_change_bus.subscribe(invalidate_after_odds_changes)
+    return _odds_change_bus
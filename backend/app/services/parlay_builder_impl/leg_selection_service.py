@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from app.core.event_logger import log_event
 from app.core.parlay_errors import record_insufficient_and_raise
 from app.services.parlay_builder_impl.parlay_selection_optimizer import ParlaySelectionOptimizer
+from app.services.parlay_probability.candidate_pair_matrix import (
+    CandidatePairMatrix,
+    get_candidate_pair_matrix_store,
+)
 from app.services.parlay_probability.parlay_correlation_model import ParlayCorrelationModel
 
 _logger = logging.getLogger(__name__)
@@ -18,7 +22,21 @@ class ParlayLegSelectionService:
         self._correlation_model = ParlayCorrelationModel()
         self._optimizer = ParlaySelectionOptimizer(correlation_model=self._correlation_model)
 
-    def select_legs(self, candidates: List[Dict], num_legs: int, risk_profile: str) -> List[Dict]:
+    def build_pair_matrix(self, candidates: List[Dict]) -> CandidatePairMatrix:
+        """Precompute pairwise correlations/conflicts for a candidate pool (see CandidateLegCache fills)."""
+        return CandidatePairMatrix.build(
+            candidates,
+            correlation_model=self._correlation_model,
+            conflict_checker=self._conflicts_with_selected,
+        )
+
+    def select_legs(
+        self,
+        candidates: List[Dict],
+        num_legs: int,
+        risk_profile: str,
+        pair_matrix: Optional[CandidatePairMatrix] = None,
+    ) -> List[Dict]:
         if not candidates:
             log_event(
                 _logger,
@@ -43,6 +61,10 @@ class ParlayLegSelectionService:
         scored = self._with_ev_scores(deduplicated)
         scored = self._prefilter_for_profile(scored, num_legs, normalized_profile)
 
+        if pair_matrix is None:
+            # Prefer the matrix built at candidate-cache fill; otherwise build once for all ceilings.
+            pair_matrix = get_candidate_pair_matrix_store().find(scored) or self.build_pair_matrix(scored)
+
         selected: List[Dict] = []
         for corr_ceiling in self._correlation_ceilings(normalized_profile):
             selected = self._optimizer.select(
@@ -52,6 +74,7 @@ class ParlayLegSelectionService:
                 conflict_checker=self._conflicts_with_selected,
                 max_legs_per_game=2,
                 max_pair_corr=corr_ceiling,
+                pair_matrix=pair_matrix,
             )
             selected = self._remove_conflicting_legs(selected)
             if len(selected) >= num_legs:
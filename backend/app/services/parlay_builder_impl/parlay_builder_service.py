@@ -18,6 +18,8 @@ from app.services.parlay_probability import (
     CorrelatedParlayProbabilityCalculator,
     ParlayCorrelationModel,
     ParlayProbabilityCalibrationService,
+    get_candidate_pair_matrix_store,
+    get_joint_probability_cache,
 )
 from app.core.event_logger import log_event
 from app.services.odds_warmup_service import OddsWarmupService
@@ -50,7 +52,11 @@ class ParlayBuilderService:
         self._engine_by_sport: Dict[str, BaseProbabilityEngine] = {}
         self._leg_selector = ParlayLegSelectionService()
         self._metrics = ParlayMetricsCalculator()
-        self._parlay_prob = CorrelatedParlayProbabilityCalculator(ParlayCorrelationModel())
+        self._parlay_prob = CorrelatedParlayProbabilityCalculator(
+            ParlayCorrelationModel(),
+            joint_cache=get_joint_probability_cache(),
+            pair_matrix_store=get_candidate_pair_matrix_store(),
+        )
         self._parlay_prob_calibration = ParlayProbabilityCalibrationService(db)
 
     # ------------------------------------------------------------------
@@ -576,7 +582,7 @@ class ParlayBuilderService:
             prob_legs.append(leg)
 
         actual_num_legs = len(legs_data)
-        raw_parlay_prob = float(self._parlay_prob.calculate(prob_legs, risk_profile=risk_profile))
+        raw_parlay_prob = float(await self._parlay_prob.calculate_async(prob_legs, risk_profile=risk_profile))
         parlay_prob = float(await self._parlay_prob_calibration.calibrate(raw_parlay_prob))
 
         confidence_scores = [float(leg.get("confidence", 0.0) or 0.0) for leg in legs_data]
@@ -611,6 +617,7 @@ class ParlayBuilderService:
 
         return {
             "market_id": str(leg.get("market_id") or ""),
+            "game_id": str(leg.get("game_id") or ""),
             "outcome": str(leg.get("outcome") or ""),
             "game": game_str,
             "home_team": str(leg.get("home_team") or ""),
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from app.services.parlay_probability import ParlayCorrelationModel
+import numpy as np
+
+from app.services.parlay_probability import CandidatePairMatrix, ParlayCorrelationModel
 
 ConflictChecker = Callable[[Dict[str, Any], List[Dict[str, Any]]], bool]
 
 
-@dataclass
-class _State:
-    selected: List[Dict[str, Any]]
-    score: float
-    game_counts: Dict[str, int]
-    keys: Set[Tuple[str, str, str]]
+@dataclass(frozen=True)
+class _CandidateArrays:
+    """Candidate pool flattened into arrays (pool order = descending sort key)."""
+
+    ev: np.ndarray  # (n,) float
+    game_idx: np.ndarray  # (n,) int, -1 when game_id is missing
+    num_games: int
+    corr: np.ndarray  # (n, n) latent correlation (0 for cross-game pairs)
+    conflict: np.ndarray  # (n, n) bool; conflict[i, j] => i cannot join a parlay holding j
+    same_key: np.ndarray  # (n, n) bool; duplicate (game_id, market_type, outcome)
 
 
 class ParlaySelectionOptimizer:
@@ -22,6 +28,15 @@ class ParlaySelectionOptimizer:
 
     Uses a lightweight beam search to maximize an additive objective (sum of `ev_score`)
     subject to hard constraints (duplicates/conflicts/correlation/max legs per game).
+
+    The candidate pool is flattened into NumPy arrays (ev vector, game ids, and pairwise
+    correlation/conflict matrices, sliced from a cached `CandidatePairMatrix` when given).
+    Beam states are then boolean masks plus scores, and each step expands the whole beam
+    with batched array operations.
+
+    Conflicts and correlations are only evaluated between legs that share a game (or lack
+    a game_id); cross-game legs are treated as independent, which matches both the
+    correlation model and the production conflict checker.
     """
 
     _DEFAULT_BEAM_WIDTH: Dict[str, int] = {
@@ -37,6 +52,8 @@ class ParlaySelectionOptimizer:
         "degen": 0.75,
     }
 
+    _MAX_BEAM_WIDTH = 500
+
     def __init__(self, *, correlation_model: ParlayCorrelationModel):
         self._corr = correlation_model
 
@@ -52,7 +69,14 @@ class ParlaySelectionOptimizer:
         beam_width: Optional[int] = None,
         candidate_pool_limit: int = 250,
         max_expansions_per_state: int = 60,
+        pair_matrix: Optional[CandidatePairMatrix] = None,
     ) -> List[Dict[str, Any]]:
+        """
+        Select up to `num_legs` legs.
+
+        `pair_matrix` is an optional precomputed `CandidatePairMatrix` covering the pool; it
+        must have been built with the same correlation model and conflict rules.
+        """
         requested = max(1, int(num_legs))
         profile = (risk_profile or "balanced").lower().strip()
 
@@ -67,7 +91,7 @@ class ParlaySelectionOptimizer:
             if beam_width is not None
             else int(self._DEFAULT_BEAM_WIDTH.get(profile, self._DEFAULT_BEAM_WIDTH["balanced"]))
         )
-        width = max(5, min(200, width))
+        width = max(5, min(self._MAX_BEAM_WIDTH, width))
 
         pool = sorted(candidates or [], key=self._candidate_sort_key, reverse=True)
         if candidate_pool_limit > 0:
@@ -76,69 +100,106 @@ class ParlaySelectionOptimizer:
         if not pool:
             return []
 
-        start = _State(selected=[], score=0.0, game_counts={}, keys=set())
-        beam: List[_State] = [start]
-        best: _State = start
+        arrays = self._build_arrays(pool, conflict_checker, pair_matrix)
+        # blocked[i, j]: leg i may not be added to a parlay already holding leg j.
+        blocked = arrays.conflict | arrays.same_key | (np.abs(arrays.corr) >= corr_ceiling)
+        np.fill_diagonal(blocked, True)
+
+        order = self._beam_search(
+            arrays,
+            blocked,
+            requested=requested,
+            width=width,
+            max_per_game=max_per_game,
+            max_expansions=max(1, int(max_expansions_per_state)),
+        )
+        return [pool[int(i)] for i in order[:requested]]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _beam_search(
+        arrays: _CandidateArrays,
+        blocked: np.ndarray,
+        *,
+        requested: int,
+        width: int,
+        max_per_game: int,
+        max_expansions: int,
+    ) -> List[int]:
+        n = int(arrays.ev.shape[0])
+        has_game = arrays.game_idx >= 0
+        game_col = np.where(has_game, arrays.game_idx, 0)
+
+        # Beam state: per-state blocked mask, per-game leg counts, score, and pick order.
+        state_blocked = np.zeros((1, n), dtype=bool)
+        state_games = np.zeros((1, max(1, arrays.num_games)), dtype=np.int16)
+        state_score = np.zeros(1, dtype=float)
+        state_order = np.zeros((1, 0), dtype=np.int64)
+        best_order = state_order[0]
 
         for _step in range(requested):
-            next_states: List[_State] = []
-            for state in beam:
-                expansions = 0
-                for leg in pool:
-                    if expansions >= max_expansions_per_state:
-                        break
-                    key = self._leg_key(leg)
-                    if key in state.keys:
-                        continue
-
-                    game_id = str(leg.get("game_id") or "").strip()
-                    if game_id and state.game_counts.get(game_id, 0) >= max_per_game:
-                        continue
-
-                    if conflict_checker(leg, state.selected):
-                        continue
-
-                    if self._is_too_correlated(leg, state.selected, ceiling=corr_ceiling):
-                        continue
-
-                    new_selected = state.selected + [leg]
-                    new_score = state.score + float(leg.get("ev_score", 0.0) or 0.0)
-
-                    new_game_counts = dict(state.game_counts)
-                    if game_id:
-                        new_game_counts[game_id] = new_game_counts.get(game_id, 0) + 1
-
-                    new_keys = set(state.keys)
-                    new_keys.add(key)
-
-                    next_states.append(
-                        _State(
-                            selected=new_selected,
-                            score=new_score,
-                            game_counts=new_game_counts,
-                            keys=new_keys,
-                        )
-                    )
-                    expansions += 1
-
-            if not next_states:
+            eligible = ~state_blocked
+            eligible &= ~((state_games[:, game_col] >= max_per_game) & has_game[None, :])
+            # Per state, only the first `max_expansions` eligible legs (pool order) expand.
+            eligible &= np.cumsum(eligible, axis=1) <= max_expansions
+
+            parents, legs = np.nonzero(eligible)  # row-major: (state order, pool order)
+            if parents.size == 0:
                 break
 
-            next_states.sort(key=lambda s: s.score, reverse=True)
-            beam = next_states[:width]
+            scores = state_score[parents] + arrays.ev[legs]
+            keep = np.argsort(-scores, kind="stable")[:width]
+            parents, legs, scores = parents[keep], legs[keep], scores[keep]
 
-            # Track best-so-far by length then score.
-            top = beam[0]
-            if len(top.selected) > len(best.selected) or (
-                len(top.selected) == len(best.selected) and top.score > best.score
-            ):
-                best = top
+            # Block candidates in either direction: the new leg may not sit with i, or i may
+            # not join a parlay holding the new leg (the conflict checker need not be symmetric).
+            state_blocked = state_blocked[parents] | blocked[legs] | blocked[:, legs].T
+            state_games = state_games[parents].copy()
+            gamed = has_game[legs]
+            state_games[np.nonzero(gamed)[0], game_col[legs[gamed]]] += 1
+            state_score = scores
+            state_order = np.concatenate([state_order[parents], legs[:, None]], axis=1)
+            # States at a step all have the same length, so the top state is best-so-far.
+            best_order = state_order[0]
 
-        return list(best.selected)[:requested]
+        return [int(i) for i in best_order]
 
-    # ------------------------------------------------------------------
-    # Internals
-    # ------------------------------------------------------------------
+    def _build_arrays(
+        self,
+        pool: List[Dict[str, Any]],
+        conflict_checker: ConflictChecker,
+        pair_matrix: Optional[CandidatePairMatrix],
+    ) -> _CandidateArrays:
+        n = len(pool)
+        ev = np.array([float(leg.get("ev_score", 0.0) or 0.0) for leg in pool], dtype=float)
+
+        game_ids: Dict[str, int] = {}
+        game_idx = np.full(n, -1, dtype=np.int64)
+        key_ids: Dict[Tuple[str, str, str], int] = {}
+        key_idx = np.empty(n, dtype=np.int64)
+        for i, leg in enumerate(pool):
+            game_id = str(leg.get("game_id") or "").strip()
+            if game_id:
+                game_idx[i] = game_ids.setdefault(game_id, len(game_ids))
+            key_idx[i] = key_ids.setdefault(self._leg_key(leg), len(key_ids))
+
+        rows = pair_matrix.indices(pool) if pair_matrix is not None else None
+        if rows is None:
+            # No precomputed matrix for this pool: evaluate same-game pairs now.
+            pair_matrix = CandidatePairMatrix.build(pool, correlation_model=self._corr, conflict_checker=conflict_checker)
+            rows = np.arange(n, dtype=np.int64)
+
+        return _CandidateArrays(
+            ev=ev,
+            game_idx=game_idx,
+            num_games=len(game_ids),
+            corr=pair_matrix.corr[np.ix_(rows, rows)],
+            conflict=pair_matrix.conflict[np.ix_(rows, rows)],
+            same_key=key_idx[:, None] == key_idx[None, :],
+        )
 
     @staticmethod
     def _candidate_sort_key(leg: Dict[str, Any]) -> tuple:
@@ -158,16 +219,3 @@ class ParlaySelectionOptimizer:
             str(leg.get("market_type") or ""),
             str(leg.get("outcome") or ""),
         )
-
-    def _is_too_correlated(self, leg: Dict[str, Any], selected: List[Dict[str, Any]], *, ceiling: float) -> bool:
-        if not selected:
-            return False
-
-        # Only same-game legs will have non-zero correlation, but keep the loop simple.
-        for other in selected:
-            corr = float(self._corr.estimate_latent_correlation(leg, other))
-            if abs(corr) >= float(ceiling):
-                return True
-        return False
-
-
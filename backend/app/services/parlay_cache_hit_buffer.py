@@ -0,0 +1,109 @@
+"""
+Buffered `ParlayCache.hit_count` updates.
+
+Cache reads only bump an in-process counter; a background task (and shutdown) flushes the
+accumulated counts to the database in one batched UPDATE, so serving a cached parlay never
+opens a write transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import uuid
+from typing import Any, Dict, Optional
+
+from sqlalchemy import bindparam, func, update
+
+from app.models.parlay_cache import ParlayCache
+
+logger = logging.getLogger(__name__)
+
+
+class ParlayCacheHitBuffer:
+    """Accumulates hit counts per `ParlayCache` row id and flushes them periodically."""
+
+    DEFAULT_INTERVAL_SECONDS = 60.0
+
+    def __init__(self, *, session_factory: Any = None, interval_seconds: float = DEFAULT_INTERVAL_SECONDS):
+        self._session_factory = session_factory
+        self._interval = float(interval_seconds)
+        self._pending: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, row_id: Any, count: int = 1) -> None:
+        if not row_id:
+            return
+        key = str(row_id)
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + int(count)
+
+    def pending(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._pending)
+
+    async def flush(self) -> int:
+        """Write buffered counts (one executemany UPDATE); counts are re-buffered on failure."""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return 0
+
+        table = ParlayCache.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("row_id"))
+            .values(hit_count=func.coalesce(table.c.hit_count, 0) + bindparam("hits"))
+        )
+        params = [{"row_id": uuid.UUID(row_id), "hits": hits} for row_id, hits in batch.items()]
+        try:
+            async with self._sessions()() as db:
+                await db.execute(stmt, params)
+                await db.commit()
+        except Exception as exc:
+            logger.warning("ParlayCache hit flush failed (%s rows): %s", len(batch), exc)
+            for row_id, hits in batch.items():
+                self.record(row_id, hits)
+            return 0
+        return len(batch)
+
+    def start_flusher(self) -> bool:
+        """Start the periodic flush task (no-op when already running)."""
+        if self._task is not None and not self._task.done():
+            return False
+        self._task = asyncio.create_task(self._run())
+        return True
+
+    async def stop_flusher(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.flush()
+
+    def _sessions(self):
+        if self._session_factory is None:
+            from app.database.session import AsyncSessionLocal
+
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+
+_buffer: Optional[ParlayCacheHitBuffer] = None
+
+
+def get_parlay_cache_hit_buffer() -> ParlayCacheHitBuffer:
+    global _buffer
+    if _buffer is None:
+        _buffer = ParlayCacheHitBuffer()
+    return _buffer
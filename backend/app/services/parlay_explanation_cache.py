@@ -0,0 +1,209 @@
+"""
+Explanation cache for AI parlay write-ups.
+
+Two layers, both in a `TieredCache` (process L1 + Redis L2):
+
+- Leg fragments, keyed `leg:{game_id}:{market}:{outcome}:{odds bucket}`: the 1-2 sentence
+  rationale the model wrote for that pick. The paragraph header (matchup, odds,
+  confidence) is rebuilt from current numbers when a fragment is reused.
+- Whole explanations, keyed by the canonical set of leg keys + risk profile + hit
+  probability bucket. An entry is only served while every one of its leg fragments is
+  still cached, so dropping a game's fragments also retires every parlay that used it.
+
+Odds are bucketed, so a real line move changes the leg key; odds change events also drop
+the fragments of the affected games (`invalidate_games`, via a per-game Redis key index
+rather than a keyspace SCAN). When every leg of a new parlay
+has a fragment, the explanation is assembled without calling the model.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.core import telemetry
+from app.services.tiered_cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+FRAGMENT_TTL_SECONDS = 30 * 60
+EXPLANATION_TTL_SECONDS = 15 * 60
+ODDS_BUCKET = 5  # American odds points
+PROBABILITY_BUCKET = 0.005
+
+_HEADER_RE = re.compile(r"^.*?—\s*Pick:.*?\)\.\s*", re.DOTALL)
+
+
+def _odds_bucket(odds: Any) -> str:
+    raw = str(odds or "").strip()
+    try:
+        value = float(raw.replace("+", ""))
+    except ValueError:
+        return raw or "na"
+    return str(int(round(value / ODDS_BUCKET)) * ODDS_BUCKET)
+
+
+def _game_prefix(game_id: Any) -> str:
+    return f"leg:{game_id}:"
+
+
+def _leg_game_prefix(leg: Dict[str, Any]) -> str:
+    return _game_prefix(str(leg.get("game_id") or "").strip() or "nogame")
+
+
+def leg_key(leg: Dict[str, Any]) -> str:
+    parts = [
+        str(leg.get("market_type") or "").lower(),
+        str(leg.get("outcome") or "").lower(),
+        _odds_bucket(leg.get("odds")),
+    ]
+    return _leg_game_prefix(leg) + hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def explanation_key(legs: List[Dict[str, Any]], risk_profile: str, parlay_probability: float, kind: str = "single") -> str:
+    prob_bucket = int(round(float(parlay_probability or 0.0) / PROBABILITY_BUCKET))
+    material = "|".join(sorted(leg_key(leg) for leg in legs)) + f"|{(risk_profile or '').lower()}|{prob_bucket}"
+    return f"{kind}:" + hashlib.sha1(material.encode("utf-8")).hexdigest()
+
+
+def leg_header(leg: Dict[str, Any]) -> str:
+    confidence = float(leg.get("confidence") or 0.0)
+    return (
+        f"{leg.get('game') or 'This matchup'} — Pick: {leg.get('outcome')} "
+        f"(Odds {leg.get('odds')}, Confidence {confidence:.1f}%)."
+    )
+
+
+def extract_leg_rationales(summary: str, legs: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Map leg key -> rationale for each leg paragraph the model wrote in the expected format."""
+    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", summary or "") if p.strip()]
+    found: Dict[str, str] = {}
+    for leg in legs:
+        game = str(leg.get("game") or "").strip()
+        outcome = str(leg.get("outcome") or "").strip().lower()
+        for paragraph in paragraphs:
+            head = paragraph[: len(game) + 120]
+            if not game or not head.startswith(game) or "Pick:" not in head or outcome not in head.lower():
+                continue
+            rationale = _HEADER_RE.sub("", paragraph, count=1).strip()
+            if rationale and rationale != paragraph:
+                found[leg_key(leg)] = rationale
+            break
+    return found
+
+
+def assemble_explanation(
+    legs: List[Dict[str, Any]],
+    rationales: Dict[str, str],
+    risk_profile: str,
+    parlay_probability: float,
+    overall_confidence: float,
+) -> Dict[str, str]:
+    """Build a summary/risk_notes pair from cached leg rationales and current leg numbers."""
+    intro = (
+        f"This {len(legs)}-leg {risk_profile} parlay has an estimated {float(parlay_probability):.1%} chance "
+        f"of hitting, with average model confidence of {float(overall_confidence):.1f}%."
+    )
+    paragraphs = [intro] + [f"{leg_header(leg)} {rationales[leg_key(leg)]}" for leg in legs]
+    swing = min(legs, key=lambda leg: float(leg.get("confidence") or 0.0))
+    risk_notes = (
+        f"The biggest swing leg is {swing.get('game')} ({swing.get('outcome')}, Odds {swing.get('odds')}), "
+        f"which carries the lowest model confidence on the ticket at {float(swing.get('confidence') or 0.0):.1f}%. "
+        "Never wager more than you can afford to lose."
+    )
+    return {"summary": "\n\n".join(paragraphs), "risk_notes": risk_notes, "highlight_leg": f"{swing.get('game')}: {swing.get('outcome')}"}
+
+
+class ParlayExplanationCache:
+    """Leg-fragment and whole-explanation cache (see module docstring)."""
+
+    def __init__(self, cache: Optional[TieredCache] = None):
+        self._cache = cache or TieredCache("parlay_explanations", max_entries=4096, stale_grace_seconds=0)
+
+    async def get(
+        self,
+        legs: List[Dict[str, Any]],
+        risk_profile: str,
+        parlay_probability: float,
+        overall_confidence: float,
+        *,
+        kind: str = "single",
+    ) -> Optional[Dict[str, str]]:
+        """Cached explanation for this parlay, else one assembled from leg fragments, else None."""
+        if not legs:
+            return None
+        rationales: Dict[str, str] = {}
+        for leg in legs:
+            fragment = await self._cache.get(leg_key(leg))
+            if fragment is None:
+                telemetry.inc("parlay_explanation_cache_miss")
+                return None
+            rationales[leg_key(leg)] = str(fragment)
+
+        cached = await self._cache.get(explanation_key(legs, risk_profile, parlay_probability, kind))
+        if isinstance(cached, dict):
+            telemetry.inc("parlay_explanation_cache_hit")
+            return dict(cached)
+
+        if all(rationales.values()):
+            telemetry.inc("parlay_explanation_cache_assembled")
+            return assemble_explanation(legs, rationales, risk_profile, parlay_probability, overall_confidence)
+        telemetry.inc("parlay_explanation_cache_miss")
+        return None
+
+    async def store(
+        self,
+        legs: List[Dict[str, Any]],
+        risk_profile: str,
+        parlay_probability: float,
+        explanation: Dict[str, str],
+        *,
+        kind: str = "single",
+        rationales: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Remember a model-written explanation plus its leg fragments.
+
+        Legs without a parsed rationale still get an (empty) fragment entry so the whole
+        explanation can be validated against invalidation; existing rationales are kept.
+        """
+        if not legs:
+            return
+        try:
+            rationales = rationales if rationales is not None else {}
+            for leg in legs:
+                key = leg_key(leg)
+                rationale = rationales.get(key, "")
+                if not rationale and await self._cache.get(key):
+                    continue
+                await self._cache.set(
+                    key, rationale, ttl=FRAGMENT_TTL_SECONDS, index_prefix=_leg_game_prefix(leg)
+                )
+            await self._cache.set(
+                explanation_key(legs, risk_profile, parlay_probability, kind),
+                dict(explanation),
+                ttl=EXPLANATION_TTL_SECONDS,
+            )
+        except Exception as exc:
+            logger.debug("Parlay explanation cache store failed: %s", exc)
+
+    async def invalidate_games(self, game_ids: Iterable[str], *, shared: bool = True) -> int:
+        """Drop leg fragments for games whose odds changed (explanations using them go with them)."""
+        return await self._cache.delete_indexed_prefixes(
+            (_game_prefix(g) for g in {str(g) for g in game_ids if g}), shared=shared
+        )
+
+    def clear(self) -> None:
+        self._cache.l1.clear()
+
+
+_explanation_cache: Optional[ParlayExplanationCache] = None
+
+
+def get_parlay_explanation_cache() -> ParlayExplanationCache:
+    global _explanation_cache
+    if _explanation_cache is None:
+        _explanation_cache = ParlayExplanationCache()
+    return _explanation_cache
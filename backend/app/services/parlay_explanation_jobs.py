@@ -0,0 +1,181 @@
+"""
+Background ("speculative") parlay explanations.
+
+With `async_explanation=true`, `/parlay/suggest` saves the parlay with a provisional
+deterministic write-up and returns straight away. `ParlayExplanationJobs.schedule` then
+generates the model explanation in the background:
+
+- writes it onto the `Parlay` row;
+- publishes its status (Redis-backed, so any instance can answer polls on
+  `/parlay/{id}/explanation`);
+- pushes it to the user's `/ws/user` connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from sqlalchemy import update
+
+from app.core.event_logger import log_event
+from app.models.parlay import Parlay
+from app.services.tiered_cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = "pending"
+STATUS_READY = "ready"
+
+
+class ParlayExplanationJobs:
+    """Runs deferred explanations with bounded concurrency and tracks their status by parlay id."""
+
+    STATUS_TTL_SECONDS = 3600
+    MAX_CONCURRENT = 8
+
+    def __init__(
+        self,
+        *,
+        session_factory: Any = None,
+        status_cache: Optional[TieredCache] = None,
+        manager_factory: Optional[Callable[[], Any]] = None,
+        notifier: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+    ):
+        self._session_factory = session_factory
+        self._status = status_cache or TieredCache("parlay_explanation_status", max_entries=2048, stale_grace_seconds=0)
+        self._manager_factory = manager_factory
+        self._notifier = notifier
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def mark_pending(self, parlay_id: str) -> None:
+        await self._status.set(parlay_id, {"parlay_id": parlay_id, "status": STATUS_PENDING}, ttl=self.STATUS_TTL_SECONDS)
+
+    async def get_status(self, parlay_id: str) -> Optional[Dict[str, Any]]:
+        # Redis first: a "pending" copy in this process's L1 may already be stale when the
+        # job ran on another instance.
+        return await self._status.get(parlay_id, l2_first=True)
+
+    def schedule(
+        self,
+        *,
+        parlay_id: str,
+        parlay_data: Dict[str, Any],
+        risk_profile: str,
+        user_id: Optional[str] = None,
+        request_id: Optional[str] = None,
+        sports: Optional[List[str]] = None,
+    ) -> asyncio.Task:
+        task = asyncio.create_task(
+            self.run(
+                parlay_id=parlay_id,
+                parlay_data=parlay_data,
+                risk_profile=risk_profile,
+                user_id=user_id,
+                request_id=request_id,
+                sports=sports,
+            )
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def run(
+        self,
+        *,
+        parlay_id: str,
+        parlay_data: Dict[str, Any],
+        risk_profile: str,
+        user_id: Optional[str] = None,
+        request_id: Optional[str] = None,
+        sports: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Generate, persist, publish and push one explanation (never raises)."""
+        async with self._semaphore:
+            explanation, fallback_used, error_type = await self._manager().get_explanation(
+                parlay_data=parlay_data,
+                risk_profile=risk_profile,
+                request_id=request_id,
+                user_id=user_id,
+                sports=sports,
+            )
+
+        payload = {
+            "parlay_id": parlay_id,
+            "status": STATUS_READY,
+            "ai_summary": explanation["summary"],
+            "ai_risk_notes": explanation["risk_notes"],
+            "explanation_fallback_used": bool(fallback_used),
+        }
+        try:
+            async with self._sessions()() as db:
+                await db.execute(
+                    update(Parlay)
+                    .where(Parlay.id == uuid.UUID(parlay_id))
+                    .values(ai_summary=payload["ai_summary"], ai_risk_notes=payload["ai_risk_notes"])
+                )
+                await db.commit()
+        except Exception as exc:
+            logger.warning("Deferred explanation for parlay %s not persisted: %s", parlay_id, exc)
+
+        try:
+            await self._status.set(parlay_id, payload, ttl=self.STATUS_TTL_SECONDS)
+        except Exception as exc:
+            logger.debug("Deferred explanation status not published: %s", exc)
+
+        if user_id:
+            try:
+                await self._notify(user_id, payload)
+            except Exception as exc:
+                logger.debug("Deferred explanation push skipped: %s", exc)
+
+        log_event(
+            logger,
+            "parlay.explanation_deferred_ready",
+            trace_id=request_id,
+            parlay_id=parlay_id,
+            fallback_used=bool(fallback_used),
+            error_type=error_type,
+        )
+        return payload
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Wait for in-flight explanations (shutdown, tests)."""
+        if self._tasks:
+            await asyncio.wait(set(self._tasks), timeout=timeout)
+
+    def _manager(self):
+        if self._manager_factory is not None:
+            return self._manager_factory()
+        from app.services.parlay_explanation_manager import ParlayExplanationManager
+
+        return ParlayExplanationManager()
+
+    async def _notify(self, user_id: str, payload: Dict[str, Any]) -> None:
+        if self._notifier is not None:
+            await self._notifier(user_id, payload)
+            return
+        from app.api.routes.websocket import manager as ws_manager
+
+        await ws_manager.send_to_user(user_id, json.dumps({"type": "parlay_explanation", "data": payload}))
+
+    def _sessions(self):
+        if self._session_factory is None:
+            from app.database.session import AsyncSessionLocal
+
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+
+_jobs: Optional[ParlayExplanationJobs] = None
+
+
+def get_parlay_explanation_jobs() -> ParlayExplanationJobs:
+    global _jobs
+    if _jobs is None:
+        _jobs = ParlayExplanationJobs()
+    return _jobs
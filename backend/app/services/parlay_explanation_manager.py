@@ -11,6 +11,11 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from app.services.openai_service import OpenAIService
 from app.services.alerting import get_alerting_service
+from app.services.parlay_explanation_cache import (
+    ParlayExplanationCache,
+    extract_leg_rationales,
+    get_parlay_explanation_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,15 +58,20 @@ class ParlayExplanationManager:
     Fail-safe parlay explanation: wraps OpenAI with timeout and fallback.
     On any error (timeout, rate limit, key, network), returns a deterministic
     explanation so the parlay endpoint never 500s due to the LLM step.
+
+    Model-written explanations go through `ParlayExplanationCache`, so repeated or
+    overlapping parlays are answered (or assembled from leg fragments) without a call.
     """
 
     def __init__(
         self,
         openai_service: Optional[OpenAIService] = None,
         timeout_seconds: float = EXPLANATION_TIMEOUT_SECONDS,
+        explanation_cache: Optional[ParlayExplanationCache] = None,
     ):
         self._openai = openai_service or OpenAIService()
         self._timeout = timeout_seconds
+        self._cache = explanation_cache or get_parlay_explanation_cache()
 
     async def get_explanation(
         self,
@@ -79,6 +89,10 @@ class ParlayExplanationManager:
         parlay_prob = parlay_data.get("parlay_hit_prob", 0.0)
         overall_conf = parlay_data.get("overall_confidence", 0.0)
 
+        cached = await self._cached(legs, risk_profile, parlay_prob, overall_conf)
+        if cached is not None:
+            return ({"summary": cached["summary"], "risk_notes": cached["risk_notes"]}, False, None)
+
         try:
             raw = await asyncio.wait_for(
                 self._openai.generate_parlay_explanation(
@@ -92,11 +106,13 @@ class ParlayExplanationManager:
             if not _is_valid_explanation(raw):
                 raise ValueError("OpenAI explanation missing required keys (summary, risk_notes)")
 
-            return (
-                {"summary": str(raw["summary"]), "risk_notes": str(raw["risk_notes"])},
-                False,
-                None,
-            )
+            explanation = {"summary": str(raw["summary"]), "risk_notes": str(raw["risk_notes"])}
+            # Only a real model answer has a paragraph per leg; OpenAIService's own
+            # deterministic fallbacks never do, so they are not cached.
+            rationales = extract_leg_rationales(explanation["summary"], legs)
+            if legs and self._caching_enabled() and len(rationales) == len(legs):
+                await self._cache.store(legs, risk_profile, parlay_prob, explanation, rationales=rationales)
+            return (explanation, False, None)
         except Exception as e:
             error_type = type(e).__name__
             logger.warning(
@@ -119,6 +135,90 @@ class ParlayExplanationManager:
             )
             return (explanation, True, error_type)
 
+    async def get_cached_explanation(
+        self,
+        parlay_data: Dict[str, Any],
+        risk_profile: str,
+    ) -> Optional[Dict[str, str]]:
+        """Explanation from the cache only (no model call); None on a miss."""
+        cached = await self._cached(
+            parlay_data.get("legs") or [],
+            risk_profile,
+            parlay_data.get("parlay_hit_prob", 0.0),
+            parlay_data.get("overall_confidence", 0.0),
+        )
+        if cached is None:
+            return None
+        return {"summary": cached["summary"], "risk_notes": cached["risk_notes"]}
+
+    @staticmethod
+    def provisional_explanation(parlay_data: Dict[str, Any], risk_profile: str) -> Dict[str, str]:
+        """Deterministic write-up shown until a deferred explanation is ready."""
+        return _fallback_explanation(parlay_data, risk_profile)
+
+    async def get_triple_explanations(self, triple_data: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+        """
+        Safe/balanced/degen explanations, served from the cache per profile when possible.
+
+        The model is only called (once, for the whole triple) when some profile misses.
+        """
+        results: Dict[str, Dict[str, str]] = {}
+        missing: List[str] = []
+        for profile_name, block in triple_data.items():
+            parlay = block.get("parlay") or {}
+            cached = await self._cached(
+                parlay.get("legs") or [],
+                parlay.get("risk_profile", profile_name),
+                parlay.get("parlay_hit_prob", 0.0),
+                parlay.get("overall_confidence", 0.0),
+                kind="triple",
+            )
+            if cached is None:
+                missing.append(profile_name)
+            else:
+                results[profile_name] = cached
+        if not missing:
+            return results
+
+        generated = await self._openai.generate_triple_parlay_explanations(triple_data)
+        for profile_name in missing:
+            entry = generated.get(profile_name) or {}
+            results[profile_name] = entry
+            parlay = (triple_data.get(profile_name) or {}).get("parlay") or {}
+            legs = parlay.get("legs") or []
+            # Fallback blocks from OpenAIService always use highlight_leg "N/A".
+            if not legs or not self._caching_enabled() or entry.get("highlight_leg") in (None, "", "N/A"):
+                continue
+            await self._cache.store(
+                legs,
+                parlay.get("risk_profile", profile_name),
+                parlay.get("parlay_hit_prob", 0.0),
+                entry,
+                kind="triple",
+                rationales=extract_leg_rationales(entry.get("summary") or "", legs),
+            )
+        return results
+
+    async def _cached(
+        self,
+        legs: List[Dict[str, Any]],
+        risk_profile: str,
+        parlay_probability: float,
+        overall_confidence: float,
+        *,
+        kind: str = "single",
+    ) -> Optional[Dict[str, str]]:
+        if not legs or not self._caching_enabled():
+            return None
+        try:
+            return await self._cache.get(legs, risk_profile, parlay_probability, overall_confidence, kind=kind)
+        except Exception as exc:
+            logger.debug("Parlay explanation cache lookup failed: %s", exc)
+            return None
+
+    def _caching_enabled(self) -> bool:
+        return bool(getattr(self._openai, "_enabled", True))
+
     async def _emit_fallback_alert(
         self,
         error_type: str,
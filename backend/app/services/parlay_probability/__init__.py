@@ -3,9 +3,25 @@
 This package contains:
 - Correlation modeling for legs within the same game
 - Correlation-aware parlay hit probability calculation
+- Joint (orthant) probability engine: exact quadrature / randomized QMC / MC
+- Memoized joint probabilities per same-game leg group
+- Precomputed pairwise correlation/conflict matrix for a candidate pool
 """
 
 from app.services.parlay_probability.parlay_correlation_model import ParlayCorrelationModel
+from app.services.parlay_probability.candidate_pair_matrix import (
+    CandidatePairMatrix,
+    CandidatePairMatrixStore,
+    get_candidate_pair_matrix_store,
+)
+from app.services.parlay_probability.joint_probability_cache import (
+    JointProbabilityCache,
+    get_joint_probability_cache,
+)
+from app.services.parlay_probability.joint_probability_engine import (
+    JointProbabilityEngine,
+    JointProbabilityEstimate,
+)
 from app.services.parlay_probability.correlated_parlay_probability_calculator import (
     CorrelatedParlayProbabilityCalculator,
 )
@@ -15,6 +31,13 @@ from app.services.parlay_probability.parlay_probability_calibration_service impo
 
 __all__ = [
     "ParlayCorrelationModel",
+    "CandidatePairMatrix",
+    "CandidatePairMatrixStore",
+    "get_candidate_pair_matrix_store",
+    "JointProbabilityEngine",
+    "JointProbabilityEstimate",
+    "JointProbabilityCache",
+    "get_joint_probability_cache",
     "CorrelatedParlayProbabilityCalculator",
     "ParlayProbabilityCalibrationService",
 ]
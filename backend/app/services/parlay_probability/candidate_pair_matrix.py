@@ -0,0 +1,182 @@
+"""Pairwise correlation/conflict matrix for a candidate-leg pool (built once per cache fill)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.parlay_probability.parlay_correlation_model import ParlayCorrelationModel
+
+ConflictChecker = Callable[[Dict[str, Any], List[Dict[str, Any]]], bool]
+LegIdentity = Tuple[str, str, str, str]
+
+
+class CandidatePairMatrix:
+    """
+    Latent correlations and conflict flags for every leg pair in a candidate pool.
+
+    - `corr[i, j]`: `ParlayCorrelationModel.estimate_latent_correlation` (0 for cross-game pairs).
+    - `conflict[i, j]`: `conflict_checker(legs[i], [legs[j]])`, i.e. leg i cannot join a
+      parlay that already holds leg j.
+
+    Only pairs that share a game (or where a leg has no game_id) are evaluated; cross-game
+    legs are independent by construction. Legs are addressed by `leg_identity`, so the
+    matrix can be sliced for any subset of the pool (including JSON round-tripped copies).
+    """
+
+    def __init__(self, *, index: Dict[LegIdentity, int], corr: np.ndarray, conflict: np.ndarray):
+        self._index = index
+        self.corr = corr
+        self.conflict = conflict
+
+    @classmethod
+    def build(
+        cls,
+        legs: Sequence[Dict[str, Any]],
+        *,
+        correlation_model: ParlayCorrelationModel,
+        conflict_checker: ConflictChecker,
+    ) -> "CandidatePairMatrix":
+        legs = list(legs or [])
+        n = len(legs)
+        index: Dict[LegIdentity, int] = {}
+        for i, leg in enumerate(legs):
+            index.setdefault(cls.leg_identity(leg), i)
+
+        corr = np.zeros((n, n), dtype=float)
+        conflict = np.zeros((n, n), dtype=bool)
+        for i, j in cls.related_pairs([str(leg.get("game_id") or "").strip() for leg in legs]):
+            value = float(correlation_model.estimate_latent_correlation(legs[i], legs[j]))
+            corr[i, j] = value
+            corr[j, i] = value
+            conflict[i, j] = bool(conflict_checker(legs[i], [legs[j]]))
+            conflict[j, i] = bool(conflict_checker(legs[j], [legs[i]]))
+        return cls(index=index, corr=corr, conflict=conflict)
+
+    @property
+    def size(self) -> int:
+        return int(self.corr.shape[0])
+
+    def indices(self, legs: Sequence[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Row indices for `legs`, or None if any leg is not part of this pool."""
+        rows = []
+        for leg in legs or []:
+            row = self._index.get(self.leg_identity(leg))
+            if row is None:
+                return None
+            rows.append(row)
+        return np.array(rows, dtype=np.int64)
+
+    def covers(self, legs: Sequence[Dict[str, Any]]) -> bool:
+        return self.indices(legs) is not None
+
+    def correlation_submatrix(self, legs: Sequence[Dict[str, Any]]) -> Optional[np.ndarray]:
+        idx = self.indices(legs)
+        if idx is None:
+            return None
+        sub = self.corr[np.ix_(idx, idx)]
+        np.fill_diagonal(sub, 1.0)
+        return sub
+
+    def conflict_submatrix(self, legs: Sequence[Dict[str, Any]]) -> Optional[np.ndarray]:
+        idx = self.indices(legs)
+        if idx is None:
+            return None
+        return self.conflict[np.ix_(idx, idx)]
+
+    @staticmethod
+    def leg_identity(leg: Dict[str, Any]) -> LegIdentity:
+        return (
+            str(leg.get("game_id") or "").strip(),
+            str(leg.get("market_id") or ""),
+            str(leg.get("market_type") or ""),
+            str(leg.get("outcome") or ""),
+        )
+
+    @staticmethod
+    def related_pairs(game_ids: Sequence[str]) -> List[Tuple[int, int]]:
+        """Index pairs (i < j) that share a game, or where either leg has no game_id."""
+        missing: List[int] = []
+        by_game: Dict[str, List[int]] = {}
+        for i, game_id in enumerate(game_ids):
+            if game_id:
+                by_game.setdefault(game_id, []).append(i)
+            else:
+                missing.append(i)
+
+        pairs: List[Tuple[int, int]] = []
+        for members in by_game.values():
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    pairs.append((members[a], members[b]))
+        missing_set = set(missing)
+        for m in missing:
+            for i in range(len(game_ids)):
+                if i != m and (i not in missing_set or i > m):
+                    pairs.append((min(i, m), max(i, m)))
+        return pairs
+
+
+class CandidatePairMatrixStore:
+    """
+    Process-wide registry of pair matrices, keyed like `CandidateLegCache` entries.
+
+    Matrices are built with the default `ParlayCorrelationModel` and the parlay leg
+    selection conflict rules; consumers using other rules must not read from here.
+    """
+
+    def __init__(self, *, max_entries: int = 16) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, Tuple[CandidatePairMatrix, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, key: str, matrix: CandidatePairMatrix, ttl_seconds: int) -> None:
+        with self._lock:
+            self._entries[key] = (matrix, time.monotonic() + max(1, int(ttl_seconds)))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[CandidatePairMatrix]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[1]:
+                del self._entries[key]
+                return None
+            return entry[0]
+
+    def find(self, legs: Sequence[Dict[str, Any]]) -> Optional[CandidatePairMatrix]:
+        """Most recently stored, unexpired matrix that covers every leg in `legs`."""
+        if not legs:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            for key in reversed(list(self._entries.keys())):
+                matrix, expires_at = self._entries[key]
+                if now >= expires_at:
+                    del self._entries[key]
+                    continue
+                if matrix.covers(legs):
+                    return matrix
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_candidate_pair_matrix_store: Optional[CandidatePairMatrixStore] = None
+
+
+def get_candidate_pair_matrix_store() -> CandidatePairMatrixStore:
+    """Module singleton for candidate pair matrices."""
+    global _candidate_pair_matrix_store
+    if _candidate_pair_matrix_store is None:
+        _candidate_pair_matrix_store = CandidatePairMatrixStore()
+    return _candidate_pair_matrix_store
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import hashlib
 from statistics import NormalDist
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from app.services.parlay_probability.candidate_pair_matrix import CandidatePairMatrixStore
+from app.services.parlay_probability.joint_probability_cache import JointProbabilityCache
+from app.services.parlay_probability.joint_probability_engine import JointProbabilityEngine
 from app.services.parlay_probability.parlay_correlation_model import ParlayCorrelationModel
 
 
@@ -16,8 +19,11 @@ class CorrelatedParlayProbabilityCalculator:
     Strategy:
     - Partition legs by game_id.
     - For groups of size 1: use the marginal probability directly.
-    - For groups of size >= 2: estimate P(all hit) via Monte Carlo using a Gaussian copula.
+    - For groups of size >= 2: estimate P(all hit) under a Gaussian copula via
+      `JointProbabilityEngine` (exact quadrature for 2-3 legs, adaptive QMC beyond that).
     - Multiply group probabilities across games (assume cross-game independence).
+    - Optionally memoize same-game groups in a `JointProbabilityCache`, and read pairwise
+      correlations from a `CandidatePairMatrixStore` when the group was precomputed.
 
     Determinism:
     - By default, uses a deterministic seed derived from the legs + risk_profile.
@@ -25,7 +31,7 @@ class CorrelatedParlayProbabilityCalculator:
     """
 
     _DEFAULT_SAMPLES_BY_PROFILE: Dict[str, int] = {
-        # Baseline sample sizes for same-game groups (size 3-4). We scale up/down by group size
+        # Baseline sample budgets for same-game groups (size 3-4). We scale up/down by group size
         # to balance stability vs latency.
         "conservative": 10000,
         "balanced": 7000,
@@ -37,8 +43,15 @@ class CorrelatedParlayProbabilityCalculator:
         correlation_model: ParlayCorrelationModel,
         *,
         samples_by_profile: Optional[Dict[str, int]] = None,
+        joint_engine: Optional[JointProbabilityEngine] = None,
+        joint_cache: Optional[JointProbabilityCache] = None,
+        pair_matrix_store: Optional[CandidatePairMatrixStore] = None,
     ):
         self._correlation_model = correlation_model
+        self._joint_engine = joint_engine or JointProbabilityEngine()
+        self._joint_cache = joint_cache
+        # Only pass a store whose matrices were built with the same correlation model.
+        self._pair_matrix_store = pair_matrix_store
         self._samples_by_profile = dict(self._DEFAULT_SAMPLES_BY_PROFILE)
         if samples_by_profile:
             self._samples_by_profile.update({str(k): int(v) for k, v in samples_by_profile.items()})
@@ -56,32 +69,44 @@ class CorrelatedParlayProbabilityCalculator:
         if not legs:
             return 0.0
 
-        # Group by game_id, but avoid accidental grouping when game_id is missing.
-        groups: Dict[str, List[Dict[str, Any]]] = {}
-        for idx, leg in enumerate(legs):
-            raw_game_id = str(leg.get("game_id") or "").strip()
-            game_id = raw_game_id if raw_game_id else f"_missing_game_id_{idx}"
-            groups.setdefault(game_id, []).append(leg)
+        profile = (risk_profile or "balanced").lower().strip()
+
+        total_prob = 1.0
+        for game_id, group in self._group_by_game(legs):
+            total_prob *= self._group_probability(profile, game_id, group, rng_seed=rng_seed)
+
+        return float(max(0.0, min(1.0, total_prob)))
+
+    async def calculate_async(
+        self,
+        legs: List[Dict[str, Any]],
+        *,
+        risk_profile: str = "balanced",
+        rng_seed: Optional[int] = None,
+    ) -> float:
+        """
+        Same as `calculate`, but also consults/populates the shared (Redis) tier of the
+        joint probability cache when one is configured.
+        """
+        legs = list(legs or [])
+        if not legs:
+            return 0.0
 
         profile = (risk_profile or "balanced").lower().strip()
+        cache = self._joint_cache
+        use_shared = cache is not None and rng_seed is None and cache.shared_configured()
 
         total_prob = 1.0
-        for game_id, group in groups.items():
-            # Ensure order-invariant determinism (callers may pass legs in any order).
-            group = sorted(group, key=self._leg_sort_key)
-            if len(group) == 1:
-                total_prob *= self._clamp01(self._extract_probability(group[0]))
-                continue
-
-            # Same-game group: Monte Carlo joint probability for "all hit"
-            num_samples = self._samples_for_group(profile, len(group))
-            seed = rng_seed if rng_seed is not None else self._derive_seed(profile, game_id, group)
-            group_prob = self._estimate_same_game_joint_prob(
-                group,
-                num_samples=num_samples,
-                seed=seed,
-            )
-            total_prob *= group_prob
+        for game_id, group in self._group_by_game(legs):
+            key = self._cache_key(profile, game_id, group) if use_shared and len(group) > 1 else None
+            publish = False
+            if key is not None and cache.peek(key) is None:
+                publish = await cache.get_shared(key) is None
+            total_prob *= self._group_probability(profile, game_id, group, rng_seed=rng_seed)
+            if publish:
+                lift = cache.peek(key)
+                if lift is not None:
+                    await cache.set_shared(key, lift)
 
         return float(max(0.0, min(1.0, total_prob)))
 
@@ -89,6 +114,62 @@ class CorrelatedParlayProbabilityCalculator:
     # Internals
     # ------------------------------------------------------------------
 
+    def _group_by_game(self, legs: List[Dict[str, Any]]) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        # Group by game_id, but avoid accidental grouping when game_id is missing.
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for idx, leg in enumerate(legs):
+            raw_game_id = str(leg.get("game_id") or "").strip()
+            game_id = raw_game_id if raw_game_id else f"_missing_game_id_{idx}"
+            groups.setdefault(game_id, []).append(leg)
+        # Ensure order-invariant determinism (callers may pass legs in any order).
+        return [(game_id, sorted(group, key=self._leg_sort_key)) for game_id, group in groups.items()]
+
+    def _group_probability(
+        self,
+        profile: str,
+        game_id: str,
+        group: List[Dict[str, Any]],
+        *,
+        rng_seed: Optional[int],
+    ) -> float:
+        if len(group) == 1:
+            return self._clamp01(self._extract_probability(group[0]))
+
+        # Explicit seeds are a testing hook; keep those paths uncached.
+        key = self._cache_key(profile, game_id, group) if self._joint_cache is not None and rng_seed is None else None
+        if key is not None:
+            lift = self._joint_cache.get(key)
+            if lift is not None:
+                return self._apply_lift(group, lift)
+
+        # Same-game group: copula joint probability for "all hit" (sample count is a budget;
+        # the engine stops early once its error bound is within tolerance).
+        num_samples = self._samples_for_group(profile, len(group))
+        seed = rng_seed if rng_seed is not None else self._derive_seed(profile, game_id, group)
+        group_prob = self._estimate_same_game_joint_prob(
+            group,
+            num_samples=num_samples,
+            seed=seed,
+        )
+
+        if key is not None:
+            independent = self._independent_prob(group)
+            if independent > 0.0:
+                self._joint_cache.set(key, group_prob / independent)
+        return group_prob
+
+    def _cache_key(self, profile: str, game_id: str, group: List[Dict[str, Any]]) -> str:
+        probs = [self._clamp01(self._extract_probability(leg)) for leg in group]
+        return self._joint_cache.build_key(game_id=game_id, risk_profile=profile, legs=group, probabilities=probs)
+
+    def _apply_lift(self, group: List[Dict[str, Any]], lift: float) -> float:
+        probs = [self._clamp01(self._extract_probability(leg)) for leg in group]
+        # P(all hit) can never exceed the least likely leg.
+        return float(max(0.0, min(min(probs), self._independent_prob(group) * float(lift))))
+
+    def _independent_prob(self, group: List[Dict[str, Any]]) -> float:
+        return float(np.prod(np.array([self._clamp01(self._extract_probability(leg)) for leg in group], dtype=float)))
+
     def _estimate_same_game_joint_prob(self, legs: List[Dict[str, Any]], *, num_samples: int, seed: int) -> float:
         probs = [self._clamp01(self._extract_probability(leg)) for leg in legs]
         if any(p <= 0.0 for p in probs):
@@ -97,28 +178,31 @@ class CorrelatedParlayProbabilityCalculator:
 
         thresholds = np.array([self._inv_standard_normal(p) for p in probs], dtype=float)
 
-        corr = self._correlation_model.build_correlation_matrix(legs)
-        if not corr:
-            return float(np.prod(np.array(probs, dtype=float)))
-
-        R = np.array(corr, dtype=float)
+        R = self._group_correlation(legs)
+        if R is None:
+            return independent
         R = self._sanitize_corr_matrix(R)
 
-        L = self._safe_cholesky(R)
-        if L is None:
+        estimate = self._joint_engine.estimate(thresholds, R, max_samples=int(num_samples), seed=int(seed))
+        if estimate is None:
             # Fallback: avoid hard-failing; assume independence if correlation matrix is invalid.
             return independent
-
-        rng = np.random.default_rng(int(seed) & 0xFFFFFFFF)
-        z = rng.standard_normal(size=(int(num_samples), int(len(probs)))) @ L.T
-        hits = (z <= thresholds).all(axis=1)
-        hit_rate = float(hits.mean())
-        # Rare-event safeguard: for long same-game parlays, Monte Carlo can return 0.0
+        # Rare-event safeguard: for long same-game parlays, sampling can return 0.0
         # simply because no samples hit. In that case we return the independence estimate
         # as a conservative, non-zero fallback.
-        if hit_rate <= 0.0:
+        if estimate.probability <= 0.0:
             return independent
-        return hit_rate
+        return float(estimate.probability)
+
+    def _group_correlation(self, legs: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+        if self._pair_matrix_store is not None:
+            matrix = self._pair_matrix_store.find(legs)
+            if matrix is not None:
+                return matrix.correlation_submatrix(legs)
+        corr = self._correlation_model.build_correlation_matrix(legs)
+        if not corr:
+            return None
+        return np.array(corr, dtype=float)
 
     def _sanitize_corr_matrix(self, R: np.ndarray) -> np.ndarray:
         n = int(R.shape[0])
@@ -131,21 +215,6 @@ class CorrelatedParlayProbabilityCalculator:
             return R
         return R
 
-    @staticmethod
-    def _safe_cholesky(R: np.ndarray) -> Optional[np.ndarray]:
-        n = int(R.shape[0])
-        if n <= 1:
-            return np.eye(n, dtype=float)
-
-        jitter = 1e-8
-        for _ in range(6):
-            try:
-                return np.linalg.cholesky(R)
-            except np.linalg.LinAlgError:
-                R = R + np.eye(n, dtype=float) * jitter
-                jitter *= 10.0
-        return None
-
     def _inv_standard_normal(self, p: float) -> float:
         # Clamp to avoid +/-inf from inv_cdf.
         p = self._clamp01(p)
@@ -0,0 +1,251 @@
+"""Bounded LRU+TTL cache for same-game joint probabilities (in-process + optional Redis)."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.services.redis.redis_client_provider import RedisClientProvider, get_redis_provider
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "joint_prob:v1:"
+INDEX_PREFIX = "joint_prob_idx:v1:"  # per-game Redis set of cached keys
+
+
+class JointProbabilityCache:
+    """
+    Memoizes the copula "lift" (P(all hit) / product of marginals) for a same-game leg group.
+
+    - Keys are canonical: per game, risk profile, and the sorted
+      (market_type, outcome, point, probability-bucket) tuples of the legs.
+    - The lift (not the raw joint probability) is stored so a hit can be re-scaled by the
+      exact marginals of the caller; within a probability bucket the lift is nearly flat.
+    - The in-process tier is a bounded LRU with TTL and is safe to use from sync code.
+    - The Redis tier is optional and async-only (shared across instances, fails open).
+    - Entries for a game are dropped when its odds change (see `invalidate_games`). Redis
+      keys are tracked in a per-game set, so invalidation never scans the keyspace.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 4096,
+        ttl_seconds: int = 900,
+        probability_bucket: float = 0.0025,
+        shared_enabled: bool = False,
+        provider: Optional[RedisClientProvider] = None,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._ttl_seconds = max(1, int(ttl_seconds))
+        self._bucket = max(1e-6, float(probability_bucket))
+        self._shared_enabled = bool(shared_enabled)
+        self._provider = provider
+        self._clock = clock or time.monotonic
+
+        self._entries: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()  # key -> (lift, expires_at)
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._shared_hits = 0
+        self._evictions = 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def build_key(self, *, game_id: str, risk_profile: str, legs: List[Dict[str, Any]], probabilities: List[float]) -> str:
+        """Canonical key for a same-game group (order-invariant)."""
+        parts = sorted(
+            "|".join(
+                [
+                    self._normalize_market_type(leg.get("market_type")),
+                    str(leg.get("outcome") or "").lower().strip(),
+                    self._format_point(leg.get("point", leg.get("line"))),
+                    str(int(round(float(p) / self._bucket))),
+                ]
+            )
+            for leg, p in zip(legs, probabilities)
+        )
+        digest = hashlib.sha256("||".join(parts).encode("utf-8")).hexdigest()[:24]
+        profile = (risk_profile or "balanced").lower().strip()
+        return f"{PREFIX}{str(game_id).strip()}:{profile}:{digest}"
+
+    # ------------------------------------------------------------------
+    # In-process tier (sync)
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[float]:
+        """Return the cached lift for `key`, counting a hit or miss."""
+        with self._lock:
+            lift = self._get_locked(key)
+            if lift is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return lift
+
+    def peek(self, key: str) -> Optional[float]:
+        """Like `get`, but does not touch hit/miss counters."""
+        with self._lock:
+            return self._get_locked(key)
+
+    def set(self, key: str, lift: float) -> None:
+        with self._lock:
+            self._entries[key] = (float(lift), self._clock() + self._ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate_games(self, game_ids: Iterable[Any]) -> int:
+        """Drop in-process entries for the given games. Returns count removed."""
+        prefixes = tuple(f"{PREFIX}{str(g).strip()}:" for g in game_ids or [] if str(g).strip())
+        if not prefixes:
+            return 0
+        with self._lock:
+            stale = [k for k in self._entries if k.startswith(prefixes)]
+            for k in stale:
+                del self._entries[k]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for sizing the cache."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "shared_hits": self._shared_hits,
+                "evictions": self._evictions,
+                "hit_rate": (self._hits / lookups) if lookups else 0.0,
+            }
+
+    def _get_locked(self, key: str) -> Optional[float]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        lift, expires_at = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return lift
+
+    # ------------------------------------------------------------------
+    # Redis tier (async, optional)
+    # ------------------------------------------------------------------
+
+    def shared_configured(self) -> bool:
+        if not self._shared_enabled:
+            return False
+        if self._provider is None:
+            self._provider = get_redis_provider()
+        return self._provider.is_configured()
+
+    async def get_shared(self, key: str) -> Optional[float]:
+        """Read a lift from Redis and promote it to the in-process tier."""
+        if not self.shared_configured():
+            return None
+        try:
+            raw = await self._provider.get_client().get(key)
+            if not raw:
+                return None
+            lift = float(raw.decode("utf-8"))
+        except Exception as exc:
+            logger.debug("JointProbabilityCache Redis get failed: %s", exc)
+            return None
+        self.set(key, lift)
+        with self._lock:
+            self._shared_hits += 1
+        return lift
+
+    async def set_shared(self, key: str, lift: float) -> None:
+        if not self.shared_configured():
+            return
+        index_key = self._index_key(key[len(PREFIX):].split(":", 1)[0])
+        try:
+            pipe = self._provider.get_client().pipeline(transaction=False)
+            pipe.set(key, repr(float(lift)).encode("utf-8"), ex=self._ttl_seconds)
+            pipe.sadd(index_key, key)
+            pipe.expire(index_key, self._ttl_seconds)
+            await pipe.execute()
+        except Exception as exc:
+            logger.debug("JointProbabilityCache Redis set failed: %s", exc)
+
+    async def invalidate_games_shared(self, game_ids: Iterable[Any]) -> int:
+        """Drop in-process and Redis entries for the given games."""
+        game_ids = [str(g).strip() for g in game_ids or [] if str(g).strip()]
+        removed = self.invalidate_games(game_ids)
+        if not game_ids or not self.shared_configured():
+            return removed
+        try:
+            client = self._provider.get_client()
+            index_keys = [self._index_key(game_id) for game_id in game_ids]
+            pipe = client.pipeline(transaction=False)
+            for index_key in index_keys:
+                pipe.smembers(index_key)
+            keys = {k for members in await pipe.execute() for k in (members or ())}
+            if keys:
+                removed += int(await client.delete(*keys) or 0)
+            await client.delete(*index_keys)
+        except Exception as exc:
+            logger.debug("JointProbabilityCache Redis invalidation failed: %s", exc)
+        return removed
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _index_key(game_id: str) -> str:
+        return f"{INDEX_PREFIX}{game_id}"
+
+    @staticmethod
+    def _normalize_market_type(value: Any) -> str:
+        v = str(value or "").lower().strip()
+        if v in {"moneyline", "ml", "h2h"}:
+            return "h2h"
+        if v in {"spread", "spreads"}:
+            return "spreads"
+        if v in {"total", "totals", "over_under"}:
+            return "totals"
+        return v or "unknown"
+
+    @staticmethod
+    def _format_point(value: Any) -> str:
+        if value is None or value == "":
+            return ""
+        try:
+            return f"{float(value):g}"
+        except (TypeError, ValueError):
+            return str(value).strip()
+
+
+_joint_probability_cache: Optional[JointProbabilityCache] = None
+
+
+def get_joint_probability_cache() -> JointProbabilityCache:
+    """Module singleton for the joint probability cache."""
+    global _joint_probability_cache
+    if _joint_probability_cache is None:
+        from app.core.config import settings
+
+        _joint_probability_cache = JointProbabilityCache(
+            max_entries=int(getattr(settings, "joint_probability_cache_max_entries", 4096)),
+            ttl_seconds=int(getattr(settings, "joint_probability_cache_ttl_seconds", 900)),
+            shared_enabled=bool(getattr(settings, "joint_probability_cache_redis_enabled", False)),
+        )
+    return _joint_probability_cache
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+
+@dataclass(frozen=True)
+class JointProbabilityEstimate:
+    """P(all legs hit) for one same-game group, with an absolute error bound."""
+
+    probability: float
+    error_bound: float
+    method: str
+    samples: int
+
+
+class JointProbabilityEngine:
+    """
+    Estimates the Gaussian-copula orthant probability P(Z_1 <= b_1, ..., Z_n <= b_n).
+
+    Methods:
+    - "exact": 1-D Gauss-Legendre integration (bivariate Sheppard formula, trivariate by
+      conditioning on one leg). Deterministic and accurate to ~1e-8; only for n <= 3.
+    - "qmc": Genz separation-of-variables with a randomized Richtmyer lattice. Randomly
+      shifted replicates give a standard error, so sampling stops once the error bound
+      is within tolerance (or the sample budget is exhausted).
+    - "mc": plain Monte Carlo on Cholesky-correlated normals (legacy reference path).
+    - "auto": exact for n <= 3, qmc otherwise.
+    """
+
+    METHOD_AUTO = "auto"
+    METHOD_EXACT = "exact"
+    METHOD_QMC = "qmc"
+    METHOD_MC = "mc"
+
+    _METHODS = (METHOD_AUTO, METHOD_EXACT, METHOD_QMC, METHOD_MC)
+
+    # Richtmyer lattice generators: square roots of the first primes (one per QMC dimension).
+    _PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+    _QUAD_NODES = 48
+    _QUAD_NODES_COARSE = 24
+    _LOWER_LIMIT = -8.5
+
+    def __init__(
+        self,
+        *,
+        method: str = METHOD_AUTO,
+        abs_tolerance: float = 2e-4,
+        rel_tolerance: float = 0.01,
+        qmc_shifts: int = 8,
+        qmc_min_points: int = 64,
+    ):
+        normalized = (method or self.METHOD_AUTO).lower().strip()
+        if normalized not in self._METHODS:
+            raise ValueError(f"Unknown joint probability method: {method}")
+        self._method = normalized
+        self._abs_tolerance = max(0.0, float(abs_tolerance))
+        self._rel_tolerance = max(0.0, float(rel_tolerance))
+        self._qmc_shifts = max(2, int(qmc_shifts))
+        self._qmc_min_points = max(8, int(qmc_min_points))
+        self._gl = {
+            n: np.polynomial.legendre.leggauss(n) for n in (self._QUAD_NODES, self._QUAD_NODES_COARSE)
+        }
+
+    @property
+    def method(self) -> str:
+        return self._method
+
+    def estimate(
+        self,
+        thresholds: np.ndarray,
+        corr: np.ndarray,
+        *,
+        max_samples: int,
+        seed: int,
+    ) -> Optional[JointProbabilityEstimate]:
+        """
+        Estimate the orthant probability for upper limits `thresholds` and correlation `corr`.
+
+        Returns None when `corr` cannot be factorized (callers fall back to independence).
+        """
+        b = np.asarray(thresholds, dtype=float).reshape(-1)
+        R = np.asarray(corr, dtype=float)
+        n = int(b.shape[0])
+        if n == 0:
+            return JointProbabilityEstimate(probability=1.0, error_bound=0.0, method=self.METHOD_EXACT, samples=0)
+        if n == 1:
+            return JointProbabilityEstimate(
+                probability=float(ndtr(b[0])), error_bound=0.0, method=self.METHOD_EXACT, samples=0
+            )
+
+        method = self._method
+        if method == self.METHOD_AUTO:
+            method = self.METHOD_EXACT if n <= 3 else self.METHOD_QMC
+        if method == self.METHOD_EXACT and n > 3:
+            method = self.METHOD_QMC
+
+        if method == self.METHOD_EXACT:
+            if n == 3 and self.safe_cholesky(R) is None:
+                return None
+            return self._estimate_exact(b, R)
+
+        if method == self.METHOD_QMC:
+            return self._estimate_qmc(b, R, max_samples=max_samples, seed=seed)
+
+        L = self.safe_cholesky(R)
+        if L is None:
+            return None
+        return self._estimate_mc(b, L, num_samples=max_samples, seed=seed)
+
+    @staticmethod
+    def safe_cholesky(R: np.ndarray) -> Optional[np.ndarray]:
+        n = int(R.shape[0])
+        if n <= 1:
+            return np.eye(n, dtype=float)
+
+        jitter = 1e-8
+        for _ in range(6):
+            try:
+                return np.linalg.cholesky(R)
+            except np.linalg.LinAlgError:
+                R = R + np.eye(n, dtype=float) * jitter
+                jitter *= 10.0
+        return None
+
+    # ------------------------------------------------------------------
+    # Exact (n <= 3)
+    # ------------------------------------------------------------------
+
+    def _estimate_exact(self, b: np.ndarray, R: np.ndarray) -> JointProbabilityEstimate:
+        fine = self._orthant_exact(b, R, nodes=self._QUAD_NODES)
+        coarse = self._orthant_exact(b, R, nodes=self._QUAD_NODES_COARSE)
+        return JointProbabilityEstimate(
+            probability=self._clamp01(fine),
+            # Difference between the two rules is a conservative estimate of quadrature error.
+            error_bound=float(abs(fine - coarse)) + 1e-12,
+            method=self.METHOD_EXACT,
+            samples=0,
+        )
+
+    def _orthant_exact(self, b: np.ndarray, R: np.ndarray, *, nodes: int) -> float:
+        if b.shape[0] == 2:
+            return float(self._bvn_cdf(b[:1], b[1:], float(R[0, 1]), nodes=nodes)[0])
+        return self._tvn_cdf(b, R, nodes=nodes)
+
+    def _bvn_cdf(self, h: np.ndarray, k: np.ndarray, rho: float, *, nodes: int) -> np.ndarray:
+        """
+        Vectorized bivariate normal CDF (Sheppard's formula):
+            Phi2(h, k; r) = Phi(h) Phi(k) + 1/(2 pi) * int_0^asin(r) exp(-(h^2 + k^2 - 2hk sin t) / (2 cos^2 t)) dt
+        """
+        base = ndtr(h) * ndtr(k)
+        rho = max(-0.9999, min(0.9999, float(rho)))
+        if rho == 0.0:
+            return base
+
+        x, w = self._gl[nodes]
+        upper = float(np.arcsin(rho))
+        theta = 0.5 * upper * (x + 1.0)
+        sin_t = np.sin(theta)
+        cos2_t = np.cos(theta) ** 2
+
+        hh = (h * h + k * k)[:, None]
+        hk = (h * k)[:, None]
+        integrand = np.exp(-(hh - 2.0 * hk * sin_t[None, :]) / (2.0 * cos2_t[None, :]))
+        integral = 0.5 * upper * (integrand @ w)
+        return base + integral / (2.0 * np.pi)
+
+    def _tvn_cdf(self, b: np.ndarray, R: np.ndarray, *, nodes: int) -> float:
+        # Condition on the tightest leg: shortest integration interval, best accuracy.
+        first = int(np.argmin(b))
+        rest = [i for i in range(3) if i != first]
+        b1 = float(b[first])
+        if b1 <= self._LOWER_LIMIT:
+            return 0.0
+
+        r12 = float(R[first, rest[0]])
+        r13 = float(R[first, rest[1]])
+        r23 = float(R[rest[0], rest[1]])
+        s2 = float(np.sqrt(max(1e-12, 1.0 - r12 * r12)))
+        s3 = float(np.sqrt(max(1e-12, 1.0 - r13 * r13)))
+        partial = (r23 - r12 * r13) / (s2 * s3)
+
+        x, w = self._gl[nodes]
+        half = 0.5 * (b1 - self._LOWER_LIMIT)
+        xs = self._LOWER_LIMIT + half * (x + 1.0)
+        density = np.exp(-0.5 * xs * xs) / np.sqrt(2.0 * np.pi)
+        conditional = self._bvn_cdf(
+            (float(b[rest[0]]) - r12 * xs) / s2,
+            (float(b[rest[1]]) - r13 * xs) / s3,
+            partial,
+            nodes=nodes,
+        )
+        return float(half * np.sum(w * density * conditional))
+
+    # ------------------------------------------------------------------
+    # Randomized quasi-Monte Carlo (Genz)
+    # ------------------------------------------------------------------
+
+    def _estimate_qmc(self, b: np.ndarray, R: np.ndarray, *, max_samples: int, seed: int) -> Optional[JointProbabilityEstimate]:
+        # Variable reordering (tightest limits first) reduces integrand variance.
+        order = np.argsort(b, kind="stable")
+        b = b[order]
+        L = self.safe_cholesky(R[np.ix_(order, order)])
+        if L is None:
+            return None
+
+        dims = int(b.shape[0]) - 1
+        if dims > len(self._PRIMES):
+            # Beyond the lattice table; the reference estimator still handles it.
+            return self._estimate_mc(b, L, num_samples=max_samples, seed=seed)
+
+        rng = np.random.default_rng(int(seed) & 0xFFFFFFFF)
+        generator = np.sqrt(np.array(self._PRIMES[:dims], dtype=float))
+        shifts = rng.random(size=(self._qmc_shifts, dims))
+
+        sums = np.zeros(self._qmc_shifts, dtype=float)
+        count = 0
+        batch = self._qmc_min_points
+        budget = max(self._qmc_min_points * self._qmc_shifts, int(max_samples))
+        mean, bound = 0.0, 1.0
+
+        while True:
+            k = np.arange(count + 1, count + batch + 1, dtype=float)[:, None]
+            base = k * generator[None, :]
+            for s in range(self._qmc_shifts):
+                frac = np.mod(base + shifts[s][None, :], 1.0)
+                # Baker's (tent) transform: periodizes the integrand for faster lattice convergence.
+                w = np.abs(2.0 * frac - 1.0)
+                sums[s] += float(np.sum(self._genz_integrand(b, L, w)))
+            count += batch
+
+            per_shift = sums / float(count)
+            mean = float(per_shift.mean())
+            stderr = float(per_shift.std(ddof=1)) / float(np.sqrt(self._qmc_shifts))
+            bound = 3.0 * stderr
+            used = count * self._qmc_shifts
+            if bound <= max(self._abs_tolerance, self._rel_tolerance * mean) or used * 2 > budget:
+                break
+            batch = count  # double the lattice each round
+
+        return JointProbabilityEstimate(
+            probability=self._clamp01(mean),
+            error_bound=float(bound),
+            method=self.METHOD_QMC,
+            samples=int(count * self._qmc_shifts),
+        )
+
+    @staticmethod
+    def _genz_integrand(b: np.ndarray, L: np.ndarray, w: np.ndarray) -> np.ndarray:
+        n = int(b.shape[0])
+        points = int(w.shape[0])
+        e = np.full(points, float(ndtr(b[0] / L[0, 0])))
+        f = e.copy()
+        y = np.zeros((points, n - 1), dtype=float)
+        for i in range(1, n):
+            u = np.clip(w[:, i - 1] * e, 1e-15, 1.0 - 1e-15)
+            y[:, i - 1] = ndtri(u)
+            shift = y[:, :i] @ L[i, :i]
+            e = ndtr((b[i] - shift) / L[i, i])
+            f *= e
+        return f
+
+    # ------------------------------------------------------------------
+    # Plain Monte Carlo (reference)
+    # ------------------------------------------------------------------
+
+    def _estimate_mc(self, b: np.ndarray, L: np.ndarray, *, num_samples: int, seed: int) -> JointProbabilityEstimate:
+        samples = max(1, int(num_samples))
+        rng = np.random.default_rng(int(seed) & 0xFFFFFFFF)
+        z = rng.standard_normal(size=(samples, int(b.shape[0]))) @ L.T
+        hit_rate = float((z <= b).all(axis=1).mean())
+        # Binomial 3-sigma bound; rule of three when nothing hit.
+        bound = 3.0 * float(np.sqrt(hit_rate * (1.0 - hit_rate) / samples)) if hit_rate > 0.0 else 3.0 / samples
+        return JointProbabilityEstimate(
+            probability=hit_rate,
+            error_bound=bound,
+            method=self.METHOD_MC,
+            samples=samples,
+        )
+
+    @staticmethod
+    def _clamp01(value: float) -> float:
+        return float(max(0.0, min(1.0, value)))
+
@@ -6,7 +6,11 @@ from itertools import combinations
 import math
 
 from app.services.probability_engine import get_probability_engine
-from app.services.parlay_probability import CorrelatedParlayProbabilityCalculator, ParlayCorrelationModel
+from app.services.parlay_probability import (
+    CorrelatedParlayProbabilityCalculator,
+    ParlayCorrelationModel,
+    get_joint_probability_cache,
+)
 
 
 class ParlayVariantService:
@@ -16,7 +20,10 @@ class ParlayVariantService:
         self.db = db
         self.sport = sport
         self.prob_engine = get_probability_engine(db, sport)
-        self._parlay_prob = CorrelatedParlayProbabilityCalculator(ParlayCorrelationModel())
+        self._parlay_prob = CorrelatedParlayProbabilityCalculator(
+            ParlayCorrelationModel(),
+            joint_cache=get_joint_probability_cache(),
+        )
     
     async def build_same_game_parlay(
         self,
@@ -141,6 +141,7 @@ class BaseProbabilityEngine:
         include_player_props: bool = False,
         trace_id: Optional[str] = None,
         now_utc: Optional[datetime] = None,
+        force_refresh: bool = False,
     ) -> List[Dict]:
         return await self._candidates.get_candidate_legs(
             sport=sport,
@@ -150,6 +151,7 @@ class BaseProbabilityEngine:
             include_player_props=include_player_props,
             trace_id=trace_id,
             now_utc=now_utc,
+            force_refresh=force_refresh,
         )
 
     async def _apply_situational_adjustments(
@@ -1,17 +1,31 @@
-"""Short-lived cache for candidate legs per sport/day (Redis + in-memory fallback)."""
+"""Short-lived cache for candidate legs per sport/day (Redis + in-memory fallback).
+
+Entries are served stale-while-revalidate: after `ttl_seconds` an entry is stale but is
+still returned for another `stale_seconds` while one background task rebuilds it. Builds
+are single-flight per key (in-process lock + `RedisDistributedLock` across instances).
+"""
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from typing import Any, Optional
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
 
+from app.core.config import settings
 from app.services.data_fetchers.fetch_utils import InMemoryCache
 from app.services.redis.redis_client_provider import RedisClientProvider, get_redis_provider
+from app.services.redis.redis_distributed_lock import RedisDistributedLock
+from app.services.redis.redis_value_codec import RedisValueCodec, get_redis_value_codec
 
 logger = logging.getLogger(__name__)
 
 PREFIX = "candidate_legs:v1:"
+LOCK_PREFIX = "candidate_legs:v1:lock:"
+SPECS_KEY = "candidate_legs:v1:refresh_specs"
 
 
 def build_candidate_legs_cache_key(
@@ -27,50 +41,206 @@ def build_candidate_legs_cache_key(
     return f"{PREFIX}{(sport or '').strip().upper()}:{date_utc}:{week_str}:{props}"
 
 
+@dataclass(frozen=True)
+class CandidateLegCacheEntry:
+    """Cached candidate pool plus the wall-clock time (epoch seconds) it stops being fresh."""
+
+    legs: list
+    fresh_until: float
+
+    def is_stale(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) >= self.fresh_until
+
+
+@dataclass(frozen=True)
+class CandidateLegRefreshSpec:
+    """Arguments needed to rebuild a cached candidate pool outside of a request."""
+
+    sport: str
+    week: Optional[int]
+    include_player_props: bool
+    min_confidence: float
+
+
 class CandidateLegCache:
     """
     Cache for get_candidate_legs results.
 
     - Prefer Redis when configured (shared across instances).
     - Fall back to in-process cache when Redis is unavailable.
+    - `get` only returns fresh entries; `get_entry` also returns stale ones (see module doc).
     """
 
-    def __init__(self, *, provider: Optional[RedisClientProvider] = None) -> None:
+    def __init__(
+        self,
+        *,
+        provider: Optional[RedisClientProvider] = None,
+        stale_seconds: Optional[int] = None,
+        lock_ttl_seconds: int = 30,
+        lock_wait_seconds: float = 10.0,
+        codec: Optional[RedisValueCodec] = None,
+    ) -> None:
         self._provider = provider or get_redis_provider()
-        self._memory = InMemoryCache()
+        self._codec = codec or get_redis_value_codec()
+        self._memory = InMemoryCache("candidate_legs", max_entries=64)
+        if stale_seconds is None:
+            stale_seconds = int(getattr(settings, "candidate_legs_cache_stale_seconds", 120))
+        self._stale_seconds = max(0, int(stale_seconds))
+        self._lock_ttl_seconds = max(1, int(lock_ttl_seconds))
+        self._lock_wait_seconds = max(0.0, float(lock_wait_seconds))
+        # key -> [lock, users]; entries are dropped once unused so locks never outlive a loop.
+        self._flight_locks: Dict[str, List[Any]] = {}
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._specs: Dict[str, CandidateLegRefreshSpec] = {}
+
+    def retention_seconds(self, ttl_seconds: int) -> int:
+        """How long an entry is kept (fresh + stale window)."""
+        return max(1, int(ttl_seconds)) + self._stale_seconds
 
     async def get(self, key: str) -> Optional[list]:
-        """Return cached list of candidate leg dicts, or None."""
+        """Return cached list of candidate leg dicts if still fresh, or None."""
+        entry = await self.get_entry(key)
+        if entry is None or entry.is_stale():
+            return None
+        return entry.legs
+
+    async def get_entry(self, key: str) -> Optional[CandidateLegCacheEntry]:
+        """Return the cached entry (fresh or stale), or None."""
         if self._provider.is_configured():
             try:
                 client = self._provider.get_client()
                 raw = await client.get(key)
                 if not raw:
                     return None
-                data = json.loads(raw.decode("utf-8"))
-                return data if isinstance(data, list) else None
+                return self._decode(self._codec.decode(raw))
             except Exception as exc:
                 logger.debug("CandidateLegCache Redis get failed: %s", exc)
         try:
-            return await self._memory.get(key)
+            return self._decode(await self._memory.get(key))
         except Exception:
             return None
 
     async def set(self, key: str, value: list, ttl_seconds: int) -> None:
-        """Store list of candidate leg dicts (JSON-serializable)."""
+        """Store list of candidate leg dicts (JSON-serializable), fresh for `ttl_seconds`."""
+        envelope = {"fresh_until": time.time() + max(1, int(ttl_seconds)), "legs": value}
+        retention = self.retention_seconds(ttl_seconds)
         if self._provider.is_configured():
             try:
                 client = self._provider.get_client()
-                payload = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-                await client.set(key, payload, ex=int(ttl_seconds))
+                payload = self._codec.encode(envelope)
+                await client.set(key, payload, ex=retention)
                 return
             except Exception as exc:
                 logger.debug("CandidateLegCache Redis set failed: %s", exc)
         try:
-            await self._memory.set(key, value, ttl=int(ttl_seconds))
+            await self._memory.set(key, envelope, ttl=retention)
         except Exception:
             pass
 
+    @asynccontextmanager
+    async def single_flight(self, key: str) -> AsyncIterator[bool]:
+        """
+        Serialize builds of `key` within this process and across instances.
+
+        Yields True when another builder held the key while we waited; callers should then
+        re-read the cache before building. If the Redis lock is still held after the wait
+        timeout (or Redis fails) the caller builds anyway.
+        """
+        slot = self._flight_locks.setdefault(key, [asyncio.Lock(), 0])
+        slot[1] += 1
+        lock: asyncio.Lock = slot[0]
+        waited = lock.locked()
+        try:
+            async with lock:
+                redis_lock: Optional[RedisDistributedLock] = None
+                handle = None
+                if self._provider.is_configured():
+                    try:
+                        redis_lock = RedisDistributedLock(client=self._provider.get_client())
+                        handle = await redis_lock.try_acquire(
+                            key=f"{LOCK_PREFIX}{key}", ttl_seconds=self._lock_ttl_seconds
+                        )
+                        if handle is None:
+                            waited = True
+                            await redis_lock.wait_until_released(
+                                key=f"{LOCK_PREFIX}{key}", timeout_seconds=self._lock_wait_seconds
+                            )
+                    except Exception as exc:
+                        logger.debug("CandidateLegCache lock failed for key=%s: %s", key, exc)
+                try:
+                    yield waited
+                finally:
+                    if redis_lock is not None and handle is not None:
+                        await redis_lock.release(handle)
+        finally:
+            slot[1] -= 1
+            if slot[1] <= 0 and self._flight_locks.get(key) is slot:
+                del self._flight_locks[key]
+
+    def schedule_refresh(self, key: str, refresh: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Rebuild a stale key in the background (at most one task per key per process).
+
+        Returns False when a refresh for `key` is already running.
+        """
+        if key in self._refreshing:
+            return False
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._run_refresh(key, refresh))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+        return True
+
+    async def _run_refresh(self, key: str, refresh: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            entry = await self.get_entry(key)
+            if entry is not None and not entry.is_stale():
+                return
+            await refresh()
+        except Exception as exc:
+            logger.warning("Candidate legs background refresh failed for key=%s: %s", key, exc)
+        finally:
+            self._refreshing.discard(key)
+
+    async def remember_refresh_spec(self, key: str, spec: CandidateLegRefreshSpec) -> None:
+        """Record how `key` was built so the scheduler can rebuild it after odds syncs."""
+        self._specs[key] = spec
+        if self._provider.is_configured():
+            try:
+                client = self._provider.get_client()
+                await client.hset(SPECS_KEY, key, json.dumps(asdict(spec)))
+                await client.expire(SPECS_KEY, 2 * 24 * 3600)
+            except Exception as exc:
+                logger.debug("CandidateLegCache spec store failed: %s", exc)
+
+    async def refresh_specs(self, *, date_utc: str) -> Dict[str, CandidateLegRefreshSpec]:
+        """Keys (for `date_utc`) built recently, with the spec to rebuild each one."""
+        specs = dict(self._specs)
+        if self._provider.is_configured():
+            try:
+                client = self._provider.get_client()
+                raw = await client.hgetall(SPECS_KEY) or {}
+                for k, v in raw.items():
+                    k = k.decode("utf-8") if isinstance(k, bytes) else str(k)
+                    data = json.loads(v.decode("utf-8") if isinstance(v, bytes) else v)
+                    specs.setdefault(k, CandidateLegRefreshSpec(**data))
+            except Exception as exc:
+                logger.debug("CandidateLegCache spec load failed: %s", exc)
+        stale_keys = [k for k in self._specs if f":{date_utc}:" not in k]
+        for k in stale_keys:
+            self._specs.pop(k, None)
+        return {k: spec for k, spec in specs.items() if f":{date_utc}:" in k}
+
+    @staticmethod
+    def _decode(data: Any) -> Optional[CandidateLegCacheEntry]:
+        if isinstance(data, dict) and isinstance(data.get("legs"), list):
+            return CandidateLegCacheEntry(legs=data["legs"], fresh_until=float(data.get("fresh_until") or 0.0))
+        if isinstance(data, list):
+            # Pre-envelope payload; its storage TTL is the freshness TTL.
+            return CandidateLegCacheEntry(legs=data, fresh_until=float("inf"))
+        return None
+
 
 _candidate_leg_cache: Optional[CandidateLegCache] = None
 
@@ -81,3 +251,24 @@ def get_candidate_leg_cache() -> CandidateLegCache:
     if _candidate_leg_cache is None:
         _candidate_leg_cache = CandidateLegCache()
     return _candidate_leg_cache
+
+
+def ensure_candidate_pair_matrix(key: str, legs: list, *, ttl_seconds: int, rebuild: bool = False) -> None:
+    """
+    Build the pairwise correlation/conflict matrix for a cached candidate pool (once per fill).
+
+    On a cache hit from another instance (Redis), the matrix is built lazily the first time
+    this process sees the key. Failures are logged and ignored; selectors fall back to
+    computing pairs themselves.
+    """
+    try:
+        from app.services.parlay_builder_impl.leg_selection_service import ParlayLegSelectionService
+        from app.services.parlay_probability.candidate_pair_matrix import get_candidate_pair_matrix_store
+
+        store = get_candidate_pair_matrix_store()
+        existing = None if rebuild else store.get(key)
+        if existing is not None and existing.covers(legs or []):
+            return
+        store.put(key, ParlayLegSelectionService().build_pair_matrix(legs or []), ttl_seconds=int(ttl_seconds))
+    except Exception as exc:
+        logger.debug("Candidate pair matrix build failed: %s", exc)
@@ -0,0 +1,96 @@
+"""Rebuild cached candidate-leg pools outside of a request (stale refresh + post-odds-sync)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Set
+
+from app.core.config import settings
+from app.database.session import AsyncSessionLocal
+from app.services.probability_engine_impl.candidate_leg_cache import (
+    CandidateLegRefreshSpec,
+    get_candidate_leg_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_candidate_legs(spec: CandidateLegRefreshSpec, *, now_utc: Optional[datetime] = None) -> int:
+    """
+    Rebuild one candidate pool with its own DB session (the triggering request's session
+    may already be closed). Returns the number of legs built.
+    """
+    from app.services.probability_engine_impl.factory import get_probability_engine
+
+    max_legs = max(1, int(getattr(settings, "parlay_max_legs_considered", 150)))
+    async with AsyncSessionLocal() as db:
+        engine = get_probability_engine(db, spec.sport)
+        legs = await engine.get_candidate_legs(
+            sport=spec.sport,
+            min_confidence=spec.min_confidence,
+            max_legs=max_legs,
+            week=spec.week,
+            include_player_props=spec.include_player_props,
+            now_utc=now_utc,
+            force_refresh=True,
+        )
+    return len(legs or [])
+
+
+async def refresh_recent_candidate_legs(
+    *,
+    now_utc: Optional[datetime] = None,
+    sports: Optional[Iterable[str]] = None,
+) -> int:
+    """
+    Rebuild every pool built today (optionally only for `sports`), so the first request
+    after an odds change hits a warm cache.
+
+    Returns the number of pools refreshed; failures are logged per pool.
+    """
+    now = now_utc or datetime.now(timezone.utc)
+    specs = await get_candidate_leg_cache().refresh_specs(date_utc=now.date().isoformat())
+    wanted = {str(s).upper() for s in sports} if sports is not None else None
+    refreshed = 0
+    for key, spec in specs.items():
+        if wanted is not None and str(spec.sport).upper() not in wanted:
+            continue
+        try:
+            await refresh_candidate_legs(spec, now_utc=now)
+            refreshed += 1
+        except Exception as exc:
+            logger.warning("Candidate legs refresh failed for key=%s: %s", key, exc)
+    return refreshed
+
+
+_pending_sports: Set[str] = set()
+_drain_task: Optional[asyncio.Task] = None
+
+
+def schedule_candidate_leg_refresh(sports: Iterable[str]) -> None:
+    """
+    Rebuild today's pools for `sports` in the background.
+
+    Requests coalesce: sports arriving while a rebuild runs are picked up by the same
+    task once it finishes, so bursts of odds changes cost one rebuild per sport.
+    """
+    global _drain_task
+    _pending_sports.update(str(s).upper() for s in sports if s)
+    if not _pending_sports:
+        return
+    if _drain_task is None or _drain_task.done():
+        _drain_task = asyncio.create_task(_drain_pending_refreshes())
+
+
+async def _drain_pending_refreshes() -> None:
+    while _pending_sports:
+        sports = set(_pending_sports)
+        _pending_sports.clear()
+        try:
+            refreshed = await refresh_recent_candidate_legs(sports=sports)
+            if refreshed:
+                logger.info("Refreshed %s candidate leg pools after odds changes (%s)", refreshed, sorted(sports))
+        except Exception as exc:
+            logger.warning("Candidate legs refresh after odds changes failed: %s", exc)
@@ -15,7 +15,9 @@ from app.services.odds_snapshot_builder import OddsSnapshotBuilder
 from app.services.schedule_repair.repair_orchestrator import ScheduleRepairOrchestrator
 from app.services.season_state_service import SeasonStateService
 from app.services.probability_engine_impl.candidate_leg_cache import (
+    CandidateLegRefreshSpec,
     build_candidate_legs_cache_key,
+    ensure_candidate_pair_matrix,
     get_candidate_leg_cache,
 )
 from app.services.probability_engine_impl.candidate_leg_query import fetch_minimal_game_rows
@@ -77,10 +79,91 @@ class CandidateLegService:
         include_player_props: bool = False,
         trace_id: Optional[str] = None,
         now_utc: Optional[datetime] = None,
+        force_refresh: bool = False,
     ) -> List[Dict]:
+        """
+        Top candidate legs by confidence, served from `CandidateLegCache` when possible.
+
+        Stale entries are returned immediately while a background task rebuilds them;
+        misses (and `force_refresh`) build single-flight per cache key.
+        """
         logger = logging.getLogger(__name__)
         target_sport = (sport or getattr(self._engine, "sport_code", None) or "NFL").upper()
         now = now_utc or datetime.now(timezone.utc)
+        cache_ttl = max(1, int(getattr(settings, "candidate_legs_cache_ttl_seconds", 45)))
+        cache = get_candidate_leg_cache()
+        cache_key = build_candidate_legs_cache_key(
+            sport=target_sport,
+            date_utc=now.date().isoformat(),
+            week=week,
+            include_player_props=include_player_props,
+        )
+        spec = CandidateLegRefreshSpec(
+            sport=target_sport,
+            week=week,
+            include_player_props=include_player_props,
+            min_confidence=float(min_confidence),
+        )
+
+        entry = None if force_refresh else await cache.get_entry(cache_key)
+        if entry is not None and entry.is_stale():
+            from app.services.probability_engine_impl.candidate_leg_refresher import refresh_candidate_legs
+
+            cache.schedule_refresh(cache_key, lambda: refresh_candidate_legs(spec))
+        if entry is None:
+            async with cache.single_flight(cache_key) as waited:
+                if waited:
+                    entry = await cache.get_entry(cache_key)
+                    entry = entry if entry is not None and not entry.is_stale() else None
+                if entry is None:
+                    final_legs = await self._build_candidate_legs(
+                        target_sport=target_sport,
+                        now=now,
+                        min_confidence=min_confidence,
+                        max_legs=max_legs,
+                        week=week,
+                        include_player_props=include_player_props,
+                        trace_id=trace_id,
+                        cache_key=cache_key,
+                        cache_ttl=cache_ttl,
+                    )
+                    await cache.remember_refresh_spec(cache_key, spec)
+                    return final_legs
+
+        cached_list = entry.legs
+        ensure_candidate_pair_matrix(cache_key, cached_list, ttl_seconds=cache.retention_seconds(cache_ttl))
+        max_legs_cap = max(1, int(getattr(settings, "parlay_max_legs_considered", 150)))
+        n_return = min(max_legs, len(cached_list), max_legs_cap)
+        final_legs = (
+            heapq.nlargest(n_return, cached_list, key=lambda x: x.get("confidence_score", 0))
+            if cached_list
+            else []
+        )
+        logger.info(
+            "parlay.generate.candidates cache_hit sport=%s key=%s stale=%s cached_count=%s returned=%s",
+            target_sport,
+            cache_key,
+            entry.is_stale(),
+            len(cached_list),
+            len(final_legs),
+        )
+        return final_legs
+
+    async def _build_candidate_legs(
+        self,
+        *,
+        target_sport: str,
+        now: datetime,
+        min_confidence: float,
+        max_legs: int,
+        week: Optional[int],
+        include_player_props: bool,
+        trace_id: Optional[str],
+        cache_key: str,
+        cache_ttl: int,
+    ) -> List[Dict]:
+        """Full game/odds query, schedule repair and scoring pipeline; fills the cache."""
+        logger = logging.getLogger(__name__)
         season_svc = SeasonStateService(self._engine.db)
         season_state = await season_svc.get_season_state(target_sport, now_utc=now)
         cutoff_time, future_cutoff, mode = resolve_candidate_window(
@@ -106,31 +189,7 @@ class CandidateLegService:
         max_props_per_game = max(0, int(getattr(settings, "parlay_max_props_per_game", 2)))
         max_odds_to_process = max(1, int(getattr(settings, "parlay_max_odds_rows_processed", 600)))
         scheduled_statuses = ("scheduled", "status_scheduled")
-        cache_ttl = max(1, int(getattr(settings, "candidate_legs_cache_ttl_seconds", 45)))
-
         cache = get_candidate_leg_cache()
-        cache_key = build_candidate_legs_cache_key(
-            sport=target_sport,
-            date_utc=now.date().isoformat(),
-            week=week,
-            include_player_props=include_player_props,
-        )
-        cached_list = await cache.get(cache_key)
-        if cached_list is not None:
-            n_return = min(max_legs, len(cached_list), max_legs_cap)
-            final_legs = (
-                heapq.nlargest(n_return, cached_list, key=lambda x: x.get("confidence_score", 0))
-                if cached_list
-                else []
-            )
-            logger.info(
-                "parlay.generate.candidates cache_hit sport=%s key=%s cached_count=%s returned=%s",
-                target_sport,
-                cache_key,
-                len(cached_list),
-                len(final_legs),
-            )
-            return final_legs
 
         log_mem(logger, "candidate_legs_before_game_query", {"sport": target_sport, "trace_id": trace_id})
 
@@ -417,6 +476,9 @@ class CandidateLegService:
             await cache.set(cache_key, candidate_legs, ttl_seconds=cache_ttl)
         except Exception as set_err:
             logger.debug("Candidate legs cache set failed: %s", set_err)
+        ensure_candidate_pair_matrix(
+            cache_key, candidate_legs, ttl_seconds=cache.retention_seconds(cache_ttl), rebuild=True
+        )
 
         return final_legs
 
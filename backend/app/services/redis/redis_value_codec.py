@@ -0,0 +1,187 @@
+"""
+Binary codec for values stored in Redis-backed caches.
+
+Layout: 6-byte header + body.
+
+    b"\\x00PG" | version (1) | serializer (b"j" JSON, b"m" msgpack) | compression (b"-", b"z" zlib, b"s" zstd)
+
+JSON text never starts with NUL, so payloads written before the header existed (plain
+UTF-8 JSON) still decode. `orjson`, `msgpack` and `zstandard` are optional: without
+them the codec falls back to stdlib `json` and `zlib`, and every format it can write is
+readable by any instance that has the same libraries installed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import zlib
+from typing import Any, Optional
+
+from app.core.config import settings
+
+try:  # Optional accelerators
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    msgpack = None  # type: ignore
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"\x00PG"
+VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+SERIALIZER_JSON = b"j"
+SERIALIZER_MSGPACK = b"m"
+COMPRESSION_NONE = b"-"
+COMPRESSION_ZLIB = b"z"
+COMPRESSION_ZSTD = b"s"
+
+
+class RedisValueCodecError(ValueError):
+    """Raised when a stored payload cannot be decoded (unknown version/format/missing library)."""
+
+
+class RedisValueCodec:
+    """
+    Encode/decode cache values (JSON-compatible data) to compact bytes.
+
+    - serializer: "auto" (msgpack when installed, else JSON), "msgpack", or "json".
+      JSON uses `orjson` when installed.
+    - compression: "auto" (zstd when installed, else zlib), "zstd", "zlib", or "none".
+      Only bodies of at least `compress_min_bytes` are compressed.
+    """
+
+    def __init__(
+        self,
+        *,
+        serializer: str = "auto",
+        compression: str = "auto",
+        compress_min_bytes: int = 1024,
+        level: int = 3,
+    ) -> None:
+        self._serializer = self._resolve_serializer(serializer)
+        self._compression = self._resolve_compression(compression)
+        self._compress_min_bytes = max(0, int(compress_min_bytes))
+        self._level = int(level)
+
+    @property
+    def serializer(self) -> bytes:
+        return self._serializer
+
+    @property
+    def compression(self) -> bytes:
+        return self._compression
+
+    def encode(self, value: Any) -> bytes:
+        body = self._serialize(value)
+        compression = COMPRESSION_NONE
+        if self._compression != COMPRESSION_NONE and len(body) >= self._compress_min_bytes:
+            compression = self._compression
+            body = self._compress(body, compression)
+        return MAGIC + bytes([VERSION]) + self._serializer + compression + body
+
+    def decode(self, raw: Any) -> Any:
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        raw = bytes(raw)
+        if not raw.startswith(MAGIC):
+            return _json_loads(raw)
+        if len(raw) < HEADER_SIZE:
+            raise RedisValueCodecError("truncated cache payload header")
+        version = raw[len(MAGIC)]
+        if version != VERSION:
+            raise RedisValueCodecError(f"unsupported cache payload version {version}")
+        serializer = raw[len(MAGIC) + 1 : len(MAGIC) + 2]
+        compression = raw[len(MAGIC) + 2 : HEADER_SIZE]
+        body = self._decompress(raw[HEADER_SIZE:], compression)
+        if serializer == SERIALIZER_JSON:
+            return _json_loads(body)
+        if serializer == SERIALIZER_MSGPACK:
+            if msgpack is None:
+                raise RedisValueCodecError("msgpack payload but msgpack is not installed")
+            return msgpack.unpackb(body, raw=False, strict_map_key=False)
+        raise RedisValueCodecError(f"unknown cache payload serializer {serializer!r}")
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _serialize(self, value: Any) -> bytes:
+        if self._serializer == SERIALIZER_MSGPACK:
+            return msgpack.packb(value, use_bin_type=True)
+        if orjson is not None:
+            try:
+                return orjson.dumps(value)
+            except TypeError:
+                # orjson is stricter (e.g. non-str dict keys); keep json.dumps semantics.
+                pass
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def _compress(self, body: bytes, compression: bytes) -> bytes:
+        if compression == COMPRESSION_ZSTD:
+            return zstandard.ZstdCompressor(level=self._level).compress(body)
+        return zlib.compress(body, max(1, min(9, self._level)))
+
+    @staticmethod
+    def _decompress(body: bytes, compression: bytes) -> bytes:
+        if compression == COMPRESSION_NONE:
+            return body
+        if compression == COMPRESSION_ZLIB:
+            return zlib.decompress(body)
+        if compression == COMPRESSION_ZSTD:
+            if zstandard is None:
+                raise RedisValueCodecError("zstd payload but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(body)
+        raise RedisValueCodecError(f"unknown cache payload compression {compression!r}")
+
+    @staticmethod
+    def _resolve_serializer(name: str) -> bytes:
+        choice = (name or "auto").strip().lower()
+        if choice in ("auto", "msgpack") and msgpack is not None:
+            return SERIALIZER_MSGPACK
+        if choice == "msgpack":
+            logger.warning("msgpack not installed; Redis cache codec falling back to JSON")
+        return SERIALIZER_JSON
+
+    @staticmethod
+    def _resolve_compression(name: str) -> bytes:
+        choice = (name or "auto").strip().lower()
+        if choice in ("none", "off", ""):
+            return COMPRESSION_NONE
+        if choice in ("auto", "zstd") and zstandard is not None:
+            return COMPRESSION_ZSTD
+        if choice == "zstd":
+            logger.warning("zstandard not installed; Redis cache codec falling back to zlib")
+        return COMPRESSION_ZLIB
+
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+_redis_value_codec: Optional[RedisValueCodec] = None
+
+
+def get_redis_value_codec() -> RedisValueCodec:
+    """Module singleton codec configured from settings."""
+    global _redis_value_codec
+    if _redis_value_codec is None:
+        _redis_value_codec = RedisValueCodec(
+            serializer=str(getattr(settings, "redis_cache_serializer", "auto") or "auto"),
+            compression=str(getattr(settings, "redis_cache_compression", "auto") or "auto"),
+            compress_min_bytes=int(getattr(settings, "redis_cache_compress_min_bytes", 1024)),
+        )
+    return _redis_value_codec
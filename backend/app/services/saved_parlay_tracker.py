@@ -7,6 +7,7 @@ from API routes.
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 import uuid
@@ -19,6 +20,7 @@ from app.models.game import Game
 from app.models.market import Market
 from app.models.saved_parlay import SavedParlay, SavedParlayType
 from app.models.saved_parlay_results import SavedParlayResult
+from app.services.leaderboards.leaderboard_totals_service import LeaderboardTotalsService
 from app.services.parlay_grading import (
     AiLegInputParser,
     CustomLegInputParser,
@@ -28,6 +30,8 @@ from app.services.parlay_grading import (
 )
 from app.services.parlay_grading.parlay_outcome_calculator import ParlayOutcomeCalculator
 
+logger = logging.getLogger(__name__)
+
 
 class SavedParlayTrackerService:
     """Tracks and resolves outcomes for `SavedParlay` rows."""
@@ -147,8 +151,19 @@ class SavedParlayTrackerService:
             await self.db.rollback()
             return False
 
+        if parlay_type == SavedParlayType.custom.value and record.hit is not None:
+            await self._refresh_leaderboard(record.user_id)
+
         return any(lr.get("status") != ParlayLegStatus.pending.value for lr in leg_results)
 
+    async def _refresh_leaderboard(self, user_id) -> None:
+        # Resolved custom parlays feed the Verified Winners totals; never fail grading over it.
+        try:
+            await LeaderboardTotalsService(self.db).refresh_verified_winners([user_id])
+        except Exception as e:
+            await self.db.rollback()
+            logger.warning("Verified winners refresh failed for user %s: %s", user_id, e)
+
     async def _grade_ai_saved_legs(self, *, legs: List[Dict[str, Any]], lookup: GameResultLookupService) -> List[Dict[str, Any]]:
         market_ids: List[uuid.UUID] = []
         for leg in legs:
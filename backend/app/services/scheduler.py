@@ -3,6 +3,7 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
+from datetime import datetime, timezone
 from typing import Optional, Callable, Any
 import asyncio
 import logging
@@ -19,6 +20,7 @@ from app.services.scheduler_jobs.ats_ou_trends_job import AtsOuTrendsJob
 from app.services.scheduler_jobs.game_results_sync_job import GameResultsSyncJob
 from app.services.scheduler_jobs.saved_parlay_resolution_job import SavedParlayResolutionJob
 from app.services.scheduler_jobs.arcade_points_award_job import ArcadePointsAwardJob
+from app.services.scheduler_jobs.leaderboard_totals_job import LeaderboardTotalsJob
 from app.services.scheduler_jobs.apisports_refresh_job import ApisportsRefreshJob
 
 logger = logging.getLogger(__name__)
@@ -281,6 +283,22 @@ class BackgroundScheduler:
                 name="Award arcade points for verified wins"
             )
 
+            # Leaderboard totals: pick up verification confirmations (SUI verifier runs out of
+            # process) every 5 minutes; full rebuild every 6 hours, first run at startup.
+            self.scheduler.add_job(
+                self._refresh_leaderboard_verifications,
+                IntervalTrigger(minutes=5),
+                id="refresh_leaderboard_verifications",
+                name="Refresh verified winner totals for new confirmations"
+            )
+            self.scheduler.add_job(
+                self._rebuild_leaderboard_totals,
+                IntervalTrigger(hours=6),
+                id="rebuild_leaderboard_totals",
+                name="Rebuild leaderboard totals",
+                next_run_time=datetime.now(timezone.utc),
+            )
+
             # API-Sports refresh (quota-safe: 100/day; every 60 min during active hours)
             self.scheduler.add_job(
                 self._run_apisports_refresh,
@@ -336,6 +354,7 @@ class BackgroundScheduler:
         try:
             await self._start_score_scraper_worker()
             await self._start_settlement_worker()
+            await self._start_full_article_worker()
             await self._start_heartbeat_worker()
         except Exception as e:
             print(f"[SCHEDULER] Error starting workers: {e}")
@@ -346,10 +365,12 @@ class BackgroundScheduler:
         try:
             from app.workers.score_scraper_worker import stop_score_scraper_worker
             from app.workers.settlement_worker import stop_settlement_worker
+            from app.workers.full_article_worker import stop_full_article_worker
             from app.workers.heartbeat_worker import stop_heartbeat_worker
             
             await stop_score_scraper_worker()
             await stop_settlement_worker()
+            await stop_full_article_worker()
             await stop_heartbeat_worker()
         except Exception as e:
             print(f"[SCHEDULER] Error stopping workers: {e}")
@@ -486,17 +507,17 @@ class BackgroundScheduler:
         from app.models.game import Game
         from app.models.game_analysis import GameAnalysis
         from app.services.sports_config import list_supported_sports
-        from app.services.analysis import AnalysisOrchestratorService
         from app.services.analysis.analysis_contract import is_core_ready
-        from app.core.config import settings
+        from app.services.analysis.analysis_generation_pipeline import (
+            AnalysisGenerationPipeline,
+            AnalysisGenerationTask,
+        )
 
         async with AsyncSessionLocal() as db:
                 now = datetime.utcnow()
                 future_cutoff = now + timedelta(days=7)  # Generate for next 7 days
 
-                generated_count = 0
-                skipped_count = 0
-                orchestrator = AnalysisOrchestratorService(db)
+                tasks: list[AnalysisGenerationTask] = []
 
                 for config in list_supported_sports():
                     # Game IDs in window (same as below for backfill)
@@ -529,22 +550,20 @@ class BackgroundScheduler:
                         )
                     )
                     for game, analysis in result.all():
-                        try:
-                            is_expired = bool(
-                                analysis is not None
-                                and analysis.expires_at is not None
-                                and analysis.expires_at <= now
-                            )
-                            await orchestrator.ensure_core_for_game(
-                                game=game,
-                                core_timeout_seconds=settings.analysis_core_timeout_seconds,
+                        is_expired = bool(
+                            analysis is not None
+                            and analysis.expires_at is not None
+                            and analysis.expires_at <= now
+                        )
+                        tasks.append(
+                            AnalysisGenerationTask(
+                                game_id=game.id,
+                                league=game.sport,
+                                start_time=game.start_time,
                                 force_regenerate=is_expired,
+                                reason="expired" if is_expired else "missing",
                             )
-                            generated_count += 1
-                        except Exception as e:
-                            logger.warning(f"[SCHEDULER] Error generating analysis for game {game.id}: {e}")
-                            skipped_count += 1
-                            continue
+                        )
 
                     # Pass 2: Non-expired analyses missing confidence_breakdown (or other core fields) -> regenerate
                     latest_per_game = (
@@ -581,19 +600,22 @@ class BackgroundScheduler:
                     for game, analysis in backfill_result.all():
                         if analysis.analysis_content and is_core_ready(analysis.analysis_content):
                             continue
-                        try:
-                            await orchestrator.ensure_core_for_game(
-                                game=game,
-                                core_timeout_seconds=settings.analysis_core_timeout_seconds,
+                        tasks.append(
+                            AnalysisGenerationTask(
+                                game_id=game.id,
+                                league=game.sport,
+                                start_time=game.start_time,
                                 force_regenerate=True,
+                                reason="backfill",
                             )
-                            generated_count += 1
-                        except Exception as e:
-                            logger.warning(
-                                f"[SCHEDULER] Error backfilling analysis for game {game.id}: {e}"
-                            )
-                            skipped_count += 1
-                            continue
+                        )
+
+                # Generate in parallel (one session per worker), highest-traffic games first
+                pipeline = AnalysisGenerationPipeline(AsyncSessionLocal)
+                tasks = await pipeline.prioritize(db, list({t.game_id: t for t in tasks}.values()))
+                run = await pipeline.run(tasks)
+                generated_count = run.generated
+                skipped_count = run.failed + run.deferred
 
                 print(f"[SCHEDULER] Generated {generated_count} analyses, skipped {skipped_count}")
 
@@ -640,6 +662,8 @@ class BackgroundScheduler:
         """Sync odds from The Odds API"""
         from app.workers.odds_sync_worker import OddsSyncWorker
         worker = OddsSyncWorker()
+        # Candidate-leg pools for sports whose odds changed are rebuilt by the odds change
+        # feed subscriber (see cache_invalidation.invalidate_after_odds_changes).
         await worker.sync_all_sports()
     
     async def trigger_odds_sync(self):
@@ -690,6 +714,16 @@ class BackgroundScheduler:
         """Award arcade points for eligible verified wins"""
         await ArcadePointsAwardJob().run()
 
+    @crash_proof_job("refresh_leaderboard_verifications")
+    async def _refresh_leaderboard_verifications(self):
+        """Refresh verified winner totals for recently confirmed verifications"""
+        await LeaderboardTotalsJob().refresh_recent_verifications()
+
+    @crash_proof_job("rebuild_leaderboard_totals", max_retries=1)
+    async def _rebuild_leaderboard_totals(self):
+        """Rebuild leaderboard totals from source tables"""
+        await LeaderboardTotalsJob().rebuild()
+
     @crash_proof_job("apisports_refresh")
     async def _run_apisports_refresh(self):
         """Refresh API-Sports cache (fixtures, standings). Quota-safe: 100/day."""
@@ -901,6 +935,14 @@ class BackgroundScheduler:
         except Exception as e:
             print(f"[SCHEDULER] Error starting settlement worker: {e}")
     
+    async def _start_full_article_worker(self):
+        """Start the full-article generation worker."""
+        try:
+            from app.workers.full_article_worker import start_full_article_worker
+            await start_full_article_worker()
+        except Exception as e:
+            print(f"[SCHEDULER] Error starting full article worker: {e}")
+    
     async def _start_heartbeat_worker(self):
         """Start the heartbeat worker."""
         try:
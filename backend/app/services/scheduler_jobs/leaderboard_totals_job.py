@@ -0,0 +1,43 @@
+"""Scheduler jobs for maintaining the pre-aggregated leaderboard tables."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.database.session import AsyncSessionLocal
+from app.services.leaderboards.leaderboard_totals_service import LeaderboardTotalsService
+
+
+class LeaderboardTotalsJob:
+    """Picks up new verification confirmations and periodically rebuilds leaderboard totals."""
+
+    # Runs every few minutes; the overlap makes a delayed or skipped run harmless (refresh is idempotent).
+    VERIFICATION_LOOKBACK_MINUTES = 15
+
+    async def refresh_recent_verifications(self, lookback_minutes: Optional[int] = None) -> None:
+        """Refresh Verified Winners rows for users with recently confirmed verifications."""
+        lookback = lookback_minutes or self.VERIFICATION_LOOKBACK_MINUTES
+        since = datetime.now(timezone.utc) - timedelta(minutes=lookback)
+        async with AsyncSessionLocal() as db:
+            try:
+                refreshed = await LeaderboardTotalsService(db).refresh_recent_verifications(since)
+                if refreshed > 0:
+                    print(f"[SCHEDULER] Refreshed verified winner totals for {refreshed} users")
+            except Exception as e:
+                print(f"[SCHEDULER] Error refreshing verified winner totals: {e}")
+
+    async def rebuild(self) -> None:
+        """Rebuild all leaderboard totals from source tables."""
+        async with AsyncSessionLocal() as db:
+            try:
+                counts = await LeaderboardTotalsService(db).rebuild()
+                print(
+                    f"[SCHEDULER] Rebuilt leaderboard totals: "
+                    f"{counts['verified_winners']} verified winners, {counts['ai_usage']} AI users"
+                )
+            except Exception as e:
+                print(f"[SCHEDULER] Error rebuilding leaderboard totals: {e}")
+                import traceback
+
+                traceback.print_exc()
@@ -19,6 +19,7 @@ from app.services.game_match_key import (
     get_canonical_key_from_game,
 )
 from app.services.scores.normalizer import ScoreNormalizer
+from app.services.settlement.settlement_job_queue import SettlementJobQueue
 from app.utils.timezone_utils import TimezoneNormalizer
 from app.services.scores.sources.espn import ESPNScraper
 from app.services.scores.sources.yahoo import YahooScraper
@@ -88,6 +89,14 @@ class ScoreScraperService:
         # Update heartbeat
         await self._update_heartbeat("scraper_worker", {"games_updated": updated_count, "sport": sport})
         
+        # Commit score/status updates together with their feed events and settlement jobs
+        try:
+            await self.db.commit()
+        except Exception as e:
+            logger.error(f"Error committing score updates for {sport}: {e}")
+            await self.db.rollback()
+            return 0
+        
         return updated_count
     
     async def _try_scrape_source(
@@ -272,10 +281,23 @@ class ScoreScraperService:
             # LIVE -> FINAL
             if old_status == "LIVE" and new_status == "FINAL":
                 await self._create_game_final_event(game)
+            
+            # Any -> FINAL: queue settlement in this transaction (outbox; the sweep is the backstop)
+            if old_status != "FINAL" and new_status == "FINAL":
+                await self._enqueue_settlement(game)
         
         except Exception as e:
             logger.error(f"Error creating status change events: {e}")
     
+    async def _enqueue_settlement(self, game: Game):
+        """Write a settlement job for a game that just went FINAL."""
+        try:
+            # Savepoint: a failed INSERT must not abort the scraper's transaction (Postgres).
+            async with self.db.begin_nested():
+                await SettlementJobQueue(self.db).enqueue([game.id])
+        except Exception as e:
+            logger.error(f"Error enqueueing settlement for game {game.id}: {e}")
+    
     async def _create_game_live_event(self, game: Game):
         """Create GAME_LIVE feed event."""
         try:
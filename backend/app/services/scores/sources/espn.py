@@ -11,6 +11,7 @@ from urllib.parse import urlencode
 import httpx
 from bs4 import BeautifulSoup
 
+from app.services.http.shared_http_client import PooledHttpSession, pooled_http_session
 from app.services.scores.normalizer import GameUpdate, ScoreNormalizer
 
 logger = logging.getLogger(__name__)
@@ -24,22 +25,18 @@ class ESPNScraper:
     
     def __init__(self):
         self._normalizer = ScoreNormalizer()
-        self._client: Optional[httpx.AsyncClient] = None
     
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create httpx client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=10.0,
-                headers={"User-Agent": self.USER_AGENT},
-                follow_redirects=True,
-            )
-        return self._client
+    async def _get_client(self) -> PooledHttpSession:
+        """Session over the shared pooled client (keeps connections warm across polls)."""
+        return pooled_http_session(
+            timeout=10.0,
+            headers={"User-Agent": self.USER_AGENT},
+            follow_redirects=True,
+        )
     
     async def close(self):
-        """Close the client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """No-op: the shared client is closed with the app/worker lifecycle."""
+        return None
     
     def _get_sport_path(self, sport: str) -> str:
         """Map sport code to ESPN path."""
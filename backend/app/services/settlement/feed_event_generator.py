@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any, Dict, Sequence
+
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.parlay import Parlay
@@ -11,11 +14,98 @@ from app.models.parlay_leg import ParlayLeg
 from app.models.parlay_feed_event import ParlayFeedEvent
 
 
+# Feed event rows per INSERT statement in `add_events`.
+FEED_EVENT_INSERT_CHUNK = 1000
+
+
 class FeedEventGenerator:
     """Generate feed events for parlay settlement."""
     
     def __init__(self, db: AsyncSession):
         self.db = db
+
+    @staticmethod
+    def parlay_won_values(
+        *,
+        parlay_type: str,
+        parlay_id=None,
+        saved_parlay_id=None,
+        user_alias: str | None = None,
+        legs_count: int = 0,
+        odds: str | None = None,
+    ) -> Dict[str, Any]:
+        """Column values for a PARLAY_WON event (shared by the ORM and bulk paths)."""
+        odds_str = odds or "+0"
+        summary = f"✅ {parlay_type} PARLAY HIT — {legs_count}-Leg {odds_str}"
+        if user_alias:
+            summary += f" ({user_alias})"
+        return {
+            "event_type": "PARLAY_WON",
+            "sport": None,  # Could extract from legs if needed
+            "parlay_id": parlay_id,
+            "saved_parlay_id": saved_parlay_id,
+            "user_alias": user_alias,
+            "summary": summary,
+            "event_metadata": {
+                "parlay_type": parlay_type,
+                "legs_count": legs_count,
+                "odds": odds_str,
+            },
+        }
+
+    @staticmethod
+    def parlay_lost_values(
+        *,
+        parlay_type: str,
+        parlay_id=None,
+        saved_parlay_id=None,
+        user_alias: str | None = None,
+        busted_leg: int | None = None,
+    ) -> Dict[str, Any]:
+        """Column values for a PARLAY_LOST event."""
+        summary = f"❌ {parlay_type} PARLAY LOST"
+        if busted_leg:
+            summary += f" — busted on Leg {busted_leg}"
+        if user_alias:
+            summary += f" ({user_alias})"
+        return {
+            "event_type": "PARLAY_LOST",
+            "sport": None,
+            "parlay_id": parlay_id,
+            "saved_parlay_id": saved_parlay_id,
+            "user_alias": user_alias,
+            "summary": summary,
+            "event_metadata": {
+                "parlay_type": parlay_type,
+                "busted_leg": busted_leg,
+            },
+        }
+
+    @staticmethod
+    def leg_result_values(leg, result: str, parlay: Parlay | SavedParlay | None = None) -> Dict[str, Any]:
+        """Column values for a LEG_WON / LEG_LOST event. `leg` may be an ORM leg or a row."""
+        icon = "✅" if result == "WON" else "❌"
+        return {
+            "event_type": f"LEG_{result}",
+            "sport": None,
+            "parlay_id": parlay.id if isinstance(parlay, Parlay) else None,
+            "saved_parlay_id": parlay.id if isinstance(parlay, SavedParlay) else None,
+            "user_alias": None,
+            "summary": f"{icon} Leg {result}: {leg.selection}",
+            "event_metadata": {
+                "leg_id": str(leg.id),
+                "game_id": str(leg.game_id),
+                "market_type": leg.market_type,
+                "selection": leg.selection,
+            },
+        }
+
+    async def add_events(self, rows: Sequence[Dict[str, Any]]) -> int:
+        """Insert many feed events with chunked executemany INSERTs (no ORM objects)."""
+        rows = list(rows)
+        for start in range(0, len(rows), FEED_EVENT_INSERT_CHUNK):
+            await self.db.execute(insert(ParlayFeedEvent), rows[start:start + FEED_EVENT_INSERT_CHUNK])
+        return len(rows)
     
     async def create_parlay_won_event(
         self,
@@ -27,24 +117,15 @@ class FeedEventGenerator:
         """Create PARLAY_WON feed event."""
         parlay_type = "AI" if isinstance(parlay, Parlay) else "CUSTOM"
         legs = legs_count or (parlay.num_legs if isinstance(parlay, Parlay) else len(parlay.legs) if isinstance(parlay, SavedParlay) else 0)
-        odds_str = odds or "+0"
-        
-        summary = f"✅ {parlay_type} PARLAY HIT — {legs}-Leg {odds_str}"
-        if user_alias:
-            summary += f" ({user_alias})"
-        
         event = ParlayFeedEvent(
-            event_type="PARLAY_WON",
-            sport=None,  # Could extract from legs if needed
-            parlay_id=parlay.id if isinstance(parlay, Parlay) else None,
-            saved_parlay_id=parlay.id if isinstance(parlay, SavedParlay) else None,
-            user_alias=user_alias,
-            summary=summary,
-            event_metadata={
-                "parlay_type": parlay_type,
-                "legs_count": legs,
-                "odds": odds_str,
-            },
+            **self.parlay_won_values(
+                parlay_type=parlay_type,
+                parlay_id=parlay.id if isinstance(parlay, Parlay) else None,
+                saved_parlay_id=parlay.id if isinstance(parlay, SavedParlay) else None,
+                user_alias=user_alias,
+                legs_count=legs,
+                odds=odds,
+            )
         )
         self.db.add(event)
         await self.db.flush()
@@ -58,24 +139,14 @@ class FeedEventGenerator:
     ) -> ParlayFeedEvent:
         """Create PARLAY_LOST feed event."""
         parlay_type = "AI" if isinstance(parlay, Parlay) else "CUSTOM"
-        
-        summary = f"❌ {parlay_type} PARLAY LOST"
-        if busted_leg:
-            summary += f" — busted on Leg {busted_leg}"
-        if user_alias:
-            summary += f" ({user_alias})"
-        
         event = ParlayFeedEvent(
-            event_type="PARLAY_LOST",
-            sport=None,
-            parlay_id=parlay.id if isinstance(parlay, Parlay) else None,
-            saved_parlay_id=parlay.id if isinstance(parlay, SavedParlay) else None,
-            user_alias=user_alias,
-            summary=summary,
-            event_metadata={
-                "parlay_type": parlay_type,
-                "busted_leg": busted_leg,
-            },
+            **self.parlay_lost_values(
+                parlay_type=parlay_type,
+                parlay_id=parlay.id if isinstance(parlay, Parlay) else None,
+                saved_parlay_id=parlay.id if isinstance(parlay, SavedParlay) else None,
+                user_alias=user_alias,
+                busted_leg=busted_leg,
+            )
         )
         self.db.add(event)
         await self.db.flush()
@@ -87,21 +158,7 @@ class FeedEventGenerator:
         parlay: Parlay | SavedParlay | None = None,
     ) -> ParlayFeedEvent:
         """Create LEG_WON feed event."""
-        summary = f"✅ Leg WON: {leg.selection}"
-        
-        event = ParlayFeedEvent(
-            event_type="LEG_WON",
-            sport=None,
-            parlay_id=parlay.id if isinstance(parlay, Parlay) else None,
-            saved_parlay_id=parlay.id if isinstance(parlay, SavedParlay) else None,
-            summary=summary,
-            event_metadata={
-                "leg_id": str(leg.id),
-                "game_id": str(leg.game_id),
-                "market_type": leg.market_type,
-                "selection": leg.selection,
-            },
-        )
+        event = ParlayFeedEvent(**self.leg_result_values(leg, "WON", parlay))
         self.db.add(event)
         await self.db.flush()
         return event
@@ -112,21 +169,7 @@ class FeedEventGenerator:
         parlay: Parlay | SavedParlay | None = None,
     ) -> ParlayFeedEvent:
         """Create LEG_LOST feed event."""
-        summary = f"❌ Leg LOST: {leg.selection}"
-        
-        event = ParlayFeedEvent(
-            event_type="LEG_LOST",
-            sport=None,
-            parlay_id=parlay.id if isinstance(parlay, Parlay) else None,
-            saved_parlay_id=parlay.id if isinstance(parlay, SavedParlay) else None,
-            summary=summary,
-            event_metadata={
-                "leg_id": str(leg.id),
-                "game_id": str(leg.game_id),
-                "market_type": leg.market_type,
-                "selection": leg.selection,
-            },
-        )
+        event = ParlayFeedEvent(**self.leg_result_values(leg, "LOST", parlay))
         self.db.add(event)
         await self.db.flush()
         return event
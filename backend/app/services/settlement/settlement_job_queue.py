@@ -0,0 +1,136 @@
+"""Durable settlement job queue backed by the `settlement_jobs` outbox table.
+
+Producers call `enqueue()` inside the transaction that moves a game to FINAL, so a job
+exists exactly when the status change commits. `SettlementWorker` drains the queue every
+few seconds:
+
+- `claim()` moves up to N due rows to `processing` (FOR UPDATE SKIP LOCKED on Postgres,
+  so several workers can drain concurrently) and commits the claim.
+- After settling, `complete()` deletes rows whose games have no open legs left and
+  `retry()` re-queues the rest with backoff. A worker that dies mid-batch leaves rows in
+  `processing`; `claim()` releases them after `PROCESSING_TIMEOUT_SECONDS`.
+
+Delivery is at-least-once; settlement only touches PENDING/LIVE legs, so repeats are no-ops.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.settlement_job import SettlementJob
+
+logger = logging.getLogger(__name__)
+
+PROCESSING_TIMEOUT_SECONDS = 300
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 1800
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class SettlementJobQueue:
+    """Enqueue/claim/ack helpers for `settlement_jobs` on a caller-owned session."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def enqueue(self, game_ids: Iterable[UUID]) -> int:
+        """Queue (or re-queue) settlement for games. Does not commit; joins the caller's transaction."""
+        ids = list(dict.fromkeys(gid for gid in game_ids if gid))
+        if not ids:
+            return 0
+        now = _utcnow()
+        insert = self._insert()
+        stmt = insert(SettlementJob).values(
+            [{"game_id": gid, "status": "queued", "attempts": 0, "available_at": now} for gid in ids]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["game_id"],
+            set_={"status": "queued", "available_at": now, "claimed_at": None},
+        )
+        await self.db.execute(stmt)
+        return len(ids)
+
+    async def claim(self, limit: int) -> List[UUID]:
+        """Claim up to `limit` due jobs and commit the claim. Returns their game ids."""
+        now = _utcnow()
+        # Release rows claimed by a worker that never acked (crash, deploy)
+        await self.db.execute(
+            update(SettlementJob)
+            .where(
+                and_(
+                    SettlementJob.status == "processing",
+                    SettlementJob.claimed_at < now - timedelta(seconds=PROCESSING_TIMEOUT_SECONDS),
+                )
+            )
+            .values(status="queued", last_error="released (stuck)")
+        )
+        result = await self.db.execute(
+            select(SettlementJob.id, SettlementJob.game_id)
+            .where(
+                and_(
+                    SettlementJob.status == "queued",
+                    SettlementJob.available_at <= now,
+                )
+            )
+            .order_by(SettlementJob.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = result.all()
+        if rows:
+            await self.db.execute(
+                update(SettlementJob)
+                .where(SettlementJob.id.in_([row.id for row in rows]))
+                .values(status="processing", claimed_at=now, attempts=SettlementJob.attempts + 1)
+            )
+        await self.db.commit()
+        return [row.game_id for row in rows]
+
+    async def complete(self, game_ids: Sequence[UUID]) -> None:
+        """Ack: delete claimed jobs. Commits."""
+        if game_ids:
+            await self.db.execute(
+                delete(SettlementJob).where(
+                    and_(
+                        SettlementJob.game_id.in_(list(game_ids)),
+                        SettlementJob.status == "processing",
+                    )
+                )
+            )
+        await self.db.commit()
+
+    async def retry(self, game_ids: Sequence[UUID], error: str) -> None:
+        """Nack: re-queue claimed jobs with exponential backoff on their attempt count. Commits."""
+        if not game_ids:
+            return
+        result = await self.db.execute(
+            select(SettlementJob.id, SettlementJob.attempts).where(SettlementJob.game_id.in_(list(game_ids)))
+        )
+        now = _utcnow()
+        for job_id, attempts in result.all():
+            delay = min(RETRY_BASE_SECONDS * (2 ** max(int(attempts or 1) - 1, 0)), RETRY_MAX_SECONDS)
+            await self.db.execute(
+                update(SettlementJob)
+                .where(SettlementJob.id == job_id)
+                .values(
+                    status="queued",
+                    claimed_at=None,
+                    available_at=now + timedelta(seconds=delay),
+                    last_error=(error or "")[:500],
+                )
+            )
+        await self.db.commit()
+
+    def _insert(self):
+        dialect = self.db.get_bind().dialect.name
+        return postgresql.insert if dialect == "postgresql" else sqlite.insert
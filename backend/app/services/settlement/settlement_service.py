@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Sequence, Set
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.game import Game
@@ -20,6 +20,18 @@ from app.services.settlement.feed_event_generator import FeedEventGenerator
 
 logger = logging.getLogger(__name__)
 
+# Bulk settlement sizing: ids per IN (...) clause and rows per executemany UPDATE.
+SETTLEMENT_IN_CHUNK = 500
+SETTLEMENT_UPDATE_CHUNK = 1000
+
+TERMINAL_STATUSES = ("WON", "LOST", "PUSH", "VOID")
+
+
+def _chunked(items: Sequence, size: int) -> Iterator[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
 # Settlement metrics (in-memory, could be moved to Redis for multi-instance)
 _settlement_metrics = {
     "legs_settled_total": 0,
@@ -81,131 +93,137 @@ class SettlementService:
         if not game_id:
             logger.warning("settle_parlay_legs_for_game: Missing game_id")
             return 0
+        return await self.settle_parlay_legs_for_games([game_id])
+
+    async def settle_parlay_legs_for_games(self, game_ids: Sequence[UUID]) -> int:
+        """Settle PENDING/LIVE legs for a batch of FINAL games with set-based reads and writes.
         
-        try:
-            # Get the game
-            result = await self.db.execute(select(Game).where(Game.id == game_id))
-            game = result.scalar_one_or_none()
+        Games and their open legs are loaded with one (chunked) query each, legs are graded
+        in memory, and leg/parlay statuses are written with bulk UPDATEs by primary key.
+        LEG_WON/LEG_LOST feed events are inserted in batches. The batch commits once.
+        
+        Args:
+            game_ids: Game IDs to settle; non-FINAL or unknown games are skipped
             
-            if not game:
-                logger.warning(f"settle_parlay_legs_for_game: Game {game_id} not found")
-                return 0
+        Returns:
+            Number of legs settled (0 on error)
+        """
+        ids = list(dict.fromkeys(gid for gid in game_ids if gid))
+        if not ids:
+            return 0
+        
+        try:
+            games: Dict[UUID, Game] = {}
+            for chunk in _chunked(ids, SETTLEMENT_IN_CHUNK):
+                result = await self.db.execute(select(Game).where(Game.id.in_(chunk)))
+                for game in result.scalars().all():
+                    # Settlement MUST rely on FINAL/status only; never assume date-based completion.
+                    # Suspended/Postponed/No Contest must not be settled until status returns to FINAL.
+                    if (game.status or "").strip().upper() != "FINAL":
+                        logger.debug(
+                            f"settle_parlay_legs_for_games: Game {game.id} status is {game.status}, not FINAL (skip)"
+                        )
+                        continue
+                    if game.home_score is None or game.away_score is None:
+                        # Still process legs - they'll be VOIDed by calculator
+                        logger.warning(
+                            f"settle_parlay_legs_for_games: Game {game.id} is FINAL but missing scores "
+                            f"(home_score={game.home_score}, away_score={game.away_score})"
+                        )
+                    games[game.id] = game
             
-            # Settlement MUST rely on FINAL/status only; never assume date-based completion.
-            # Suspended/Postponed/No Contest must not be settled until status returns to FINAL.
-            status_norm = (game.status or "").strip().upper()
-            if status_norm != "FINAL":
-                logger.debug(
-                    f"settle_parlay_legs_for_game: Game {game_id} status is {game.status}, not FINAL (skip)"
-                )
+            if not games:
+                logger.debug(f"settle_parlay_legs_for_games: No FINAL games among {len(ids)} requested")
                 return 0
             
-            # Validate game has scores
-            if game.home_score is None or game.away_score is None:
-                logger.warning(
-                    f"settle_parlay_legs_for_game: Game {game_id} is FINAL but missing scores "
-                    f"(home_score={game.home_score}, away_score={game.away_score})"
-                )
-                # Still process legs - they'll be VOIDed by calculator
-            
-            # Find all pending/live legs for this game
-            result = await self.db.execute(
-                select(ParlayLeg).where(
-                    and_(
-                        ParlayLeg.game_id == game_id,
-                        ParlayLeg.status.in_(["PENDING", "LIVE"]),
-                    )
-                )
-            )
-            legs = result.scalars().all()
-            
+            # Prevent duplicate settlement: only PENDING/LIVE legs are selected; already-settled skipped
+            legs = await self._load_open_legs(list(games))
             if not legs:
-                logger.debug(f"settle_parlay_legs_for_game: No pending/live legs found for game {game_id}")
+                logger.debug(f"settle_parlay_legs_for_games: No pending/live legs for {len(games)} FINAL games")
                 return 0
-
-            # Prevent duplicate settlement: only PENDING/LIVE legs are selected above; already-settled skipped
-            logger.info(f"settle_parlay_legs_for_game: Processing {len(legs)} legs for game {game_id}")
-            settled_count = 0
+            
+            logger.info(f"settle_parlay_legs_for_games: Processing {len(legs)} legs across {len(games)} games")
+            now = datetime.utcnow()
+            leg_updates: List[Dict] = []
+            feed_rows: List[Dict] = []
+            parlay_ids: Set[UUID] = set()
+            saved_parlay_ids: Set[UUID] = set()
             error_count = 0
             
             for leg in legs:
                 try:
-                    # Validate leg
+                    game = games[leg.game_id]
                     if not leg.market_type:
-                        logger.warning(f"settle_parlay_legs_for_game: Leg {leg.id} missing market_type")
-                        leg.status = "VOID"
-                        leg.settled_at = datetime.utcnow()
-                        leg.result_reason = "Missing market_type"
-                        await self.db.flush()
-                        settled_count += 1
-                        continue
-                    
-                    # Calculate leg result
-                    if leg.market_type == "h2h":
-                        result_status = self._leg_calculator.calculate_moneyline_result(leg, game)
-                    elif leg.market_type == "spreads":
-                        result_status = self._leg_calculator.calculate_spread_result(leg, game)
-                    elif leg.market_type == "totals":
-                        result_status = self._leg_calculator.calculate_total_result(leg, game)
-                    else:
-                        logger.warning(
-                            f"settle_parlay_legs_for_game: Unknown market_type '{leg.market_type}' "
-                            f"for leg {leg.id}, VOIDing"
-                        )
+                        logger.warning(f"settle_parlay_legs_for_games: Leg {leg.id} missing market_type")
                         result_status = "VOID"
+                        reason = "Missing market_type"
+                    else:
+                        result_status = self._calculate_leg_result(leg, game)
+                        if result_status is None:
+                            logger.warning(
+                                f"settle_parlay_legs_for_games: Unknown market_type '{leg.market_type}' "
+                                f"for leg {leg.id}, VOIDing"
+                            )
+                            result_status = "VOID"
+                        home_score_str = str(game.home_score) if game.home_score is not None else "None"
+                        away_score_str = str(game.away_score) if game.away_score is not None else "None"
+                        reason = f"Game {game.away_team} @ {game.home_team} final: {away_score_str}-{home_score_str}"
                     
-                    # Update leg (first settlement only; settlement_locked_at enables stat-correction re-eval window)
-                    leg.status = result_status
-                    leg.settled_at = datetime.utcnow()
-                    if not getattr(leg, "settlement_locked_at", None):
-                        leg.settlement_locked_at = datetime.utcnow()
-                    home_score_str = str(game.home_score) if game.home_score is not None else "None"
-                    away_score_str = str(game.away_score) if game.away_score is not None else "None"
-                    leg.result_reason = f"Game {game.away_team} @ {game.home_team} final: {away_score_str}-{home_score_str}"
-
-                    await self.db.flush()
-                    settled_count += 1
-                    
-                    # Create feed event for leg result (with error handling)
-                    try:
-                        if result_status == "WON":
-                            await self._feed_generator.create_leg_won_event(leg)
-                        elif result_status == "LOST":
-                            await self._feed_generator.create_leg_lost_event(leg)
-                    except Exception as feed_error:
-                        # Don't fail settlement if feed event creation fails
-                        logger.error(
-                            f"settle_parlay_legs_for_game: Error creating feed event for leg {leg.id}: {feed_error}",
-                            exc_info=True
-                        )
-                    
-                    # Update parlay status (with error handling)
-                    try:
-                        await self._update_parlay_status(leg)
-                    except Exception as parlay_error:
-                        # Log but don't fail - leg is already settled
-                        logger.error(
-                            f"settle_parlay_legs_for_game: Error updating parlay status for leg {leg.id}: {parlay_error}",
-                            exc_info=True
-                        )
-                
+                    # First settlement only; settlement_locked_at enables stat-correction re-eval window
+                    leg_updates.append({
+                        "id": leg.id,
+                        "status": result_status,
+                        "settled_at": now,
+                        "settlement_locked_at": leg.settlement_locked_at or now,
+                        "result_reason": reason,
+                    })
+                    if result_status in ("WON", "LOST"):
+                        feed_rows.append(FeedEventGenerator.leg_result_values(leg, result_status))
+                    if leg.parlay_id:
+                        parlay_ids.add(leg.parlay_id)
+                    if leg.saved_parlay_id:
+                        saved_parlay_ids.add(leg.saved_parlay_id)
                 except Exception as e:
                     error_count += 1
                     logger.error(
-                        f"settle_parlay_legs_for_game: Error settling leg {leg.id} for game {game_id}: {e}",
+                        f"settle_parlay_legs_for_games: Error settling leg {leg.id} for game {leg.game_id}: {e}",
                         exc_info=True
                     )
                     # Continue processing other legs
                     continue
             
+            await self._bulk_update(ParlayLeg, leg_updates)
+            settled_count = len(leg_updates)
+            
+            # Create feed events for leg results (don't fail settlement if this fails)
+            try:
+                await self._feed_generator.add_events(feed_rows)
+            except Exception as feed_error:
+                logger.error(
+                    f"settle_parlay_legs_for_games: Error creating {len(feed_rows)} leg feed events: {feed_error}",
+                    exc_info=True
+                )
+            
+            # Update parlay statuses (log but don't fail - legs are already settled)
+            try:
+                await self._recalculate_parent_statuses(Parlay, ParlayLeg.parlay_id, parlay_ids)
+                await self._recalculate_parent_statuses(SavedParlay, ParlayLeg.saved_parlay_id, saved_parlay_ids)
+            except Exception as parlay_error:
+                logger.error(
+                    f"settle_parlay_legs_for_games: Error updating parlay statuses: {parlay_error}",
+                    exc_info=True
+                )
+            
             if error_count > 0:
                 logger.warning(
-                    f"settle_parlay_legs_for_game: Settled {settled_count} legs with {error_count} errors "
-                    f"for game {game_id}"
+                    f"settle_parlay_legs_for_games: Settled {settled_count} legs with {error_count} errors "
+                    f"across {len(games)} games"
                 )
                 _settlement_metrics["errors_total"] += error_count
             else:
-                logger.info(f"settle_parlay_legs_for_game: Successfully settled {settled_count} legs for game {game_id}")
+                logger.info(
+                    f"settle_parlay_legs_for_games: Successfully settled {settled_count} legs across {len(games)} games"
+                )
             
             # Update metrics
             _settlement_metrics["legs_settled_total"] += settled_count
@@ -215,7 +233,7 @@ class SettlementService:
                 await self.db.commit()
             except Exception as commit_error:
                 logger.error(
-                    f"settle_parlay_legs_for_game: Error committing settlement for game {game_id}: {commit_error}",
+                    f"settle_parlay_legs_for_games: Error committing settlement: {commit_error}",
                     exc_info=True
                 )
                 await self.db.rollback()
@@ -226,7 +244,7 @@ class SettlementService:
 
         except Exception as e:
             logger.error(
-                f"settle_parlay_legs_for_game: Fatal error settling legs for game {game_id}: {e}",
+                f"settle_parlay_legs_for_games: Fatal error settling legs for {len(ids)} games: {e}",
                 exc_info=True
             )
             try:
@@ -297,13 +315,8 @@ class SettlementService:
                 game = game_result.scalar_one_or_none()
                 if not game or (game.status or "").strip().upper() != "FINAL":
                     continue
-                if leg.market_type == "h2h":
-                    new_result = self._leg_calculator.calculate_moneyline_result(leg, game)
-                elif leg.market_type == "spreads":
-                    new_result = self._leg_calculator.calculate_spread_result(leg, game)
-                elif leg.market_type == "totals":
-                    new_result = self._leg_calculator.calculate_total_result(leg, game)
-                else:
+                new_result = self._calculate_leg_result(leg, game)
+                if new_result is None:
                     continue
                 if new_result == leg.status:
                     continue
@@ -346,188 +359,112 @@ class SettlementService:
     async def settle_all_pending_parlays(self) -> SettlementStats:
         """Settle all parlays that have all legs settled.
         
+        Pending parlays and their legs are loaded with one (chunked) query each; changed
+        statuses are written with bulk UPDATEs and PARLAY_WON/LOST feed events in batches.
+        
         Returns:
             SettlementStats with counts
         """
         stats = SettlementStats()
         
         try:
-            # Get all parlays with pending/live status
-            result = await self.db.execute(
-                select(Parlay).where(Parlay.status.in_(["PENDING", "LIVE"]))
-            )
-            parlays = result.scalars().all()
-            
-            if not parlays:
-                logger.debug("settle_all_pending_parlays: No pending/live parlays found")
-                return stats
-            
-            logger.info(f"settle_all_pending_parlays: Processing {len(parlays)} parlays")
             error_count = 0
+            feed_rows: List[Dict] = []
             
-            for parlay in parlays:
-                try:
-                    # Validate parlay
-                    if not parlay.id:
-                        logger.warning("settle_all_pending_parlays: Parlay missing id, skipping")
-                        continue
-                    
-                    # Get all legs for this parlay
-                    result = await self.db.execute(
-                        select(ParlayLeg).where(ParlayLeg.parlay_id == parlay.id)
+            # AI parlays, then saved_parlays (custom parlays)
+            for model, leg_fk, parlay_type in (
+                (Parlay, ParlayLeg.parlay_id, "AI"),
+                (SavedParlay, ParlayLeg.saved_parlay_id, "CUSTOM"),
+            ):
+                result = await self.db.execute(
+                    select(model.id, model.status, model.is_public, model.public_alias).where(
+                        model.status.in_(["PENDING", "LIVE"])
                     )
-                    legs = result.scalars().all()
-                    
-                    if not legs:
-                        logger.debug(f"settle_all_pending_parlays: Parlay {parlay.id} has no legs, skipping")
-                        continue
-                    
-                    # Calculate new status
-                    new_status = self._parlay_calculator.calculate_status(legs)
-                    
-                    # Only update if status changed
-                    if new_status != parlay.status:
-                        old_status = parlay.status
-                        parlay.status = new_status
+                )
+                parents = result.all()
+                if not parents:
+                    logger.debug(f"settle_all_pending_parlays: No pending/live {model.__tablename__} found")
+                    continue
+                
+                logger.info(f"settle_all_pending_parlays: Processing {len(parents)} {model.__tablename__}")
+                legs_by_parent = await self._load_legs_by_parent(leg_fk, [p.id for p in parents])
+                now = datetime.utcnow()
+                updates: List[Dict] = []
+                
+                for parent in parents:
+                    try:
+                        legs = legs_by_parent.get(parent.id)
+                        if not legs:
+                            logger.debug(f"settle_all_pending_parlays: {parlay_type} parlay {parent.id} has no legs, skipping")
+                            continue
                         
-                        if new_status in ("WON", "LOST", "PUSH", "VOID"):
-                            parlay.settled_at = datetime.utcnow()
+                        # Only update if status changed
+                        new_status = self._parlay_calculator.calculate_status(legs)
+                        if new_status == parent.status:
+                            continue
                         
-                        await self.db.flush()
+                        values = {"id": parent.id, "status": new_status}
+                        if new_status in TERMINAL_STATUSES:
+                            values["settled_at"] = now
+                        updates.append(values)
                         stats.parlays_settled += 1
-                        
-                        logger.info(
-                            f"settle_all_pending_parlays: Parlay {parlay.id} status changed "
-                            f"from {old_status} to {new_status}"
+                        logger.debug(
+                            f"settle_all_pending_parlays: {parlay_type} parlay {parent.id} status changed "
+                            f"from {parent.status} to {new_status}"
                         )
                         
-                        # Create feed events (with error handling)
-                        try:
-                            if new_status == "WON":
-                                stats.parlays_won += 1
-                                user_alias = getattr(parlay, 'public_alias', None) if getattr(parlay, 'is_public', False) else None
-                                # Extract odds from legs if available
-                                odds = None
-                                if legs and legs[0].price:
-                                    odds = legs[0].price
-                                await self._feed_generator.create_parlay_won_event(
-                                    parlay,
+                        user_alias = parent.public_alias if parent.is_public else None
+                        ids = {
+                            "parlay_id": parent.id if model is Parlay else None,
+                            "saved_parlay_id": parent.id if model is SavedParlay else None,
+                        }
+                        if new_status == "WON":
+                            stats.parlays_won += 1
+                            # AI parlays carry odds from the first leg if available
+                            odds = legs[0].price if model is Parlay and legs[0].price else None
+                            feed_rows.append(
+                                FeedEventGenerator.parlay_won_values(
+                                    parlay_type=parlay_type,
                                     user_alias=user_alias,
                                     legs_count=len(legs),
                                     odds=odds,
+                                    **ids,
                                 )
-                            elif new_status == "LOST":
-                                stats.parlays_lost += 1
-                                # Find which leg busted
-                                busted_leg = None
-                                for idx, leg in enumerate(legs, 1):
-                                    if leg.status == "LOST":
-                                        busted_leg = idx
-                                        break
-                                
-                                user_alias = getattr(parlay, 'public_alias', None) if getattr(parlay, 'is_public', False) else None
-                                await self._feed_generator.create_parlay_lost_event(
-                                    parlay,
+                            )
+                        elif new_status == "LOST":
+                            stats.parlays_lost += 1
+                            # Find which leg busted
+                            busted_leg = next(
+                                (idx for idx, leg in enumerate(legs, 1) if leg.status == "LOST"), None
+                            )
+                            feed_rows.append(
+                                FeedEventGenerator.parlay_lost_values(
+                                    parlay_type=parlay_type,
                                     user_alias=user_alias,
                                     busted_leg=busted_leg,
+                                    **ids,
                                 )
-                        except Exception as feed_error:
-                            # Don't fail settlement if feed event creation fails
-                            logger.error(
-                                f"settle_all_pending_parlays: Error creating feed event for parlay {parlay.id}: {feed_error}",
-                                exc_info=True
                             )
-                
-                except Exception as e:
-                    error_count += 1
-                    logger.error(
-                        f"settle_all_pending_parlays: Error settling parlay {parlay.id}: {e}",
-                        exc_info=True
-                    )
-                    # Continue processing other parlays
-                    continue
-            
-            # Also process saved_parlays (custom parlays)
-            result = await self.db.execute(
-                select(SavedParlay).where(SavedParlay.status.in_(["PENDING", "LIVE"]))
-            )
-            saved_parlays = result.scalars().all()
-            
-            if saved_parlays:
-                logger.info(f"settle_all_pending_parlays: Processing {len(saved_parlays)} saved parlays")
-            
-            for saved_parlay in saved_parlays:
-                try:
-                    # Validate saved_parlay
-                    if not saved_parlay.id:
-                        logger.warning("settle_all_pending_parlays: SavedParlay missing id, skipping")
-                        continue
                     
-                    result = await self.db.execute(
-                        select(ParlayLeg).where(ParlayLeg.saved_parlay_id == saved_parlay.id)
-                    )
-                    legs = result.scalars().all()
-                    
-                    if not legs:
-                        logger.debug(f"settle_all_pending_parlays: SavedParlay {saved_parlay.id} has no legs, skipping")
-                        continue
-                    
-                    new_status = self._parlay_calculator.calculate_status(legs)
-                    
-                    if new_status != saved_parlay.status:
-                        old_status = saved_parlay.status
-                        saved_parlay.status = new_status
-                        
-                        if new_status in ("WON", "LOST", "PUSH", "VOID"):
-                            saved_parlay.settled_at = datetime.utcnow()
-                        
-                        await self.db.flush()
-                        stats.parlays_settled += 1
-                        
-                        logger.info(
-                            f"settle_all_pending_parlays: SavedParlay {saved_parlay.id} status changed "
-                            f"from {old_status} to {new_status}"
+                    except Exception as e:
+                        error_count += 1
+                        logger.error(
+                            f"settle_all_pending_parlays: Error settling {parlay_type} parlay {parent.id}: {e}",
+                            exc_info=True
                         )
-                        
-                        # Create feed events (with error handling)
-                        try:
-                            if new_status == "WON":
-                                stats.parlays_won += 1
-                                user_alias = getattr(saved_parlay, 'public_alias', None) if getattr(saved_parlay, 'is_public', False) else None
-                                await self._feed_generator.create_parlay_won_event(
-                                    saved_parlay,
-                                    user_alias=user_alias,
-                                    legs_count=len(legs),
-                                )
-                            elif new_status == "LOST":
-                                stats.parlays_lost += 1
-                                busted_leg = None
-                                for idx, leg in enumerate(legs, 1):
-                                    if leg.status == "LOST":
-                                        busted_leg = idx
-                                        break
-                                
-                                user_alias = getattr(saved_parlay, 'public_alias', None) if getattr(saved_parlay, 'is_public', False) else None
-                                await self._feed_generator.create_parlay_lost_event(
-                                    saved_parlay,
-                                    user_alias=user_alias,
-                                    busted_leg=busted_leg,
-                                )
-                        except Exception as feed_error:
-                            # Don't fail settlement if feed event creation fails
-                            logger.error(
-                                f"settle_all_pending_parlays: Error creating feed event for saved_parlay {saved_parlay.id}: {feed_error}",
-                                exc_info=True
-                            )
+                        # Continue processing other parlays
+                        continue
                 
-                except Exception as e:
-                    error_count += 1
-                    logger.error(
-                        f"settle_all_pending_parlays: Error settling saved_parlay {saved_parlay.id}: {e}",
-                        exc_info=True
-                    )
-                    # Continue processing other saved parlays
-                    continue
+                await self._bulk_update(model, updates)
+            
+            # Create feed events (don't fail settlement if feed event creation fails)
+            try:
+                await self._feed_generator.add_events(feed_rows)
+            except Exception as feed_error:
+                logger.error(
+                    f"settle_all_pending_parlays: Error creating {len(feed_rows)} feed events: {feed_error}",
+                    exc_info=True
+                )
             
             # Commit all changes
             try:
@@ -570,6 +507,82 @@ class SettlementService:
                 pass
         
         return stats
+
+    def _calculate_leg_result(self, leg, game: Game) -> Optional[str]:
+        """Grade a leg (ORM leg or row) against a FINAL game; None for unknown market types."""
+        if leg.market_type == "h2h":
+            return self._leg_calculator.calculate_moneyline_result(leg, game)
+        if leg.market_type == "spreads":
+            return self._leg_calculator.calculate_spread_result(leg, game)
+        if leg.market_type == "totals":
+            return self._leg_calculator.calculate_total_result(leg, game)
+        return None
+
+    async def _load_open_legs(self, game_ids: List[UUID]) -> List:
+        """PENDING/LIVE legs for the given games as lightweight rows (no ORM identity map)."""
+        legs: List = []
+        for chunk in _chunked(game_ids, SETTLEMENT_IN_CHUNK):
+            result = await self.db.execute(
+                select(
+                    ParlayLeg.id,
+                    ParlayLeg.game_id,
+                    ParlayLeg.parlay_id,
+                    ParlayLeg.saved_parlay_id,
+                    ParlayLeg.market_type,
+                    ParlayLeg.selection,
+                    ParlayLeg.line,
+                    ParlayLeg.settlement_locked_at,
+                ).where(
+                    and_(
+                        ParlayLeg.game_id.in_(chunk),
+                        ParlayLeg.status.in_(["PENDING", "LIVE"]),
+                    )
+                )
+            )
+            legs.extend(result.all())
+        return legs
+
+    async def _load_legs_by_parent(self, leg_fk, parent_ids: List[UUID]) -> Dict[UUID, List]:
+        """All legs (id, status, price) for the given parlays/saved parlays, grouped by parent id."""
+        legs_by_parent: Dict[UUID, List] = {}
+        for chunk in _chunked(parent_ids, SETTLEMENT_IN_CHUNK):
+            result = await self.db.execute(
+                select(leg_fk.label("parent_id"), ParlayLeg.id, ParlayLeg.status, ParlayLeg.price).where(
+                    leg_fk.in_(chunk)
+                )
+            )
+            for row in result.all():
+                legs_by_parent.setdefault(row.parent_id, []).append(row)
+        return legs_by_parent
+
+    async def _recalculate_parent_statuses(self, model, leg_fk, parent_ids: Set[UUID]) -> int:
+        """Recompute parlay/saved parlay status from current leg statuses; bulk-write changes."""
+        if not parent_ids:
+            return 0
+        ids = list(parent_ids)
+        legs_by_parent = await self._load_legs_by_parent(leg_fk, ids)
+        now = datetime.utcnow()
+        updates: List[Dict] = []
+        for chunk in _chunked(ids, SETTLEMENT_IN_CHUNK):
+            result = await self.db.execute(select(model.id, model.status).where(model.id.in_(chunk)))
+            for parent_id, status in result.all():
+                legs = legs_by_parent.get(parent_id)
+                if not legs:
+                    continue
+                new_status = self._parlay_calculator.calculate_status(legs)
+                if new_status == status:
+                    continue
+                values = {"id": parent_id, "status": new_status}
+                if new_status in TERMINAL_STATUSES:
+                    values["settled_at"] = now
+                updates.append(values)
+        await self._bulk_update(model, updates)
+        return len(updates)
+
+    async def _bulk_update(self, model, rows: List[Dict]) -> None:
+        """ORM bulk UPDATE by primary key (executemany), chunked."""
+        for chunk in _chunked(rows, SETTLEMENT_UPDATE_CHUNK):
+            await self.db.execute(update(model), chunk)
     
     async def _update_parlay_status(self, leg: ParlayLeg):
         """Update parlay status after a leg is settled.
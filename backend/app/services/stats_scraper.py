@@ -1,6 +1,5 @@
 """Stats scraper service for team data, weather, and injuries"""
 
-import httpx
 import asyncio
 from typing import Dict, Optional, List
 from datetime import datetime
@@ -20,6 +19,7 @@ from app.services.apisports.injury_parser import (
     LEAGUE_TO_SPORT_KEY,
     apisports_injury_payload_to_canonical,
 )
+from app.services.http.shared_http_client import pooled_http_session
 from app.services.stats.snapshot_manager import SnapshotManager
 from app.services.stats.normalizer import StatsNormalizer
 from app.services.stats.features.team_feature_builder import TeamFeatureBuilder
@@ -1077,7 +1077,7 @@ class StatsScraperService:
         
         try:
             # Use OpenWeatherMap API (free tier: 1000 calls/day)
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_http_session(timeout=10.0) as client:
                 # Get lat/lon from city name (simplified - in production use geocoding)
                 # For now, use a simple mapping or geocoding API
                 response = await client.get(
@@ -17,6 +17,8 @@ from typing import Any, Dict, Iterable, List, Optional
 
 import httpx
 
+from app.services.http.shared_http_client import pooled_http_session
+
 
 @dataclass(frozen=True)
 class OddsApiKeys:
@@ -148,7 +150,7 @@ class TheOddsApiClient:
 
     @staticmethod
     async def _get_once(*, url: str, params: Dict[str, Any], timeout_seconds: float) -> Any:
-        async with httpx.AsyncClient(timeout=timeout_seconds, follow_redirects=True) as client:
+        async with pooled_http_session(timeout=timeout_seconds, follow_redirects=True) as client:
             # Retry once on 429 (burst protection) with a short delay.
             for attempt in range(2):
                 resp = await client.get(url, params=params)
@@ -0,0 +1,432 @@
+"""
+Two-tier cache: bounded in-process L1 (LRU + TTL) with optional Redis L2.
+
+- `LocalTtlCache` is the L1: bounded by entry count and by estimated bytes, evicts least
+  recently used entries, and purges long-expired entries on writes. Reads and writes share
+  one lock, since reads reorder the LRU list.
+- `TieredCache` puts Redis (via `RedisValueCodec`) behind an L1. L2 hits are promoted
+  into L1 with their remaining TTL; Redis errors fail open to L1-only behaviour.
+- Every cache registers under a namespace; `tiered_cache_stats()` reports hits, misses,
+  evictions, entry counts and estimated bytes per namespace.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_MAX_SIZE_NODES = 200_000
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Rough deep size of `value` in bytes (containers, strings, numbers, objects with __dict__).
+
+    Shared objects are counted once; very large graphs stop after `_MAX_SIZE_NODES` nodes.
+    """
+    total = 0
+    seen: set = set()
+    stack: List[Any] = [value]
+    nodes = 0
+    while stack and nodes < _MAX_SIZE_NODES:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        nodes += 1
+        try:
+            total += sys.getsizeof(obj)
+        except TypeError:
+            total += 64
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+    return total
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(self.__dict__)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    stale_until: float
+    size: int
+    stored_at: float = field(default_factory=time.time)
+
+
+class LocalTtlCache:
+    """
+    Bounded in-process LRU cache with per-entry TTL (L1).
+
+    Expired entries stay readable with `allow_stale=True` for `stale_grace_seconds`, then
+    are dropped by the periodic sweep on writes (or by LRU eviction before that).
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        stale_grace_seconds: Optional[float] = None,
+        sweep_interval_seconds: float = 30.0,
+    ) -> None:
+        self.namespace = namespace
+        if max_entries is None:
+            max_entries = int(getattr(settings, "tiered_cache_l1_max_entries", 1024))
+        if max_bytes is None:
+            max_bytes = int(getattr(settings, "tiered_cache_l1_max_bytes", 16 * 1024 * 1024))
+        if stale_grace_seconds is None:
+            stale_grace_seconds = float(getattr(settings, "tiered_cache_stale_grace_seconds", 3600))
+        self._max_entries = max(1, int(max_entries))
+        self._max_bytes = max(1, int(max_bytes))
+        self._stale_grace = max(0.0, float(stale_grace_seconds))
+        self._sweep_interval = max(0.0, float(sweep_interval_seconds))
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._next_sweep = 0.0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+        _register(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            now = time.time()
+            if now < entry.expires_at:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry.value
+            if allow_stale and now < entry.stale_until:
+                self._entries.move_to_end(key)
+                self.stats.stale_hits += 1
+                return entry.value
+            self.stats.misses += 1
+            return None
+
+    def remaining_ttl(self, key: str) -> Optional[float]:
+        """Seconds until `key` expires (<= 0 when expired), or None if absent."""
+        with self._lock:
+            entry = self._entries.get(key)
+        return None if entry is None else entry.expires_at - time.time()
+
+    def stored_at(self, key: str) -> Optional[float]:
+        """Epoch seconds when `key` was stored, or None if absent."""
+        with self._lock:
+            entry = self._entries.get(key)
+        return None if entry is None else entry.stored_at
+
+    def set(self, key: str, value: Any, ttl: float, *, size: Optional[int] = None) -> None:
+        now = time.time()
+        expires_at = now + max(0.0, float(ttl))
+        entry = _Entry(
+            value=value,
+            expires_at=expires_at,
+            stale_until=expires_at + self._stale_grace,
+            size=int(size) if size is not None else estimate_size(value),
+            stored_at=now,
+        )
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self.stats.sets += 1
+            if now >= self._next_sweep:
+                self._sweep_locked(now)
+            while self._entries and (len(self._entries) > self._max_entries or self._bytes > self._max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+
+    def delete_where(self, predicate: Callable[[str], bool]) -> int:
+        """Drop every key for which `predicate(key)` is true; returns how many were dropped."""
+        with self._lock:
+            doomed = [k for k in self._entries if predicate(k)]
+            for key in doomed:
+                self._bytes -= self._entries.pop(key).size
+            return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def clear_expired(self) -> int:
+        """Drop every expired entry (including ones still inside the stale grace)."""
+        now = time.time()
+        with self._lock:
+            expired = [k for k, e in self._entries.items() if now >= e.expires_at]
+            for key in expired:
+                self._bytes -= self._entries.pop(key).size
+            self.stats.expirations += len(expired)
+            return len(expired)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.stats.as_dict(),
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+        }
+
+    def _sweep_locked(self, now: float) -> None:
+        self._next_sweep = now + self._sweep_interval
+        dead = [k for k, e in self._entries.items() if now >= e.stale_until]
+        for key in dead:
+            self._bytes -= self._entries.pop(key).size
+        self.stats.expirations += len(dead)
+
+
+class TieredCache:
+    """
+    L1 `LocalTtlCache` in front of Redis (L2).
+
+    L2 is used only when `l2_enabled` and Redis is configured; values must then be
+    codec-serializable (JSON-compatible). L2 entries are stored as {"exp", "v"} under
+    `l2_prefix + key` and kept for the stale grace past expiry.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        stale_grace_seconds: Optional[float] = None,
+        l2_enabled: bool = True,
+        l2_prefix: Optional[str] = None,
+        provider: Any = None,
+        codec: Any = None,
+    ) -> None:
+        self.namespace = namespace
+        self.l1 = LocalTtlCache(
+            namespace,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            stale_grace_seconds=stale_grace_seconds,
+        )
+        self._l2_enabled = bool(l2_enabled)
+        self._l2_prefix = l2_prefix if l2_prefix is not None else f"tiered:v1:{namespace}:"
+        self._provider = provider
+        self._codec = codec
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.l1.stats
+
+    async def get(self, key: str, allow_stale: bool = False, *, l2_first: bool = False) -> Optional[Any]:
+        """
+        L1, then L2 (promoting hits into L1). `l2_first` reads L2 before L1, for values
+        another instance may have just replaced; L1 still answers when L2 is down or missing.
+        """
+        if l2_first and self._l2_configured():
+            value = await self._get_l2(key, allow_stale)
+            return value if value is not None else self.l1.get(key, allow_stale=allow_stale)
+        value = self.l1.get(key, allow_stale=allow_stale)
+        if value is not None or not self._l2_configured():
+            return value
+        return await self._get_l2(key, allow_stale)
+
+    async def _get_l2(self, key: str, allow_stale: bool) -> Optional[Any]:
+        try:
+            raw = await self._provider.get_client().get(self._l2_key(key))
+            if not raw:
+                return None
+            envelope = self._codec.decode(raw)
+            expires_at = float(envelope.get("exp") or 0.0)
+            value = envelope.get("v")
+        except Exception as exc:
+            logger.debug("TieredCache[%s] L2 get failed: %s", self.namespace, exc)
+            return None
+        if value is None:
+            return None
+        remaining = expires_at - time.time()
+        if remaining <= 0 and not allow_stale:
+            return None
+        self.l1.set(key, value, ttl=max(0.0, remaining))
+        self.stats.l2_hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float, *, index_prefix: Optional[str] = None) -> None:
+        """
+        Store in L1 and L2. With `index_prefix` (a prefix of `key`), the L2 key is also
+        recorded in a Redis set for that prefix so `delete_indexed_prefixes` can drop it
+        without a SCAN.
+        """
+        self.l1.set(key, value, ttl=ttl)
+        if not self._l2_configured():
+            return
+        try:
+            payload = self._codec.encode({"exp": time.time() + float(ttl), "v": value})
+            ex = max(1, int(float(ttl) + self.l1._stale_grace))
+            client = self._provider.get_client()
+            if index_prefix is None:
+                await client.set(self._l2_key(key), payload, ex=ex)
+                return
+            index_key = self._l2_index_key(index_prefix)
+            pipe = client.pipeline(transaction=False)
+            pipe.set(self._l2_key(key), payload, ex=ex)
+            pipe.sadd(index_key, self._l2_key(key))
+            pipe.expire(index_key, ex)
+            await pipe.execute()
+        except Exception as exc:
+            logger.debug("TieredCache[%s] L2 set failed: %s", self.namespace, exc)
+
+    async def delete(self, key: str) -> None:
+        self.l1.delete(key)
+        if not self._l2_configured():
+            return
+        try:
+            await self._provider.get_client().delete(self._l2_key(key))
+        except Exception as exc:
+            logger.debug("TieredCache[%s] L2 delete failed: %s", self.namespace, exc)
+
+    async def delete_prefix(self, prefix: str, *, shared: bool = True) -> int:
+        """Drop L1 keys starting with `prefix`; with `shared`, also SCAN+DEL them in L2."""
+        removed = self.l1.delete_where(lambda k: k.startswith(prefix))
+        if not shared or not self._l2_configured():
+            return removed
+        try:
+            client = self._provider.get_client()
+            keys = [k async for k in client.scan_iter(match=f"{self._l2_key(prefix)}*", count=200)]
+            if keys:
+                removed += int(await client.delete(*keys) or 0)
+        except Exception as exc:
+            logger.debug("TieredCache[%s] L2 prefix delete failed: %s", self.namespace, exc)
+        return removed
+
+    async def delete_indexed_prefixes(self, prefixes: Iterable[str], *, shared: bool = True) -> int:
+        """
+        Drop L1 keys under any of `prefixes`; with `shared`, also DEL the L2 keys recorded by
+        `set(..., index_prefix=)` for them (one pipelined SMEMBERS and one DEL, no SCAN).
+        """
+        prefixes = tuple(dict.fromkeys(p for p in prefixes if p))
+        if not prefixes:
+            return 0
+        removed = self.l1.delete_where(lambda k: k.startswith(prefixes))
+        if not shared or not self._l2_configured():
+            return removed
+        try:
+            client = self._provider.get_client()
+            index_keys = [self._l2_index_key(p) for p in prefixes]
+            pipe = client.pipeline(transaction=False)
+            for index_key in index_keys:
+                pipe.smembers(index_key)
+            keys = {k for members in await pipe.execute() for k in (members or ())}
+            if keys:
+                removed += int(await client.delete(*keys) or 0)
+            await client.delete(*index_keys)
+        except Exception as exc:
+            logger.debug("TieredCache[%s] L2 indexed delete failed: %s", self.namespace, exc)
+        return removed
+
+    async def clear_expired(self) -> int:
+        return self.l1.clear_expired()
+
+    def remaining_ttl(self, key: str) -> Optional[float]:
+        return self.l1.remaining_ttl(key)
+
+    def stored_at(self, key: str) -> Optional[float]:
+        return self.l1.stored_at(key)
+
+    def _l2_key(self, key: str) -> str:
+        return f"{self._l2_prefix}{key}"
+
+    def _l2_index_key(self, prefix: str) -> str:
+        return f"{self._l2_prefix}#idx:{prefix}"
+
+    def _l2_configured(self) -> bool:
+        if not self._l2_enabled:
+            return False
+        if self._provider is None:
+            from app.services.redis.redis_client_provider import get_redis_provider
+
+            self._provider = get_redis_provider()
+        if self._codec is None:
+            from app.services.redis.redis_value_codec import get_redis_value_codec
+
+            self._codec = get_redis_value_codec()
+        try:
+            return bool(self._provider.is_configured())
+        except Exception:
+            return False
+
+
+_registry_lock = threading.Lock()
+_registry: "weakref.WeakSet[LocalTtlCache]" = weakref.WeakSet()
+
+
+def _register(cache: LocalTtlCache) -> None:
+    with _registry_lock:
+        _registry.add(cache)
+
+
+def tiered_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-namespace L1 stats (instances sharing a namespace are summed)."""
+    with _registry_lock:
+        caches: List[LocalTtlCache] = list(_registry)
+    out: Dict[str, Dict[str, Any]] = {}
+    for cache in caches:
+        snap = cache.snapshot()
+        agg = out.setdefault(cache.namespace, {"instances": 0})
+        agg["instances"] += 1
+        for k, v in snap.items():
+            agg[k] = agg.get(k, 0) + v
+    return out
+
+
+def tiered_cache_memory_bytes() -> Tuple[int, int]:
+    """(total estimated bytes, total entries) held by all live L1 caches."""
+    stats = tiered_cache_stats()
+    return (
+        sum(int(s.get("bytes", 0)) for s in stats.values()),
+        sum(int(s.get("entries", 0)) for s in stats.values()),
+    )
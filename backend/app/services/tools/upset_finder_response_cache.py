@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Optional
 
-from app.services.data_fetchers.fetch_utils import InMemoryCache
 from app.services.redis.redis_client_provider import RedisClientProvider, get_redis_provider
+from app.services.redis.redis_value_codec import RedisValueCodec, get_redis_value_codec
+from app.services.tiered_cache import TieredCache
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +21,8 @@ class UpsetFinderResponseCache:
     """
     Cache for /api/tools/upsets responses.
 
-    - Prefer Redis when configured (shared across instances).
-    - Fall back to in-process async cache when Redis is unavailable.
+    - Two-tier: bounded in-process L1 in front of Redis (shared across instances).
+    - L1-only when Redis is unavailable.
     - Separate namespaces to prevent wrong-shape cache bugs:
       - tools:upsets_meta:v1:...
       - tools:upsets_full:v1:...
@@ -31,9 +31,18 @@ class UpsetFinderResponseCache:
     META_PREFIX = "tools:upsets_meta:v1:"
     FULL_PREFIX = "tools:upsets_full:v1:"
 
-    def __init__(self, *, provider: Optional[RedisClientProvider] = None) -> None:
-        self._provider = provider or get_redis_provider()
-        self._memory = InMemoryCache()
+    def __init__(
+        self,
+        *,
+        provider: Optional[RedisClientProvider] = None,
+        codec: Optional[RedisValueCodec] = None,
+    ) -> None:
+        self._cache = TieredCache(
+            "tools_upsets",
+            max_entries=256,
+            provider=provider or get_redis_provider(),
+            codec=codec or get_redis_value_codec(),
+        )
 
     @staticmethod
     def ttl_seconds(*, sport: str, days: int) -> int:
@@ -76,34 +85,19 @@ class UpsetFinderResponseCache:
             f"{safe(sport)}:{int(days)}:{float(min_edge)}:{int(max_results)}:{int(min_underdog_odds)}:{safe(entitlement)}"
         )
 
+    async def invalidate_sport(self, sport: str, *, shared: bool = True) -> int:
+        """Drop meta/full responses for `sport` and for "all" (which includes it)."""
+        removed = 0
+        for s in {(sport or "").strip().lower(), "all"}:
+            for prefix in (self.META_PREFIX, self.FULL_PREFIX):
+                removed += await self._cache.delete_prefix(f"{prefix}{s}:", shared=shared)
+        return removed
+
     async def get_json(self, *, key: str) -> Optional[Any]:
-        if self._provider.is_configured():
-            try:
-                client = self._provider.get_client()
-                raw = await client.get(key)
-                if not raw:
-                    return None
-                return json.loads(raw.decode("utf-8"))
-            except Exception as exc:
-                logger.debug("UpsetFinderResponseCache Redis get failed: %s", exc)
-        try:
-            return await self._memory.get(key)
-        except Exception:
-            return None
+        return await self._cache.get(key)
 
     async def set_json(self, *, key: str, value: Any, ttl_seconds: int) -> None:
-        if self._provider.is_configured():
-            try:
-                client = self._provider.get_client()
-                payload = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-                await client.set(key, payload, ex=int(ttl_seconds))
-                return
-            except Exception as exc:
-                logger.debug("UpsetFinderResponseCache Redis set failed: %s", exc)
-        try:
-            await self._memory.set(key, value, ttl=int(ttl_seconds))
-        except Exception:
-            pass
+        await self._cache.set(key, value, ttl=int(ttl_seconds))
 
     async def get_or_compute_json(
         self,
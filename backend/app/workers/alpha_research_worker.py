@@ -26,6 +26,7 @@ from app.alpha.strategy_graph_service import StrategyGraphService
 from app.alpha.alpha_decay_monitor import AlphaDecayMonitor
 from app.alpha.meta_learning_controller import MetaLearningController
 from app.models.alpha_feature import AlphaFeature
+from app.services.institutional.model_inputs_snapshot import bump_model_inputs_version
 from sqlalchemy import select
 
 logger = logging.getLogger(__name__)
@@ -75,6 +76,10 @@ async def run_alpha_research_cycle(correlation_id: str | None = None) -> dict:
             deprecated = await decay.check_all_validated(correlation_id=cid)
             summary["deprecated"] = deprecated
 
+            # Predictors serve validated features from a process-wide snapshot; reload it
+            if summary["validated"] or deprecated:
+                await bump_model_inputs_version()
+
             # Optionally start experiments (meta controller)
             meta = MetaLearningController(db)
             if await meta.should_run_experiment():
@@ -0,0 +1,199 @@
+"""Full-article worker: drains the durable full-article job queue."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+import sys
+from typing import Optional, Set
+
+from app.core import telemetry
+from app.core.config import settings
+from app.core.event_logger import log_event
+from app.services.analysis.full_article_job_queue import (
+    ClaimedArticleJob,
+    FullArticleJobQueue,
+    get_full_article_job_queue,
+)
+from app.services.analysis.full_article_job_runner import FullArticleJobRunner
+
+logger = logging.getLogger(__name__)
+
+
+class FullArticleWorker:
+    """Claims queued full-article jobs and generates them with bounded concurrency."""
+
+    POLL_INTERVAL = 2
+    ERROR_BACKOFF_INTERVAL = 30
+    DEPTH_REPORT_INTERVAL = 60
+
+    def __init__(
+        self,
+        *,
+        queue: Optional[FullArticleJobQueue] = None,
+        runner: Optional[FullArticleJobRunner] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.running = False
+        self._task = None
+        self._queue = queue
+        self._runner = runner
+        self._concurrency = max(1, int(concurrency or settings.analysis_full_article_worker_concurrency))
+        self._in_flight: Set[asyncio.Task] = set()
+        self._last_depth_report = 0.0
+
+    async def start(self):
+        """Start the background worker."""
+        if self.running:
+            logger.warning("FullArticleWorker already running")
+            return
+
+        self.running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("FullArticleWorker started")
+
+    async def stop(self):
+        """Stop the background worker. In-flight jobs are left claimed and re-queued after the timeout."""
+        self.running = False
+        for task in list(self._in_flight) + ([self._task] if self._task else []):
+            task.cancel()
+        if self._task:
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("FullArticleWorker stopped")
+
+    async def _run_loop(self):
+        while self.running:
+            try:
+                await self.process_available()
+                await self._report_depth()
+                await asyncio.sleep(self.POLL_INTERVAL)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"FullArticleWorker: Error in loop: {e}", exc_info=True)
+                await asyncio.sleep(self.ERROR_BACKOFF_INTERVAL)
+
+    async def process_available(self) -> int:
+        """Claim jobs for free slots and start them. Returns the number of jobs claimed."""
+        free = self._concurrency - len(self._in_flight)
+        if free <= 0:
+            return 0
+        jobs = await self._get_queue().claim(free)
+        for job in jobs:
+            task = asyncio.create_task(self._process(job))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+        return len(jobs)
+
+    async def drain(self) -> None:
+        """Wait for in-flight jobs (used by tests and shutdown hooks)."""
+        if self._in_flight:
+            await asyncio.gather(*list(self._in_flight), return_exceptions=True)
+
+    async def _process(self, job: ClaimedArticleJob) -> None:
+        queue = self._get_queue()
+        error = ""
+        try:
+            done = await self._get_runner().run_job(analysis_id=job.analysis_id)
+            if not done:
+                error = "generation failed or timed out"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            logger.warning(f"FullArticleWorker: Job for analysis {job.analysis_id} failed: {e}")
+
+        try:
+            if not error:
+                await queue.complete(job)
+                log_event(logger, "full_article_job.done", analysis_id=job.analysis_id, attempts=job.attempts)
+                return
+            requeued = await queue.retry(job, error)
+            log_event(
+                logger,
+                "full_article_job.retry" if requeued else "full_article_job.dropped",
+                level=logging.WARNING,
+                analysis_id=job.analysis_id,
+                attempts=job.attempts,
+                error=error[:200],
+            )
+        except Exception as e:
+            logger.error(f"FullArticleWorker: Could not ack job for analysis {job.analysis_id}: {e}")
+
+    async def _report_depth(self) -> None:
+        loop_time = asyncio.get_running_loop().time()
+        if loop_time - self._last_depth_report < self.DEPTH_REPORT_INTERVAL:
+            return
+        self._last_depth_report = loop_time
+        depth = await self._get_queue().depth()
+        telemetry.set("full_article_queue_depth", depth)
+        log_event(logger, "full_article_job.queue_depth", **depth)
+
+    def _get_queue(self) -> FullArticleJobQueue:
+        if self._queue is None:
+            self._queue = get_full_article_job_queue()
+        return self._queue
+
+    def _get_runner(self) -> FullArticleJobRunner:
+        if self._runner is None:
+            self._runner = FullArticleJobRunner()
+        return self._runner
+
+
+# Global worker instance
+_worker = None
+
+
+def get_full_article_worker() -> FullArticleWorker:
+    """Get the global FullArticleWorker instance."""
+    global _worker
+    if _worker is None:
+        _worker = FullArticleWorker()
+    return _worker
+
+
+async def start_full_article_worker():
+    """Start the full-article worker."""
+    worker = get_full_article_worker()
+    await worker.start()
+
+
+async def stop_full_article_worker():
+    """Stop the full-article worker."""
+    worker = get_full_article_worker()
+    await worker.stop()
+
+
+async def run_full_article_worker() -> None:
+    """Standalone entry point: run the worker until SIGINT/SIGTERM."""
+    from app.services.http.shared_http_client import close_http_clients
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows event loops
+            pass
+
+    worker = get_full_article_worker()
+    await worker.start()
+    try:
+        await stop.wait()
+    finally:
+        await worker.stop()
+        await close_http_clients()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        datefmt="%Y-%m-%dT%H:%M:%SZ",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+    asyncio.run(run_full_article_worker())
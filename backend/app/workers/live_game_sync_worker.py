@@ -253,6 +253,10 @@ if __name__ == "__main__":
         except KeyboardInterrupt:
             print("\nStopping worker...")
             await worker.stop()
+        finally:
+            from app.services.http.shared_http_client import close_http_clients
+
+            await close_http_clients()
     
     asyncio.run(main())
 
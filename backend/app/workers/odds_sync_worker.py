@@ -89,8 +89,13 @@ class OddsSyncWorker:
 
 async def run_odds_sync_worker():
     """Main entry point for odds sync worker"""
+    from app.services.http.shared_http_client import close_http_clients
+
     worker = OddsSyncWorker()
-    await worker.sync_all_sports()
+    try:
+        await worker.sync_all_sports()
+    finally:
+        await close_http_clients()
 
 
 if __name__ == "__main__":
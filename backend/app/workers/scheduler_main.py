@@ -1,5 +1,6 @@
 """
-Standalone scheduler process: sport/team/standings/injuries/roster refresh.
+Standalone scheduler process: sport/team/standings/injuries/roster refresh and
+leaderboard totals maintenance.
 
 - Runs as separate process (systemd parlaygorilla-scheduler.service).
 - Uses Redis lock to prevent concurrent runs.
@@ -33,13 +34,18 @@ logger = logging.getLogger("scheduler_main")
 
 # Job name -> interval in seconds
 # Sport state every 6h; daily pass for team catalog, standings, injuries, roster (same pipeline, quota-aware).
+# Leaderboard totals: pick up verification confirmations every cycle, full rebuild every 6h.
 JOB_INTERVALS = {
     "apisports_refresh": 6 * 3600,   # 6 hours — sport state
     "apisports_daily": 24 * 3600,    # 24 hours — team catalog, standings, injuries, roster rotation
+    "refresh_leaderboard_verifications": 60 * 60,  # every cycle
+    "rebuild_leaderboard_totals": 6 * 3600,        # 6 hours
 }
 LOCK_KEY = "parlaygorilla:scheduler:run"
 LOCK_TTL_SECONDS = 45 * 60  # 45 min
 CYCLE_SLEEP_SECONDS = 60 * 60  # check every 1 hour
+# Two cycles, so one skipped cycle (lock held, crash) does not drop confirmations.
+LEADERBOARD_VERIFICATION_LOOKBACK_MINUTES = 2 * CYCLE_SLEEP_SECONDS // 60
 
 
 async def _get_last_run_at(db_session, job_name: str) -> datetime | None:
@@ -67,6 +73,14 @@ async def _run_job(job_name: str) -> tuple[str, int | None, str | None, dict | N
                 summary.get("refreshed"),
             )
             run_stats = summary.get("run_stats")
+        elif job_name == "refresh_leaderboard_verifications":
+            from app.services.scheduler_jobs.leaderboard_totals_job import LeaderboardTotalsJob
+            await LeaderboardTotalsJob().refresh_recent_verifications(
+                lookback_minutes=LEADERBOARD_VERIFICATION_LOOKBACK_MINUTES
+            )
+        elif job_name == "rebuild_leaderboard_totals":
+            from app.services.scheduler_jobs.leaderboard_totals_job import LeaderboardTotalsJob
+            await LeaderboardTotalsJob().rebuild()
         else:
             raise ValueError(f"Unknown job: {job_name}")
         duration_ms = int((time.perf_counter() - start) * 1000)
@@ -137,13 +151,18 @@ async def _run_cycle() -> None:
 
 async def main() -> None:
     """Loop: run cycle every CYCLE_SLEEP_SECONDS."""
+    from app.services.http.shared_http_client import close_http_clients
+
     logger.info("[SCHEDULER] Standalone scheduler started; cycle_sleep=%ss", CYCLE_SLEEP_SECONDS)
-    while True:
-        try:
-            await _run_cycle()
-        except Exception as e:
-            logger.exception("[SCHEDULER] Cycle error: %s", e)
-        await asyncio.sleep(CYCLE_SLEEP_SECONDS)
+    try:
+        while True:
+            try:
+                await _run_cycle()
+            except Exception as e:
+                logger.exception("[SCHEDULER] Cycle error: %s", e)
+            await asyncio.sleep(CYCLE_SLEEP_SECONDS)
+    finally:
+        await close_http_clients()
 
 
 if __name__ == "__main__":
@@ -291,8 +291,13 @@ class ScraperWorker:
 
 async def run_scraper_worker():
     """Main entry point for scraper worker"""
+    from app.services.http.shared_http_client import close_http_clients
+
     worker = ScraperWorker()
-    await worker.run_full_scrape()
+    try:
+        await worker.run_full_scrape()
+    finally:
+        await close_http_clients()
 
 
 if __name__ == "__main__":
@@ -7,9 +7,11 @@ import logging
 from datetime import datetime, timedelta
 
 from app.database.session import AsyncSessionLocal
+from app.services.settlement.settlement_job_queue import SettlementJobQueue
 from app.services.settlement.settlement_service import SettlementService
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, exists
 from app.models.game import Game
+from app.models.parlay_leg import ParlayLeg
 
 logger = logging.getLogger(__name__)
 
@@ -17,17 +19,24 @@ logger = logging.getLogger(__name__)
 class SettlementWorker:
     """Background worker for settling parlays."""
     
-    # Smart cadence: faster during active games, slower otherwise
-    ACTIVE_POLL_INTERVAL = 90  # 1.5 minutes during active games
-    IDLE_POLL_INTERVAL = 300  # 5 minutes when no active games
+    # Event-driven: settlement jobs (written when a game goes FINAL) are drained every few seconds.
+    JOB_POLL_INTERVAL = 3
+    JOBS_PER_CLAIM = 200
+    MAX_CLAIMS_PER_TICK = 10
+    # Reconciliation sweep (backstop for games that went FINAL outside the score scraper):
+    # faster during active games, slower otherwise
+    ACTIVE_POLL_INTERVAL = 600  # 10 minutes during active games
+    IDLE_POLL_INTERVAL = 1800  # 30 minutes when no active games
+    CIRCUIT_OPEN_SLEEP = 300
     ERROR_BACKOFF_INTERVAL = 60  # seconds after error
     
     # Circuit breaker settings
     MAX_CONSECUTIVE_ERRORS = 5  # Open circuit after this many consecutive errors
     CIRCUIT_RESET_TIMEOUT = 300  # 5 minutes before attempting to close circuit
     
-    # Rate limiting
-    MAX_GAMES_PER_CYCLE = 100  # Process max 100 games per settlement cycle
+    # Rate limiting: games are settled in set-based batches (one leg query + bulk writes per batch)
+    MAX_GAMES_PER_CYCLE = 2000  # Process max 2000 games with open legs per settlement cycle
+    GAMES_PER_BATCH = 200  # Games per settle_parlay_legs_for_games call (one commit each)
     
     def __init__(self):
         self.running = False
@@ -36,6 +45,7 @@ class SettlementWorker:
         self._circuit_open = False
         self._circuit_open_since = None
         self._last_error_time = None
+        self._next_sweep_at = None  # None: sweep on first iteration
     
     async def start(self):
         """Start the background worker."""
@@ -78,29 +88,30 @@ class SettlementWorker:
                                 f"SettlementWorker: Circuit breaker is OPEN, skipping settlement cycle "
                                 f"(will retry in {self.CIRCUIT_RESET_TIMEOUT - elapsed:.0f}s)"
                             )
-                            await asyncio.sleep(self.IDLE_POLL_INTERVAL)
+                            await asyncio.sleep(self.CIRCUIT_OPEN_SLEEP)
                             continue
                     else:
                         self._circuit_open_since = datetime.utcnow()
-                        await asyncio.sleep(self.IDLE_POLL_INTERVAL)
+                        await asyncio.sleep(self.CIRCUIT_OPEN_SLEEP)
                         continue
                 
-                # Check if any games are LIVE or recently FINAL
-                has_active_games = await self._has_active_games()
+                # Settle games whose FINAL transition queued a job
+                await self._process_settlement_jobs()
                 
-                # Process settlements
-                await self._process_settlements()
+                # Reconciliation sweep on a slow timer (cadence based on activity)
+                now = datetime.utcnow()
+                if self._next_sweep_at is None or now >= self._next_sweep_at:
+                    has_active_games = await self._has_active_games()
+                    await self._process_settlements()
+                    interval = self.ACTIVE_POLL_INTERVAL if has_active_games else self.IDLE_POLL_INTERVAL
+                    self._next_sweep_at = datetime.utcnow() + timedelta(seconds=interval)
                 
                 # Reset error count on successful run
                 if self._consecutive_errors > 0:
                     logger.info(f"SettlementWorker: Successful run, resetting error count (was {self._consecutive_errors})")
                     self._consecutive_errors = 0
                 
-                # Wait based on activity
-                if has_active_games:
-                    await asyncio.sleep(self.ACTIVE_POLL_INTERVAL)
-                else:
-                    await asyncio.sleep(self.IDLE_POLL_INTERVAL)
+                await asyncio.sleep(self.JOB_POLL_INTERVAL)
             
             except asyncio.CancelledError:
                 break
@@ -139,6 +150,52 @@ class SettlementWorker:
 
                 await asyncio.sleep(self.ERROR_BACKOFF_INTERVAL)
     
+    async def _process_settlement_jobs(self) -> int:
+        """Claim queued settlement jobs, settle their games in one batch, ack or re-queue.
+        
+        Returns:
+            Number of legs settled
+        """
+        total_legs_settled = 0
+        async with AsyncSessionLocal() as db:
+            queue = SettlementJobQueue(db)
+            settlement_service = SettlementService(db)
+            for _ in range(self.MAX_CLAIMS_PER_TICK):
+                game_ids = await queue.claim(self.JOBS_PER_CLAIM)
+                if not game_ids:
+                    break
+                try:
+                    total_legs_settled += await settlement_service.settle_parlay_legs_for_games(game_ids)
+                    # A job is done unless its game is still FINAL with open legs (settlement
+                    # error); those are retried with backoff. Games that left FINAL are
+                    # re-enqueued by their next FINAL transition.
+                    result = await db.execute(
+                        select(ParlayLeg.game_id)
+                        .join(Game, Game.id == ParlayLeg.game_id)
+                        .where(
+                            and_(
+                                ParlayLeg.game_id.in_(game_ids),
+                                ParlayLeg.status.in_(["PENDING", "LIVE"]),
+                                Game.status == "FINAL",
+                            )
+                        )
+                        .distinct()
+                    )
+                    unsettled = {row[0] for row in result.all()}
+                    await queue.complete([gid for gid in game_ids if gid not in unsettled])
+                    if unsettled:
+                        await queue.retry(list(unsettled), "legs still open after settlement")
+                except Exception as e:
+                    logger.error(f"SettlementWorker: Error processing {len(game_ids)} settlement jobs: {e}", exc_info=True)
+                    await db.rollback()
+                    await queue.retry(game_ids, f"{type(e).__name__}: {e}")
+                    raise
+                if len(game_ids) < self.JOBS_PER_CLAIM:
+                    break
+        if total_legs_settled > 0:
+            logger.info(f"SettlementWorker: Settled {total_legs_settled} legs from settlement jobs")
+        return total_legs_settled
+    
     async def _has_active_games(self) -> bool:
         """Check if any games are LIVE or recently FINAL (within last hour)."""
         try:
@@ -166,18 +223,26 @@ class SettlementWorker:
                 # Settle legs for ALL FINAL games with pending legs; do NOT assume date-based completion.
                 # Late games (delayed start, next-day finish) are included by using a wide window.
                 # Duplicate settlement is prevented: we only update PENDING/LIVE legs; re-run is no-op.
+                # Only games that still have PENDING/LIVE legs are selected, so settled games drop out.
                 cutoff = datetime.utcnow() - timedelta(days=30)
+                open_legs = exists().where(
+                    and_(
+                        ParlayLeg.game_id == Game.id,
+                        ParlayLeg.status.in_(["PENDING", "LIVE"]),
+                    )
+                )
                 result = await db.execute(
-                    select(Game).where(
+                    select(Game.id).where(
                         and_(
                             Game.status == "FINAL",
                             Game.start_time >= cutoff,
+                            open_legs,
                         )
                     ).limit(self.MAX_GAMES_PER_CYCLE)  # Rate limiting per cycle
                 )
-                final_games = result.scalars().all()
+                final_game_ids = [row[0] for row in result.all()]
                 
-                if len(final_games) >= self.MAX_GAMES_PER_CYCLE:
+                if len(final_game_ids) >= self.MAX_GAMES_PER_CYCLE:
                     logger.warning(
                         f"SettlementWorker: Rate limit reached, processing {self.MAX_GAMES_PER_CYCLE} games "
                         f"(more may be pending)"
@@ -186,19 +251,20 @@ class SettlementWorker:
                 games_processed = 0
                 total_legs_settled = 0
                 
-                for game in final_games:
+                for start in range(0, len(final_game_ids), self.GAMES_PER_BATCH):
+                    batch = final_game_ids[start:start + self.GAMES_PER_BATCH]
                     try:
-                        legs_settled = await settlement_service.settle_parlay_legs_for_game(game.id)
+                        legs_settled = await settlement_service.settle_parlay_legs_for_games(batch)
                         if legs_settled > 0:
-                            logger.info(f"SettlementWorker: Settled {legs_settled} legs for game {game.id}")
+                            logger.info(f"SettlementWorker: Settled {legs_settled} legs for {len(batch)} games")
                             total_legs_settled += legs_settled
-                        games_processed += 1
+                        games_processed += len(batch)
                     except Exception as e:
                         logger.error(
-                            f"SettlementWorker: Error settling legs for game {game.id}: {e}",
+                            f"SettlementWorker: Error settling legs for batch of {len(batch)} games: {e}",
                             exc_info=True
                         )
-                        # Continue processing other games
+                        # Continue processing other batches
                         continue
                 
                 if games_processed > 0:
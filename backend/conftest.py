@@ -94,6 +94,11 @@ async def _clear_db_between_tests(db: AsyncSession):
     for table in reversed(Base.metadata.sorted_tables):
         await db.execute(text(f'DELETE FROM "{table.name}"'))
     await db.commit()
+
+    # Process-wide model input snapshot would otherwise leak rows from earlier tests.
+    from app.services.institutional.model_inputs_snapshot import reset_model_inputs_snapshot
+
+    reset_model_inputs_snapshot()
     yield
 
 
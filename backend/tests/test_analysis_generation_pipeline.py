@@ -0,0 +1,116 @@
+"""Tests for the scheduler's parallel analysis generation pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.database.session import AsyncSessionLocal
+from app.models.analysis_page_views import AnalysisPageViews
+from app.models.game import Game
+from app.models.game_analysis import GameAnalysis
+from app.services.analysis.analysis_generation_pipeline import (
+    AnalysisGenerationPipeline,
+    AnalysisGenerationTask,
+)
+
+
+async def _games(db, count: int):
+    now = datetime.now(timezone.utc)
+    games = [
+        Game(
+            external_game_id=f"pipeline-{i}",
+            sport="NBA",
+            home_team=f"Home {i}",
+            away_team=f"Away {i}",
+            start_time=now + timedelta(days=1, hours=i),
+            status="scheduled",
+        )
+        for i in range(count)
+    ]
+    db.add_all(games)
+    await db.commit()
+    return games
+
+
+@pytest.mark.asyncio
+async def test_prioritize_puts_high_traffic_games_first(db):
+    games = await _games(db, 3)
+    analysis = GameAnalysis(
+        game_id=games[2].id,
+        league="NBA",
+        slug="nba/away-2-vs-home-2",
+        matchup="Away 2 @ Home 2",
+        analysis_content={},
+    )
+    db.add(analysis)
+    await db.flush()
+    db.add(
+        AnalysisPageViews(
+            analysis_id=analysis.id,
+            game_id=games[2].id,
+            league="NBA",
+            slug=analysis.slug,
+            view_bucket_date=date.today(),
+            views=4000,
+        )
+    )
+    await db.commit()
+
+    pipeline = AnalysisGenerationPipeline(AsyncSessionLocal, workers=2)
+    tasks = [AnalysisGenerationTask(game_id=g.id, league="NBA", start_time=g.start_time) for g in games]
+    ordered = await pipeline.prioritize(db, tasks)
+
+    assert ordered[0].game_id == games[2].id
+    assert [t.game_id for t in ordered[1:]] == [games[0].id, games[1].id]
+
+
+@pytest.mark.asyncio
+async def test_run_generates_in_parallel_with_own_sessions(db, monkeypatch):
+    games = await _games(db, 4)
+    in_flight = 0
+    peak = 0
+    sessions = set()
+
+    class _FakeOrchestrator:
+        def __init__(self, session):
+            sessions.add(id(session))
+
+        async def ensure_core_for_game(self, *, game, core_timeout_seconds, force_regenerate):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return SimpleNamespace(analysis_content={})
+
+    monkeypatch.setattr("app.services.analysis.AnalysisOrchestratorService", _FakeOrchestrator)
+
+    async def _closed() -> bool:
+        return False
+
+    pipeline = AnalysisGenerationPipeline(AsyncSessionLocal, workers=2, circuit_open=_closed)
+    result = await pipeline.run([AnalysisGenerationTask(game_id=g.id, league="NBA") for g in games])
+
+    assert result.generated == 4
+    assert result.failed == 0
+    assert len(result.durations_ms) == 4
+    assert peak == 2
+    assert len(sessions) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_defers_remaining_games_when_circuit_opens(db):
+    games = await _games(db, 3)
+
+    async def _open() -> bool:
+        return True
+
+    pipeline = AnalysisGenerationPipeline(AsyncSessionLocal, workers=2, circuit_open=_open)
+    result = await pipeline.run([AnalysisGenerationTask(game_id=g.id, league="NBA") for g in games])
+
+    assert result.generated == 0
+    assert result.deferred == 3
@@ -33,7 +33,7 @@ async def test_apisports_client_request_200_does_not_raise_name_error():
     mock_ac.__aexit__ = AsyncMock(return_value=None)
 
     with (
-        patch("app.services.apisports.client.httpx.AsyncClient", return_value=mock_ac),
+        patch("app.services.apisports.client.pooled_http_session", return_value=mock_ac),
         patch.object(client, "_quota") as quota,
         patch.object(client, "_rate_limiter") as limiter,
     ):
@@ -64,7 +64,7 @@ async def test_apisports_client_request_200_calls_after_success_with_sport():
     mock_ac.__aexit__ = AsyncMock(return_value=None)
 
     with (
-        patch("app.services.apisports.client.httpx.AsyncClient", return_value=mock_ac),
+        patch("app.services.apisports.client.pooled_http_session", return_value=mock_ac),
         patch.object(client, "_quota") as quota,
         patch.object(client, "_rate_limiter") as limiter,
         patch.object(client, "_after_success", new_callable=AsyncMock) as after_success,
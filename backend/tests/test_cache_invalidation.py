@@ -43,3 +43,19 @@ def test_clear_parlay_cache(monkeypatch):
     assert called["memory"] is True
 
 
+
+
+def test_remote_odds_change_drops_parlay_memory_entries_for_that_sport():
+    from app.services.cache_manager import _parlay_memory_cache
+
+    l1 = _parlay_memory_cache.l1
+    l1.clear()
+    l1.set("NFL:abc", {"id": "1", "data": {}, "cached_at": 0.0, "stale": False}, ttl=60)
+    l1.set("NBA:def", {"id": "2", "data": {}, "cached_at": 0.0, "stale": False}, ttl=60)
+
+    events = [SimpleNamespace(sport="NFL", game_id="g1")]
+    asyncio.run(cache_invalidation.invalidate_after_odds_changes(events, local=False))
+
+    assert l1.get("NFL:abc") is None
+    assert l1.get("NBA:def") is not None
+    l1.clear()
@@ -1,13 +1,21 @@
 """Tests for CacheManager stale fallback behavior."""
 
+import uuid
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from app.services import cache_manager as cache_manager_module
 from app.services.cache_manager import CacheManager
+from app.services.parlay_cache_hit_buffer import ParlayCacheHitBuffer
 
 
 @pytest.mark.asyncio
-async def test_cache_manager_returns_stale_when_no_fresh_cache():
+async def test_cache_manager_returns_stale_when_no_fresh_cache(monkeypatch):
+    buffer = ParlayCacheHitBuffer()
+    monkeypatch.setattr(cache_manager_module, "get_parlay_cache_hit_buffer", lambda: buffer)
+    CacheManager(AsyncMock()).clear_memory_cache()
+
     db = AsyncMock()
 
     # First query (fresh) returns nothing
@@ -16,8 +24,10 @@ async def test_cache_manager_returns_stale_when_no_fresh_cache():
 
     # Second query (stale) returns an entry
     stale_entry = MagicMock()
+    stale_entry.id = uuid.uuid4()
     stale_entry.cached_parlay_data = {"legs": [], "num_legs": 0}
     stale_entry.hit_count = 0
+    stale_entry.cached_at = None
     stale_entry.expires_at = None
 
     stale_result = MagicMock()
@@ -30,9 +40,13 @@ async def test_cache_manager_returns_stale_when_no_fresh_cache():
     result = await manager.get_cached_parlay(num_legs=5, risk_profile="balanced", sport="NFL", max_age_hours=6)
 
     assert result == {"legs": [], "num_legs": 0}
-    assert stale_entry.hit_count == 1
-    assert db.commit.await_count >= 1
-
-
-
-
+    # Hits are buffered, never committed on the read path.
+    assert buffer.pending() == {str(stale_entry.id): 1}
+    assert db.commit.await_count == 0
+
+    # A second manager (i.e. another request) is served from process memory.
+    again = await CacheManager(db).get_cached_parlay(num_legs=5, risk_profile="balanced", sport="NFL")
+    assert again == {"legs": [], "num_legs": 0}
+    assert db.execute.await_count == 2
+    assert buffer.pending() == {str(stale_entry.id): 2}
+    manager.clear_memory_cache()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import date, datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -10,6 +11,7 @@ import pytest
 
 from app.services.probability_engine_impl.candidate_leg_cache import (
     CandidateLegCache,
+    CandidateLegRefreshSpec,
     build_candidate_legs_cache_key,
     get_candidate_leg_cache,
 )
@@ -126,3 +128,101 @@ async def test_get_candidate_legs_cache_hit_bypasses_build(db):
     assert len(legs) == 2
     assert legs[0]["confidence_score"] == 80.0
     assert legs[1]["confidence_score"] == 70.0
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_by_get_entry_only():
+    """Past its TTL an entry is stale: get() misses, get_entry() still returns it for SWR."""
+    cache = _memory_only_cache()
+    key = "candidate_legs:v1:NFL:2025-02-06:all:0"
+    await cache._memory.set(key, {"fresh_until": time.time() - 1, "legs": [{"x": 1}]}, ttl=60)
+
+    assert await cache.get(key) is None
+    entry = await cache.get_entry(key)
+    assert entry is not None and entry.is_stale()
+    assert entry.legs == [{"x": 1}]
+
+
+def _stub_engine(db):
+    class _EngineStub:
+        sport_code = "NFL"
+
+        def __init__(self, db):
+            self.db = db
+
+    return _EngineStub(db)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_build_once(db):
+    """Single-flight: concurrent misses for one key run the build pipeline once."""
+    from app.services.probability_engine_impl.candidate_leg_service import CandidateLegService
+
+    cache = _memory_only_cache()
+    builds = []
+
+    async def _build(self, *, cache_key, cache_ttl, **_kwargs):
+        builds.append(cache_key)
+        await asyncio.sleep(0.05)
+        legs = [{"game_id": "1", "confidence_score": 70.0}]
+        await cache.set(cache_key, legs, ttl_seconds=cache_ttl)
+        return legs
+
+    with patch("app.services.probability_engine_impl.candidate_leg_service.get_candidate_leg_cache", return_value=cache), patch.object(
+        CandidateLegService, "_build_candidate_legs", _build
+    ):
+        service = CandidateLegService(engine=_stub_engine(db), repo=AsyncMock())
+        results = await asyncio.gather(
+            *[service.get_candidate_legs(sport="NFL", min_confidence=0.0, max_legs=5, week=None) for _ in range(5)]
+        )
+
+    assert len(builds) == 1
+    assert all(r == [{"game_id": "1", "confidence_score": 70.0}] for r in results)
+    assert not cache._flight_locks
+
+
+@pytest.mark.asyncio
+async def test_stale_hit_returns_cached_legs_and_refreshes_once(db):
+    """A stale hit is served immediately; one background refresh is scheduled per key."""
+    from app.services.probability_engine_impl.candidate_leg_service import CandidateLegService
+
+    cache = _memory_only_cache()
+    now_utc = datetime.now(timezone.utc)
+    key = build_candidate_legs_cache_key(
+        sport="NFL", date_utc=now_utc.date().isoformat(), week=None, include_player_props=False
+    )
+    await cache._memory.set(key, {"fresh_until": time.time() - 1, "legs": [{"game_id": "1", "confidence_score": 65.0}]}, ttl=60)
+    refreshed = []
+    release = asyncio.Event()
+
+    async def _refresh(spec, **_kwargs):
+        refreshed.append(spec)
+        await release.wait()
+
+    with patch("app.services.probability_engine_impl.candidate_leg_service.get_candidate_leg_cache", return_value=cache), patch(
+        "app.services.probability_engine_impl.candidate_leg_refresher.refresh_candidate_legs", _refresh
+    ):
+        service = CandidateLegService(engine=_stub_engine(db), repo=AsyncMock())
+        first = await service.get_candidate_legs(sport="NFL", min_confidence=55.0, max_legs=5, week=None, now_utc=now_utc)
+        second = await service.get_candidate_legs(sport="NFL", min_confidence=55.0, max_legs=5, week=None, now_utc=now_utc)
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*cache._refresh_tasks)
+
+    assert first == second == [{"game_id": "1", "confidence_score": 65.0}]
+    assert len(refreshed) == 1
+    assert refreshed[0] == CandidateLegRefreshSpec(sport="NFL", week=None, include_player_props=False, min_confidence=55.0)
+    assert not cache._refreshing
+
+
+@pytest.mark.asyncio
+async def test_refresh_specs_are_limited_to_requested_day():
+    cache = _memory_only_cache()
+    spec = CandidateLegRefreshSpec(sport="NBA", week=None, include_player_props=False, min_confidence=50.0)
+    await cache.remember_refresh_spec("candidate_legs:v1:NBA:2025-02-06:all:0", spec)
+    await cache.remember_refresh_spec("candidate_legs:v1:NBA:2025-02-05:all:0", spec)
+
+    specs = await cache.refresh_specs(date_utc="2025-02-06")
+
+    assert list(specs) == ["candidate_legs:v1:NBA:2025-02-06:all:0"]
+    assert list(cache._specs) == ["candidate_legs:v1:NBA:2025-02-06:all:0"]
@@ -88,12 +88,12 @@ async def test_candidate_leg_service_includes_espn_status_scheduled(db: AsyncSes
 
 
 def _cache_miss_cache():
-    """Cache that always misses (for tests that need full pipeline)."""
-    from unittest.mock import AsyncMock, MagicMock
-    c = MagicMock()
-    c.get = AsyncMock(return_value=None)
-    c.set = AsyncMock()
-    return c
+    """Empty in-memory cache (for tests that need full pipeline)."""
+    from unittest.mock import MagicMock
+    from app.services.probability_engine_impl.candidate_leg_cache import CandidateLegCache
+    provider = MagicMock()
+    provider.is_configured.return_value = False
+    return CandidateLegCache(provider=provider)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,113 @@
+"""Tests for the precomputed candidate pair (correlation/conflict) matrix."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from app.services.parlay_builder_impl.leg_selection_service import ParlayLegSelectionService
+from app.services.parlay_builder_impl.parlay_selection_optimizer import ParlaySelectionOptimizer
+from app.services.parlay_probability.candidate_pair_matrix import (
+    CandidatePairMatrix,
+    CandidatePairMatrixStore,
+)
+from app.services.parlay_probability.parlay_correlation_model import ParlayCorrelationModel
+from app.services.probability_engine_impl.candidate_leg_cache import ensure_candidate_pair_matrix
+
+
+def _pool():
+    legs = []
+    for g in range(12):
+        for i, (market_type, outcome) in enumerate(
+            [("h2h", "home"), ("h2h", "away"), ("spreads", "home"), ("totals", "over"), ("totals", "under")]
+        ):
+            legs.append(
+                {
+                    "game_id": f"g{g}",
+                    "market_id": f"m{g}-{i}",
+                    "market_type": market_type,
+                    "outcome": outcome,
+                    "ev_score": float((g * 37 + i * 11) % 23) / 10.0,
+                    "confidence_score": 60.0 + i,
+                }
+            )
+    return legs
+
+
+def test_matrix_matches_pairwise_model_and_conflicts():
+    selector = ParlayLegSelectionService()
+    model = ParlayCorrelationModel()
+    legs = _pool()
+
+    matrix = selector.build_pair_matrix(legs)
+
+    assert matrix.size == len(legs)
+    home, away, over = legs[0], legs[1], legs[3]
+    sub = matrix.correlation_submatrix([home, over])
+    assert sub[0, 0] == 1.0
+    assert sub[0, 1] == pytest.approx(model.estimate_latent_correlation(home, over))
+    assert matrix.conflict_submatrix([home, away]).tolist() == [[False, True], [True, False]]
+    # Cross-game pairs are never evaluated.
+    assert matrix.correlation_submatrix([legs[0], legs[5]])[0, 1] == 0.0
+
+
+def test_matrix_lookup_survives_json_round_trip_and_rejects_unknown_legs():
+    legs = _pool()
+    matrix = ParlayLegSelectionService().build_pair_matrix(legs)
+    copies = json.loads(json.dumps(legs[:4]))
+
+    assert matrix.indices(copies).tolist() == [0, 1, 2, 3]
+    assert matrix.indices(copies + [{"game_id": "gx", "market_id": "x"}]) is None
+
+
+def test_optimizer_selection_is_identical_with_precomputed_matrix():
+    selector = ParlayLegSelectionService()
+    optimizer = ParlaySelectionOptimizer(correlation_model=ParlayCorrelationModel())
+    legs = _pool()
+    matrix = selector.build_pair_matrix(legs)
+
+    kwargs = dict(
+        num_legs=5,
+        risk_profile="balanced",
+        conflict_checker=selector._conflicts_with_selected,
+        max_pair_corr=0.55,
+    )
+    subset = legs[::2]
+    assert optimizer.select(candidates=subset, pair_matrix=matrix, **kwargs) == optimizer.select(
+        candidates=subset, **kwargs
+    )
+
+
+def test_store_find_returns_covering_matrix_and_expires():
+    store = CandidatePairMatrixStore()
+    legs = _pool()
+    first = CandidatePairMatrix.build(
+        legs[:10], correlation_model=ParlayCorrelationModel(), conflict_checker=lambda _l, _s: False
+    )
+    store.put("k1", first, ttl_seconds=60)
+
+    assert store.find(legs[:3]) is first
+    assert store.find(legs[9:11]) is None
+
+    store.put("k2", first, ttl_seconds=60)
+    store._entries["k2"] = (first, 0.0)  # force expiry
+    assert store.get("k2") is None
+
+
+def test_ensure_candidate_pair_matrix_builds_once_per_key(monkeypatch):
+    store = CandidatePairMatrixStore()
+    monkeypatch.setattr(
+        "app.services.parlay_probability.candidate_pair_matrix.get_candidate_pair_matrix_store",
+        lambda: store,
+    )
+    legs = _pool()
+
+    ensure_candidate_pair_matrix("candidate_legs:v1:NFL:x", legs, ttl_seconds=60)
+    built = store.get("candidate_legs:v1:NFL:x")
+    ensure_candidate_pair_matrix("candidate_legs:v1:NFL:x", legs, ttl_seconds=60)
+
+    assert built is not None
+    assert store.get("candidate_legs:v1:NFL:x") is built
+    assert isinstance(built.corr, np.ndarray)
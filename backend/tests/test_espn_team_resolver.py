@@ -129,7 +129,7 @@ async def test_resolve_team_ref_uses_espn_resolver_when_teams_returned():
             {"team": {"id": "10", "displayName": "Seattle Seahawks", "links": []}},
         ]
     }
-    with patch("app.services.espn.espn_team_resolver.httpx.AsyncClient") as mock_client:
+    with patch("app.services.espn.espn_team_resolver.pooled_http_session") as mock_client:
         mock_get = AsyncMock()
         mock_get.return_value.status_code = 200
         mock_get.return_value.json = MagicMock(return_value=mock_response)
@@ -145,7 +145,7 @@ async def test_resolve_team_ref_uses_espn_resolver_when_teams_returned():
 async def test_resolve_team_ref_returns_none_on_http_error():
     """resolve_team_ref returns None when API returns non-200."""
     resolver = EspnTeamResolver()
-    with patch("app.services.espn.espn_team_resolver.httpx.AsyncClient") as mock_client:
+    with patch("app.services.espn.espn_team_resolver.pooled_http_session") as mock_client:
         mock_get = AsyncMock()
         mock_get.return_value.status_code = 404
         mock_client.return_value.__aenter__.return_value.get = mock_get
@@ -157,7 +157,7 @@ async def test_resolve_team_ref_returns_none_on_http_error():
 async def test_resolve_team_ref_returns_none_on_empty_teams():
     """resolve_team_ref returns None when API returns empty teams list."""
     resolver = EspnTeamResolver()
-    with patch("app.services.espn.espn_team_resolver.httpx.AsyncClient") as mock_client:
+    with patch("app.services.espn.espn_team_resolver.pooled_http_session") as mock_client:
         mock_get = AsyncMock()
         mock_get.return_value.status_code = 200
         mock_get.return_value.json = MagicMock(return_value={"teams": []})
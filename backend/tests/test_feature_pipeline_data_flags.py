@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -7,6 +7,7 @@ from app.services.feature_pipeline import (
     FeaturePipeline,
     HOME_ADVANTAGE_BY_SPORT,
     MatchupFeatureVector,
+    SlateMatchup,
 )
 
 
@@ -54,6 +55,30 @@ async def test_feature_pipeline_marks_injuries_when_payload_exists():
     assert features.key_players_out_home == ["Player A"]
 
 
+@pytest.mark.asyncio
+async def test_slate_features_fetch_each_team_once():
+    pipeline = FeaturePipeline(db=None)
+    espn = MagicMock()
+    espn.scrape_team_stats = AsyncMock(return_value={"record": {"win_percentage": 0.6}})
+    espn.scrape_recent_games = AsyncMock(return_value=[{"result": "W"}])
+    espn.scrape_matchup_context = AsyncMock(return_value=None)
+    pipeline._espn_scraper = espn
+    pipeline._fetch_injuries_many = AsyncMock(return_value={})
+
+    games = [
+        SlateMatchup(home_team="A", away_team="B", sport="NBA"),
+        SlateMatchup(home_team="C", away_team="A", sport="NBA"),
+        SlateMatchup(home_team="B", away_team="C", sport="NBA"),
+    ]
+    vectors = await pipeline.build_slate_features(games)
+
+    assert [(v.home_team, v.away_team) for v in vectors] == [("A", "B"), ("C", "A"), ("B", "C")]
+    assert all(v.has_stats_data for v in vectors)
+    assert espn.scrape_team_stats.await_count == 3
+    assert espn.scrape_recent_games.await_count == 3
+    assert espn.scrape_matchup_context.await_count == 3
+
+
 def test_feature_pipeline_wnba_normalization_and_home_advantage():
     pipeline = FeaturePipeline(db=None)
 
@@ -0,0 +1,103 @@
+"""Tests for the durable full-article job queue (DB backend) and its worker."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.database.session import AsyncSessionLocal
+from app.models.full_article_job import FullArticleJob
+from app.models.game import Game
+from app.models.game_analysis import GameAnalysis
+from app.services.analysis import full_article_job_queue as queue_module
+from app.services.analysis.full_article_job_queue import FullArticleJobQueue
+from app.workers.full_article_worker import FullArticleWorker
+
+
+class _NoRedis:
+    def is_configured(self) -> bool:
+        return False
+
+
+def _queue() -> FullArticleJobQueue:
+    return FullArticleJobQueue(provider=_NoRedis(), session_factory=AsyncSessionLocal)
+
+
+async def _analysis(db, key: str) -> GameAnalysis:
+    game = Game(
+        external_game_id=key,
+        sport="NFL",
+        home_team="Home Team",
+        away_team="Away Team",
+        start_time=datetime.now(timezone.utc) + timedelta(days=1),
+        status="scheduled",
+    )
+    db.add(game)
+    await db.flush()
+    analysis = GameAnalysis(
+        game_id=game.id,
+        league="NFL",
+        slug=f"nfl/{key}",
+        matchup="Away Team @ Home Team",
+        analysis_content={},
+    )
+    db.add(analysis)
+    await db.commit()
+    return analysis
+
+
+@pytest.mark.asyncio
+async def test_enqueue_dedupes_and_claim_marks_processing(db):
+    analysis = await _analysis(db, "article_jobs_1")
+    queue = _queue()
+    assert await queue.enqueue([str(analysis.id)]) == 1
+    assert await queue.enqueue([str(analysis.id)]) == 0
+
+    claimed = await queue.claim(10)
+    assert [job.analysis_id for job in claimed] == [str(analysis.id)]
+    assert claimed[0].attempts == 1
+    assert await queue.claim(10) == []
+    assert await queue.depth() == {"queued": 0, "processing": 1}
+
+    await queue.complete(claimed[0])
+    assert (await db.execute(select(FullArticleJob))).scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_retry_backs_off_and_drops_after_max_attempts(db, monkeypatch):
+    analysis = await _analysis(db, "article_jobs_2")
+    queue = _queue()
+    await queue.enqueue([str(analysis.id)])
+
+    job = (await queue.claim(10))[0]
+    assert await queue.retry(job, "timeout") is True
+    # Backoff: not due yet
+    assert await queue.claim(10) == []
+    assert await queue.depth() == {"queued": 1, "processing": 0}
+
+    monkeypatch.setattr(queue_module, "MAX_ATTEMPTS", 1)
+    assert await queue.retry(job, "timeout") is False
+    assert await queue.depth() == {"queued": 0, "processing": 0}
+
+
+@pytest.mark.asyncio
+async def test_worker_acks_done_jobs_and_requeues_failures(db):
+    ok = await _analysis(db, "article_jobs_ok")
+    failing = await _analysis(db, "article_jobs_fail")
+    queue = _queue()
+    await queue.enqueue([str(ok.id), str(failing.id)])
+
+    class _Runner:
+        async def run_job(self, *, analysis_id: str) -> bool:
+            return analysis_id == str(ok.id)
+
+    worker = FullArticleWorker(queue=queue, runner=_Runner(), concurrency=4)
+    assert await worker.process_available() == 2
+    await worker.drain()
+
+    rows = (await db.execute(select(FullArticleJob))).scalars().all()
+    assert [str(row.analysis_id) for row in rows] == [str(failing.id)]
+    assert rows[0].status == "queued"
+    assert rows[0].last_error == "generation failed or timed out"
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.api.routes.games_response_cache import GamesResponseCache, encode_games_list, meta_fingerprint
+from app.schemas.game import GameResponse
+
+_META = {
+    "sport_state": "IN_SEASON",
+    "next_game_at": None,
+    "status_label": "In season",
+    "days_to_next": 0,
+    "preseason_enable_days": 14,
+}
+
+
+def _game(game_id: str, start_time: datetime) -> GameResponse:
+    return GameResponse(
+        id=game_id,
+        external_game_id=f"odds:nba:{game_id}",
+        sport="NBA",
+        home_team="Home",
+        away_team="Away",
+        start_time=start_time,
+        status="scheduled",
+        markets=[],
+    )
+
+
+def test_encoded_entry_is_reused_until_a_game_crosses_the_window():
+    now = datetime(2026, 1, 10, 12, tzinfo=timezone.utc)
+    games = [
+        _game("old", now - timedelta(hours=10)),
+        _game("live", now - timedelta(hours=2)),
+        _game("later", now + timedelta(days=9)),
+        _game("far", now + timedelta(days=11)),
+    ]
+    start, end = now - timedelta(hours=6), now + timedelta(days=10)
+    entry = encode_games_list(games, _META, start, end)
+
+    body = json.loads(gzip.decompress(entry.body_gzip))
+    assert [g["id"] for g in body["games"]] == ["live", "later"]
+    assert entry.etag.startswith('"') and entry.etag.endswith('"')
+    assert encode_games_list(games, _META, start, end).etag == entry.etag
+    assert entry.body == gzip.decompress(entry.body_gzip)
+    assert entry.etag_gzip != entry.etag and entry.etag_gzip.endswith('-gz"')
+
+    cache = GamesResponseCache(ttl_seconds=60)
+    cache.set("nba", games)
+    fp = meta_fingerprint(_META)
+    cache.set_encoded("nba", fp, entry)
+
+    shift = timedelta(hours=3)
+    assert cache.get_encoded("nba", fp, start + shift, end + shift) is entry
+    # "live" drops out of the window once it is more than 6h old.
+    shift = timedelta(hours=5)
+    assert cache.get_encoded("nba", fp, start + shift, end + shift) is None
+    # "far" enters once the window end reaches it.
+    shift = timedelta(days=1)
+    assert cache.get_encoded("nba", fp, start, end + shift) is None
+
+    cache.invalidate_sport("nba")
+    assert cache.get_encoded("nba", fp, start, end) is None
+
+
+@pytest.mark.asyncio
+async def test_games_route_serves_etag_and_304(client, monkeypatch):
+    import app.api.routes.games_public_routes as routes
+
+    now = datetime.now(timezone.utc)
+    calls = []
+
+    async def _fake_get_sport_state(db, sport_code, now):
+        _ = db, sport_code, now
+        return {"sport_state": "IN_SEASON", "next_game_at": None, "days_to_next": 0, "preseason_enable_days": 14}
+
+    class _FakeFetcher:
+        def __init__(self, db):
+            _ = db
+
+        async def get_or_fetch_games(self, sport_identifier: str, **kwargs):
+            calls.append(sport_identifier)
+            return [_game("1", now + timedelta(hours=1))]
+
+    monkeypatch.setattr(routes, "get_sport_state", _fake_get_sport_state)
+    monkeypatch.setattr(routes, "OddsFetcherService", _FakeFetcher)
+    routes.games_response_cache.clear()
+
+    first = await client.get("/api/sports/nba/games")
+    assert first.status_code == 200
+    assert [g["id"] for g in first.json()["games"]] == ["1"]
+    etag = first.headers["etag"]
+    assert first.headers["content-encoding"] == "gzip"
+    assert etag.endswith('-gz"')
+
+    identity = await client.get(
+        "/api/sports/nba/games", headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert identity.status_code == 200
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] != etag
+    assert identity.json() == first.json()
+
+    second = await client.get("/api/sports/nba/games", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert calls == ["nba"]
+
+    routes.games_response_cache.invalidate_sport("nba")
+    third = await client.get("/api/sports/nba/games", headers={"If-None-Match": etag})
+    assert third.status_code == 304
+    assert calls == ["nba", "nba"]
+    routes.games_response_cache.clear()
@@ -1,5 +1,6 @@
 """Tests for Gorilla Bot chat API."""
 
+import json
 import pytest
 import uuid
 from datetime import datetime, timezone
@@ -39,3 +40,42 @@ async def test_gorilla_bot_chat_creates_conversation(client, db):
     messages = await db.execute(select(GorillaBotMessage))
     assert len(conversations.scalars().all()) == 1
     assert len(messages.scalars().all()) == 2
+
+
+@pytest.mark.asyncio
+async def test_gorilla_bot_chat_stream_emits_tokens_and_persists_reply(client, db):
+    user = User(
+        id=uuid.uuid4(),
+        email=f"gorilla-bot-stream-{uuid.uuid4()}@example.com",
+        account_number=uuid.uuid4().hex[:20],
+        password_hash=get_password_hash("testpass123"),
+        created_at=datetime.now(timezone.utc),
+    )
+    db.add(user)
+    await db.commit()
+
+    token = create_access_token({"sub": str(user.id), "email": user.email})
+    response = await client.post(
+        "/api/gorilla-bot/chat/stream",
+        json={"message": "How do free parlay limits work?"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = []
+    for frame in response.text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+
+    names = [name for name, _ in events]
+    assert names[0] == "start" and names[-1] == "done"
+    assert "token" in names
+    done = events[-1][1]
+    assert done["conversation_id"] == events[0][1]["conversation_id"]
+    assert "remaining" in done["reply"].lower()
+
+    messages = await db.execute(select(GorillaBotMessage))
+    stored = messages.scalars().all()
+    assert sorted(m.role for m in stored) == ["assistant", "user"]
+    assert any(str(m.id) == done["message_id"] for m in stored)
@@ -1,10 +1,11 @@
-"""Tests for Gorilla Bot retriever ordering."""
+"""Tests for Gorilla Bot retriever ordering and the in-process vector index."""
 
 import pytest
 
 from app.models.gorilla_bot_kb_document import GorillaBotKnowledgeDocument
 from app.models.gorilla_bot_kb_chunk import GorillaBotKnowledgeChunk
 from app.services.gorilla_bot.kb_retriever import GorillaBotKnowledgeRetriever
+from app.services.gorilla_bot.kb_vector_index import GorillaBotVectorIndex
 
 
 class FakeOpenAIClient:
@@ -46,3 +47,68 @@ async def test_retriever_orders_by_similarity(db):
 
     assert results
     assert results[0].content == "Chunk A"
+
+
+async def _add_document(db, path: str, checksum: str, embeddings):
+    document = GorillaBotKnowledgeDocument(source_path=path, title=path, checksum=checksum, is_active=True)
+    db.add(document)
+    await db.flush()
+    db.add_all(
+        [
+            GorillaBotKnowledgeChunk(
+                document_id=document.id,
+                chunk_index=i,
+                content=f"{path}#{i}",
+                embedding_json=embedding,
+            )
+            for i, embedding in enumerate(embeddings)
+        ]
+    )
+    await db.commit()
+    return document
+
+
+@pytest.mark.asyncio
+async def test_vector_index_returns_top_k_by_cosine(db):
+    await _add_document(db, "docs/a.md", "a1", [[1.0, 0.0], [0.6, 0.8], [0.0, 1.0], None, [-1.0, 0.0]])
+    index = GorillaBotVectorIndex(refresh_seconds=0)
+    await index.sync(db)
+
+    results = index.search([2.0, 0.0], limit=3)
+
+    assert [r.content for r in results] == ["docs/a.md#0", "docs/a.md#1", "docs/a.md#2"]
+    assert results[0].score == pytest.approx(1.0)
+    assert results[1].score == pytest.approx(0.6)
+    assert len(index.search([1.0, 0.0], limit=10)) == 5  # chunk without embedding scores 0.0
+
+
+@pytest.mark.asyncio
+async def test_vector_index_reloads_only_changed_documents(db):
+    doc_a = await _add_document(db, "docs/a.md", "a1", [[1.0, 0.0]])
+    doc_b = await _add_document(db, "docs/b.md", "b1", [[0.0, 1.0]])
+    index = GorillaBotVectorIndex(refresh_seconds=3600)
+    assert await index.sync(db) is True
+    assert await index.sync(db) is False  # checksums unchanged
+
+    doc_b.checksum = "b2"
+    (await db.get(GorillaBotKnowledgeChunk, (await _chunk_ids(db, doc_b.id))[0])).embedding_json = [1.0, 1.0]
+    doc_a.is_active = False
+    await db.commit()
+
+    await index.ensure_fresh(db)  # throttled: still the old view
+    assert [r.content for r in index.search([1.0, 0.0], limit=1)] == ["docs/a.md#0"]
+
+    index.invalidate()
+    await index.ensure_fresh(db)
+    results = index.search([1.0, 0.0], limit=5)
+    assert [r.content for r in results] == ["docs/b.md#0"]
+    assert results[0].score == pytest.approx(2 ** -0.5)
+
+
+async def _chunk_ids(db, document_id):
+    from sqlalchemy import select
+
+    result = await db.execute(
+        select(GorillaBotKnowledgeChunk.id).where(GorillaBotKnowledgeChunk.document_id == document_id)
+    )
+    return result.scalars().all()
@@ -0,0 +1,194 @@
+"""Tests for the memoized same-game joint probability cache."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.parlay_probability.correlated_parlay_probability_calculator import (
+    CorrelatedParlayProbabilityCalculator,
+)
+from app.services.parlay_probability.joint_probability_cache import PREFIX, JointProbabilityCache
+from app.services.parlay_probability.parlay_correlation_model import ParlayCorrelationModel
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store = {}
+
+    async def get(self, key):
+        value = self.store.get(key)
+        return value if isinstance(value, bytes) else None
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+    async def sadd(self, key, *members):
+        self.store.setdefault(key, set()).update(members)
+        return len(members)
+
+    async def expire(self, key, seconds):
+        return key in self.store
+
+    async def smembers(self, key):
+        return set(self.store.get(key, set()))
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+    def scan_iter(self, *args, **kwargs):
+        raise AssertionError("invalidation must not scan the keyspace")
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client: _FakeRedis) -> None:
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((getattr(self._client, name), args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        return [await fn(*args, **kwargs) for fn, args, kwargs in self._calls]
+
+
+def _provider(client):
+    provider = MagicMock()
+    provider.is_configured.return_value = True
+    provider.get_client.return_value = client
+    return provider
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _legs(game_id: str = "g1", home_prob: float = 0.62, over_prob: float = 0.55):
+    return [
+        {"game_id": game_id, "market_id": "m1", "market_type": "h2h", "outcome": "home", "adjusted_prob": home_prob},
+        {"game_id": game_id, "market_id": "m2", "market_type": "totals", "outcome": "over", "point": 47.5, "adjusted_prob": over_prob},
+    ]
+
+
+def test_key_is_order_invariant_and_bucketed():
+    cache = JointProbabilityCache(probability_bucket=0.01)
+    legs = _legs()
+    key = cache.build_key(game_id="g1", risk_profile="balanced", legs=legs, probabilities=[0.62, 0.55])
+
+    assert key == cache.build_key(game_id="g1", risk_profile="BALANCED", legs=legs[::-1], probabilities=[0.55, 0.62])
+    assert key == cache.build_key(game_id="g1", risk_profile="balanced", legs=legs, probabilities=[0.621, 0.549])
+    assert key != cache.build_key(game_id="g1", risk_profile="degen", legs=legs, probabilities=[0.62, 0.55])
+    assert key != cache.build_key(game_id="g1", risk_profile="balanced", legs=legs, probabilities=[0.66, 0.55])
+
+
+def test_lru_eviction_and_ttl_expiry():
+    clock = _Clock()
+    cache = JointProbabilityCache(max_entries=2, ttl_seconds=60, clock=clock)
+    cache.set("a", 1.1)
+    cache.set("b", 1.2)
+    assert cache.get("a") == 1.1  # "a" is now most recently used
+    cache.set("c", 1.3)
+
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+    clock.now += 61
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+
+
+def test_invalidate_games_only_drops_that_game():
+    cache = JointProbabilityCache()
+    k1 = cache.build_key(game_id="g1", risk_profile="balanced", legs=_legs("g1"), probabilities=[0.6, 0.5])
+    k2 = cache.build_key(game_id="g2", risk_profile="balanced", legs=_legs("g2"), probabilities=[0.6, 0.5])
+    cache.set(k1, 1.1)
+    cache.set(k2, 1.2)
+
+    assert cache.invalidate_games(["g1"]) == 1
+    assert cache.peek(k1) is None
+    assert cache.peek(k2) == 1.2
+
+
+def test_calculator_hits_cache_and_matches_uncached_result():
+    cache = JointProbabilityCache()
+    cached = CorrelatedParlayProbabilityCalculator(ParlayCorrelationModel(), joint_cache=cache)
+    uncached = CorrelatedParlayProbabilityCalculator(ParlayCorrelationModel())
+
+    first = cached.calculate(_legs(), risk_profile="balanced")
+    second = cached.calculate(_legs()[::-1], risk_profile="balanced")
+
+    assert first == pytest.approx(uncached.calculate(_legs(), risk_profile="balanced"), abs=1e-12)
+    assert second == pytest.approx(first, abs=1e-12)
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_calculator_rescales_lift_by_exact_marginals_within_bucket():
+    cache = JointProbabilityCache(probability_bucket=0.01)
+    calc = CorrelatedParlayProbabilityCalculator(ParlayCorrelationModel(), joint_cache=cache)
+    uncached = CorrelatedParlayProbabilityCalculator(ParlayCorrelationModel())
+
+    calc.calculate(_legs(home_prob=0.620), risk_profile="balanced")
+    nearby = calc.calculate(_legs(home_prob=0.622), risk_profile="balanced")
+
+    assert cache.stats()["hits"] == 1
+    assert nearby == pytest.approx(uncached.calculate(_legs(home_prob=0.622), risk_profile="balanced"), abs=1e-4)
+
+
+def test_calculator_skips_cache_for_explicit_seed():
+    cache = JointProbabilityCache()
+    calc = CorrelatedParlayProbabilityCalculator(ParlayCorrelationModel(), joint_cache=cache)
+
+    calc.calculate(_legs(), risk_profile="balanced", rng_seed=7)
+
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_calculate_async_publishes_miss_to_redis_and_reads_shared_hit():
+    client = _FakeRedis()
+    provider = _provider(client)
+
+    writer = CorrelatedParlayProbabilityCalculator(
+        ParlayCorrelationModel(),
+        joint_cache=JointProbabilityCache(shared_enabled=True, provider=provider),
+    )
+    p1 = await writer.calculate_async(_legs(), risk_profile="balanced")
+    assert len([k for k in client.store if k.startswith(PREFIX)]) == 1
+
+    reader_cache = JointProbabilityCache(shared_enabled=True, provider=provider)
+    reader = CorrelatedParlayProbabilityCalculator(ParlayCorrelationModel(), joint_cache=reader_cache)
+    p2 = await reader.calculate_async(_legs(), risk_profile="balanced")
+
+    assert p2 == pytest.approx(p1, abs=1e-12)
+    assert reader_cache.stats()["shared_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_invalidation_uses_per_game_key_index():
+    client = _FakeRedis()
+    cache = JointProbabilityCache(shared_enabled=True, provider=_provider(client))
+    k1 = cache.build_key(game_id="g1", risk_profile="balanced", legs=_legs("g1"), probabilities=[0.6, 0.5])
+    k2 = cache.build_key(game_id="g2", risk_profile="balanced", legs=_legs("g2"), probabilities=[0.6, 0.5])
+    await cache.set_shared(k1, 1.05)
+    await cache.set_shared(k2, 1.07)
+
+    await cache.invalidate_games_shared(["g1"])
+
+    assert k1 not in client.store
+    assert client.store[k2] == repr(1.07).encode("utf-8")
+    assert await cache.get_shared(k1) is None
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+from scipy.stats import multivariate_normal
+
+from app.services.parlay_probability.correlated_parlay_probability_calculator import (
+    CorrelatedParlayProbabilityCalculator,
+)
+from app.services.parlay_probability.joint_probability_engine import JointProbabilityEngine
+
+
+def _equicorrelated(n: int, rho: float) -> np.ndarray:
+    return np.array([[1.0 if i == j else rho for j in range(n)] for i in range(n)], dtype=float)
+
+
+def _reference(b: np.ndarray, R: np.ndarray) -> float:
+    return float(
+        multivariate_normal(mean=np.zeros(len(b)), cov=R, abseps=1e-8, releps=1e-8, maxpts=1_000_000).cdf(b)
+    )
+
+
+@pytest.mark.parametrize("rho", [-0.5, 0.0, 0.35, 0.9, 0.99])
+def test_exact_bivariate_matches_reference(rho):
+    engine = JointProbabilityEngine(method="exact")
+    b = np.array([0.3, -0.2])
+    R = _equicorrelated(2, rho)
+
+    est = engine.estimate(b, R, max_samples=0, seed=0)
+
+    assert est is not None
+    assert est.method == "exact"
+    assert est.samples == 0
+    assert est.probability == pytest.approx(_reference(b, R), abs=1e-6)
+
+
+def test_exact_trivariate_matches_reference():
+    engine = JointProbabilityEngine(method="exact")
+    b = np.array([0.5, -0.4, 1.1])
+    R = np.array([[1.0, 0.41, 0.12], [0.41, 1.0, 0.18], [0.12, 0.18, 1.0]])
+
+    est = engine.estimate(b, R, max_samples=0, seed=0)
+
+    assert est is not None
+    assert est.probability == pytest.approx(_reference(b, R), abs=1e-6)
+    assert est.error_bound < 1e-6
+
+
+def test_qmc_stays_within_reported_error_bound_with_small_budget():
+    engine = JointProbabilityEngine(method="qmc")
+    b = np.array([0.2, -0.1, 0.4, 0.0, 0.3, -0.3, 0.1])
+    R = _equicorrelated(7, 0.3)
+
+    est = engine.estimate(b, R, max_samples=7000, seed=42)
+
+    assert est is not None
+    assert est.method == "qmc"
+    assert est.samples <= 7000
+    assert abs(est.probability - _reference(b, R)) <= max(est.error_bound, 1e-4)
+
+
+def test_qmc_is_deterministic_for_seed():
+    engine = JointProbabilityEngine(method="qmc")
+    b = np.array([0.2, -0.1, 0.4, 0.0])
+    R = _equicorrelated(4, 0.4)
+
+    a = engine.estimate(b, R, max_samples=5000, seed=7)
+    c = engine.estimate(b, R, max_samples=5000, seed=7)
+    assert a == c
+
+
+def test_auto_uses_exact_for_small_groups_and_qmc_for_large():
+    engine = JointProbabilityEngine()
+    small = engine.estimate(np.zeros(3), _equicorrelated(3, 0.2), max_samples=5000, seed=1)
+    large = engine.estimate(np.zeros(6), _equicorrelated(6, 0.2), max_samples=5000, seed=1)
+    assert small is not None and small.method == "exact"
+    assert large is not None and large.method == "qmc"
+
+
+def test_mc_reference_reports_binomial_error_bound():
+    engine = JointProbabilityEngine(method="mc")
+    b = np.array([0.3, 0.1])
+    R = _equicorrelated(2, 0.5)
+
+    est = engine.estimate(b, R, max_samples=20000, seed=3)
+
+    assert est is not None
+    assert est.samples == 20000
+    assert abs(est.probability - _reference(b, R)) <= est.error_bound
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        JointProbabilityEngine(method="magic")
+
+
+def test_long_same_game_parlay_is_not_zero_and_beats_independence():
+    # 10 correlated long-shot legs: plain MC with a few thousand samples rarely sees a hit.
+    legs = [
+        {"game_id": "g1", "market_type": "h2h", "outcome": f"home_{i}", "market_id": str(i), "adjusted_prob": 0.30}
+        for i in range(10)
+    ]
+
+    class _Rho:
+        def build_correlation_matrix(self, group):
+            return _equicorrelated(len(group), 0.5).tolist()
+
+    calc = CorrelatedParlayProbabilityCalculator(_Rho())
+    prob = calc.calculate(legs, risk_profile="degen")
+
+    assert prob > 0.30**10
+    assert prob < 0.30
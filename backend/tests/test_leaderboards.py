@@ -10,6 +10,7 @@ from app.models.saved_parlay import SavedParlay
 from app.models.saved_parlay_results import SavedParlayResult
 from app.models.user import User
 from app.models.verification_record import VerificationRecord, VerificationStatus
+from app.services.leaderboards.leaderboard_totals_service import LeaderboardTotalsService
 
 
 async def _register_and_profile(client: AsyncClient, *, email: str, display_name: str) -> str:
@@ -172,6 +173,8 @@ async def test_verified_winners_leaderboard_qualification_and_sorting(client: As
     for r in results:
         db.add(r)
     await db.commit()
+    # Rows were inserted directly (no resolve hook), so sync the totals as the scheduler would.
+    await LeaderboardTotalsService(db).rebuild()
 
     lb = await client.get("/api/leaderboards/custom?limit=10")
     assert lb.status_code == 200, lb.text
@@ -246,6 +249,9 @@ async def test_ai_usage_leaderboard_counts_parlays_and_custom_saves(client: Asyn
         )
         assert resp.status_code == 200
 
+    # Parlays were inserted directly (no generation hook), so sync the totals as the scheduler would.
+    await LeaderboardTotalsService(db).rebuild()
+
     lb = await client.get("/api/leaderboards/ai-usage?period=all_time&limit=10")
     assert lb.status_code == 200, lb.text
     data = lb.json()
@@ -262,3 +268,62 @@ async def test_ai_usage_leaderboard_counts_parlays_and_custom_saves(client: Asyn
     assert second["ai_parlays_generated"] == 9
 
 
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_totals_update_incrementally(client: AsyncClient, db: AsyncSession):
+    email = "incremental@test.com"
+    token = await _register_and_profile(client, email=email, display_name="FreshApe")
+
+    save = await client.post(
+        "/api/parlays/custom/save",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "title": "Inc",
+            "legs": [{"game_id": "00000000-0000-0000-0000-000000000005", "pick": "home", "market_type": "spreads", "point": -2.5}],
+        },
+    )
+    assert save.status_code == 200, save.text
+
+    # The save counted toward AI usage without a rebuild.
+    usage = (await client.get("/api/leaderboards/ai-usage?period=30d&limit=10")).json()
+    assert [(e["username"], e["ai_parlays_generated"]) for e in usage["leaderboard"]] == [("FreshApe", 1)]
+
+    saved = (await db.execute(select(SavedParlay).where(SavedParlay.id == save.json()["id"]))).scalar_one()
+    db.add(
+        VerificationRecord(
+            id=uuid.uuid4(),
+            user_id=saved.user_id,
+            saved_parlay_id=saved.id,
+            data_hash=str(saved.content_hash),
+            status=VerificationStatus.confirmed.value,
+            tx_digest="tx-inc",
+            network="mainnet",
+            quota_consumed=True,
+            credits_consumed=False,
+        )
+    )
+    db.add(
+        SavedParlayResult(
+            saved_parlay_id=saved.id,
+            user_id=saved.user_id,
+            parlay_type="custom",
+            num_legs=1,
+            hit=True,
+            legs_hit=1,
+            legs_missed=0,
+            leg_results=[{"status": "hit"}],
+            resolved_at=datetime.now(timezone.utc),
+        )
+    )
+    await db.commit()
+
+    assert (await client.get("/api/leaderboards/custom?limit=10")).json()["leaderboard"] == []
+
+    await LeaderboardTotalsService(db).refresh_verified_winners([saved.user_id])
+    winners = (await client.get("/api/leaderboards/custom?limit=10")).json()["leaderboard"]
+    assert len(winners) == 1
+    assert winners[0]["username"] == "FreshApe"
+    assert winners[0]["verified_wins"] == 1
+    assert winners[0]["win_rate"] == 1.0
+    assert winners[0]["inscription_id"] == "tx-inc"
@@ -0,0 +1,33 @@
+"""Process-wide model inputs snapshot: reused across reads, reloaded after a version bump."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import update
+
+from app.models.strategy_weight import StrategyWeight
+from app.services.institutional.model_inputs_snapshot import bump_model_inputs_version
+from app.services.institutional.strategy_constants import ALL_STRATEGIES, STRATEGY_BASE_MODEL, STRATEGY_CLV
+from app.services.institutional.strategy_decomposition_service import StrategyDecompositionService
+
+
+@pytest.mark.asyncio
+async def test_strategy_weights_served_from_snapshot_until_bump(db):
+    db.add_all([StrategyWeight(strategy_name=name, weight=1.0) for name in ALL_STRATEGIES])
+    await db.commit()
+
+    service = StrategyDecompositionService(db)
+    first = await service.get_weights()
+    assert first[STRATEGY_BASE_MODEL] == pytest.approx(first[STRATEGY_CLV])
+
+    await db.execute(
+        update(StrategyWeight).where(StrategyWeight.strategy_name == STRATEGY_CLV).values(weight=3.0)
+    )
+    await db.commit()
+
+    # Snapshot still current: no DB reload
+    assert await service.get_weights() == first
+
+    await bump_model_inputs_version()
+    reloaded = await service.get_weights()
+    assert reloaded[STRATEGY_CLV] > reloaded[STRATEGY_BASE_MODEL]
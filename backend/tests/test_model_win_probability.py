@@ -429,6 +429,91 @@ class TestSportSpecificAdjustments:
             assert nhl_result["home_model_prob"] > nhl_baseline["home_model_prob"]
 
 
+class TestSlateScoring:
+    """Batch scoring against hand-computed expectations."""
+
+    @pytest.mark.asyncio
+    async def test_batch_scores_each_game(self):
+        mock_db = MagicMock()
+        with patch('app.services.model_win_probability.get_probability_engine') as mock_engine:
+            mock_engine.return_value = MagicMock()
+            calculator = ModelWinProbabilityCalculator(mock_db, "NBA")
+
+        items = [
+            (
+                {"home_fair_prob": 0.55, "away_fair_prob": 0.45},
+                TeamMatchupStats(
+                    home_team_stats={"wins": 30, "losses": 10},
+                    away_team_stats={"wins": 15, "losses": 25},
+                    rest_days_home=2,
+                    rest_days_away=0,
+                    home_team_name="A",
+                    away_team_name="B",
+                    sport="NBA",
+                ),
+                {"home_ml": "-130"},
+            ),
+            (
+                {"home_fair_prob": 0.4, "away_fair_prob": 0.6},
+                TeamMatchupStats(home_team_name="C", away_team_name="A", sport="NBA"),
+                None,
+            ),
+        ]
+
+        with patch(
+            'app.alpha.model_augmentation_service.ModelAugmentationService.get_validated_alpha_contributions',
+            new=AsyncMock(return_value=[]),
+        ):
+            batch = await calculator.compute_model_win_probabilities_batch(items)
+
+        # Game 1: stats 0.375 * 0.18 = 0.0675, rest +0.01, home court 0.035
+        #   0.55*0.5 + 0.6175*0.3 + 0.595*0.2 + 0.1125*0.3 = 0.613
+        #   confidence: quality 15 + 10 + 10 + 2.5 = 37.5, edge 0.063 * 500 = 31.5
+        assert batch[0]["home_model_prob"] == pytest.approx(0.613, abs=1e-4)
+        assert batch[0]["away_model_prob"] == pytest.approx(0.387, abs=1e-4)
+        assert batch[0]["data_quality_score"] == pytest.approx(37.5)
+        assert batch[0]["ai_confidence"] == pytest.approx(69.0)
+        assert batch[0]["calculation_method"] == "odds_and_stats"
+
+        # Game 2: home court only: 0.4*0.8 + 0.435*0.2 + 0.035*0.3 = 0.4175; edge floor 10
+        assert batch[1]["home_model_prob"] == pytest.approx(0.4175, abs=1e-4)
+        assert batch[1]["away_model_prob"] == pytest.approx(0.5825, abs=1e-4)
+        assert batch[1]["ai_confidence"] == pytest.approx(10.0)
+        assert batch[1]["calculation_method"] == "minimal_data"
+
+    @pytest.mark.asyncio
+    async def test_slate_builds_missing_matchup_data_with_feature_pipeline(self):
+        from app.services import model_win_probability as mwp
+
+        built = [{"home_team_stats": {"wins": 30, "losses": 10}, "away_team_stats": {"wins": 15, "losses": 25}}]
+        with patch.object(mwp, "get_probability_engine", return_value=MagicMock()), patch(
+            "app.services.feature_pipeline.FeaturePipeline.build_slate_matchup_data",
+            new=AsyncMock(return_value=built),
+        ) as build, patch(
+            'app.alpha.model_augmentation_service.ModelAugmentationService.get_validated_alpha_contributions',
+            new=AsyncMock(return_value=[]),
+        ):
+            results = await mwp.compute_slate_win_probabilities(
+                MagicMock(), [mwp.SlateGame(home_team="Slate Home", away_team="Slate Away", sport="NBA")]
+            )
+
+        assert build.await_count == 1
+        assert results[0]["calculation_method"] == "stats_only"
+        assert results[0]["data_sources_used"] == ["team_stats"]
+
+    def test_alpha_adjustments_share_cap_and_clamp_values(self):
+        from app.alpha.model_augmentation_service import ALPHA_WEIGHT_CAP_INITIAL, alpha_adjustments
+
+        contributions = [{"feature_name": "a"}, {"feature_name": "b"}]
+        rows = [{"a": 1.0, "b": 0.5}, {"a": -3.0}, {}]
+
+        adjustments = alpha_adjustments(contributions, rows)
+
+        half = ALPHA_WEIGHT_CAP_INITIAL / 2
+        assert list(adjustments) == pytest.approx([half * 1.5, -half, 0.0])
+        assert list(alpha_adjustments([], rows)) == [0.0, 0.0, 0.0]
+
+
 class TestWeights:
     """Test that weight constants are correct."""
     
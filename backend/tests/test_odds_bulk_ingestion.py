@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select, update
+
+from app.models.market import Market
+from app.models.odds import Odds
+from app.services.odds_api.odds_api_data_store import OddsApiDataStore
+from app.services.sports_config import get_sport_config
+
+
+def _event(event_id: str, home_price: int, *, hours: int = 8) -> dict:
+    commence = (datetime.now(tz=timezone.utc) + timedelta(hours=hours)).isoformat().replace("+00:00", "Z")
+    return {
+        "id": event_id,
+        "home_team": "Boston Celtics",
+        "away_team": "New York Knicks",
+        "commence_time": commence,
+        "bookmakers": [
+            {
+                "key": book,
+                "markets": [
+                    {
+                        "key": "h2h",
+                        "outcomes": [
+                            {"name": "Boston Celtics", "price": home_price},
+                            {"name": "New York Knicks", "price": 120},
+                        ],
+                    },
+                    {
+                        "key": "totals",
+                        "outcomes": [
+                            {"name": "Over", "price": -110, "point": 221.5},
+                            {"name": "Under", "price": -110, "point": 221.5},
+                        ],
+                    },
+                ],
+            }
+            for book in ("fanduel", "draftkings")
+        ],
+    }
+
+
+async def _counts(db):
+    markets = await db.scalar(select(func.count(Market.id)))
+    odds = await db.scalar(select(func.count(Odds.id)))
+    return markets, odds
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingestion_upserts_without_duplicates(db):
+    sport_config = get_sport_config("nba")
+    store = OddsApiDataStore(db)
+
+    games = await store.normalize_and_store_odds([_event("nba-1", -140)], sport_config)
+    assert len(games) == 1
+    assert await _counts(db) == (4, 8)
+
+    # Same payload again: the upserts are no-ops and no rows are duplicated.
+    await store.normalize_and_store_odds([_event("nba-1", -140)], sport_config)
+    assert await _counts(db) == (4, 8)
+
+    # Price move updates the existing row in place.
+    await store.normalize_and_store_odds([_event("nba-1", -155)], sport_config)
+    assert await _counts(db) == (4, 8)
+    prices = (
+        await db.execute(select(Odds.price).join(Market).where(Market.book == "fanduel", Odds.outcome == "home"))
+    ).scalars().all()
+    assert prices == ["-155"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingestion_restores_rows_changed_outside_the_writer(db):
+    sport_config = get_sport_config("nba")
+    store = OddsApiDataStore(db)
+
+    await store.normalize_and_store_odds([_event("nba-2", -140), _event("nba-3", -200, hours=30)], sport_config)
+    # Another writer (or a manual fix) moves a price; the next identical sync must still repair it.
+    await db.execute(update(Odds).where(Odds.outcome == "home").values(price="+999"))
+    await db.commit()
+    await store.normalize_and_store_odds([_event("nba-2", -140), _event("nba-3", -200, hours=30)], sport_config)
+
+    assert await _counts(db) == (8, 16)
+    prices = set((await db.execute(select(Odds.price).where(Odds.outcome == "home"))).scalars().all())
+    assert "+999" not in prices
@@ -0,0 +1,155 @@
+"""Tests for the odds change feed (ingestion -> targeted cache invalidation)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import cache_invalidation
+from app.services.odds_api import odds_change_feed
+from app.services.odds_api.odds_api_data_store import OddsApiDataStore
+from app.services.odds_api.odds_change_feed import (
+    OddsChangeBus,
+    OddsChangeEvent,
+    build_odds_change_events,
+)
+from app.services.redis.redis_value_codec import RedisValueCodec
+from app.services.sports_config import get_sport_config
+
+
+class _NoRedis:
+    def is_configured(self) -> bool:
+        return False
+
+
+def _bus() -> OddsChangeBus:
+    return OddsChangeBus(provider=_NoRedis(), codec=RedisValueCodec())
+
+
+def _game(game_id: str, status: str = "scheduled"):
+    return SimpleNamespace(
+        id=game_id,
+        home_team="Boston Celtics",
+        away_team="New York Knicks",
+        start_time=datetime(2026, 1, 2, 0, 30, tzinfo=timezone.utc),
+        status=status,
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_delivers_only_games_whose_content_hash_changed():
+    bus = _bus()
+    received = []
+
+    async def handler(events, *, local):
+        received.append(([e.game_id for e in events], local))
+
+    bus.subscribe(handler)
+    fingerprints = {"g1": "a", "g2": "b"}
+
+    first = await bus.publish(build_odds_change_events("NBA", [_game("g1"), _game("g2")], fingerprints))
+    again = await bus.publish(build_odds_change_events("NBA", [_game("g1"), _game("g2")], fingerprints))
+    moved = await bus.publish(
+        build_odds_change_events("NBA", [_game("g1"), _game("g2", status="final")], fingerprints)
+    )
+
+    assert [e.game_id for e in first] == ["g1", "g2"]
+    assert again == []
+    assert [e.game_id for e in moved] == ["g2"]
+    assert received == [(["g1", "g2"], True), (["g2"], True)]
+
+
+@pytest.mark.asyncio
+async def test_remote_messages_are_delivered_as_non_local_and_own_messages_skipped():
+    bus = _bus()
+    codec = RedisValueCodec()
+    received = []
+
+    async def handler(events, *, local):
+        received.append((events, local))
+
+    bus.subscribe(handler)
+    event = OddsChangeEvent(sport="NFL", game_id="g9", content_hash="h", occurred_at=1.0)
+    remote = codec.encode({"origin": "other", "events": [event.__dict__]})
+    own = codec.encode({"origin": bus._origin, "events": [event.__dict__]})
+
+    assert await bus.handle_message(own) == []
+    assert await bus.handle_message(remote) == [event]
+    assert await bus.handle_message(remote) == []  # same hash already seen
+    assert received == [([event], False)]
+
+
+@pytest.mark.asyncio
+async def test_subscriber_drops_only_affected_sport_entries(monkeypatch):
+    from app.api.routes import analysis as analysis_routes
+    from app.api.routes.games_response_cache import games_response_cache
+
+    scheduled = []
+    monkeypatch.setattr(
+        "app.services.probability_engine_impl.candidate_leg_refresher.schedule_candidate_leg_refresh",
+        lambda sports: scheduled.append(list(sports)),
+    )
+    games_response_cache.clear()
+    analysis_routes._analysis_list_cache.clear()
+    for key in ("nba", "nba_week_3", "nfl"):
+        games_response_cache.set(key, ["cached"])  # type: ignore[list-item]
+    analysis_routes._analysis_list_cache.update({"nba:50": ("x", None), "nfl:50": ("y", None)})
+    event = OddsChangeEvent(sport="NBA", game_id="g1", content_hash="h", occurred_at=1.0)
+
+    await cache_invalidation.invalidate_after_odds_changes([event], local=False)
+    assert games_response_cache.get("nba") is None
+    assert games_response_cache.get("nba_week_3") is None
+    assert games_response_cache.get("nfl") == ["cached"]
+    assert list(analysis_routes._analysis_list_cache) == ["nfl:50"]
+    assert scheduled == []
+
+    await cache_invalidation.invalidate_after_odds_changes([event], local=True)
+    assert scheduled == [["NBA"]]
+
+
+def _event(event_id: str, home_price: int, *, hours: int = 8) -> dict:
+    commence = (datetime.now(tz=timezone.utc) + timedelta(hours=hours)).replace(microsecond=0)
+    return {
+        "id": event_id,
+        "home_team": "Boston Celtics",
+        "away_team": "New York Knicks",
+        "commence_time": commence.isoformat().replace("+00:00", "Z"),
+        "bookmakers": [
+            {
+                "key": "fanduel",
+                "markets": [
+                    {
+                        "key": "h2h",
+                        "outcomes": [
+                            {"name": "Boston Celtics", "price": home_price},
+                            {"name": "New York Knicks", "price": 120},
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_ingestion_publishes_events_only_for_changed_games(db, monkeypatch):
+    bus = _bus()
+    published = []
+
+    async def handler(events, *, local):
+        published.append(sorted(e.sport for e in events))
+
+    bus.subscribe(handler)
+    monkeypatch.setattr(odds_change_feed, "_odds_change_bus", bus)
+    sport_config = get_sport_config("nba")
+    store = OddsApiDataStore(db)
+
+    first, second = _event("feed-1", -140), _event("feed-2", -110, hours=30)
+    await store.normalize_and_store_odds([first, second], sport_config)
+    await store.normalize_and_store_odds([first, second], sport_config)
+    moved = {**first, "bookmakers": _event("feed-1", -160)["bookmakers"]}
+    await store.normalize_and_store_odds([moved, second], sport_config)
+
+    assert published == [["NBA", "NBA"], ["NBA"]]
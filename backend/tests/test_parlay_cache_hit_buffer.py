@@ -0,0 +1,42 @@
+"""Tests for batched ParlayCache hit-count flushing."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.database.session import AsyncSessionLocal
+from app.models.parlay_cache import ParlayCache
+from app.services.parlay_cache_hit_buffer import ParlayCacheHitBuffer
+
+
+@pytest.mark.asyncio
+async def test_flush_applies_buffered_hits_in_one_batch(db):
+    rows = [
+        ParlayCache(
+            num_legs=n,
+            risk_profile="balanced",
+            sport="NFL",
+            cached_parlay_data={"legs": []},
+            expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+            hit_count=1,
+        )
+        for n in (3, 5)
+    ]
+    db.add_all(rows)
+    await db.commit()
+
+    buffer = ParlayCacheHitBuffer(session_factory=AsyncSessionLocal)
+    for _ in range(3):
+        buffer.record(rows[0].id)
+    buffer.record(rows[1].id)
+
+    assert await buffer.flush() == 2
+    assert buffer.pending() == {}
+    assert await buffer.flush() == 0
+
+    db.expire_all()
+    hits = {r.num_legs: r.hit_count for r in (await db.execute(select(ParlayCache))).scalars().all()}
+    assert hits == {3: 4, 5: 2}
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import itertools
+import math
+import random
 import uuid
 from dataclasses import dataclass
 
@@ -152,3 +155,62 @@ async def test_coverage_pack_total_cap_applies_across_sections():
     assert all(t.analysis.num_legs == len(t.legs) for t in resp.round_robin_tickets)
 
 
+def _leg_analysis(prob: float) -> CustomParlayLegAnalysis:
+    return CustomParlayLegAnalysis(
+        game_id=str(uuid.uuid4()),
+        game="Away @ Home",
+        home_team="Home",
+        away_team="Away",
+        sport="NFL",
+        market_type="h2h",
+        pick="Home",
+        pick_display="Home ML",
+        odds="+100",
+        decimal_odds=2.0,
+        implied_probability=50.0,
+        ai_probability=prob * 100.0,
+        confidence=60.0,
+        edge=0.0,
+        recommendation="moderate",
+    )
+
+
+def test_best_first_selection_matches_exhaustive_enumeration():
+    rng = random.Random(7)
+    n = 8
+    p_orig = [rng.uniform(0.2, 0.8) for _ in range(n)]
+    p_flip = [rng.uniform(0.2, 0.8) for _ in range(n)]
+    service = ParlayCoverageService(analysis_service=None)
+
+    scenarios = service._top_k_scenarios(
+        original_leg_analyses=[_leg_analysis(p) for p in p_orig],
+        flipped_leg_analyses=[_leg_analysis(p) for p in p_flip],
+        k=20,
+    )
+    exhaustive = sorted(
+        (math.prod(p_flip[i] if mask >> i & 1 else p_orig[i] for i in range(n)) for mask in range(1 << n)),
+        reverse=True,
+    )[:20]
+    assert [s.probability for s in scenarios] == pytest.approx(exhaustive)
+    assert len({s.mask for s in scenarios}) == 20
+
+    combos = service._top_k_round_robins(
+        legs=[None] * n, leg_analyses=[_leg_analysis(p) for p in p_orig], size=3, k=15
+    )
+    exhaustive_rr = sorted(
+        (math.prod(p_orig[i] for i in c) for c in itertools.combinations(range(n), 3)), reverse=True
+    )[:15]
+    assert [c.probability for c in combos] == pytest.approx(exhaustive_rr)
+    assert len({c.indices for c in combos}) == 15
+
+
+def test_best_first_selection_handles_large_tickets():
+    service = ParlayCoverageService(analysis_service=None)
+    legs = [_leg_analysis(0.5 + i / 100.0) for i in range(40)]
+
+    scenarios = service._top_k_scenarios(original_leg_analyses=legs, flipped_leg_analyses=legs[::-1], k=50)
+    combos = service._top_k_round_robins(legs=[None] * 40, leg_analyses=legs, size=10, k=50)
+
+    assert len(scenarios) == 50
+    assert len(combos) == 50
+    assert combos[0].indices == tuple(range(30, 40))
@@ -0,0 +1,91 @@
+"""Tests for deferred (background) parlay explanations."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.database.session import AsyncSessionLocal
+from app.models.parlay import Parlay
+from app.services.parlay_explanation_jobs import ParlayExplanationJobs
+from app.services.redis.redis_value_codec import RedisValueCodec
+from app.services.tiered_cache import TieredCache
+
+
+class _Manager:
+    async def get_explanation(self, parlay_data, risk_profile, request_id=None, user_id=None, sports=None):
+        return ({"summary": f"Final {risk_profile} write-up.", "risk_notes": "Final risk notes."}, False, None)
+
+
+@pytest.mark.asyncio
+async def test_deferred_explanation_updates_row_status_and_pushes(db):
+    parlay = Parlay(
+        legs=[{"market_id": "m1", "outcome": "home"}],
+        num_legs=1,
+        parlay_hit_prob=0.5,
+        risk_profile="balanced",
+        ai_summary="Provisional.",
+        ai_risk_notes="Provisional.",
+    )
+    db.add(parlay)
+    await db.commit()
+    parlay_id = str(parlay.id)
+
+    pushed = []
+
+    async def _notify(user_id, payload):
+        pushed.append((user_id, payload["status"]))
+
+    jobs = ParlayExplanationJobs(
+        session_factory=AsyncSessionLocal,
+        status_cache=TieredCache("test_explanation_status", l2_enabled=False),
+        manager_factory=_Manager,
+        notifier=_notify,
+    )
+    await jobs.mark_pending(parlay_id)
+    assert (await jobs.get_status(parlay_id))["status"] == "pending"
+
+    jobs.schedule(parlay_id=parlay_id, parlay_data={"legs": []}, risk_profile="balanced", user_id="u1")
+    await jobs.drain()
+
+    status = await jobs.get_status(parlay_id)
+    assert status["status"] == "ready"
+    assert status["ai_summary"] == "Final balanced write-up."
+    assert pushed == [("u1", "ready")]
+
+    await db.refresh(parlay)
+    assert parlay.ai_summary == "Final balanced write-up."
+    assert parlay.ai_risk_notes == "Final risk notes."
+
+
+@pytest.mark.asyncio
+async def test_status_poll_on_another_instance_sees_ready():
+    store = {}
+
+    class _Redis:
+        async def get(self, key):
+            return store.get(key)
+
+        async def set(self, key, value, ex=None):
+            store[key] = value
+            return True
+
+    provider = MagicMock()
+    provider.is_configured.return_value = True
+    provider.get_client.return_value = _Redis()
+    codec = RedisValueCodec(serializer="json", compression="none")
+
+    def _instance():
+        return ParlayExplanationJobs(
+            status_cache=TieredCache("test_explanation_status_shared", provider=provider, codec=codec),
+            manager_factory=_Manager,
+        )
+
+    worker, poller = _instance(), _instance()
+    await worker.mark_pending("p1")
+    assert (await poller.get_status("p1"))["status"] == "pending"  # now also in the poller's L1
+
+    await worker._status.set("p1", {"parlay_id": "p1", "status": "ready"}, ttl=60)
+
+    assert (await poller.get_status("p1"))["status"] == "ready"
@@ -127,3 +127,55 @@ async def test_get_explanation_invalid_shape_uses_fallback():
     assert error_type == "ValueError"
     assert "summary" in explanation and "risk_notes" in explanation
     assert "Conservative" in explanation["summary"]
+
+
+def _legs():
+    return [
+        {"game_id": "g1", "game": "A @ B", "market_type": "h2h", "outcome": "B", "odds": "-112", "confidence": 61.0},
+        {"game_id": "g2", "game": "C @ D", "market_type": "totals", "outcome": "Over 44.5", "odds": "+105", "confidence": 55.0},
+        {"game_id": "g3", "game": "E @ F", "market_type": "h2h", "outcome": "E", "odds": "+130", "confidence": 52.0},
+    ]
+
+
+def _model_summary(legs):
+    paragraphs = ["Intro."] + [
+        f"{leg['game']} — Pick: {leg['outcome']} (Odds {leg['odds']}, Confidence {leg['confidence']:.1f}%). Why {leg['outcome']}."
+        for leg in legs
+    ]
+    return "\n\n".join(paragraphs)
+
+
+@pytest.mark.asyncio
+async def test_get_explanation_reuses_cached_and_assembles_overlapping_parlays():
+    from app.services.parlay_explanation_cache import ParlayExplanationCache
+    from app.services.tiered_cache import TieredCache
+
+    legs = _legs()
+    mock_openai = MagicMock(spec_set=["generate_parlay_explanation"])
+    mock_openai.generate_parlay_explanation = AsyncMock(
+        side_effect=lambda legs, **kwargs: {"summary": _model_summary(legs), "risk_notes": "Model risk notes."}
+    )
+    cache = ParlayExplanationCache(TieredCache("test_explanations", l2_enabled=False))
+    manager = ParlayExplanationManager(openai_service=mock_openai, explanation_cache=cache)
+
+    first = {"legs": legs[:2], "parlay_hit_prob": 0.3, "overall_confidence": 58.0}
+    explanation, fallback_used, _ = await manager.get_explanation(parlay_data=first, risk_profile="balanced")
+    assert fallback_used is False
+    again, _, _ = await manager.get_explanation(parlay_data=dict(first), risk_profile="balanced")
+    assert again == explanation
+    assert mock_openai.generate_parlay_explanation.await_count == 1
+
+    # Same legs (one line moved within its bucket), different profile: assembled from fragments.
+    moved = [dict(legs[1], odds="+104"), legs[0]]
+    assembled, _, _ = await manager.get_explanation(
+        parlay_data={"legs": moved, "parlay_hit_prob": 0.3, "overall_confidence": 58.0}, risk_profile="degen"
+    )
+    assert mock_openai.generate_parlay_explanation.await_count == 1
+    assert "Odds +104" in assembled["summary"] and "Why B." in assembled["summary"]
+
+    # A leg without a fragment needs the model; an odds change for g1 retires its fragment.
+    await manager.get_explanation(parlay_data={"legs": legs, "parlay_hit_prob": 0.2, "overall_confidence": 56.0}, risk_profile="balanced")
+    assert mock_openai.generate_parlay_explanation.await_count == 2
+    assert await cache.invalidate_games(["g1"]) == 1
+    await manager.get_explanation(parlay_data=dict(first), risk_profile="balanced")
+    assert mock_openai.generate_parlay_explanation.await_count == 3
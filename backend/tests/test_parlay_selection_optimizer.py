@@ -96,6 +96,31 @@ def test_optimizer_never_selects_conflicting_h2h_legs():
     assert not _h2h_conflict_checker(selected[1], [selected[0]])
 
 
+
+def test_optimizer_honours_one_directional_conflict_checker():
+    optimizer = ParlaySelectionOptimizer(correlation_model=_NoCorrelationModel())
+    candidates = [
+        {"game_id": "g1", "market_type": "h2h", "outcome": "home", "market_id": "m1", "ev_score": 10.0},
+        {"game_id": "g1", "market_type": "spreads", "outcome": "home", "market_id": "m2", "ev_score": 9.0},
+        {"game_id": "g3", "market_type": "h2h", "outcome": "home", "market_id": "m3", "ev_score": 1.0},
+    ]
+
+    def _m2_rejects_m1(leg: Dict[str, Any], selected: List[Dict[str, Any]]) -> bool:
+        # Only flags m2 being added after m1, never the reverse.
+        return leg["market_id"] == "m2" and any(o["market_id"] == "m1" for o in selected)
+
+    selected = optimizer.select(
+        candidates=candidates,
+        num_legs=2,
+        risk_profile="balanced",
+        conflict_checker=_m2_rejects_m1,
+        max_legs_per_game=2,
+        max_pair_corr=0.99,
+        beam_width=20,
+    )
+
+    assert {leg["market_id"] for leg in selected} != {"m1", "m2"}
+
 def test_optimizer_beats_naive_greedy_in_constructed_case():
     # In game g1: picking A blocks adding any other g1 leg due to correlation ceiling.
     mapping = {
@@ -158,3 +183,55 @@ def test_optimizer_beats_naive_greedy_in_constructed_case():
     assert opt_score > greedy_score
 
 
+def test_optimizer_respects_max_legs_per_game_and_duplicate_keys():
+    optimizer = ParlaySelectionOptimizer(correlation_model=_NoCorrelationModel())
+    candidates = [
+        {"game_id": "g1", "market_type": "h2h", "outcome": "home", "market_id": "m1", "ev_score": 10.0},
+        # Same (game, market, outcome) from another book: never both in one parlay.
+        {"game_id": "g1", "market_type": "h2h", "outcome": "home", "market_id": "m1b", "ev_score": 9.5},
+        {"game_id": "g1", "market_type": "totals", "outcome": "over", "market_id": "m2", "ev_score": 9.0},
+        {"game_id": "g1", "market_type": "spreads", "outcome": "home", "market_id": "m3", "ev_score": 8.0},
+        {"game_id": "g2", "market_type": "h2h", "outcome": "away", "market_id": "m4", "ev_score": 1.0},
+    ]
+
+    selected = optimizer.select(
+        candidates=candidates,
+        num_legs=3,
+        risk_profile="balanced",
+        conflict_checker=_no_conflicts,
+        max_legs_per_game=2,
+        max_pair_corr=0.99,
+        beam_width=20,
+    )
+
+    assert [leg["market_id"] for leg in selected] == ["m1", "m2", "m4"]
+
+
+def test_optimizer_handles_wide_beam_over_large_pool():
+    optimizer = ParlaySelectionOptimizer(correlation_model=ParlayCorrelationModel())
+    candidates = [
+        {
+            "game_id": f"g{i % 80}",
+            "market_type": ("h2h", "spreads", "totals")[i % 3],
+            "outcome": ("home", "away", "over", "under")[i % 4],
+            "market_id": f"m{i}",
+            "ev_score": float((i * 7919) % 1000) / 100.0,
+        }
+        for i in range(1200)
+    ]
+
+    selected = optimizer.select(
+        candidates=candidates,
+        num_legs=8,
+        risk_profile="degen",
+        conflict_checker=_h2h_conflict_checker,
+        beam_width=250,
+        candidate_pool_limit=1200,
+    )
+
+    assert len(selected) == 8
+    per_game = {}
+    for leg in selected:
+        per_game[leg["game_id"]] = per_game.get(leg["game_id"], 0) + 1
+    assert max(per_game.values()) <= 2
+    assert len({(l["game_id"], l["market_type"], l["outcome"]) for l in selected}) == 8
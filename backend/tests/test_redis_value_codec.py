@@ -0,0 +1,100 @@
+"""Tests for the shared Redis cache value codec."""
+
+from __future__ import annotations
+
+import json
+import zlib
+
+import pytest
+
+from app.services.redis import redis_value_codec as codec_module
+from app.services.redis.redis_value_codec import (
+    COMPRESSION_NONE,
+    COMPRESSION_ZLIB,
+    COMPRESSION_ZSTD,
+    MAGIC,
+    SERIALIZER_JSON,
+    RedisValueCodec,
+    RedisValueCodecError,
+)
+
+
+def _odds_payload(n: int = 200):
+    return [
+        {
+            "id": f"evt{i}",
+            "home_team": "Kansas City Chiefs",
+            "away_team": "Buffalo Bills",
+            "bookmakers": [{"key": "fanduel", "markets": [{"key": "h2h", "outcomes": [{"name": "Chiefs", "price": -135}]}]}],
+            "score": 0.5 + i / 1000.0,
+            "live": None,
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize(
+    "serializer,compression",
+    [("json", "none"), ("json", "zlib"), ("auto", "auto"), ("msgpack", "zstd")],
+)
+def test_round_trip_preserves_json_compatible_values(serializer, compression):
+    codec = RedisValueCodec(serializer=serializer, compression=compression)
+    value = _odds_payload()
+
+    assert codec.decode(codec.encode(value)) == value
+
+
+def test_header_is_versioned_and_large_bodies_are_compressed():
+    codec = RedisValueCodec(serializer="json", compression="zlib", compress_min_bytes=1024)
+    value = _odds_payload()
+
+    payload = codec.encode(value)
+    plain = json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    assert payload[:3] == MAGIC
+    assert payload[3] == codec_module.VERSION
+    assert payload[4:5] == SERIALIZER_JSON
+    assert payload[5:6] == COMPRESSION_ZLIB
+    assert len(payload) < len(plain) // 4
+    assert json.loads(zlib.decompress(payload[6:])) == value
+    # Small bodies skip compression.
+    assert codec.encode({"a": 1})[5:6] == COMPRESSION_NONE
+
+
+def test_decodes_legacy_plain_json_payloads():
+    codec = RedisValueCodec()
+    legacy = json.dumps([{"game_id": "1", "confidence_score": 70.0}]).encode("utf-8")
+
+    assert codec.decode(legacy) == [{"game_id": "1", "confidence_score": 70.0}]
+
+
+def test_rejects_unknown_version_and_missing_library(monkeypatch):
+    codec = RedisValueCodec(serializer="json", compression="none")
+    payload = bytearray(codec.encode([1, 2, 3]))
+    payload[3] = 99
+    with pytest.raises(RedisValueCodecError):
+        codec.decode(bytes(payload))
+
+    # A zstd-flagged payload must fail loudly when zstandard is unavailable (built by hand
+    # so the check runs whether or not the library is installed here).
+    zstd_payload = bytearray(codec.encode([1]))
+    zstd_payload[5:6] = COMPRESSION_ZSTD
+    monkeypatch.setattr(codec_module, "zstandard", None)
+    with pytest.raises(RedisValueCodecError):
+        codec.decode(bytes(zstd_payload))
+
+    # Asking for zstd without the library falls back to zlib on encode.
+    fallback = RedisValueCodec(serializer="json", compression="zstd", compress_min_bytes=0)
+    assert fallback.encode([1])[5:6] == COMPRESSION_ZLIB
+
+
+def test_falls_back_to_stdlib_when_accelerators_missing(monkeypatch):
+    monkeypatch.setattr(codec_module, "msgpack", None)
+    monkeypatch.setattr(codec_module, "zstandard", None)
+    monkeypatch.setattr(codec_module, "orjson", None)
+    codec = RedisValueCodec()
+
+    assert codec.serializer == SERIALIZER_JSON
+    assert codec.compression == COMPRESSION_ZLIB
+    value = _odds_payload(50)
+    assert codec.decode(codec.encode(value)) == value
@@ -0,0 +1,96 @@
+"""Tests for the settlement job outbox and event-driven settlement."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.models.game import Game
+from app.models.parlay import Parlay
+from app.models.parlay_leg import ParlayLeg
+from app.models.settlement_job import SettlementJob
+from app.services.scores.score_scraper_service import ScoreScraperService
+from app.services.settlement.settlement_job_queue import SettlementJobQueue
+from app.workers.settlement_worker import SettlementWorker
+
+
+async def _final_game_with_leg(db, key: str):
+    now = datetime.now(timezone.utc)
+    game = Game(
+        external_game_id=key,
+        sport="NFL",
+        home_team="Home Team",
+        away_team="Away Team",
+        start_time=now - timedelta(hours=3),
+        status="FINAL",
+        home_score=21,
+        away_score=17,
+    )
+    db.add(game)
+    await db.flush()
+    parlay = Parlay(
+        user_id=None,
+        legs=[],
+        num_legs=1,
+        parlay_hit_prob=Decimal("0.55"),
+        risk_profile="balanced",
+        status="PENDING",
+    )
+    db.add(parlay)
+    await db.flush()
+    leg = ParlayLeg(parlay_id=parlay.id, game_id=game.id, market_type="h2h", selection="Home Team", status="PENDING")
+    db.add(leg)
+    await db.flush()
+    return game, parlay, leg
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_idempotent_and_claim_marks_processing(db):
+    game, _, _ = await _final_game_with_leg(db, "test_jobs_1")
+    queue = SettlementJobQueue(db)
+    await queue.enqueue([game.id])
+    await queue.enqueue([game.id])
+    await db.commit()
+
+    claimed = await queue.claim(10)
+    assert claimed == [game.id]
+    assert await queue.claim(10) == []
+
+    job = (await db.execute(select(SettlementJob))).scalar_one()
+    await db.refresh(job)
+    assert job.status == "processing"
+    assert job.attempts == 1
+
+    await queue.complete(claimed)
+    assert (await db.execute(select(SettlementJob))).scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_final_transition_enqueues_job(db):
+    game, _, _ = await _final_game_with_leg(db, "test_jobs_2")
+    scraper = ScoreScraperService(db)
+    await scraper._create_status_change_events(game, "LIVE", "FINAL")
+    await db.commit()
+
+    jobs = (await db.execute(select(SettlementJob.game_id))).scalars().all()
+    assert jobs == [game.id]
+
+
+@pytest.mark.asyncio
+async def test_worker_settles_queued_games_and_acks(db):
+    game, parlay, leg = await _final_game_with_leg(db, "test_jobs_3")
+    await SettlementJobQueue(db).enqueue([game.id])
+    await db.commit()
+
+    worker = SettlementWorker()
+    settled = await worker._process_settlement_jobs()
+
+    assert settled == 1
+    await db.refresh(leg)
+    await db.refresh(parlay)
+    assert leg.status == "WON"
+    assert parlay.status == "WON"
+    assert (await db.execute(select(SettlementJob))).scalars().all() == []
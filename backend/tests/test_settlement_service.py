@@ -661,3 +661,93 @@ async def test_settle_legs_error_handling_continues_on_failure(db):
     # Invalid leg should be VOIDed
     await db.refresh(leg2)
     assert leg2.status == "VOID"
+
+
+@pytest.mark.asyncio
+async def test_settle_legs_for_games_batch(db):
+    """Bulk settlement grades legs across games and updates parlays and feed events in one pass."""
+    now = datetime.now(timezone.utc)
+    
+    final_game = Game(
+        external_game_id="test_settle_batch_1",
+        sport="NFL",
+        home_team="Home Team",
+        away_team="Away Team",
+        start_time=now - timedelta(hours=3),
+        status="FINAL",
+        home_score=28,
+        away_score=14,
+    )
+    other_final = Game(
+        external_game_id="test_settle_batch_2",
+        sport="NFL",
+        home_team="Home Two",
+        away_team="Away Two",
+        start_time=now - timedelta(hours=3),
+        status="FINAL",
+        home_score=10,
+        away_score=20,
+    )
+    live_game = Game(
+        external_game_id="test_settle_batch_3",
+        sport="NFL",
+        home_team="Home Three",
+        away_team="Away Three",
+        start_time=now - timedelta(hours=1),
+        status="LIVE",
+        home_score=7,
+        away_score=0,
+    )
+    db.add_all([final_game, other_final, live_game])
+    await db.flush()
+    
+    won_parlay = Parlay(
+        user_id=None,
+        legs=[],
+        num_legs=2,
+        parlay_hit_prob=Decimal("0.30"),
+        risk_profile="balanced",
+        status="PENDING",
+    )
+    open_parlay = Parlay(
+        user_id=None,
+        legs=[],
+        num_legs=2,
+        parlay_hit_prob=Decimal("0.30"),
+        risk_profile="balanced",
+        status="PENDING",
+    )
+    db.add_all([won_parlay, open_parlay])
+    await db.flush()
+    
+    legs = [
+        ParlayLeg(parlay_id=won_parlay.id, game_id=final_game.id, market_type="h2h", selection="Home Team", status="PENDING"),
+        ParlayLeg(parlay_id=won_parlay.id, game_id=other_final.id, market_type="h2h", selection="Away Two", status="PENDING"),
+        ParlayLeg(parlay_id=open_parlay.id, game_id=final_game.id, market_type="h2h", selection="Away Team", status="PENDING"),
+        ParlayLeg(parlay_id=open_parlay.id, game_id=live_game.id, market_type="h2h", selection="Home Three", status="PENDING"),
+    ]
+    db.add_all(legs)
+    await db.commit()
+    
+    service = SettlementService(db)
+    settled_count = await service.settle_parlay_legs_for_games([final_game.id, other_final.id, live_game.id])
+    
+    assert settled_count == 3
+    for leg in legs:
+        await db.refresh(leg)
+    assert [leg.status for leg in legs] == ["WON", "WON", "LOST", "PENDING"]
+    assert all(leg.settlement_locked_at is not None for leg in legs[:3])
+    
+    await db.refresh(won_parlay)
+    await db.refresh(open_parlay)
+    assert won_parlay.status == "WON"
+    assert won_parlay.settled_at is not None
+    assert open_parlay.status == "LOST"
+    
+    result = await db.execute(
+        select(ParlayFeedEvent).where(ParlayFeedEvent.event_type.in_(["LEG_WON", "LEG_LOST"]))
+    )
+    assert len(result.scalars().all()) == 3
+    
+    # Re-running is a no-op: only PENDING/LIVE legs are selected
+    assert await service.settle_parlay_legs_for_games([final_game.id, other_final.id]) == 0
@@ -0,0 +1,41 @@
+"""Tests for the shared pooled outbound HTTP client."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from app.services.http.shared_http_client import PooledHttpSession, SharedHttpClientRegistry
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_one_client_per_loop_and_recreates_after_close():
+    registry = SharedHttpClientRegistry(http2=False)
+
+    first = registry.get()
+    assert registry.get() is first
+
+    await registry.aclose()
+    assert first.is_closed
+    assert registry.get() is not first
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_session_applies_per_call_defaults_and_leaves_pool_open():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with PooledHttpSession(client, timeout=3.0, headers={"User-Agent": "pg-test"}) as session:
+        response = await session.get("https://example.test/a", headers={"X-Extra": "1"})
+
+    assert response.json() == {"ok": True}
+    assert seen[0].headers["User-Agent"] == "pg-test"
+    assert seen[0].headers["X-Extra"] == "1"
+    assert seen[0].extensions["timeout"]["read"] == 3.0
+    assert not client.is_closed
+    await client.aclose()
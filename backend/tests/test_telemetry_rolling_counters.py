@@ -0,0 +1,43 @@
+"""Rolling window counters in core telemetry (bucketed ring buffers)."""
+
+from __future__ import annotations
+
+from app.core import telemetry
+
+
+def _clock(monkeypatch, start: float = 1_000_000.0):
+    now = [start]
+    monkeypatch.setattr(telemetry, "_now", lambda: now[0])
+    monkeypatch.setattr(telemetry, "_rolling", {})
+    return now
+
+
+def test_rolling_counts_expire_after_window(monkeypatch):
+    now = _clock(monkeypatch)
+    telemetry.inc("error_count_5m")
+    telemetry.inc("error_count_5m", 3)
+    assert telemetry.get("error_count_5m") == 4
+
+    now[0] += 200
+    telemetry.inc("error_count_5m")
+    assert telemetry.get("error_count_5m") == 5
+
+    # First four events are now older than 5 minutes
+    now[0] += 150
+    assert telemetry.get("error_count_5m") == 1
+    assert telemetry.get_snapshot()["error_count_5m"] == 1
+
+
+def test_thirty_minute_window_and_plain_counters(monkeypatch):
+    now = _clock(monkeypatch)
+    for _ in range(1000):
+        telemetry.inc("api_429_count_30m")
+    now[0] += 1200
+    assert telemetry.get("api_429_count_30m") == 1000
+    now[0] += 700
+    assert telemetry.get("api_429_count_30m") == 0
+
+    # Buckets are reused in place after wrapping around the ring
+    telemetry.inc("api_429_count_30m", 2)
+    assert telemetry.get("api_429_count_30m") == 2
+    assert telemetry.get("generation_failures_5m", 0) == 0
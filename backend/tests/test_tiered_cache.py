@@ -0,0 +1,204 @@
+"""Tests for the bounded L1 / Redis L2 tiered cache."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.data_fetchers.fetch_utils import InMemoryCache
+from app.services.redis.redis_value_codec import RedisValueCodec
+from app.services.tiered_cache import LocalTtlCache, TieredCache, estimate_size, tiered_cache_stats
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+    async def sadd(self, key, *members):
+        self.store.setdefault(key, set()).update(members)
+        return len(members)
+
+    async def expire(self, key, seconds):
+        return key in self.store
+
+    async def smembers(self, key):
+        return set(self.store.get(key, set()))
+
+    def scan_iter(self, *args, **kwargs):
+        raise AssertionError("indexed deletes must not scan the keyspace")
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((getattr(self._client, name), args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        return [await fn(*args, **kwargs) for fn, args, kwargs in self._calls]
+
+
+def _provider(client):
+    provider = MagicMock()
+    provider.is_configured.return_value = True
+    provider.get_client.return_value = client
+    return provider
+
+
+def test_l1_evicts_least_recently_used_by_entry_count():
+    cache = LocalTtlCache("test_lru", max_entries=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1  # a becomes most recent
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_l1_is_bounded_by_estimated_bytes():
+    big = ["x" * 1000 for _ in range(10)]
+    cache = LocalTtlCache("test_bytes", max_entries=100, max_bytes=estimate_size(big) * 2 + 100)
+    for i in range(5):
+        cache.set(f"k{i}", list(big), ttl=60)
+
+    assert len(cache) == 2
+    assert cache.bytes_used <= estimate_size(big) * 2 + 100
+    cache.clear()
+    assert cache.bytes_used == 0
+
+
+def test_l1_expiry_stale_grace_and_sweep():
+    cache = LocalTtlCache("test_ttl", stale_grace_seconds=60, sweep_interval_seconds=0)
+    cache.set("k", "v", ttl=0)
+
+    assert cache.get("k") is None
+    assert cache.get("k", allow_stale=True) == "v"
+
+    cache._entries["k"].stale_until = time.time() - 1
+    cache.set("other", 1, ttl=60)  # write triggers the sweep
+    assert "k" not in cache._entries
+    assert cache.stats.expirations == 1
+
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_keeps_stale_values_past_the_grace():
+    cache = InMemoryCache("test_in_memory_stale")
+    await cache.set("k", "v", ttl=0)
+    cache._cache._entries["k"].expires_at = time.time() - 7 * 24 * 3600
+    cache._cache.set("other", 1, ttl=60)  # write triggers the sweep
+
+    assert await cache.get("k") is None
+    assert await cache.get("k", allow_stale=True) == "v"
+    assert cache._cache.stats.misses == 1
+    assert cache._cache.stats.stale_hits == 1
+
+def test_l1_reads_are_safe_against_concurrent_prefix_deletes():
+    cache = LocalTtlCache("test_threads", max_entries=512)
+    errors = []
+    stop = threading.Event()
+
+    def reader():
+        try:
+            while not stop.is_set():
+                for i in range(200):
+                    cache.get(f"k{i}")
+                    cache.remaining_ttl(f"k{i}")
+        except Exception as exc:  # pragma: no cover - failure path
+            errors.append(exc)
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for t in threads:
+        t.start()
+    try:
+        for _ in range(200):
+            for i in range(200):
+                cache.set(f"k{i}", i, ttl=60)
+            cache.delete_where(lambda key: key.startswith("k1"))
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+
+    assert errors == []
+
+
+def test_stats_are_reported_per_namespace():
+    cache = LocalTtlCache("test_stats_ns")
+    cache.set("k", {"a": 1}, ttl=60)
+    cache.get("k")
+    cache.get("missing")
+
+    stats = tiered_cache_stats()["test_stats_ns"]
+    assert stats["hits"] >= 1 and stats["misses"] >= 1
+    assert stats["entries"] >= 1 and stats["bytes"] > 0
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_promotes_l2_hits_into_l1():
+    redis = _FakeRedis()
+    codec = RedisValueCodec(serializer="json", compression="none")
+    writer = TieredCache("test_tiered", provider=_provider(redis), codec=codec)
+    reader = TieredCache("test_tiered", provider=_provider(redis), codec=codec)
+
+    await writer.set("k", [{"id": 1}], ttl=60)
+    assert await reader.get("k") == [{"id": 1}]
+    assert reader.stats.l2_hits == 1
+
+    redis.store.clear()
+    assert await reader.get("k") == [{"id": 1}]  # served from L1 now
+    remaining = reader.remaining_ttl("k")
+    assert remaining is not None and 0 < remaining <= 60
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_fails_open_when_redis_errors():
+    client = MagicMock()
+    client.get.side_effect = RuntimeError("down")
+    client.set.side_effect = RuntimeError("down")
+    cache = TieredCache("test_tiered_down", provider=_provider(client), codec=RedisValueCodec())
+
+    await cache.set("k", "v", ttl=60)
+    assert await cache.get("k") == "v"
+    assert await cache.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_indexed_prefix_delete_drops_l1_and_indexed_l2_keys_without_scan():
+    redis = _FakeRedis()
+    codec = RedisValueCodec(serializer="json", compression="none")
+    cache = TieredCache("test_tiered_index", provider=_provider(redis), codec=codec)
+
+    await cache.set("leg:g1:a", "x", ttl=60, index_prefix="leg:g1:")
+    await cache.set("leg:g1:b", "y", ttl=60, index_prefix="leg:g1:")
+    await cache.set("leg:g2:a", "z", ttl=60, index_prefix="leg:g2:")
+
+    assert await cache.delete_indexed_prefixes(["leg:g1:"]) == 4  # two in L1, two in L2
+
+    assert cache.l1.get("leg:g1:a") is None and cache.l1.get("leg:g1:b") is None
+    assert not any(k.endswith("leg:g1:a") or k.endswith("leg:g1:b") for k in redis.store)
+    assert await cache.get("leg:g2:a") == "z"